@@ -100,9 +100,21 @@ _db_client: Optional[Prisma] = None
 
 
 async def connect_database() -> Prisma:
-    """데이터베이스에 연결합니다."""
+    """데이터베이스에 연결합니다 (실제 환경에서는 공유 클라이언트 레지스트리 사용)."""
     global _db_client
 
+    if not IS_TESTING:
+        from shared.database.client_registry import prisma_registry
+
+        try:
+            _db_client = await prisma_registry.get_client()
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 실패: {str(e)}")
+            from fastapi import HTTPException
+
+            raise HTTPException(status_code=500, detail="데이터베이스 연결 실패")
+        return _db_client
+
     if _db_client is None:
         _db_client = Prisma()
 
@@ -124,6 +136,13 @@ async def disconnect_database() -> None:
     """데이터베이스 연결을 종료합니다."""
     global _db_client
 
+    if not IS_TESTING:
+        from shared.database.client_registry import prisma_registry
+
+        await prisma_registry.shutdown()
+        _db_client = None
+        return
+
     if _db_client and _db_client.is_connected():
         try:
             await _db_client.disconnect()
@@ -167,6 +186,11 @@ async def database_session() -> AsyncGenerator[Prisma, None]:
 
 async def check_database_health() -> bool:
     """데이터베이스 연결 상태를 확인합니다."""
+    if not IS_TESTING:
+        from shared.database.client_registry import prisma_registry
+
+        return (await prisma_registry.health_check())["healthy"]
+
     try:
         db = get_database()
         # 간단한 쿼리로 연결 상태 확인
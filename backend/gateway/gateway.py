@@ -6,17 +6,22 @@
 
 import os
 import sys
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
 import json
 
+# 공용 모듈(shared)을 불러올 수 있도록 backend 디렉토리를 모듈 검색 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from shared.utils.server_launcher import default_response_class, run_server
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="CarGoro GraphQL Gateway",
     description="카고로 마이크로서비스 통합 API 게이트웨이",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -186,4 +191,4 @@ if __name__ == "__main__":
     print(f"💚 헬스 체크: http://localhost:{port}/health")
     print(f"🔗 서비스 통합 정보: http://localhost:{port}/graphql/services")
 
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=False, log_level="info")
+    run_server(app, app_path="gateway:app", host="0.0.0.0", port=port, log_level="info")
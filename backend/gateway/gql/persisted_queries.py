@@ -0,0 +1,127 @@
+"""
+Persisted query / APQ(Automatic Persisted Queries)
+
+클라이언트는 쿼리 본문 대신 sha256 해시만 보낼 수 있습니다.
+- 미리 등록한 쿼리: 배포 시 만든 {sha256: query} JSON 파일을 시작할 때 읽어 둡니다.
+- APQ: 처음 보는 해시면 PersistedQueryNotFound 를 돌려주고, 클라이언트가 해시와 쿼리를 함께 다시 보내면 등록합니다.
+
+해시로 찾은 쿼리 문자열은 매번 같은 객체이므로 ParserCache/ValidationCache 에서 바로 적중해
+파싱과 검증을 건너뜁니다.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+from graphql import GraphQLError
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+from strawberry.types import ExecutionResult
+
+from shared.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# APQ 로 등록할 최대 쿼리 수 (초과 시 가장 오래 사용하지 않은 쿼리 제거, 미리 등록한 쿼리는 유지)
+MAX_PERSISTED_QUERIES = 5000
+
+
+def query_hash(query: str) -> str:
+    """쿼리 본문의 sha256 (APQ 해시와 같은 형식)"""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryNotFound(Exception):
+    """등록되지 않은 해시"""
+
+
+class PersistedQueryMismatch(Exception):
+    """해시와 쿼리 본문이 다름"""
+
+
+class PersistedQueryStore:
+    """해시 -> 쿼리 본문 저장소"""
+
+    def __init__(self, manifest: Optional[Mapping[str, str]] = None, max_size: int = MAX_PERSISTED_QUERIES):
+        self._manifest: Dict[str, str] = dict(manifest or {})
+        self._registered: "OrderedDict[str, str]" = OrderedDict()
+        self.max_size = max_size
+
+    @classmethod
+    def from_file(cls, path: Optional[str], **kwargs: Any) -> "PersistedQueryStore":
+        """미리 등록할 쿼리 목록 파일을 읽어 생성 (경로가 없으면 빈 저장소)"""
+        if not path:
+            return cls(**kwargs)
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        logger.info(f"persisted query {len(manifest)}건 로드: {path}")
+        return cls(manifest, **kwargs)
+
+    def get(self, sha256: str) -> Optional[str]:
+        query = self._manifest.get(sha256)
+        if query is None:
+            query = self._registered.get(sha256)
+            if query is not None:
+                self._registered.move_to_end(sha256)
+        return query
+
+    def register(self, sha256: str, query: str) -> str:
+        """APQ 등록 (해시가 본문과 다르면 PersistedQueryMismatch), 저장된 본문 반환"""
+        if query_hash(query) != sha256:
+            raise PersistedQueryMismatch()
+        existing = self.get(sha256)
+        if existing is not None:
+            return existing
+        self._registered[sha256] = query
+        while len(self._registered) > self.max_size:
+            self._registered.popitem(last=False)
+        return query
+
+    def resolve(self, query: Optional[str], extensions: Optional[Dict[str, Any]]) -> Optional[str]:
+        """요청의 query/extensions.persistedQuery 로 실행할 쿼리 본문 결정"""
+        persisted = (extensions or {}).get("persistedQuery")
+        if not isinstance(persisted, dict) or not persisted.get("sha256Hash"):
+            return query
+        sha256 = str(persisted["sha256Hash"])
+        if query:
+            return self.register(sha256, query)
+        stored = self.get(sha256)
+        if stored is None:
+            raise PersistedQueryNotFound()
+        return stored
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """extensions.persistedQuery 를 처리하는 GraphQL 라우터"""
+
+    def __init__(self, *args: Any, persisted_queries: PersistedQueryStore, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.persisted_queries = persisted_queries
+
+    async def parse_http_body(self, request) -> GraphQLRequestData:
+        content_type = request.content_type or ""
+        if "application/json" not in content_type and request.method != "GET":
+            return await super().parse_http_body(request)
+
+        if "application/json" in content_type:
+            data = self.parse_json(await request.get_body())
+        else:
+            data = self.parse_query_params(request.query_params)
+            if isinstance(data.get("extensions"), str):
+                data["extensions"] = json.loads(data["extensions"])
+
+        return GraphQLRequestData(
+            query=self.persisted_queries.resolve(data.get("query"), data.get("extensions")),
+            variables=data.get("variables"),  # type: ignore
+            operation_name=data.get("operationName"),
+        )
+
+    async def execute_operation(self, request, context, root_value) -> ExecutionResult:
+        # APQ 클라이언트는 오류 코드를 보고 쿼리 본문을 함께 다시 보냄
+        try:
+            return await super().execute_operation(request=request, context=context, root_value=root_value)
+        except PersistedQueryNotFound:
+            error = GraphQLError("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+        except PersistedQueryMismatch:
+            error = GraphQLError("provided sha does not match query", extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"})
+        return ExecutionResult(data=None, errors=[error])
@@ -0,0 +1,234 @@
+"""
+GraphQL 쿼리 비용 분석
+
+실행 전에 문서만 보고 쿼리 비용과 중첩 깊이를 계산합니다.
+필드마다 1점, 목록 필드는 하위 선택 비용에 예상 항목 수(page_size 등 인자, 없으면 기본값)를 곱합니다.
+쿼리 1건의 최대 비용/깊이를 넘거나 클라이언트(토큰/IP)별 분당 비용 한도를 다 쓰면 실행하지 않고 오류를 반환합니다.
+"""
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Set, Tuple
+
+from graphql import ExecutionResult as GraphQLExecutionResult
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+)
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+# 목록 크기를 정하는 인자 (GraphQL 이름)
+LIST_SIZE_ARGUMENTS = ("pageSize", "first", "limit")
+# 크기 인자가 없는 목록 필드의 예상 항목 수
+DEFAULT_LIST_SIZE = 20
+# 비용 계산에 쓰는 목록 크기 상한 (인자로 큰 값을 주어도 이 값으로 계산하지 않음)
+MAX_LIST_SIZE = 1000
+# 분당 한도를 추적할 최대 클라이언트 수
+MAX_TRACKED_CLIENTS = 10_000
+
+
+@dataclass
+class QueryCost:
+    """쿼리 비용 분석 결과"""
+
+    cost: int = 0
+    depth: int = 0
+    # 선택된 객체 타입 이름 (응답 캐시 무효화 태그)
+    type_names: Set[str] = field(default_factory=set)
+
+
+class _CostVisitor:
+    def __init__(self, schema: GraphQLSchema, fragments: Dict[str, FragmentDefinitionNode], variables: Dict[str, Any]):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables
+        self.type_names: Set[str] = set()
+
+    def _fields(self, parent_type, selection_set: SelectionSetNode, visited: FrozenSet[str]) -> Iterator[Tuple[Any, FieldNode]]:
+        """선택 집합의 필드 (프래그먼트 펼침, 타입 조건이 있으면 그 타입 기준)"""
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                yield parent_type, selection
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                yield from self._fields(fragment_type, selection.selection_set, visited)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                yield from self._fields(fragment_type, fragment.selection_set, visited | {name})
+
+    def _list_size(self, field_def, node: FieldNode) -> int:
+        arguments = {argument.name.value: argument.value for argument in node.arguments or ()}
+        for name in LIST_SIZE_ARGUMENTS:
+            if name not in field_def.args:
+                continue
+            value = arguments.get(name)
+            if isinstance(value, IntValueNode):
+                size = int(value.value)
+            elif isinstance(value, VariableNode) and self.variables.get(value.name.value) is not None:
+                size = int(self.variables[value.name.value])
+            else:
+                default = field_def.args[name].default_value
+                size = default if isinstance(default, int) else DEFAULT_LIST_SIZE
+            return max(0, min(size, MAX_LIST_SIZE))
+        return DEFAULT_LIST_SIZE
+
+    def visit(self, parent_type, selection_set: SelectionSetNode, visited: FrozenSet[str] = frozenset()) -> Tuple[int, int]:
+        """선택 집합의 (비용, 깊이)"""
+        cost = depth = 0
+        for owner, node in self._fields(parent_type, selection_set, visited):
+            name = node.name.value
+            # __typename, 인트로스펙션 필드는 비용 없음
+            if name.startswith("__"):
+                continue
+            field_def = getattr(owner, "fields", {}).get(name)
+            if field_def is None:
+                continue
+            field_cost, field_depth = 1, 1
+            if node.selection_set:
+                named_type = get_named_type(field_def.type)
+                self.type_names.add(named_type.name)
+                child_cost, child_depth = self.visit(named_type, node.selection_set, visited)
+                multiplier = self._list_size(field_def, node) if is_list_type(get_nullable_type(field_def.type)) else 1
+                field_cost += multiplier * child_cost
+                field_depth += child_depth
+            cost += field_cost
+            depth = max(depth, field_depth)
+        return cost, depth
+
+
+def analyze_operation(
+    schema: GraphQLSchema,
+    operation: OperationDefinitionNode,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Optional[Dict[str, Any]] = None,
+) -> QueryCost:
+    """검증을 통과한 연산 하나의 비용/깊이/타입 계산"""
+    root_type = schema.get_root_type(operation.operation)
+    visitor = _CostVisitor(schema, fragments, variables or {})
+    cost, depth = visitor.visit(root_type, operation.selection_set)
+    return QueryCost(cost=cost, depth=depth, type_names=visitor.type_names)
+
+
+def analyze_document(schema: GraphQLSchema, document, operation_name: Optional[str] = None, variables=None) -> Optional[QueryCost]:
+    """문서에서 실행할 연산의 비용 분석 (연산을 찾지 못하면 None)"""
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return None
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    return analyze_operation(schema, operation, fragments, variables)
+
+
+class CostBudget:
+    """클라이언트별 분당 비용 한도 (토큰 버킷, 1분에 걸쳐 한도만큼 다시 채워짐)"""
+
+    def __init__(self, points_per_minute: int, max_clients: int = MAX_TRACKED_CLIENTS):
+        self.capacity = float(points_per_minute)
+        self.refill_per_second = self.capacity / 60.0
+        self.max_clients = max_clients
+        # client_key -> (남은 점수, 갱신 시각)
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def consume(self, client_key: str, cost: int) -> float:
+        """
+        비용 차감
+
+        Returns:
+            0 이면 허용, 아니면 다시 시도할 수 있을 때까지 남은 시간(초)
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(client_key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) * self.refill_per_second)
+        if cost > tokens:
+            self._buckets[client_key] = (tokens, now)
+            return (cost - tokens) / self.refill_per_second if cost <= self.capacity else 60.0
+        self._buckets[client_key] = (tokens - cost, now)
+        self._buckets.move_to_end(client_key)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+
+def client_key(context: Any) -> str:
+    """비용 한도를 적용할 클라이언트 식별자 (토큰 해시, 없으면 IP)"""
+    token = getattr(context, "token", None)
+    if token:
+        return "token:" + hashlib.sha256(token.encode()).hexdigest()[:32]
+    request = getattr(context, "request", None)
+    client = getattr(request, "client", None)
+    return "ip:" + (client.host if client else "unknown")
+
+
+class QueryCostLimiter(SchemaExtension):
+    """
+    실행 직전 비용/깊이 분석과 클라이언트별 한도 적용
+
+    한도를 넘으면 오류 결과를 미리 채워 실행을 건너뜁니다.
+    앞선 확장(응답 캐시)이 이미 결과를 채웠으면 분석하지 않습니다.
+    인스턴스 하나를 모든 요청이 공유하므로 요청별 상태는 훅 안의 지역 변수로만 다룹니다.
+    """
+
+    def __init__(self, max_cost: int, max_depth: int, points_per_minute: Optional[int] = None):
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.budget = CostBudget(points_per_minute) if points_per_minute else None
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if execution_context.result is None:
+            analysis = analyze_document(
+                execution_context.schema._schema,
+                execution_context.graphql_document,
+                execution_context.operation_name,
+                execution_context.variables,
+            )
+            error = self.check(analysis, execution_context.context) if analysis is not None else None
+            if error is not None:
+                execution_context.result = GraphQLExecutionResult(data=None, errors=[error])
+        yield
+
+    def check(self, analysis: QueryCost, context: Any) -> Optional[GraphQLError]:
+        """한도를 넘으면 반환할 오류"""
+        if analysis.depth > self.max_depth:
+            return GraphQLError(
+                f"쿼리 깊이 {analysis.depth} 이(가) 최대 {self.max_depth} 을(를) 초과합니다.",
+                extensions={"code": "QUERY_TOO_DEEP", "depth": analysis.depth, "maxDepth": self.max_depth},
+            )
+        if analysis.cost > self.max_cost:
+            return GraphQLError(
+                f"쿼리 비용 {analysis.cost} 이(가) 최대 {self.max_cost} 을(를) 초과합니다.",
+                extensions={"code": "QUERY_TOO_COMPLEX", "cost": analysis.cost, "maxCost": self.max_cost},
+            )
+        if self.budget is not None:
+            retry_after = self.budget.consume(client_key(context), analysis.cost)
+            if retry_after:
+                return GraphQLError(
+                    "쿼리 비용 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                    extensions={"code": "COST_BUDGET_EXCEEDED", "cost": analysis.cost, "retryAfter": math.ceil(retry_after)},
+                )
+        return None
@@ -6,6 +6,7 @@ import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import strawberry
+from strawberry.fastapi import BaseContext
 from strawberry.types import Info
 
 from shared.config.settings import settings
@@ -13,27 +14,45 @@ from shared.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
-# 마이크로서비스 URL 설정
-CORE_API_URL = f"http://core-api:8001/api/v1"
+# 마이크로서비스 URL 설정 (서비스가 라우터를 등록한 경로 접두사까지 포함)
+# core_api, fleet_api 는 /api, 나머지는 /api/v1 아래에 라우터를 등록함
+CORE_API_URL = f"http://core-api:8001/api"
 REPAIR_API_URL = f"http://repair-api:8002/api/v1"
 PARTS_API_URL = f"http://parts-api:8003/api/v1"
 DELIVERY_API_URL = f"http://delivery-api:8004/api/v1"
-FLEET_API_URL = f"http://fleet-api:8005/api/v1"
+FLEET_API_URL = f"http://fleet-api:8005/api"
 
-class GraphQLContext:
-    """GraphQL 컨텍스트"""
-    def __init__(self, request, token: Optional[str] = None):
+class GraphQLContext(BaseContext):
+    """
+    GraphQL 컨텍스트
+
+    모든 리졸버는 info.context.session 을 사용합니다.
+    게이트웨이가 시작할 때 만든 공용 세션을 넘기면 요청 간에도 연결을 재사용하고,
+    세션 없이 만들면 async with 블록 동안만 쓸 세션을 직접 엽니다.
+    """
+    def __init__(
+        self,
+        request=None,
+        token: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        super().__init__()
         self.request = request
         self.token = token
-        self.session = None
+        self.session = session
+        self._owns_session = False
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
 
 async def make_request(
     session: aiohttp.ClientSession,
@@ -74,30 +93,30 @@ async def resolve_me(info: Info) -> Optional[Dict[str, Any]]:
     
     headers = {"Authorization": f"Bearer {context.token}"}
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "GET",
-            f"{CORE_API_URL}/auth/me",
-            headers=headers
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "GET",
+        f"{CORE_API_URL}/auth/me",
+        headers=headers
+    )
         
-        return result.get("data") if result.get("success") else None
+    return result.get("data") if result.get("success") else None
 
 async def resolve_user(info: Info, id: str) -> Optional[Dict[str, Any]]:
     """특정 사용자 정보 조회"""
     context = info.context
     headers = {"Authorization": f"Bearer {context.token}"} if context.token else {}
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "GET",
-            f"{CORE_API_URL}/users/{id}",
-            headers=headers
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "GET",
+        f"{CORE_API_URL}/users/{id}",
+        headers=headers
+    )
         
-        return result.get("data") if result.get("success") else None
+    return result.get("data") if result.get("success") else None
 
 async def resolve_users(
     info: Info,
@@ -116,29 +135,29 @@ async def resolve_users(
     if role:
         params["role"] = role
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "GET",
-            f"{CORE_API_URL}/users",
-            headers=headers,
-            params=params
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "GET",
+        f"{CORE_API_URL}/users",
+        headers=headers,
+        params=params
+    )
         
-        if result.get("success"):
-            return result.get("data", {}).get("items", [])
-        return []
+    if result.get("success"):
+        return result.get("data", {}).get("items", [])
+    return []
 
 async def resolve_workshop(info: Info, id: str) -> Optional[Dict[str, Any]]:
     """특정 정비소 정보 조회"""
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "GET",
-            f"{REPAIR_API_URL}/workshops/{id}"
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "GET",
+        f"{REPAIR_API_URL}/workshops/{id}"
+    )
         
-        return result.get("data") if result.get("success") else None
+    return result.get("data") if result.get("success") else None
 
 async def resolve_workshops(
     info: Info,
@@ -160,17 +179,17 @@ async def resolve_workshops(
     if min_rating is not None:
         params["min_rating"] = min_rating
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "GET",
-            f"{REPAIR_API_URL}/workshops",
-            params=params
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "GET",
+        f"{REPAIR_API_URL}/workshops",
+        params=params
+    )
         
-        if result.get("success"):
-            return result.get("data", {}).get("items", [])
-        return []
+    if result.get("success"):
+        return result.get("data", {}).get("items", [])
+    return []
 
 # Mutation 리졸버
 async def resolve_register(
@@ -192,28 +211,28 @@ async def resolve_register(
     if organization_name:
         data["organization_name"] = organization_name
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
+    session = info.context.session
+    result = await make_request(
+        session,
+        "POST",
+        f"{CORE_API_URL}/auth/register",
+        data=data
+    )
+        
+    if result.get("success"):
+        # 회원가입 후 자동 로그인
+        login_result = await make_request(
             session,
             "POST",
-            f"{CORE_API_URL}/auth/register",
-            data=data
+            f"{CORE_API_URL}/auth/login",
+            data={"username": email, "password": password},
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
         )
-        
-        if result.get("success"):
-            # 회원가입 후 자동 로그인
-            login_result = await make_request(
-                session,
-                "POST",
-                f"{CORE_API_URL}/auth/login",
-                data={"username": email, "password": password},
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
             
-            if login_result.get("success"):
-                return login_result.get("data")
+        if login_result.get("success"):
+            return login_result.get("data")
         
-        raise Exception(result.get("message", "회원가입 실패"))
+    raise Exception(result.get("message", "회원가입 실패"))
 
 async def resolve_login(
     info: Info,
@@ -221,19 +240,19 @@ async def resolve_login(
     password: str
 ) -> Dict[str, Any]:
     """로그인"""
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "POST",
-            f"{CORE_API_URL}/auth/login",
-            data={"username": email, "password": password},
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "POST",
+        f"{CORE_API_URL}/auth/login",
+        data={"username": email, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"}
+    )
         
-        if result.get("success"):
-            return result.get("data")
+    if result.get("success"):
+        return result.get("data")
         
-        raise Exception(result.get("message", "로그인 실패"))
+    raise Exception(result.get("message", "로그인 실패"))
 
 async def resolve_create_repair_request(
     info: Info,
@@ -258,19 +277,19 @@ async def resolve_create_repair_request(
     if preferred_date:
         data["preferred_date"] = preferred_date.isoformat()
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "POST",
-            f"{REPAIR_API_URL}/repair-requests",
-            headers=headers,
-            data=data
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "POST",
+        f"{REPAIR_API_URL}/repair-requests",
+        headers=headers,
+        data=data
+    )
         
-        if result.get("success"):
-            return result.get("data")
+    if result.get("success"):
+        return result.get("data")
         
-        raise Exception(result.get("message", "정비 요청 생성 실패"))
+    raise Exception(result.get("message", "정비 요청 생성 실패"))
 
 async def resolve_create_workshop(
     info: Info,
@@ -300,16 +319,16 @@ async def resolve_create_workshop(
     if description:
         data["description"] = description
     
-    async with aiohttp.ClientSession() as session:
-        result = await make_request(
-            session,
-            "POST",
-            f"{REPAIR_API_URL}/workshops",
-            headers=headers,
-            data=data
-        )
+    session = info.context.session
+    result = await make_request(
+        session,
+        "POST",
+        f"{REPAIR_API_URL}/workshops",
+        headers=headers,
+        data=data
+    )
         
-        if result.get("success"):
-            return result.get("data")
+    if result.get("success"):
+        return result.get("data")
         
-        raise Exception(result.get("message", "정비소 등록 실패"))
+    raise Exception(result.get("message", "정비소 등록 실패"))
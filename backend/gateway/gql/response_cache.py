@@ -0,0 +1,170 @@
+"""
+GraphQL 응답 캐시
+
+쿼리 결과를 (쿼리 해시, 연산 이름, 정규화한 변수, 인증 범위) 키로 짧게 캐시합니다.
+항목에는 선택한 객체 타입(Vehicle, Part ...)을 태그로 붙이고, 뮤테이션이 성공하면
+반환 타입과 INVALIDATES 에 등록한 타입의 버전을 올려 해당 태그의 항목을 모두 무효화합니다.
+무효화는 프로세스 안에서만 적용되므로 다른 게이트웨이 인스턴스의 캐시는 TTL 이 지나면 갱신됩니다.
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from graphql import ExecutionResult as GraphQLExecutionResult
+from graphql import FieldNode, OperationDefinitionNode, get_named_type
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from gql.persisted_queries import query_hash
+from gql.query_cost import analyze_document
+
+# 캐시할 최대 응답 수
+MAX_CACHED_RESPONSES = 2000
+
+# 반환 타입 외에 함께 무효화할 타입 (뮤테이션 필드 이름 -> 타입 이름)
+INVALIDATES: Dict[str, FrozenSet[str]] = {
+    "register": frozenset({"User"}),
+    "addMaintenanceRecord": frozenset({"Vehicle"}),
+    "updateVehicleLocation": frozenset({"Vehicle"}),
+    "adjustStock": frozenset({"Part"}),
+    "createPurchaseOrder": frozenset({"PurchaseOrderItem", "Part"}),
+}
+
+
+def register_invalidation(mutation_field: str, *type_names: str) -> None:
+    """뮤테이션이 바꾸는 타입 추가 등록"""
+    INVALIDATES[mutation_field] = INVALIDATES.get(mutation_field, frozenset()) | frozenset(type_names)
+
+
+def auth_scope(context: Any) -> str:
+    """캐시를 나눌 인증 범위 (토큰별, 없으면 익명 공용)"""
+    token = getattr(context, "token", None)
+    return hashlib.sha256(token.encode()).hexdigest()[:32] if token else "anonymous"
+
+
+def normalize_variables(variables: Optional[Dict[str, Any]]) -> str:
+    """키 순서/공백과 무관한 변수 문자열"""
+    return json.dumps(variables or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def mutated_types(schema, operation: OperationDefinitionNode) -> FrozenSet[str]:
+    """뮤테이션 최상위 필드의 반환 타입과 INVALIDATES 에 등록한 타입"""
+    mutation_type = schema.mutation_type
+    types = set()
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            continue
+        name = selection.name.value
+        field_def = mutation_type.fields.get(name) if mutation_type else None
+        if field_def is not None:
+            types.add(get_named_type(field_def.type).name)
+        types.update(INVALIDATES.get(name, ()))
+    return frozenset(types)
+
+
+class ResponseCache:
+    """TTL + LRU 응답 캐시 (태그 버전이 바뀐 항목은 무효)"""
+
+    def __init__(self, ttl: float, max_size: int = MAX_CACHED_RESPONSES):
+        self.ttl = ttl
+        self.max_size = max_size
+        # key -> (만료 시각, data, ((태그, 버전), ...))
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[float, Any, Tuple[Tuple[str, int], ...]]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        # 쿼리 해시 -> 태그 (변수와 무관하므로 쿼리별로 한 번만 계산)
+        self._tags: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def versions(self, tags: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        return tuple((tag, self._versions.get(tag, 0)) for tag in tags)
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic() or entry[2] != self.versions(tag for tag, _ in entry[2]):
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Tuple[str, ...], data: Any, tags: Iterable[str]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, data, self.versions(sorted(tags)))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *type_names: str) -> None:
+        """타입 이름 태그가 붙은 항목 무효화"""
+        for name in type_names:
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def tags_for(self, sha256: str, schema, document, operation_name: Optional[str]) -> FrozenSet[str]:
+        tags = self._tags.get(sha256)
+        if tags is None:
+            analysis = analyze_document(schema, document, operation_name)
+            tags = frozenset(analysis.type_names) if analysis else frozenset()
+            self._tags[sha256] = tags
+            while len(self._tags) > self.max_size:
+                self._tags.popitem(last=False)
+        return tags
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """
+    쿼리는 캐시에서 응답하고, 성공한 뮤테이션은 관련 캐시 무효화
+
+    인스턴스 하나를 모든 요청이 공유하므로 요청별 상태는 훅 안의 지역 변수로만 다룹니다.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        self.cache = cache
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        schema = execution_context.schema._schema
+        operation_type = execution_context.operation_type
+
+        if operation_type == OperationType.MUTATION:
+            yield
+            # 일부 필드만 실패해도 나머지는 반영됐을 수 있으므로 결과가 있으면 무효화
+            if execution_context.result is not None:
+                operation = get_operation_ast(execution_context.graphql_document, execution_context.operation_name)
+                if operation is not None:
+                    self.cache.invalidate(*mutated_types(schema, operation))
+            return
+
+        if operation_type != OperationType.QUERY or execution_context.result is not None:
+            yield
+            return
+
+        sha256 = query_hash(execution_context.query)
+        key = (
+            sha256,
+            execution_context.operation_name or "",
+            normalize_variables(execution_context.variables),
+            auth_scope(execution_context.context),
+        )
+        data = self.cache.get(key)
+        if data is not None:
+            execution_context.result = GraphQLExecutionResult(data=data, errors=None)
+            yield
+            return
+
+        # 실행 중 무효화된 결과를 저장하지 않도록 실행 전 버전으로 태그를 기록
+        tags = self.cache.tags_for(sha256, schema, execution_context.graphql_document, execution_context.operation_name)
+        snapshot = self.cache.versions(sorted(tags))
+        yield
+        result = execution_context.result
+        if result is not None and not result.errors and result.data is not None:
+            if snapshot == self.cache.versions(sorted(tags)):
+                self.cache.set(key, result.data, tags)
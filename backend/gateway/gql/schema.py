@@ -2,11 +2,24 @@
 GraphQL 스키마 정의
 """
 from strawberry import Schema
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.fastapi import GraphQLRouter
 import strawberry
-from typing import List, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 from datetime import datetime
 
+from shared.config.settings import settings
+from gql.persisted_queries import PersistedQueryRouter, PersistedQueryStore
+from gql.query_cost import QueryCostLimiter
+from gql.response_cache import ResponseCache, ResponseCacheExtension
+from gql.subscriptions import (
+    MAX_SUBSCRIBED_VEHICLES,
+    authenticate_subscription,
+    authorized_vehicle_ids,
+    can_access_workshop,
+    subscription_hub,
+)
+
 # GraphQL 타입 정의
 @strawberry.type
 class User:
@@ -188,6 +201,15 @@ class RepairRequest:
     created_at: datetime
     updated_at: datetime
 
+@strawberry.type
+class RepairRequestStatusEvent:
+    id: strawberry.ID
+    request_number: str
+    workshop_id: str
+    status: str
+    previous_status: Optional[str]
+    changed_at: datetime
+
 @strawberry.type
 class AuthResponse:
     access_token: str
@@ -581,9 +603,97 @@ class Mutation:
         # TODO: Parts API 호출
         raise NotImplementedError
 
+def _parse_datetime(value: Any) -> datetime:
+    """이벤트 payload 의 ISO 8601 시각 문자열 변환"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+def _vehicle_location(payload: Dict[str, Any]) -> VehicleLocation:
+    return VehicleLocation(
+        id=payload["id"],
+        vehicle_id=payload["vehicle_id"],
+        latitude=payload["latitude"],
+        longitude=payload["longitude"],
+        speed=payload.get("speed"),
+        heading=payload.get("heading"),
+        altitude=payload.get("altitude"),
+        accuracy=payload.get("accuracy"),
+        timestamp=_parse_datetime(payload["timestamp"]),
+    )
+
+def _repair_request_status_event(payload: Dict[str, Any]) -> RepairRequestStatusEvent:
+    return RepairRequestStatusEvent(
+        id=payload["id"],
+        request_number=payload["request_number"],
+        workshop_id=payload["workshop_id"],
+        status=payload["status"],
+        previous_status=payload.get("previous_status"),
+        changed_at=_parse_datetime(payload["changed_at"]),
+    )
+
+# Subscription 정의 (graphql-ws / graphql-transport-ws)
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def vehicle_location_updated(
+        self,
+        info,
+        vehicle_ids: List[strawberry.ID]
+    ) -> AsyncGenerator[VehicleLocation, None]:
+        """차량 위치 갱신 (전송이 밀리면 차량별 최신 위치만 전달, 사용자 조직 차량만 구독)"""
+        user = await authenticate_subscription(info.context)
+        if len(vehicle_ids) > MAX_SUBSCRIBED_VEHICLES:
+            raise Exception(f"한 번에 구독할 수 있는 차량은 최대 {MAX_SUBSCRIBED_VEHICLES}대입니다")
+        vehicle_ids = await authorized_vehicle_ids(info.context.session, user, vehicle_ids)
+        if not vehicle_ids:
+            raise Exception("구독할 수 있는 차량이 없습니다")
+        async for payload in subscription_hub.vehicle_locations(vehicle_ids):
+            yield _vehicle_location(payload)
+
+    @strawberry.subscription
+    async def repair_request_status_changed(
+        self,
+        info,
+        workshop_id: strawberry.ID
+    ) -> AsyncGenerator[RepairRequestStatusEvent, None]:
+        """정비소에 배정된 정비 요청의 상태 변경 (전송이 밀리면 요청별 최신 상태만 전달)"""
+        user = await authenticate_subscription(info.context)
+        if not await can_access_workshop(info.context.session, user, workshop_id):
+            raise Exception("정비소 구독 권한이 없습니다")
+        async for payload in subscription_hub.repair_request_statuses(workshop_id):
+            yield _repair_request_status_event(payload)
+
+# 파싱/검증 결과를 캐시할 쿼리 수
+DOCUMENT_CACHE_SIZE = 1000
+
+# 게이트웨이 프로세스 공용 캐시
+persisted_queries = PersistedQueryStore.from_file(settings.graphql_persisted_queries_path)
+response_cache = ResponseCache(ttl=settings.graphql_response_cache_ttl)
+
+def build_extensions() -> list:
+    """쿼리 파싱/검증 캐시, 비용 제한, 응답 캐시"""
+    extensions = [
+        ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=DOCUMENT_CACHE_SIZE),
+    ]
+    # 캐시에서 응답한 쿼리는 비용 한도를 차감하지 않도록 응답 캐시를 먼저 둠
+    if settings.graphql_response_cache_ttl > 0:
+        extensions.append(ResponseCacheExtension(response_cache))
+    extensions.append(
+        QueryCostLimiter(
+            max_cost=settings.graphql_max_query_cost,
+            max_depth=settings.graphql_max_query_depth,
+            points_per_minute=settings.graphql_cost_budget_per_minute,
+        )
+    )
+    return extensions
+
 # 스키마 생성
-schema = Schema(query=Query, mutation=Mutation)
+schema = Schema(query=Query, mutation=Mutation, subscription=Subscription, extensions=build_extensions())
 
 # GraphQL 라우터 생성
-def create_graphql_router() -> GraphQLRouter:
-    return GraphQLRouter(schema)
+def create_graphql_router(context_getter: Optional[Callable] = None) -> GraphQLRouter:
+    return PersistedQueryRouter(
+        schema,
+        context_getter=context_getter,
+        persisted_queries=persisted_queries,
+    )
@@ -0,0 +1,221 @@
+"""
+GraphQL 구독 허브
+
+서비스가 이벤트 버스로 발행한 이벤트를 받아 구독자에게 나눠 줍니다.
+- 서버 측 필터링: 차량 ID / 정비소 ID 색인으로 해당 구독자에게만 전달 (이벤트당 O(구독자 수) 순회 없음)
+- 구독자별 병합: 구독자가 아직 보내지 못한 이벤트는 키(차량 ID, 정비 요청 ID)별 최신 값만 남김
+  느린 클라이언트는 중간 위치를 건너뛰고 마지막 위치만 받으며, 대기 이벤트 수는 MAX_PENDING_EVENTS 로 제한
+
+이벤트 버스 핸들러는 수신 루프에서 바로 호출되므로 대기열에 넣고 깨우기만 하고,
+웹소켓 전송은 각 구독의 async generator 가 담당합니다.
+
+구독 이벤트는 백엔드 서비스를 거치지 않으므로 구독을 시작할 때 게이트웨이가 직접 권한을 확인합니다.
+- 토큰은 Core API 로 검증하고, 차량/정비소는 사용자 조직에 속한 것만 구독할 수 있습니다.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Set, Tuple
+
+import aiohttp
+
+from shared.utils.event_bus import EventBus, REPAIR_REQUEST_STATUS_CHANGED, VEHICLE_LOCATION_UPDATED
+from shared.utils.logging_utils import get_logger
+from gql.resolvers import FLEET_API_URL, REPAIR_API_URL
+from middleware.auth import extract_bearer_token, verify_token
+
+logger = get_logger(__name__)
+
+# 구독 1건에서 지정할 수 있는 최대 차량 수
+MAX_SUBSCRIBED_VEHICLES = 500
+# 구독 권한 확인 시 차량 조회 동시 요청 수
+OWNERSHIP_LOOKUP_CONCURRENCY = 20
+# 구독자 1명이 쌓아 둘 수 있는 최대 미전송 이벤트 수 (초과 시 가장 오래된 이벤트 제거)
+MAX_PENDING_EVENTS = 1000
+
+Payload = Dict[str, Any]
+
+
+def connection_token(context: Any) -> Optional[str]:
+    """
+    구독 요청의 인증 토큰
+
+    브라우저 웹소켓은 Authorization 헤더를 보낼 수 없으므로 connection_init payload 의
+    Authorization(또는 authorization) 값도 확인합니다.
+    """
+    if context.token:
+        return context.token
+    params = context.connection_params if isinstance(context.connection_params, dict) else {}
+    return extract_bearer_token(params.get("Authorization") or params.get("authorization"))
+
+
+def _organization_id(data: Dict[str, Any]) -> Optional[str]:
+    return data.get("organization_id") or data.get("organizationId")
+
+
+async def _fetch_data(session: aiohttp.ClientSession, url: str) -> Optional[Dict[str, Any]]:
+    """서비스 조회 응답의 data (없거나 조회 실패 시 None)"""
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status != 200:
+                return None
+            result = await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.error(f"구독 권한 확인 요청 실패: {url} - {str(e)}")
+        return None
+    data = result.get("data") if isinstance(result, dict) else None
+    return data if isinstance(data, dict) else None
+
+
+async def authenticate_subscription(context: Any) -> Dict[str, Any]:
+    """구독 요청 토큰을 Core API 로 검증하고 사용자 정보 반환 (실패 시 예외)"""
+    token = connection_token(context)
+    if not token:
+        raise Exception("인증이 필요합니다")
+    user = await verify_token(token, context.session)
+    if user is None:
+        raise Exception("유효하지 않은 인증 토큰입니다")
+    return user
+
+
+async def authorized_vehicle_ids(
+    session: aiohttp.ClientSession, user: Dict[str, Any], vehicle_ids: Iterable[str]
+) -> List[str]:
+    """사용자 조직에 속한 차량 ID 만 남김 (조회할 수 없는 차량은 제외)"""
+    organization_id = _organization_id(user)
+    if not organization_id:
+        return []
+    semaphore = asyncio.Semaphore(OWNERSHIP_LOOKUP_CONCURRENCY)
+
+    async def owned(vehicle_id: str) -> bool:
+        async with semaphore:
+            vehicle = await _fetch_data(session, f"{FLEET_API_URL}/vehicles/{vehicle_id}")
+        return vehicle is not None and _organization_id(vehicle) == organization_id
+
+    vehicle_ids = list(dict.fromkeys(str(vehicle_id) for vehicle_id in vehicle_ids))
+    results = await asyncio.gather(*(owned(vehicle_id) for vehicle_id in vehicle_ids))
+    return [vehicle_id for vehicle_id, allowed in zip(vehicle_ids, results) if allowed]
+
+
+async def can_access_workshop(
+    session: aiohttp.ClientSession, user: Dict[str, Any], workshop_id: str
+) -> bool:
+    """정비소 소유자/직원이거나 정비소(소유자) 조직이 사용자 조직과 같으면 True"""
+    workshop = await _fetch_data(session, f"{REPAIR_API_URL}/workshops/{workshop_id}")
+    if workshop is None:
+        return False
+    user_id = user.get("id")
+    if workshop.get("owner_id") == user_id:
+        return True
+    if any((staff or {}).get("user_id") == user_id for staff in workshop.get("staff") or ()):
+        return True
+    organization_id = _organization_id(user)
+    workshop_organization_id = _organization_id(workshop) or _organization_id(workshop.get("owner") or {})
+    return bool(organization_id) and workshop_organization_id == organization_id
+
+
+class Subscriber:
+    """구독 1건의 미전송 이벤트 대기열 (키별 최신 값만 유지)"""
+
+    def __init__(self, max_pending: int = MAX_PENDING_EVENTS):
+        self.max_pending = max_pending
+        self._pending: "OrderedDict[str, Payload]" = OrderedDict()
+        self._ready = asyncio.Event()
+        # 통계
+        self.coalesced = 0
+        self.dropped = 0
+
+    def push(self, key: str, payload: Payload, keep: Tuple[str, ...] = ()) -> None:
+        """
+        이벤트 추가
+
+        같은 키의 미전송 이벤트가 있으면 새 값으로 바꾸되 keep 에 지정한 필드는 처음 값을 유지합니다.
+        (예: 상태 이벤트를 합쳐도 previous_status 는 클라이언트가 마지막으로 받은 상태)
+        """
+        previous = self._pending.get(key)
+        if previous is not None:
+            if keep:
+                payload = {**payload, **{field: previous.get(field) for field in keep}}
+            self._pending[key] = payload
+            self.coalesced += 1
+        else:
+            self._pending[key] = payload
+            if len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+        self._ready.set()
+
+    async def events(self) -> AsyncGenerator[Payload, None]:
+        """대기 중인 이벤트를 차례로 꺼냄 (없으면 다음 이벤트까지 대기)"""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            batch, self._pending = self._pending, OrderedDict()
+            for payload in batch.values():
+                yield payload
+
+
+class SubscriptionHub:
+    """이벤트 버스 이벤트를 필터링해 구독자에게 전달"""
+
+    def __init__(self, max_pending: int = MAX_PENDING_EVENTS):
+        self.max_pending = max_pending
+        self._by_vehicle: Dict[str, Set[Subscriber]] = {}
+        self._by_workshop: Dict[str, Set[Subscriber]] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        subscribers: Set[Subscriber] = set()
+        for index in (self._by_vehicle, self._by_workshop):
+            for group in index.values():
+                subscribers.update(group)
+        return len(subscribers)
+
+    def attach(self, bus: EventBus) -> None:
+        """이벤트 버스에 핸들러 등록 (bus.start() 전에 호출)"""
+        bus.subscribe(VEHICLE_LOCATION_UPDATED, self.on_vehicle_location)
+        bus.subscribe(REPAIR_REQUEST_STATUS_CHANGED, self.on_repair_request_status)
+
+    # ---------- 구독 ----------
+
+    async def _stream(
+        self, index: Dict[str, Set[Subscriber]], keys: Iterable[str]
+    ) -> AsyncGenerator[Payload, None]:
+        subscriber = Subscriber(self.max_pending)
+        keys = set(keys)
+        for key in keys:
+            index.setdefault(key, set()).add(subscriber)
+        try:
+            async for payload in subscriber.events():
+                yield payload
+        finally:
+            # 클라이언트가 구독을 끝내거나 연결이 끊기면 색인에서 제거
+            for key in keys:
+                group = index.get(key)
+                if group is not None:
+                    group.discard(subscriber)
+                    if not group:
+                        del index[key]
+
+    def vehicle_locations(self, vehicle_ids: Iterable[str]) -> AsyncGenerator[Payload, None]:
+        """지정한 차량들의 위치 이벤트"""
+        return self._stream(self._by_vehicle, (str(vehicle_id) for vehicle_id in vehicle_ids))
+
+    def repair_request_statuses(self, workshop_id: str) -> AsyncGenerator[Payload, None]:
+        """정비소에 배정된 정비 요청의 상태 변경 이벤트"""
+        return self._stream(self._by_workshop, (str(workshop_id),))
+
+    # ---------- 이벤트 버스 핸들러 ----------
+
+    def on_vehicle_location(self, payload: Payload) -> None:
+        vehicle_id = payload.get("vehicle_id")
+        for subscriber in self._by_vehicle.get(vehicle_id, ()):
+            subscriber.push(vehicle_id, payload)
+
+    def on_repair_request_status(self, payload: Payload) -> None:
+        request_id = payload.get("id")
+        for subscriber in self._by_workshop.get(payload.get("workshop_id"), ()):
+            subscriber.push(request_id, payload, keep=("previous_status",))
+
+
+# 게이트웨이 프로세스 공용 허브
+subscription_hub = SubscriptionHub()
@@ -2,14 +2,20 @@
 GraphQL Gateway 메인 서버
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, Depends
+import aiohttp
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.requests import HTTPConnection
 from strawberry.fastapi import GraphQLRouter
 
 from shared.config.settings import settings
+from shared.utils.event_bus import close_event_bus, get_event_bus
 from shared.utils.logging_utils import get_logger
-from graphql.schema import create_graphql_router
-from middleware.auth import get_current_token
+from shared.utils.server_launcher import default_response_class
+from gql.resolvers import GraphQLContext
+from gql.schema import create_graphql_router
+from gql.subscriptions import subscription_hub
+from middleware.auth import extract_bearer_token
 
 logger = get_logger(__name__)
 
@@ -19,7 +25,15 @@ async def lifespan(app: FastAPI):
     앱 시작 및 종료 시 실행될 로직
     """
     logger.info(f"GraphQL Gateway 서버 시작 (환경: {settings.ENV})")
+    # 모든 요청/리졸버가 연결 풀을 공유하는 HTTP 세션
+    app.state.http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+    # 서비스가 발행한 차량 위치/정비 요청 상태 이벤트를 구독자에게 전달
+    event_bus = get_event_bus()
+    subscription_hub.attach(event_bus)
+    await event_bus.start()
     yield
+    await close_event_bus()
+    await app.state.http_session.close()
     logger.info("GraphQL Gateway 서버 종료")
 
 # FastAPI 앱 생성
@@ -27,6 +41,7 @@ app = FastAPI(
     title="CarGoro GraphQL Gateway",
     description="마이크로서비스 통합 GraphQL API Gateway",
     version="0.1.0",
+    default_response_class=default_response_class(),
     lifespan=lifespan,
     debug=settings.DEBUG
 )
@@ -40,25 +55,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# GraphQL 엔드포인트 추가
-graphql_app = create_graphql_router()
-
 # 컨텍스트 생성 함수
-async def get_context(
-    request: Request,
-    token: str = Depends(get_current_token)
-):
-    """GraphQL 컨텍스트 생성"""
-    return {
-        "request": request,
-        "token": token
-    }
+async def get_context(connection: HTTPConnection) -> GraphQLContext:
+    """
+    GraphQL 컨텍스트 생성 (게이트웨이 공용 HTTP 세션 사용)
+
+    HTTP 요청과 구독 웹소켓이 함께 사용하므로 Request 대신 HTTPConnection 을 받습니다.
+    """
+    return GraphQLContext(
+        connection,
+        token=extract_bearer_token(connection.headers.get("Authorization")),
+        session=connection.app.state.http_session
+    )
+
+# GraphQL 엔드포인트 추가
+graphql_app = create_graphql_router(context_getter=get_context)
 
 # GraphQL 라우터 등록
 app.include_router(
     graphql_app,
-    prefix="/graphql",
-    dependencies=[Depends(get_context)]
+    prefix="/graphql"
 )
 
 # 헬스 체크 엔드포인트
@@ -1,11 +1,15 @@
 """
 Gateway 인증 미들웨어
 """
+import asyncio
 from typing import Optional
+
+import aiohttp
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from shared.utils.logging_utils import get_logger
+from gql.resolvers import CORE_API_URL
 
 logger = get_logger(__name__)
 
@@ -37,21 +41,45 @@ class BearerAuth(HTTPBearer):
 # 인증 인스턴스
 bearer_auth = BearerAuth(auto_error=False)
 
+def extract_bearer_token(value: Optional[str]) -> Optional[str]:
+    """'Bearer <토큰>' 형식의 값(Authorization 헤더, 웹소켓 connection_init payload)에서 토큰 추출"""
+    if value and value.startswith("Bearer "):
+        return value[7:]  # "Bearer " 제거
+    return None
+
 async def get_current_token(
     request: Request,
     token: Optional[str] = None
 ) -> Optional[str]:
     """현재 요청의 토큰 가져오기"""
     # Authorization 헤더에서 토큰 추출
-    auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        return auth_header[7:]  # "Bearer " 제거
+    header_token = extract_bearer_token(request.headers.get("Authorization"))
+    if header_token:
+        return header_token
     
     # 또는 bearer_auth 사용
     return await bearer_auth(request)
 
-async def verify_token(token: str) -> Optional[dict]:
-    """토큰 검증 (Core API 호출)"""
-    # TODO: Core API의 /auth/me 엔드포인트 호출하여 토큰 검증
-    # 현재는 임시로 None 반환
-    return None
+async def verify_token(token: str, session: aiohttp.ClientSession) -> Optional[dict]:
+    """
+    토큰 검증 (Core API /auth/me 호출)
+
+    유효한 토큰이면 사용자 정보(id, organization_id 등)를, 아니면 None 을 반환합니다.
+    Core API 에 연결할 수 없을 때도 None 을 반환합니다 (검증하지 못한 토큰은 거부).
+    """
+    try:
+        async with session.get(
+            f"{CORE_API_URL}/auth/me",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
+            if response.status != 200:
+                return None
+            result = await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.error(f"토큰 검증 요청 실패: {str(e)}")
+        return None
+
+    # 응답 래퍼({"success": ..., "data": {...}}) 유무와 관계없이 사용자 정보 추출
+    user = result.get("data") if isinstance(result.get("data"), dict) else result
+    return user if isinstance(user, dict) and user.get("id") else None
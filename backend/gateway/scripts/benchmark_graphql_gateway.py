@@ -0,0 +1,149 @@
+"""
+GraphQL 게이트웨이 요청 처리 벤치마크
+
+- 같은 쿼리 반복 실행: 캐시 없음 vs 파싱/검증 캐시 + 비용 분석 vs 응답 캐시까지
+- APQ: 쿼리 본문 대신 해시만 보낼 때 요청 크기
+- 리졸버 HTTP 세션: 호출마다 새 세션 vs 컨텍스트 공용 세션 (로컬 aiohttp 서버 대상)
+
+사용법: python scripts/benchmark_graphql_gateway.py [--requests 2000] [--calls 300]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# shared 패키지는 backend/ 아래에 있음
+sys.path.insert(0, os.path.dirname(GATEWAY_DIR))
+sys.path.insert(0, GATEWAY_DIR)
+
+from aiohttp import web
+from strawberry import Schema
+from strawberry.extensions import ParserCache, ValidationCache
+
+from gql import resolvers
+from gql.persisted_queries import query_hash
+from gql.query_cost import QueryCostLimiter
+from gql.resolvers import GraphQLContext
+from gql.response_cache import ResponseCache, ResponseCacheExtension
+from gql.schema import DOCUMENT_CACHE_SIZE, Mutation, Query
+
+# 대시보드 화면 하나 분량의 쿼리
+DASHBOARD_QUERY = """
+query Dashboard($pageSize: Int!, $status: String) {
+  vehicles(pageSize: $pageSize) { ...VehicleFields }
+  workshops(pageSize: $pageSize) {
+    id name address phone businessNumber description specialties operatingHours
+    capacity isActive rating reviewCount completedRepairs ownerId createdAt updatedAt
+  }
+  repairRequests(pageSize: $pageSize, status: $status) {
+    id requestNumber vehicleId customerId workshopId technicianId description urgency status
+    preferredDate scheduledDate completedDate estimatedDuration actualDuration symptoms diagnosis
+    repairNotes totalCost createdAt updatedAt
+  }
+  parts(pageSize: $pageSize, lowStockOnly: true) {
+    id partNumber name category manufacturer model description unit price cost minStock maxStock
+    leadTimeDays isActive tags organizationId createdAt updatedAt
+  }
+  purchaseOrders(pageSize: $pageSize) {
+    id orderNumber supplierName supplierContact expectedDate totalAmount status notes organizationId
+    createdAt updatedAt
+  }
+}
+
+fragment VehicleFields on Vehicle {
+  id vehicleNumber manufacturer model year vin engineType color mileage lastServiceMileage
+  registrationDate customerId organizationId notes createdAt updatedAt
+}
+"""
+VARIABLES = {"pageSize": 5, "status": "PENDING"}
+
+
+async def run_queries(schema: Schema, requests: int) -> float:
+    context = GraphQLContext(token="benchmark")
+    started = time.perf_counter()
+    for _ in range(requests):
+        result = await schema.execute(DASHBOARD_QUERY, variable_values=VARIABLES, context_value=context)
+        assert not result.errors, result.errors
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def benchmark_sessions(calls: int) -> None:
+    async def user(request):
+        return web.json_response({"success": True, "data": {"id": request.match_info["id"]}})
+
+    app = web.Application()
+    app.router.add_get("/api/users/{id}", user)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    resolvers.CORE_API_URL = f"http://127.0.0.1:{port}/api"
+
+    # 이전 방식: 리졸버 호출마다 세션(연결 풀)을 새로 만듦
+    started = time.perf_counter()
+    for i in range(calls):
+        async with GraphQLContext(token="benchmark") as context:
+            await resolvers.resolve_user(SimpleNamespace(context=context), str(i))
+    per_call_session = (time.perf_counter() - started) / calls * 1000
+
+    async with GraphQLContext(token="benchmark") as context:
+        info = SimpleNamespace(context=context)
+        started = time.perf_counter()
+        for i in range(calls):
+            await resolvers.resolve_user(info, str(i))
+        shared_session = (time.perf_counter() - started) / calls * 1000
+
+    await runner.cleanup()
+    print(f"\nresolver HTTP call ({calls} calls to local aiohttp server)")
+    print(f"  new session per call    {per_call_session:>8.3f} ms/call")
+    print(f"  shared context session  {shared_session:>8.3f} ms/call")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="쿼리 반복 횟수")
+    parser.add_argument("--calls", type=int, default=300, help="리졸버 HTTP 호출 횟수")
+    args = parser.parse_args()
+
+    limiter = QueryCostLimiter(max_cost=10_000, max_depth=10, points_per_minute=None)
+    schemas = {
+        "no extensions": Schema(query=Query, mutation=Mutation),
+        "parse/validate cache + cost": Schema(
+            query=Query,
+            mutation=Mutation,
+            extensions=[ParserCache(maxsize=DOCUMENT_CACHE_SIZE), ValidationCache(maxsize=DOCUMENT_CACHE_SIZE), limiter],
+        ),
+        "+ response cache": Schema(
+            query=Query,
+            mutation=Mutation,
+            extensions=[
+                ParserCache(maxsize=DOCUMENT_CACHE_SIZE),
+                ValidationCache(maxsize=DOCUMENT_CACHE_SIZE),
+                ResponseCacheExtension(ResponseCache(ttl=60)),
+                limiter,
+            ],
+        ),
+    }
+    print(f"dashboard query, {len(DASHBOARD_QUERY):,} chars, {args.requests} requests")
+    for label, schema in schemas.items():
+        print(f"  {label:<30} {await run_queries(schema, args.requests):>8.1f} µs/request")
+
+    full = json.dumps({"query": DASHBOARD_QUERY, "variables": VARIABLES})
+    persisted = json.dumps(
+        {
+            "extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash(DASHBOARD_QUERY)}},
+            "variables": VARIABLES,
+        }
+    )
+    print(f"\nrequest body: full query {len(full):,} bytes, persisted hash {len(persisted):,} bytes")
+
+    await benchmark_sessions(args.calls)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
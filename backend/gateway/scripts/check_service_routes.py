@@ -0,0 +1,116 @@
+"""
+구독 권한 확인 요청 경로 점검
+
+게이트웨이가 구독을 시작할 때 보내는 요청(토큰 검증, 차량/정비소 조회)의 URL 을 실제 함수에서 그대로 수집하고,
+각 서비스의 FastAPI 앱(lib.server:app)에 그 경로의 GET 라우트가 있는지 확인합니다.
+부하 테스트(load_test_subscriptions.py)는 권한 확인을 모두 허용하도록 바꾸므로 경로가 틀려도 드러나지 않습니다.
+
+서비스 앱은 서비스별로 별도 프로세스에서 불러옵니다 (서비스마다 lib 패키지 이름이 같음).
+DB 에 연결하지 않지만 각 서비스의 의존성(prisma 클라이언트 등)은 설치되어 있어야 합니다.
+
+사용법: python scripts/check_service_routes.py
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from urllib.parse import urlsplit
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.dirname(GATEWAY_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, GATEWAY_DIR)
+
+from gql.subscriptions import authorized_vehicle_ids, can_access_workshop
+from middleware.auth import verify_token
+
+# 게이트웨이 URL 의 호스트 -> 서비스 디렉터리
+SERVICE_DIRS = {
+    "core-api": os.path.join(BACKEND_DIR, "services", "core_api"),
+    "fleet-api": os.path.join(BACKEND_DIR, "services", "fleet_api"),
+    "repair-api": os.path.join(BACKEND_DIR, "services", "repair-api"),
+}
+
+# 서비스 프로세스에서 실행: 인자로 받은 경로마다 GET 라우트가 있는지 JSON 으로 출력
+ROUTE_CHECK = """
+import json, sys
+service_dir, backend_dir, paths = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+sys.path[:0] = [service_dir, backend_dir]
+from starlette.routing import Match, Mount
+from lib.server import app
+# 정적 파일 마운트는 하위 경로를 모두 받으므로 제외
+routes = [route for route in app.routes if not isinstance(route, Mount)]
+found = {}
+for path in paths:
+    scope = {"type": "http", "method": "GET", "path": path, "root_path": ""}
+    found[path] = any(route.matches(scope)[0] == Match.FULL for route in routes)
+print(json.dumps(found))
+"""
+
+
+class RecordingSession:
+    """요청 URL 만 기록하고 모든 요청에 404 로 응답하는 aiohttp 세션 대용"""
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _NotFound()
+
+
+class _NotFound:
+    status = 404
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def collect_urls():
+    """구독 권한 확인 함수들이 요청하는 URL"""
+    session = RecordingSession()
+    user = {"id": "route-check-user", "organization_id": "route-check-org"}
+    await verify_token("route-check-token", session)
+    await authorized_vehicle_ids(session, user, ["route-check-vehicle"])
+    await can_access_workshop(session, user, "route-check-workshop")
+    return session.urls
+
+
+def check_service(service_dir, paths):
+    """서비스 앱에서 경로별 GET 라우트 존재 여부"""
+    completed = subprocess.run(
+        [sys.executable, "-c", ROUTE_CHECK, service_dir, BACKEND_DIR, json.dumps(paths)],
+        cwd=service_dir,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{service_dir} 앱을 불러오지 못했습니다\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    by_service = {}
+    for url in asyncio.run(collect_urls()):
+        parts = urlsplit(url)
+        if parts.hostname not in SERVICE_DIRS:
+            raise RuntimeError(f"점검 대상 서비스가 아닙니다: {url}")
+        by_service.setdefault(parts.hostname, []).append(parts.path)
+
+    missing = 0
+    for host, paths in by_service.items():
+        for path, found in check_service(SERVICE_DIRS[host], paths).items():
+            print(f"  {'ok     ' if found else 'MISSING'} GET {host}{path}")
+            missing += not found
+    if missing:
+        print(f"서비스에 없는 경로 {missing}개")
+        sys.exit(1)
+    print("구독 권한 확인 경로가 모두 서비스 라우트와 일치합니다")
+
+
+if __name__ == "__main__":
+    main()
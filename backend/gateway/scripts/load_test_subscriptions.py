@@ -0,0 +1,236 @@
+"""
+GraphQL 구독 부하 테스트
+
+게이트웨이 스키마(Subscription)와 구독 허브에 동시 구독자를 붙이고 이벤트 버스로 이벤트를 발행합니다.
+- 구독자 대부분은 vehicleLocationUpdated(차량 N대), 나머지는 repairRequestStatusChanged(정비소 1곳)
+- 일부 구독자는 메시지마다 지연(느린 클라이언트)을 두어 구독자별 병합을 확인
+- 확인 항목: 필터링 위반(구독하지 않은 차량/정비소 이벤트 수신), 최종 상태 불일치(병합 후 마지막 값이 최신이 아님),
+  구독 종료 후 허브 색인 정리, 발행 -> 구독자 전달 지연, 허브 분배 비용(이벤트 버스 핸들러 실행 시간)
+
+웹소켓 전송과 구독 권한 확인(Core API / fleet_api / repair-api 조회)은 포함하지 않습니다
+(schema.subscribe 로 직접 실행하고 권한 확인은 모든 대상을 허용하도록 바꿈).
+권한 확인 요청 경로가 실제 서비스 라우트와 맞는지는 scripts/check_service_routes.py 로 확인합니다.
+
+사용법: python scripts/load_test_subscriptions.py [--subscribers 5000] [--events 20000] [--rate 200]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+GATEWAY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# shared 패키지는 backend/ 아래에 있음
+sys.path.insert(0, os.path.dirname(GATEWAY_DIR))
+sys.path.insert(0, GATEWAY_DIR)
+
+from shared.utils.event_bus import EventBus, REPAIR_REQUEST_STATUS_CHANGED, VEHICLE_LOCATION_UPDATED
+
+import gql.schema
+from gql.resolvers import GraphQLContext
+from gql.schema import schema
+from gql.subscriptions import subscription_hub
+
+
+async def allow_user(context):
+    return {"id": "load-test", "organization_id": "load-test"}
+
+
+async def allow_vehicles(session, user, vehicle_ids):
+    return list(vehicle_ids)
+
+
+async def allow_workshop(session, user, workshop_id):
+    return True
+
+
+# 허브 분배 비용만 측정하도록 구독 권한 확인을 생략
+gql.schema.authenticate_subscription = allow_user
+gql.schema.authorized_vehicle_ids = allow_vehicles
+gql.schema.can_access_workshop = allow_workshop
+
+VEHICLE_SUBSCRIPTION = """
+subscription Locations($vehicleIds: [ID!]!) {
+  vehicleLocationUpdated(vehicleIds: $vehicleIds) { id vehicleId latitude longitude speed timestamp }
+}
+"""
+STATUS_SUBSCRIPTION = """
+subscription Statuses($workshopId: ID!) {
+  repairRequestStatusChanged(workshopId: $workshopId) { id requestNumber workshopId status previousStatus changedAt }
+}
+"""
+STATUSES = ["PENDING", "CONFIRMED", "IN_PROGRESS", "COMPLETED"]
+
+
+class Stats:
+    def __init__(self):
+        self.sent_at = {}  # 이벤트 태그 -> 발행 시각
+        self.latencies = []
+        self.delivered = 0
+        self.filter_violations = 0
+        self.errors = 0
+        # (구독자, 키) -> 마지막으로 받은 이벤트 태그
+        self.last_received = {}
+
+
+async def run_subscriber(index, query, variables, allowed, key_field, slow_delay, stats, ready):
+    context = GraphQLContext(token="load-test")
+    result = await schema.subscribe(query, variable_values=variables, context_value=context)
+    ready.release()
+    field = "vehicleLocationUpdated" if key_field == "vehicleId" else "repairRequestStatusChanged"
+    async for message in result:
+        received = time.perf_counter()
+        if message.errors:
+            stats.errors += 1
+            continue
+        event = message.data[field]
+        if key_field == "vehicleId":
+            key, tag = event["vehicleId"], event["id"]
+        else:
+            key, tag = event["id"], event["requestNumber"]
+        stats.delivered += 1
+        stats.latencies.append(received - stats.sent_at[tag])
+        if event[key_field] not in allowed:
+            stats.filter_violations += 1
+        stats.last_received[(index, key)] = tag
+        if slow_delay:
+            await asyncio.sleep(slow_delay)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=5000, help="동시 구독자 수")
+    parser.add_argument("--vehicles", type=int, default=5000, help="차량 수")
+    parser.add_argument("--vehicles-per-subscriber", type=int, default=20, help="구독자 1명이 구독할 차량 수")
+    parser.add_argument("--workshops", type=int, default=100, help="정비소 수")
+    parser.add_argument("--status-share", type=float, default=0.2, help="정비 요청 상태 구독자 비율")
+    parser.add_argument("--slow-share", type=float, default=0.1, help="느린 구독자 비율")
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="느린 구독자의 메시지당 처리 시간(초)")
+    parser.add_argument("--events", type=int, default=20000, help="발행할 이벤트 수")
+    parser.add_argument("--rate", type=int, default=200, help="초당 발행 이벤트 수")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="비교용 폴링 주기(초)")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    bus = EventBus()  # Redis 없이 프로세스 내 전달
+    subscription_hub.attach(bus)
+    stats = Stats()
+
+    vehicle_ids = [f"vehicle-{i}" for i in range(args.vehicles)]
+    workshop_ids = [f"workshop-{i}" for i in range(args.workshops)]
+    ready = asyncio.Semaphore(0)
+    tasks = []
+    started = time.perf_counter()
+    for index in range(args.subscribers):
+        slow_delay = args.slow_delay if rng.random() < args.slow_share else 0
+        if rng.random() < args.status_share:
+            workshop_id = rng.choice(workshop_ids)
+            query, variables, allowed, key_field = STATUS_SUBSCRIPTION, {"workshopId": workshop_id}, {workshop_id}, "workshopId"
+        else:
+            chosen = rng.sample(vehicle_ids, args.vehicles_per_subscriber)
+            query, variables, allowed, key_field = VEHICLE_SUBSCRIPTION, {"vehicleIds": chosen}, set(chosen), "vehicleId"
+        tasks.append(
+            asyncio.create_task(run_subscriber(index, query, variables, allowed, key_field, slow_delay, stats, ready))
+        )
+    for _ in tasks:
+        await ready.acquire()
+    # 첫 이벤트를 기다리기 시작할 때 허브 색인에 등록됨
+    await asyncio.sleep(0.1)
+    print(
+        f"{args.subscribers:,} subscribers attached in {time.perf_counter() - started:.2f} s "
+        f"(hub: {subscription_hub.subscriber_count:,})"
+    )
+
+    # 발행: 차량 위치 80%, 정비 요청 상태 20%
+    # 이벤트 태그(발행 시각/최신 값 확인용): 위치는 위치 기록 id, 상태는 request_number 에 순번을 넣어 사용
+    latest = {}
+    expected = 0
+    dispatch_time = 0.0
+    batch = max(1, args.rate // 100)
+    publish_started = time.perf_counter()
+    for n in range(args.events):
+        if rng.random() < 0.8:
+            vehicle_id = rng.choice(vehicle_ids)
+            tag = f"location-{n}"
+            payload = {
+                "id": tag,
+                "vehicle_id": vehicle_id,
+                "latitude": 37.5 + rng.random() / 10,
+                "longitude": 127.0 + rng.random() / 10,
+                "speed": rng.random() * 80,
+                "timestamp": datetime.utcnow(),
+            }
+            latest[vehicle_id] = tag
+            event_type = VEHICLE_LOCATION_UPDATED
+            expected += len(subscription_hub._by_vehicle.get(vehicle_id, ()))
+        else:
+            workshop_id = rng.choice(workshop_ids)
+            request_id = f"{workshop_id}-request-{rng.randrange(20)}"
+            tag = f"RR-{n}"
+            payload = {
+                "id": request_id,
+                "request_number": tag,
+                "workshop_id": workshop_id,
+                "status": rng.choice(STATUSES),
+                "previous_status": "PENDING",
+                "changed_at": datetime.utcnow(),
+            }
+            latest[request_id] = tag
+            event_type = REPAIR_REQUEST_STATUS_CHANGED
+            expected += len(subscription_hub._by_workshop.get(workshop_id, ()))
+        stats.sent_at[tag] = time.perf_counter()
+        # 프로세스 내 전달이므로 publish 시간 = JSON 변환 + 허브 필터링/대기열 추가
+        await bus.publish(event_type, payload)
+        dispatch_time += time.perf_counter() - stats.sent_at[tag]
+        if (n + 1) % batch == 0:
+            await asyncio.sleep(0.01)
+    publish_elapsed = time.perf_counter() - publish_started
+
+    # 느린 구독자가 밀린 이벤트를 모두 받을 때까지 대기
+    previous = -1
+    while previous != stats.delivered:
+        previous = stats.delivered
+        await asyncio.sleep(max(args.slow_delay * 4, 0.2))
+
+    # 병합 후에도 각 구독자가 마지막으로 받은 값은 키별 최신 이벤트여야 함
+    stale = sum(1 for (_, key), tag in stats.last_received.items() if latest.get(key) != tag)
+
+    # 같은 구독자가 여러 차량에 등록되어 있으므로 중복 제거 후 합산
+    subscribers = {s for group in subscription_hub._by_vehicle.values() for s in group} | {
+        s for group in subscription_hub._by_workshop.values() for s in group
+    }
+    coalesced = sum(s.coalesced for s in subscribers)
+    dropped = sum(s.dropped for s in subscribers)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    latencies = sorted(stats.latencies) or [0.0]
+    print(f"{args.events:,} events published in {publish_elapsed:.2f} s ({args.events / publish_elapsed:,.0f}/s)")
+    print(f"  hub dispatch              {dispatch_time / args.events * 1_000_000:>10.1f} µs/event")
+    print(f"  deliveries                {stats.delivered:>10,}  (matching subscriptions {expected:,})")
+    print(f"  coalesced per subscriber  {coalesced:>10,}  dropped {dropped:,}")
+    print(f"  filter violations         {stats.filter_violations:>10,}")
+    print(f"  stale final values        {stale:>10,}")
+    print(f"  errors                    {stats.errors:>10,}")
+    print(
+        f"  delivery latency          p50 {statistics.median(latencies) * 1000:.2f} ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms  max {latencies[-1] * 1000:.2f} ms"
+    )
+    print(
+        f"  hub after unsubscribe     vehicles {len(subscription_hub._by_vehicle)}  "
+        f"workshops {len(subscription_hub._by_workshop)}"
+    )
+    print(
+        f"\npolling every {args.poll_interval:g} s instead: "
+        f"{args.subscribers / args.poll_interval:,.0f} requests/s to fleet_api/repair-api; subscriptions: 0"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -25,6 +25,14 @@ class Prisma:
         """데이터베이스 연결 해제"""
         logger.info("Mock DB 연결 해제됨")
 
+    async def query_raw(self, query, *args):
+        """원시 SQL 조회"""
+        return []
+
+    async def execute_raw(self, query, *args):
+        """원시 SQL 실행"""
+        return 0
+
 
 class AuditlogModel:
     """Auditlog 모델 Mock 구현"""
@@ -43,11 +51,15 @@ class AuditlogModel:
         """로그 생성"""
         return data
 
+    async def create_many(self, data, skip_duplicates=None):
+        """로그 일괄 생성"""
+        return len(data)
+
     async def find_unique(self, where=None, include=None):
         """단일 로그 조회"""
         return None
 
-    async def group_by(self, by=None, where=None, _count=None, take=None, order=None):
+    async def group_by(self, by=None, where=None, count=None, _count=None, take=None, order=None):
         """그룹화 조회"""
         return []
 
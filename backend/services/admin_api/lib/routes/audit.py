@@ -1,10 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional, Dict, Any, cast
 from datetime import datetime, timedelta
 from services.admin_api.lib.database import get_prisma
+from services.admin_api.lib.services.audit_export import (
+    EXPORT_FORMATS,
+    export_filename,
+    stream_audit_export,
+)
+from services.admin_api.lib.services.audit_stats import (
+    compute_dashboard_stats,
+    count_by,
+    level_summary,
+    stats_cache,
+)
 from enum import Enum
-import json
+import asyncio
 import logging
 from shared.utils.response_utils import (
     ApiResponse,
@@ -18,6 +30,18 @@ from shared.utils.response_utils import (
 router = APIRouter()
 logger = logging.getLogger("admin-api:audit")
 
+# 일괄 생성 요청당 최대 이벤트 수와 INSERT 한 번에 넣는 행 수
+MAX_BULK_EVENTS = 5000
+BULK_INSERT_CHUNK = 1000
+
+# 요청 필드(snake_case) -> DB 필드(camelCase)
+AUDIT_FIELD_MAP = {
+    "user_id": "userId",
+    "ip_address": "ipAddress",
+    "user_agent": "userAgent",
+    "resource_id": "resourceId",
+}
+
 
 # 감사 로그 레벨 열거형
 class AuditLogLevel(str, Enum):
@@ -50,6 +74,8 @@ class ServiceType(str, Enum):
 
 # 감사 로그 요청 모델
 class AuditLogCreate(BaseModel):
+    # 클라이언트가 정한 이벤트 ID (재전송된 이벤트는 같은 ID 로 중복 저장하지 않음)
+    id: Optional[str] = Field(None, min_length=1, max_length=64)
     level: AuditLogLevel
     service: ServiceType
     category: AuditCategory
@@ -62,6 +88,13 @@ class AuditLogCreate(BaseModel):
     resource_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
     success: bool = True
+    # 이벤트 발생 시각 (배치 전송 시 클라이언트가 지정, 없으면 저장 시각)
+    timestamp: Optional[datetime] = None
+
+
+# 감사 로그 일괄 생성 요청 모델
+class AuditLogBulkCreate(BaseModel):
+    events: List[Dict[str, Any]] = Field(..., max_length=MAX_BULK_EVENTS)
 
 
 # 감사 로그 응답 모델
@@ -123,17 +156,16 @@ class SystemHealth(BaseModel):
     environment: str
 
 
-# 대시보드 통계 모델
-class DashboardStats(BaseModel):
-    audit_log_summary: AuditLogStats
-    recent_errors: List[AuditLogResponse]
-    activity_by_service: Dict[str, int]
-    activity_by_category: Dict[str, int]
-    activity_by_day: Dict[str, int]
-    top_resources: List[Dict[str, Any]]
-    top_users: List[Dict[str, Any]]
-    failure_rate: float
-    average_actions_per_day: float
+def to_audit_record(audit_log: AuditLogCreate) -> Dict[str, Any]:
+    """요청 모델을 DB 레코드로 변환 (snake_case -> camelCase)"""
+    data = audit_log.model_dump(exclude_unset=True)
+    for field, column in AUDIT_FIELD_MAP.items():
+        if field in data:
+            data[column] = data.pop(field)
+    for field in ("id", "timestamp"):
+        if data.get(field) is None:
+            data.pop(field, None)
+    return data
 
 
 # 감사 로그 생성 API
@@ -145,19 +177,7 @@ async def create_audit_log(audit_log: AuditLogCreate, prisma=Depends(get_prisma)
     새로운 감사 로그를 생성합니다.
     """
     try:
-        data = audit_log.model_dump(exclude_unset=True)
-
-        # snake_case to camelCase 변환
-        if "user_id" in data:
-            data["userId"] = data.pop("user_id")
-        if "ip_address" in data:
-            data["ipAddress"] = data.pop("ip_address")
-        if "user_agent" in data:
-            data["userAgent"] = data.pop("user_agent")
-        if "resource_id" in data:
-            data["resourceId"] = data.pop("resource_id")
-
-        created_log = await prisma.auditlog.create(data=data)
+        created_log = await prisma.auditlog.create(data=to_audit_record(audit_log))
 
         return create_response(data=created_log, status_code=201)
     except Exception as e:
@@ -165,6 +185,52 @@ async def create_audit_log(audit_log: AuditLogCreate, prisma=Depends(get_prisma)
         raise server_error_exception(f"감사 로그 생성 중 오류가 발생했습니다: {str(e)}")
 
 
+# 감사 로그 일괄 생성 API
+@router.post(
+    "/audit-logs/bulk", status_code=201
+)
+async def create_audit_logs_bulk(payload: AuditLogBulkCreate, prisma=Depends(get_prisma)):
+    """
+    감사 로그를 일괄 생성합니다.
+
+    이벤트별로 검증해 유효한 이벤트만 배치 INSERT 하고, 잘못된 이벤트는 인덱스와 오류를 반환합니다.
+    청크 단위로 저장하므로 중간에 실패하면 일부만 저장된 채 오류를 반환합니다.
+    전송기가 배치를 다시 보내도 이미 저장된 이벤트(같은 id)는 건너뜁니다.
+    accepted 는 실제로 저장된 건수, skipped 는 이미 저장되어 있어 건너뛴 건수입니다.
+    """
+    records = []
+    rejected = []
+    for index, event in enumerate(payload.events):
+        try:
+            records.append(to_audit_record(AuditLogCreate.model_validate(event)))
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            rejected.append({"index": index, "error": errors})
+
+    try:
+        accepted = 0
+        skipped = 0
+        for start in range(0, len(records), BULK_INSERT_CHUNK):
+            chunk = records[start:start + BULK_INSERT_CHUNK]
+            # create_many 는 실제로 INSERT 된 행 수를 반환 (skip_duplicates 로 건너뛴 행 제외)
+            inserted = await prisma.auditlog.create_many(data=chunk, skip_duplicates=True)
+            accepted += inserted
+            skipped += len(chunk) - inserted
+    except Exception as e:
+        logger.error(
+            f"감사 로그 일괄 생성 실패 ({accepted}건 저장, {skipped}건 중복 / 전체 {len(records)}건): {str(e)}"
+        )
+        raise server_error_exception(f"감사 로그 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
+    if rejected:
+        logger.warning(f"감사 로그 일괄 생성: 잘못된 이벤트 {len(rejected)}건 제외")
+
+    return create_response(
+        data={"accepted": accepted, "skipped": skipped, "rejected": rejected},
+        status_code=201,
+    )
+
+
 # 감사 로그 조회 API
 @router.get("/audit-logs")
 async def get_audit_logs(
@@ -215,30 +281,24 @@ async def get_audit_logs(
         elif end_date:
             where["timestamp"] = {"lte": end_date}
 
-        # 총 로그 수 조회
-        total_logs = await prisma.auditlog.count(where=where)
-
         # 페이지네이션 계산
         skip = (page - 1) * page_size
-        total_pages = (total_logs + page_size - 1) // page_size
-
-        # 로그 조회
-        logs = await prisma.auditlog.find_many(
-            where=where,
-            skip=skip,
-            take=page_size,
-            order={"timestamp": "desc"},
-            include={"user": True},
-        )
 
-        # 통계 정보 조회
-        stats = AuditLogStats(
-            info=await prisma.auditlog.count(where={"level": "info", **where}),
-            warning=await prisma.auditlog.count(where={"level": "warning", **where}),
-            error=await prisma.auditlog.count(where={"level": "error", **where}),
-            critical=await prisma.auditlog.count(where={"level": "critical", **where}),
-            total=total_logs,
+        # 레벨별 통계는 group_by 한 번으로 계산하고 합계를 총 개수로 사용 (같은 필터는 캐시)
+        stats_key = ("audit-logs", level, category, service, search_query, start_date, end_date)
+        level_counts, logs = await asyncio.gather(
+            stats_cache.get_or_compute(stats_key, lambda: count_by(prisma, "level", where)),
+            prisma.auditlog.find_many(
+                where=where,
+                skip=skip,
+                take=page_size,
+                order={"timestamp": "desc"},
+                include={"user": True},
+            ),
         )
+        stats = AuditLogStats(**level_summary(level_counts))
+        total_logs = stats.total
+        total_pages = (total_logs + page_size - 1) // page_size
 
         # 응답 구성
         response_data = AuditLogPaginatedResponse(
@@ -276,14 +336,11 @@ async def get_audit_log_statistics(
         if service:
             where["service"] = service.value
 
-        # 레벨별 통계
-        stats = AuditLogStats(
-            info=await prisma.auditlog.count(where={"level": "info", **where}),
-            warning=await prisma.auditlog.count(where={"level": "warning", **where}),
-            error=await prisma.auditlog.count(where={"level": "error", **where}),
-            critical=await prisma.auditlog.count(where={"level": "critical", **where}),
+        # 레벨별 통계 (group_by 1회)
+        level_counts = await stats_cache.get_or_compute(
+            ("statistics", days, service), lambda: count_by(prisma, "level", where)
         )
-        stats.total = stats.info + stats.warning + stats.error + stats.critical
+        stats = AuditLogStats(**level_summary(level_counts))
 
         return create_response(data=stats)
     except Exception as e:
@@ -294,100 +351,59 @@ async def get_audit_log_statistics(
 # 감사 로그 내보내기 API (정적 경로)
 @router.get("/audit-logs/export")
 async def export_audit_logs(
-    format: str = Query(..., description="내보내기 형식 (csv 또는 json)"),
+    format: str = Query(..., description="내보내기 형식 (csv, json 또는 ndjson)"),
     level: Optional[AuditLogLevel] = None,
     category: Optional[AuditCategory] = None,
     service: Optional[ServiceType] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    compress: bool = Query(False, description="gzip 압축 여부"),
     prisma=Depends(get_prisma),
 ):
     """
-    감사 로그를 CSV 또는 JSON 형식으로 내보냅니다.
-    """
-    try:
-        if format.lower() not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=422,
-                detail="지원하지 않는 내보내기 형식입니다. 'csv' 또는 'json'을 사용하세요."
-            )
-
-        # 필터 조건 구성
-        where: Dict[str, Any] = {}
+    감사 로그를 CSV, JSON 또는 NDJSON 형식으로 스트리밍 내보냅니다.
 
-        if level:
-            where["level"] = level
-        if category:
-            where["category"] = category
-        if service:
-            where["service"] = service.value
-        if start_date and end_date:
-            where["timestamp"] = {"gte": start_date, "lte": end_date}
-
-        # 로그 조회 (최대 10,000개)
-        logs = await prisma.auditlog.find_many(
-            where=where,
-            order={"timestamp": "desc"},
-            take=10000
+    (timestamp, id) 키셋 커서로 페이지 단위로 읽어 바로 전송하므로 기간에 관계없이 메모리 사용량이 일정합니다.
+    """
+    export_format = format.lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=422,
+            detail="지원하지 않는 내보내기 형식입니다. 'csv', 'json' 또는 'ndjson'을 사용하세요."
         )
 
-        if format.lower() == "csv":
-            import csv
-            import io
-
-            output = io.StringIO()
-            writer = csv.writer(output)
-
-            # 헤더 작성
-            writer.writerow([
-                "ID", "타임스탬프", "레벨", "서비스", "카테고리", "메시지",
-                "사용자ID", "IP주소", "작업", "리소스", "성공"
-            ])
-
-            # 데이터 작성
-            for log in logs:
-                writer.writerow([
-                    log.id, log.timestamp, log.level, log.service, log.category,
-                    log.message, log.userId, log.ipAddress, log.action,
-                    log.resource, log.success
-                ])
-
-            return Response(
-                content=output.getvalue(),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename=audit_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
-            )
-        else:  # json
-            logs_data = []
-            for log in logs:
-                logs_data.append({
-                    "id": log.id,
-                    "timestamp": log.timestamp.isoformat() if log.timestamp else None,
-                    "level": log.level,
-                    "service": log.service,
-                    "category": log.category,
-                    "message": log.message,
-                    "user_id": log.userId,
-                    "ip_address": log.ipAddress,
-                    "action": log.action,
-                    "resource": log.resource,
-                    "success": log.success
-                })
-
-            return Response(
-                content=json.dumps(logs_data, ensure_ascii=False),
-                media_type="application/json",
-                headers={"Content-Disposition": f"attachment; filename=audit_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"}
-            )
-
-    except ApiException as e:
-        # shared의 ApiException을 HTTPException으로 변환
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"감사 로그 내보내기 실패: {str(e)}")
-        raise server_error_exception(f"감사 로그 내보내기 중 오류가 발생했습니다: {str(e)}")
+    # 필터 조건 구성
+    where: Dict[str, Any] = {}
+
+    if level:
+        where["level"] = level
+    if category:
+        where["category"] = category
+    if service:
+        where["service"] = service.value
+    if start_date and end_date:
+        where["timestamp"] = {"gte": start_date, "lte": end_date}
+    elif start_date:
+        where["timestamp"] = {"gte": start_date}
+    elif end_date:
+        where["timestamp"] = {"lte": end_date}
+
+    async def body():
+        try:
+            async for chunk in stream_audit_export(prisma, where, export_format, compress):
+                yield chunk
+        except Exception as e:
+            # 응답 헤더를 이미 보냈으므로 상태 코드를 바꿀 수 없음 (연결 종료로 불완전한 파일임을 알림)
+            logger.error(f"감사 로그 내보내기 실패: {str(e)}")
+            raise
+
+    media_type = "application/gzip" if compress else EXPORT_FORMATS[export_format][0]
+    filename = export_filename(export_format, compress, datetime.now())
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 
 # 특정 감사 로그 조회 API (동적 경로는 나중에 정의)
@@ -427,55 +443,17 @@ async def get_dashboard_stats(
     대시보드에 표시할 통계 정보를 조회합니다.
     """
     try:
-        # 기간 설정
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        where: Dict[str, Any] = {"timestamp": {"gte": start_date, "lte": end_date}}
-
-        if service:
-            where["service"] = service.value
-
-        # 레벨별 통계
-        stats = AuditLogStats(
-            info=await prisma.auditlog.count(where={"level": "info", **where}),
-            warning=await prisma.auditlog.count(where={"level": "warning", **where}),
-            error=await prisma.auditlog.count(where={"level": "error", **where}),
-            critical=await prisma.auditlog.count(where={"level": "critical", **where}),
+        service_value = service.value if service else None
+        dashboard_data = await stats_cache.get_or_compute(
+            ("dashboard", days, service_value),
+            lambda: compute_dashboard_stats(
+                prisma,
+                days,
+                service_value,
+                [service_type.value for service_type in ServiceType],
+                [category_type.value for category_type in AuditCategory],
+            ),
         )
-        stats.total = stats.info + stats.warning + stats.error + stats.critical
-
-        # 최근 오류들
-        recent_errors = await prisma.auditlog.find_many(
-            where={"level": {"in": ["error", "critical"]}, **where},
-            take=10,
-            order={"timestamp": "desc"}
-        )
-
-        # 서비스별 활동
-        activity_by_service = {}
-        for service_type in ServiceType:
-            count = await prisma.auditlog.count(
-                where={"service": service_type.value, **where}
-            )
-            activity_by_service[service_type.value] = count
-
-        # 카테고리별 활동
-        activity_by_category = {}
-        for category_type in AuditCategory:
-            count = await prisma.auditlog.count(
-                where={"category": category_type.value, **where}
-            )
-            activity_by_category[category_type.value] = count
-
-        dashboard_data = {
-            "audit_log_summary": stats,
-            "recent_errors": recent_errors,
-            "activity_by_service": activity_by_service,
-            "activity_by_category": activity_by_category,
-            "failure_rate": 0.0,  # 간단한 구현
-            "average_actions_per_day": stats.total / days if days > 0 else 0
-        }
 
         return create_response(data=dashboard_data)
     except Exception as e:
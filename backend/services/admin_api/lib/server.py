@@ -8,6 +8,7 @@ from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -15,9 +16,11 @@ from contextlib import asynccontextmanager
 from shared.utils.logging_utils import setup_logger
 from shared.utils.response_utils import ApiException, ErrorResponse
 from shared.config.settings import get_settings
+from shared.utils.server_launcher import default_response_class
 
 # 라우터 임포트
 from .routes import audit
+from .services.audit_partitions import maintenance_loop
 
 # 환경 설정 로드
 settings = get_settings()
@@ -53,6 +56,7 @@ async def lifespan(app: FastAPI):
 
     # Prisma 클라이언트 초기화 및 연결
     global prisma
+    maintenance_task = None
     try:
         # 실제 Prisma 모듈 임포트 시도
         from prisma import Prisma
@@ -60,6 +64,9 @@ async def lifespan(app: FastAPI):
         prisma = Prisma()
         await prisma.connect()
         logger.info("Prisma 데이터베이스 연결 성공")
+
+        # 감사 로그 파티션 생성/보관 정책 주기 실행
+        maintenance_task = asyncio.create_task(maintenance_loop(prisma))
     except ImportError:
         # Prisma 모듈을 임포트할 수 없는 경우
         logger.error(
@@ -78,6 +85,13 @@ async def lifespan(app: FastAPI):
     yield
 
     # 앱 종료 시 실행될 코드
+    if maintenance_task:
+        maintenance_task.cancel()
+        try:
+            await maintenance_task
+        except asyncio.CancelledError:
+            pass
+
     # Prisma 클라이언트 연결 해제
     try:
         if prisma:
@@ -94,6 +108,7 @@ app = FastAPI(
     title="Admin API",
     description="시스템 관리를 위한 Admin API",
     version="1.0.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
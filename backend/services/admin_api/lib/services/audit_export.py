@@ -0,0 +1,166 @@
+"""
+감사 로그 스트리밍 내보내기
+
+(timestamp, id) 키셋 커서로 감사 로그를 페이지 단위로 읽으면서 CSV/JSON/NDJSON 청크를 바로 내보냅니다.
+OFFSET 없이 마지막 행 다음부터 읽으므로 페이지마다 조회 비용이 같고,
+메모리에는 한 페이지만 유지되어 내보내기 크기와 관계없이 사용량이 일정합니다.
+compress 를 켜면 청크를 gzip 으로 바로 압축해 보냅니다.
+"""
+import csv
+import io
+import json
+import zlib
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+# 한 번에 읽을 행 수
+EXPORT_PAGE_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "json": ("application/json", "json"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+CSV_HEADER = [
+    "ID", "타임스탬프", "레벨", "서비스", "카테고리", "메시지",
+    "사용자ID", "IP주소", "작업", "리소스", "성공"
+]
+
+
+def _keyset_where(where: Dict[str, Any], last: Optional[Any]) -> Dict[str, Any]:
+    """마지막으로 읽은 행 다음(더 오래된 행)만 조회하는 조건"""
+    if last is None:
+        return where
+    after = {
+        "OR": [
+            {"timestamp": {"lt": last.timestamp}},
+            {"timestamp": last.timestamp, "id": {"lt": last.id}},
+        ]
+    }
+    return {"AND": [where, after]} if where else after
+
+
+async def iter_audit_logs(
+    prisma, where: Dict[str, Any], page_size: int = EXPORT_PAGE_SIZE
+) -> AsyncIterator[List[Any]]:
+    """
+    감사 로그를 최신순으로 페이지 단위 조회 (키셋 페이지네이션)
+
+    Args:
+        prisma: Prisma 클라이언트
+        where: 필터 조건
+        page_size: 페이지 크기
+
+    Yields:
+        감사 로그 페이지
+    """
+    last = None
+    while True:
+        page = await prisma.auditlog.find_many(
+            where=_keyset_where(where, last),
+            order=[{"timestamp": "desc"}, {"id": "desc"}],
+            take=page_size,
+        )
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        last = page[-1]
+
+
+def _csv_row(log: Any) -> List[Any]:
+    return [
+        log.id, log.timestamp, log.level, log.service, log.category,
+        log.message, log.userId, log.ipAddress, log.action,
+        log.resource, log.success
+    ]
+
+
+def _json_row(log: Any) -> Dict[str, Any]:
+    return {
+        "id": log.id,
+        "timestamp": log.timestamp.isoformat() if log.timestamp else None,
+        "level": log.level,
+        "service": log.service,
+        "category": log.category,
+        "message": log.message,
+        "user_id": log.userId,
+        "ip_address": log.ipAddress,
+        "action": log.action,
+        "resource": log.resource,
+        "success": log.success
+    }
+
+
+def _encode_page(format: str, page: List[Any], first: bool) -> str:
+    """한 페이지를 형식에 맞는 텍스트 청크로 변환"""
+    if format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if first:
+            writer.writerow(CSV_HEADER)
+        writer.writerows(_csv_row(log) for log in page)
+        return buffer.getvalue()
+
+    lines = (json.dumps(_json_row(log), ensure_ascii=False) for log in page)
+    if format == "ndjson":
+        return "".join(f"{line}\n" for line in lines)
+    # json: 배열을 나눠서 전송 ("[" + 항목들 + "]")
+    body = ",\n".join(lines)
+    return ("[\n" if first else ",\n") + body
+
+
+async def stream_audit_export(
+    prisma,
+    where: Dict[str, Any],
+    format: str,
+    compress: bool = False,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    감사 로그 내보내기 본문 스트림
+
+    Args:
+        prisma: Prisma 클라이언트
+        where: 필터 조건
+        format: csv, json, ndjson
+        compress: gzip 압축 여부
+        page_size: 페이지 크기
+
+    Yields:
+        응답 본문 청크
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+
+    def encode(text: str) -> bytes:
+        data = text.encode("utf-8")
+        if compressor is None:
+            return data
+        # 페이지마다 동기화 flush 해서 클라이언트가 바로 받을 수 있게 함
+        return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    first = True
+    async for page in iter_audit_logs(prisma, where, page_size):
+        chunk = encode(_encode_page(format, page, first))
+        first = False
+        if chunk:
+            yield chunk
+
+    tail = ""
+    if format == "csv" and first:
+        tail = _encode_page(format, [], True)
+    elif format == "json":
+        tail = "[]" if first else "\n]"
+    chunk = encode(tail) if tail else b""
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+
+def export_filename(format: str, compress: bool, now: Any) -> str:
+    """내보내기 파일 이름"""
+    extension = EXPORT_FORMATS[format][1]
+    suffix = ".gz" if compress else ""
+    return f"audit_logs_{now.strftime('%Y%m%d_%H%M%S')}.{extension}{suffix}"
@@ -0,0 +1,467 @@
+"""
+감사 로그 월 파티션 관리
+
+"AuditLog" 테이블을 timestamp 기준 월별 RANGE 파티션으로 운영합니다.
+- 파티션 이름: AuditLog_pYYYY_MM (해당 월 1일 00:00 이상, 다음 달 1일 미만)
+- DEFAULT 파티션(AuditLog_default): 월 파티션이 없는 시각(클라이언트 지정 시각, 재전송, 시계 오차 등)의 행을 받아
+  적재가 실패하지 않게 하고, 해당 월 파티션을 만들 때 그 월의 행을 새 파티션으로 옮깁니다.
+- ensure_partitions: 이번 달부터 앞으로 몇 달치 파티션을 미리 생성
+- apply_retention: 보관 기간이 지난 파티션을 분리(DETACH)해 압축 파일로 아카이브한 뒤 삭제
+  (이미 아카이브한 월에 늦게 들어온 행은 번호를 붙인 새 파일로 아카이브하며, 기존 아카이브는 덮어쓰지 않음)
+- 조회 라우팅: timestamp 범위 조건이 있는 쿼리(목록 필터, 통계, 내보내기)는 PostgreSQL 파티션 프루닝으로
+  해당 월 파티션만 읽고, 범위 없는 최신순 목록은 파티션별 (timestamp, id) 인덱스를 병합하며 LIMIT 에서 멈춥니다.
+- 관리 작업은 advisory lock 으로 한 프로세스(워커)만 실행합니다.
+
+Prisma 는 파티션 테이블을 모델링하지 않으므로 전환은 convert_statements() 의 SQL 로 한 번 수행하며,
+전환 후 "AuditLog" 에 prisma db push/migrate 를 적용하지 않아야 합니다.
+(파티션 테이블의 기본 키는 파티션 키를 포함해야 하므로 (id, timestamp) 입니다.)
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import asyncpg
+
+from shared.config.settings import get_settings
+
+logger = logging.getLogger("admin-api:audit-partitions")
+
+AUDIT_TABLE = "AuditLog"
+PARTITION_PREFIX = f"{AUDIT_TABLE}_p"
+DEFAULT_PARTITION = f"{AUDIT_TABLE}_default"
+# 파티션 관리 advisory lock 키 (여러 워커/인스턴스 중 한 곳만 생성/분리/아카이브)
+MAINTENANCE_LOCK_KEY = 0x4155_4449_5450
+# asyncpg 가 모르는 Prisma 전용 연결 문자열 옵션
+PRISMA_URL_PARAMS = {"schema", "connection_limit", "pool_timeout", "pgbouncer", "socket_timeout", "statement_cache_size"}
+# 아카이브할 때 한 번에 읽을 행 수
+ARCHIVE_PAGE_SIZE = 5000
+
+
+def month_start(value: Any) -> date:
+    """해당 시각이 속한 달의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """월 단위 덧셈 (결과는 해당 달의 1일)"""
+    index = month.year * 12 + (month.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 파티션 테이블 이름"""
+    return f"{PARTITION_PREFIX}{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """파티션 테이블 이름에서 월 추출 (형식이 다르면 None)"""
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        year, month = name[len(PARTITION_PREFIX):].split("_")
+        return date(int(year), int(month), 1)
+    except ValueError:
+        return None
+
+
+def months_between(start: Any, end: Any) -> List[date]:
+    """start ~ end 기간이 걸치는 월 목록 (조회 시 읽게 되는 파티션)"""
+    months = []
+    month = month_start(start)
+    last = month_start(end)
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def _create_partition_sql(month: date) -> str:
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF "{AUDIT_TABLE}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def _create_default_partition_sql() -> str:
+    return f'CREATE TABLE IF NOT EXISTS "{DEFAULT_PARTITION}" PARTITION OF "{AUDIT_TABLE}" DEFAULT'
+
+
+def convert_statements(first_month: date, last_month: date) -> List[str]:
+    """
+    기존 "AuditLog" 테이블을 월 파티션 테이블로 전환하는 SQL (유지보수 시간에 한 번 실행)
+
+    Args:
+        first_month: 기존 데이터의 가장 오래된 월
+        last_month: 미리 만들 가장 최근 월
+
+    Returns:
+        순서대로 실행할 SQL 문 목록
+    """
+    legacy = f"{AUDIT_TABLE}_legacy"
+    statements = [
+        f'ALTER TABLE "{AUDIT_TABLE}" RENAME TO "{legacy}"',
+        f'ALTER TABLE "{legacy}" RENAME CONSTRAINT "{AUDIT_TABLE}_pkey" TO "{legacy}_pkey"',
+        f'CREATE TABLE "{AUDIT_TABLE}" (LIKE "{legacy}" INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")',
+        f'ALTER TABLE "{AUDIT_TABLE}" ADD PRIMARY KEY ("id", "timestamp")',
+    ]
+    statements += [_create_partition_sql(month) for month in months_between(first_month, last_month)]
+    statements += [
+        _create_default_partition_sql(),
+        f'INSERT INTO "{AUDIT_TABLE}" SELECT * FROM "{legacy}"',
+        # 기존 인덱스 이름과 겹치지 않도록 기존 테이블을 먼저 삭제
+        f'DROP TABLE "{legacy}"',
+        f'ALTER TABLE "{AUDIT_TABLE}" ADD CONSTRAINT "{AUDIT_TABLE}_userId_fkey" '
+        f'FOREIGN KEY ("userId") REFERENCES "User"("id") ON DELETE RESTRICT ON UPDATE CASCADE',
+        # 부모 테이블에 만든 인덱스는 모든 파티션에 자동으로 생성됨
+        f'CREATE INDEX IF NOT EXISTS "{AUDIT_TABLE}_timestamp_id_idx" ON "{AUDIT_TABLE}" ("timestamp", "id")',
+        f'CREATE INDEX IF NOT EXISTS "{AUDIT_TABLE}_userId_timestamp_idx" ON "{AUDIT_TABLE}" ("userId", "timestamp")',
+        f'CREATE INDEX IF NOT EXISTS "{AUDIT_TABLE}_resource_resourceId_idx" ON "{AUDIT_TABLE}" ("resource", "resourceId")',
+        # message contains(LIKE '%..%') 검색용 트라이그램 인덱스
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f'CREATE INDEX IF NOT EXISTS "{AUDIT_TABLE}_message_trgm_idx" ON "{AUDIT_TABLE}" USING gin ("message" gin_trgm_ops)',
+    ]
+    return statements
+
+
+async def is_partitioned(prisma) -> bool:
+    """"AuditLog" 가 파티션 테이블인지 확인"""
+    rows = await prisma.query_raw(
+        "SELECT c.relkind::text AS kind FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = current_schema() AND c.relname = $1",
+        AUDIT_TABLE,
+    )
+    return bool(rows) and rows[0]["kind"] == "p"
+
+
+async def list_partitions(prisma) -> List[Tuple[date, str]]:
+    """연결된 월 파티션 목록 (오래된 순)"""
+    rows = await prisma.query_raw(
+        "SELECT child.relname AS name FROM pg_inherits i "
+        "JOIN pg_class parent ON parent.oid = i.inhparent "
+        "JOIN pg_class child ON child.oid = i.inhrelid "
+        "JOIN pg_namespace n ON n.oid = parent.relnamespace "
+        "WHERE n.nspname = current_schema() AND parent.relname = $1",
+        AUDIT_TABLE,
+    )
+    partitions = [(partition_month(row["name"]), row["name"]) for row in rows]
+    return sorted((month, name) for month, name in partitions if month is not None)
+
+
+async def list_detached(prisma) -> List[Tuple[date, str]]:
+    """분리됐지만 아직 아카이브/삭제되지 않은 파티션 (아카이브 도중 중단된 경우)"""
+    rows = await prisma.query_raw(
+        "SELECT c.relname AS name FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = current_schema() AND c.relkind = 'r' AND c.relname LIKE $1 "
+        "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)",
+        f"{PARTITION_PREFIX}%",
+    )
+    partitions = [(partition_month(row["name"]), row["name"]) for row in rows]
+    return sorted((month, name) for month, name in partitions if month is not None)
+
+
+async def create_partition(prisma, month: date) -> bool:
+    """
+    월 파티션 생성 (이미 있으면 건너뜀)
+
+    DEFAULT 파티션에 해당 월 행이 있으면 파티션을 만들 수 없으므로
+    같은 트랜잭션에서 그 행들을 꺼내 두었다가 새 파티션에 다시 넣습니다.
+
+    Returns:
+        새로 만들었는지 여부
+    """
+    name = partition_name(month)
+    async with prisma.tx() as tx:
+        rows = await tx.query_raw(
+            "SELECT to_regclass($1) IS NOT NULL AS partition, to_regclass($2) IS NOT NULL AS has_default",
+            f'"{name}"',
+            f'"{DEFAULT_PARTITION}"',
+        )
+        if rows[0]["partition"]:
+            return False
+        moved = 0
+        if rows[0]["has_default"]:
+            await tx.execute_raw(
+                f'CREATE TEMP TABLE "audit_default_moved" (LIKE "{AUDIT_TABLE}") ON COMMIT DROP'
+            )
+            moved = await tx.execute_raw(
+                f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+                f'WHERE "timestamp" >= $1::timestamp AND "timestamp" < $2::timestamp RETURNING *) '
+                f'INSERT INTO "audit_default_moved" SELECT * FROM moved',
+                month.isoformat(),
+                add_months(month, 1).isoformat(),
+            )
+        await tx.execute_raw(_create_partition_sql(month))
+        if moved:
+            await tx.execute_raw(f'INSERT INTO "{AUDIT_TABLE}" SELECT * FROM "audit_default_moved"')
+            logger.info(f"DEFAULT 파티션의 {month:%Y-%m} 감사 로그 {moved}행을 {name} 로 옮겼습니다.")
+    return True
+
+
+async def ensure_partitions(prisma, now: Optional[datetime] = None, months_ahead: int = 2) -> List[str]:
+    """
+    DEFAULT 파티션과 이번 달부터 months_ahead 달 뒤까지의 파티션 생성 (이미 있으면 건너뜀)
+
+    DEFAULT 파티션에 쌓인 지난 달 행도 해당 월 파티션을 만들어 옮깁니다.
+    (보관 기간이 지난 월이면 이어지는 apply_retention 에서 아카이브됨)
+
+    Returns:
+        확인한 파티션 이름 목록
+    """
+    current = month_start(now or datetime.now())
+    await prisma.execute_raw(_create_default_partition_sql())
+    rows = await prisma.query_raw(
+        f'SELECT DISTINCT date_trunc(\'month\', "timestamp") AS month FROM "{DEFAULT_PARTITION}" '
+        f'WHERE "timestamp" < $1::timestamp',
+        current.isoformat(),
+    )
+    past = sorted({month_start(datetime.fromisoformat(str(row["month"]).replace("Z", "+00:00"))) for row in rows})
+
+    names = []
+    for month in past + [add_months(current, offset) for offset in range(months_ahead + 1)]:
+        await create_partition(prisma, month)
+        names.append(partition_name(month))
+    return names
+
+
+def _archive_path(archive_dir: str, month: date, fmt: str, sequence: int = 1) -> str:
+    extension = "parquet" if fmt == "parquet" else "ndjson.gz"
+    suffix = f".{sequence}" if sequence > 1 else ""
+    return os.path.join(archive_dir, f"audit_log_{month.year:04d}_{month.month:02d}{suffix}.{extension}")
+
+
+def _next_archive_path(archive_dir: str, month: date, fmt: str) -> Tuple[str, int]:
+    """아직 쓰지 않은 아카이브 경로와 번호 (같은 월의 첫 아카이브는 번호 없음)"""
+    sequence = 1
+    while True:
+        path = _archive_path(archive_dir, month, fmt, sequence)
+        if not os.path.exists(path) and not os.path.exists(f"{path}.manifest.json"):
+            return path, sequence
+        sequence += 1
+
+
+def _publish_archive(temp_path: str, path: str) -> None:
+    """임시 파일을 아카이브 경로로 옮김 (같은 이름의 파일이 있으면 덮어쓰지 않고 FileExistsError)"""
+    os.link(temp_path, path)
+    os.remove(temp_path)
+
+
+class _NdjsonArchiveWriter:
+    """gzip 압축 NDJSON 아카이브 파일 작성기"""
+
+    def __init__(self, path: str):
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetArchiveWriter:
+    """Parquet 아카이브 파일 작성기 (pyarrow 필요)"""
+
+    def __init__(self, path: str):
+        import pyarrow.parquet as pq
+
+        self._pq = pq
+        self._path = path
+        self._writer = None
+        self._schema = None
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        import pyarrow as pa
+
+        if self._writer is None:
+            inferred = pa.Table.from_pylist(rows).schema
+            # 첫 페이지에서 모두 NULL 인 컬럼은 문자열로 저장
+            self._schema = pa.schema(
+                [field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in inferred]
+            )
+            self._writer = self._pq.ParquetWriter(self._path, self._schema, compression="zstd")
+        self._writer.write_table(pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _open_archive_writer(path: str, fmt: str):
+    if fmt == "parquet":
+        try:
+            return _ParquetArchiveWriter(path)
+        except ImportError:
+            raise RuntimeError("Parquet 아카이브에는 pyarrow 패키지가 필요합니다.")
+    return _NdjsonArchiveWriter(path)
+
+
+async def archive_partition(
+    prisma, month: date, archive_dir: str, fmt: str = "ndjson", detached: bool = False
+) -> Dict[str, Any]:
+    """
+    월 파티션을 분리해 아카이브 파일로 내보낸 뒤 삭제
+
+    Args:
+        prisma: Prisma 클라이언트
+        month: 파티션 월
+        archive_dir: 아카이브 디렉터리
+        fmt: ndjson(gzip) 또는 parquet
+        detached: 이미 분리된 파티션인지 여부
+
+    Returns:
+        아카이브 정보 (manifest 파일에도 저장)
+    """
+    name = partition_name(month)
+    if not detached:
+        # 분리 이후에는 일반 테이블이 되어 조회 대상에서 빠짐
+        # DEFAULT 파티션이 있으면 CONCURRENTLY 를 쓸 수 없으므로 일반 DETACH 사용
+        # (부모 테이블에 ACCESS EXCLUSIVE 잠금, 카탈로그만 바꾸므로 잠금 시간은 짧음)
+        await prisma.execute_raw(f'ALTER TABLE "{AUDIT_TABLE}" DETACH PARTITION "{name}"')
+
+    os.makedirs(archive_dir, exist_ok=True)
+    path, sequence = _next_archive_path(archive_dir, month, fmt)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    writer = await asyncio.to_thread(_open_archive_writer, temp_path, fmt)
+
+    rows_written = 0
+    last: Optional[Tuple[Any, Any]] = None
+    try:
+        while True:
+            # (timestamp, id) 키셋으로 한 페이지씩 읽어 메모리 사용량을 일정하게 유지
+            if last is None:
+                page = await prisma.query_raw(
+                    f'SELECT * FROM "{name}" ORDER BY "timestamp", "id" LIMIT {ARCHIVE_PAGE_SIZE}'
+                )
+            else:
+                page = await prisma.query_raw(
+                    f'SELECT * FROM "{name}" WHERE ("timestamp", "id") > ($1::timestamp, $2) '
+                    f'ORDER BY "timestamp", "id" LIMIT {ARCHIVE_PAGE_SIZE}',
+                    *last,
+                )
+            if not page:
+                break
+            await asyncio.to_thread(writer.write, page)
+            rows_written += len(page)
+            last = (page[-1]["timestamp"], page[-1]["id"])
+            if len(page) < ARCHIVE_PAGE_SIZE:
+                break
+    finally:
+        await asyncio.to_thread(writer.close)
+
+    counted = await prisma.query_raw(f'SELECT count(*)::int AS count FROM "{name}"')
+    if counted[0]["count"] != rows_written:
+        os.remove(temp_path)
+        raise RuntimeError(f"{name} 아카이브 행 수 불일치 ({rows_written}/{counted[0]['count']})")
+
+    await asyncio.to_thread(_publish_archive, temp_path, path)
+    manifest = {
+        "partition": name,
+        "month": month.isoformat(),
+        "sequence": sequence,
+        "rows": rows_written,
+        "format": fmt,
+        "file": os.path.basename(path),
+        "archived_at": datetime.now().isoformat(),
+    }
+    with open(f"{path}.manifest.json", "x", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+
+    await prisma.execute_raw(f'DROP TABLE "{name}"')
+    logger.info(f"감사 로그 파티션 {name} 아카이브 완료 ({rows_written}행 -> {path})")
+    return manifest
+
+
+async def apply_retention(
+    prisma,
+    retention_months: Optional[int] = None,
+    archive_dir: Optional[str] = None,
+    fmt: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    보관 기간이 지난 월 파티션을 아카이브 (이번 달 포함 retention_months 개월만 DB 에 유지)
+
+    Returns:
+        아카이브한 파티션 정보 목록
+    """
+    settings = get_settings()
+    retention_months = retention_months or settings.audit_retention_months
+    archive_dir = archive_dir or settings.audit_archive_dir
+    fmt = fmt or settings.audit_archive_format
+    cutoff = add_months(month_start(now or datetime.now()), -(retention_months - 1))
+
+    archived = []
+    # 이전 실행에서 분리만 되고 끝나지 않은 파티션부터 처리
+    for month, _ in await list_detached(prisma):
+        if month < cutoff:
+            archived.append(await archive_partition(prisma, month, archive_dir, fmt, detached=True))
+    for month, _ in await list_partitions(prisma):
+        if month < cutoff:
+            archived.append(await archive_partition(prisma, month, archive_dir, fmt))
+    return archived
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    """Prisma 연결 문자열에서 asyncpg 가 모르는 옵션 제거"""
+    parts = urlsplit(database_url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key not in PRISMA_URL_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+@asynccontextmanager
+async def maintenance_lock(database_url: Optional[str] = None) -> AsyncIterator[bool]:
+    """
+    파티션 관리 advisory lock (다른 프로세스가 잡고 있으면 False)
+
+    Prisma 는 요청마다 풀의 다른 연결을 쓸 수 있어 세션 잠금을 풀 연결에서 잡지 않고,
+    관리 작업 동안 유지하는 전용 연결에서 잡습니다. (연결이 끊기면 잠금도 풀림)
+    """
+    connection = await asyncpg.connect(_asyncpg_dsn(database_url or get_settings().database_url))
+    try:
+        acquired = await connection.fetchval("SELECT pg_try_advisory_lock($1)", MAINTENANCE_LOCK_KEY)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await connection.execute("SELECT pg_advisory_unlock($1)", MAINTENANCE_LOCK_KEY)
+    finally:
+        await connection.close()
+
+
+async def run_maintenance(prisma, database_url: Optional[str] = None) -> bool:
+    """
+    파티션 생성과 보관 정책 적용 (파티션 테이블이 아니면 건너뜀)
+
+    Returns:
+        실행 여부 (다른 프로세스가 관리 중이면 False)
+    """
+    if not await is_partitioned(prisma):
+        logger.warning(f'"{AUDIT_TABLE}" 가 파티션 테이블이 아니므로 파티션 관리를 건너뜁니다.')
+        return False
+    async with maintenance_lock(database_url) as acquired:
+        if not acquired:
+            logger.info("다른 프로세스가 감사 로그 파티션 관리를 실행 중이므로 건너뜁니다.")
+            return False
+        await ensure_partitions(prisma)
+        await apply_retention(prisma)
+    return True
+
+
+async def maintenance_loop(prisma, interval: float = 6 * 3600) -> None:
+    """주기적으로 파티션 관리 실행 (앱 수명 동안 백그라운드 작업으로 실행)"""
+    while True:
+        try:
+            await run_maintenance(prisma)
+        except Exception as e:
+            logger.error(f"감사 로그 파티션 관리 실패: {str(e)}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,193 @@
+"""
+감사 로그 집계 서비스
+
+차원(레벨, 서비스, 카테고리, 성공 여부)마다 group_by 쿼리 한 번으로 개수를 구하고,
+일별 활동과 상위 사용자/리소스는 GROUP BY ... LIMIT 원시 쿼리로 계산합니다.
+독립적인 쿼리는 동시에 실행하고, 결과는 짧은 TTL 캐시에 보관합니다.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# 집계 결과 캐시 만료 시간(초)
+STATS_CACHE_TTL = 30.0
+TOP_N = 10
+
+AUDIT_LEVELS = ("info", "warning", "error", "critical")
+
+# 감사 로그 테이블 (Prisma 모델 AuditLog)
+AUDIT_TABLE = '"AuditLog"'
+
+
+class StatsCache:
+    """짧은 TTL 집계 캐시 (같은 키의 동시 계산은 한 번만 실행)"""
+
+    def __init__(self, ttl: float = STATS_CACHE_TTL, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        value = await asyncio.shield(task)
+
+        if len(self._data) >= self.maxsize:
+            now = time.monotonic()
+            self._data = {k: v for k, v in self._data.items() if v[0] > now}
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+
+stats_cache = StatsCache()
+
+
+def _group_count(row: Any) -> int:
+    """group_by 결과의 _count 값 (count=True 이면 {'_all': n})"""
+    count = row.get("_count") if isinstance(row, dict) else getattr(row, "_count", None)
+    if isinstance(count, dict):
+        return int(count.get("_all", 0))
+    return int(count or 0)
+
+
+async def count_by(prisma, field: str, where: Dict[str, Any]) -> Dict[str, int]:
+    """
+    한 차원의 값별 개수 (group_by 쿼리 1회)
+
+    Args:
+        prisma: Prisma 클라이언트
+        field: 그룹화할 필드
+        where: 필터 조건
+
+    Returns:
+        값 -> 개수 (값이 없는 행은 키 None)
+    """
+    rows = await prisma.auditlog.group_by(by=[field], where=where, count=True)
+    counts: Dict[str, int] = {}
+    for row in rows:
+        value = row.get(field) if isinstance(row, dict) else getattr(row, field, None)
+        counts[value] = counts.get(value, 0) + _group_count(row)
+    return counts
+
+
+def level_summary(level_counts: Dict[str, int]) -> Dict[str, int]:
+    """레벨별 개수로 AuditLogStats 필드 구성 (합계는 모든 그룹의 합)"""
+    summary = {level: level_counts.get(level, 0) for level in AUDIT_LEVELS}
+    summary["total"] = sum(level_counts.values())
+    return summary
+
+
+def _time_filter_sql(start_date: datetime, end_date: datetime, service: Optional[str]) -> Tuple[str, List[Any]]:
+    clauses = ['"timestamp" >= $1', '"timestamp" <= $2']
+    params: List[Any] = [start_date, end_date]
+    if service:
+        params.append(service)
+        clauses.append(f'"service" = ${len(params)}')
+    return " AND ".join(clauses), params
+
+
+async def _activity_by_day(prisma, start_date: datetime, end_date: datetime, service: Optional[str]) -> Dict[str, int]:
+    """일별 활동 수 (기간 내 모든 날짜 포함, 활동이 없는 날은 0)"""
+    condition, params = _time_filter_sql(start_date, end_date, service)
+    rows = await prisma.query_raw(
+        f'SELECT to_char(date_trunc(\'day\', "timestamp"), \'YYYY-MM-DD\') AS day, count(*)::int AS count '
+        f"FROM {AUDIT_TABLE} WHERE {condition} GROUP BY 1",
+        *params,
+    )
+    by_day = {row["day"]: int(row["count"]) for row in rows}
+
+    activity: Dict[str, int] = {}
+    day = start_date.date()
+    while day <= end_date.date():
+        key = day.isoformat()
+        activity[key] = by_day.get(key, 0)
+        day += timedelta(days=1)
+    return activity
+
+
+async def _top(
+    prisma, column: str, start_date: datetime, end_date: datetime, service: Optional[str]
+) -> List[Dict[str, Any]]:
+    """상위 N개 값과 개수 (DB 에서 정렬/제한)"""
+    condition, params = _time_filter_sql(start_date, end_date, service)
+    return await prisma.query_raw(
+        f'SELECT "{column}" AS key, count(*)::int AS count FROM {AUDIT_TABLE} '
+        f'WHERE {condition} AND "{column}" IS NOT NULL '
+        f"GROUP BY 1 ORDER BY 2 DESC LIMIT {TOP_N}",
+        *params,
+    )
+
+
+async def compute_dashboard_stats(
+    prisma, days: int, service: Optional[str], service_types: List[str], categories: List[str]
+) -> Dict[str, Any]:
+    """
+    대시보드 통계 계산 (쿼리를 동시에 실행)
+
+    Args:
+        prisma: Prisma 클라이언트
+        days: 조회 기간(일)
+        service: 서비스 필터
+        service_types: 결과에 항상 포함할 서비스 목록
+        categories: 결과에 항상 포함할 카테고리 목록
+
+    Returns:
+        DashboardStats 필드 사전
+    """
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    where: Dict[str, Any] = {"timestamp": {"gte": start_date, "lte": end_date}}
+    if service:
+        where["service"] = service
+
+    (
+        level_counts,
+        service_counts,
+        category_counts,
+        success_counts,
+        recent_errors,
+        activity_by_day,
+        top_users,
+        top_resources,
+    ) = await asyncio.gather(
+        count_by(prisma, "level", where),
+        count_by(prisma, "service", where),
+        count_by(prisma, "category", where),
+        count_by(prisma, "success", where),
+        prisma.auditlog.find_many(
+            where={"level": {"in": ["error", "critical"]}, **where},
+            take=10,
+            order={"timestamp": "desc"},
+        ),
+        _activity_by_day(prisma, start_date, end_date, service),
+        _top(prisma, "userId", start_date, end_date, service),
+        _top(prisma, "resource", start_date, end_date, service),
+    )
+
+    summary = level_summary(level_counts)
+    failures = success_counts.get(False, 0)
+    return {
+        "audit_log_summary": summary,
+        "recent_errors": recent_errors,
+        "activity_by_service": {name: service_counts.get(name, 0) for name in service_types},
+        "activity_by_category": {name: category_counts.get(name, 0) for name in categories},
+        "activity_by_day": activity_by_day,
+        "top_users": [{"user_id": row["key"], "count": row["count"]} for row in top_users],
+        "top_resources": [{"resource": row["key"], "count": row["count"]} for row in top_resources],
+        "failure_rate": failures / summary["total"] if summary["total"] else 0.0,
+        "average_actions_per_day": summary["total"] / days if days > 0 else 0,
+    }
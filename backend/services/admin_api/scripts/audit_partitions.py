@@ -0,0 +1,77 @@
+"""
+감사 로그 파티션 관리 도구
+
+사용법:
+    python scripts/audit_partitions.py list        # 연결된/분리된 월 파티션 목록
+    python scripts/audit_partitions.py convert     # 기존 "AuditLog" 를 월 파티션 테이블로 전환 (한 번, 유지보수 시간에)
+    python scripts/audit_partitions.py maintain    # 파티션 생성 + 보관 기간 지난 파티션 아카이브
+    python scripts/audit_partitions.py convert --dry-run   # 실행할 SQL 만 출력
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from prisma import Prisma
+
+from services.admin_api.lib.services.audit_partitions import (
+    add_months,
+    convert_statements,
+    is_partitioned,
+    list_detached,
+    list_partitions,
+    month_start,
+    run_maintenance,
+)
+
+
+async def convert(prisma: Prisma, dry_run: bool) -> None:
+    if await is_partitioned(prisma):
+        print('"AuditLog" 는 이미 파티션 테이블입니다.')
+        return
+
+    rows = await prisma.query_raw('SELECT min("timestamp") AS first FROM "AuditLog"')
+    first = rows[0]["first"] if rows else None
+    now = datetime.now()
+    first_month = month_start(datetime.fromisoformat(str(first).replace("Z", "+00:00")) if first else now)
+    statements = convert_statements(first_month, add_months(month_start(now), 2))
+
+    if dry_run:
+        print(";\n".join(statements) + ";")
+        return
+
+    # 전환 도중 실패하면 전체를 되돌림
+    async with prisma.tx(timeout=timedelta(hours=2)) as tx:
+        for statement in statements:
+            print(statement)
+            await tx.execute_raw(statement)
+    print("전환 완료")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["list", "convert", "maintain"])
+    parser.add_argument("--dry-run", action="store_true", help="convert: SQL 만 출력")
+    args = parser.parse_args()
+
+    prisma = Prisma()
+    await prisma.connect()
+    try:
+        if args.command == "list":
+            for month, name in await list_partitions(prisma):
+                print(f"{month:%Y-%m}  {name}")
+            for month, name in await list_detached(prisma):
+                print(f"{month:%Y-%m}  {name}  (분리됨, 아카이브 대기)")
+        elif args.command == "convert":
+            await convert(prisma, args.dry_run)
+        else:
+            await run_maintenance(prisma)
+    finally:
+        await prisma.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
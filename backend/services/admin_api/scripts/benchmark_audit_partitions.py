@@ -0,0 +1,169 @@
+"""
+감사 로그 파티션 벤치마크
+
+같은 합성 데이터를 일반 테이블과 월 파티션 테이블에 넣고 감사 로그 조회 패턴의 지연을 비교합니다.
+데이터는 DB 서버에서 generate_series 로 생성합니다 (기본 1억 행, 24개월).
+
+사용법: DATABASE_URL=postgresql://... python scripts/benchmark_audit_partitions.py [--rows 100000000] [--months 24]
+        --skip-load 로 이미 만든 벤치마크 테이블을 재사용합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import asyncpg
+
+from services.admin_api.lib.services.audit_partitions import add_months, months_between
+
+FLAT = "bench_audit_flat"
+PARTITIONED = "bench_audit_part"
+LOAD_BATCH = 1_000_000
+REPEATS = 5
+
+COLUMNS = """
+    "id" text NOT NULL,
+    "timestamp" timestamp(3) NOT NULL,
+    "level" text NOT NULL,
+    "service" text NOT NULL,
+    "category" text NOT NULL,
+    "message" text NOT NULL,
+    "userId" text
+"""
+
+# 합성 행: 기간에 고르게 분포, 레벨/서비스/카테고리 순환, 메시지에 검색어 포함
+GENERATE_SQL = """
+INSERT INTO {table}
+SELECT
+    'log' || g,
+    $1::timestamp + (g::float8 / $3) * ($2::timestamp - $1::timestamp),
+    (ARRAY['info','info','info','warning','error','critical'])[1 + g % 6],
+    (ARRAY['fleet','parts','workshop','admin','smart_car'])[1 + g % 5],
+    (ARRAY['security','data','system','user','operation'])[1 + g % 5],
+    'vehicle ' || (g % 50000) || ' status ' || (ARRAY['updated','checked','repaired','registered'])[1 + g % 4],
+    'user-' || (g % 10000)
+FROM generate_series($4::bigint, $5::bigint) AS g
+"""
+
+
+async def create_tables(conn, start: date, months: int) -> None:
+    end = add_months(start, months)
+    await conn.execute(f"DROP TABLE IF EXISTS {FLAT}, {PARTITIONED} CASCADE")
+    await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    await conn.execute(f"CREATE TABLE {FLAT} ({COLUMNS})")
+    await conn.execute(f'CREATE TABLE {PARTITIONED} ({COLUMNS}) PARTITION BY RANGE ("timestamp")')
+    for month in months_between(start, add_months(end, -1)):
+        await conn.execute(
+            f"CREATE TABLE {PARTITIONED}_{month:%Y_%m} PARTITION OF {PARTITIONED} "
+            f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+        )
+
+
+async def load(conn, rows: int, start: date, months: int) -> None:
+    end = add_months(start, months)
+    for table in (FLAT, PARTITIONED):
+        started = time.perf_counter()
+        for low in range(0, rows, LOAD_BATCH):
+            high = min(rows, low + LOAD_BATCH) - 1
+            await conn.execute(
+                GENERATE_SQL.format(table=table), _at(start), _at(end), float(rows), low, high
+            )
+            print(f"\r{table}: {high + 1:,}/{rows:,}", end="", flush=True)
+        print(f"  ({time.perf_counter() - started:,.0f}s)")
+
+        started = time.perf_counter()
+        await conn.execute(f'ALTER TABLE {table} ADD PRIMARY KEY ("id", "timestamp")')
+        await conn.execute(f'CREATE INDEX ON {table} ("timestamp", "id")')
+        await conn.execute(f'CREATE INDEX ON {table} ("userId", "timestamp")')
+        await conn.execute(f'CREATE INDEX ON {table} USING gin ("message" gin_trgm_ops)')
+        await conn.execute(f"ANALYZE {table}")
+        print(f"{table}: indexes ({time.perf_counter() - started:,.0f}s)")
+
+
+def _relations(plan) -> set:
+    """실제로 실행된 스캔 노드의 테이블 (실행 중 프루닝되거나 LIMIT 으로 읽지 않은 파티션 제외)"""
+    names = set()
+    if "Relation Name" in plan and plan.get("Actual Loops", 0) > 0:
+        names.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        names |= _relations(child)
+    return names
+
+
+async def measure(conn, sql: str, params) -> tuple:
+    """(중앙값 ms, 실제로 읽은 테이블 수)"""
+    await conn.fetch(sql, *params)  # 워밍업
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        await conn.fetch(sql, *params)
+        timings.append((time.perf_counter() - started) * 1000)
+    plan = await conn.fetchval(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", *params)
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return statistics.median(timings), len(_relations(plan[0]["Plan"]))
+
+
+def _at(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def queries(start: date, months: int):
+    last_month = _at(add_months(start, months - 1))
+    month_end = _at(add_months(start, months))
+    week_end = last_month + timedelta(days=7)
+    return [
+        (
+            "1주 범위 + 레벨 필터, 최신 50건",
+            'SELECT * FROM {table} WHERE "timestamp" >= $1 AND "timestamp" < $2 AND "level" = $3 '
+            'ORDER BY "timestamp" DESC LIMIT 50',
+            (last_month, week_end, "error"),
+        ),
+        (
+            "1개월 범위 + message contains 개수",
+            'SELECT count(*) FROM {table} WHERE "timestamp" >= $1 AND "timestamp" < $2 AND "message" LIKE $3',
+            (last_month, month_end, "%vehicle 4242 %"),
+        ),
+        (
+            "1개월 범위 레벨별 개수",
+            'SELECT "level", count(*) FROM {table} WHERE "timestamp" >= $1 AND "timestamp" < $2 GROUP BY 1',
+            (last_month, month_end),
+        ),
+        (
+            "범위 없는 최신 50건",
+            'SELECT * FROM {table} ORDER BY "timestamp" DESC LIMIT 50',
+            (),
+        ),
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--skip-load", action="store_true")
+    args = parser.parse_args()
+
+    start = add_months(date.today().replace(day=1), -args.months)
+    conn = await asyncpg.connect(os.environ["DATABASE_URL"])
+    try:
+        if not args.skip_load:
+            await create_tables(conn, start, args.months)
+            await load(conn, args.rows, start, args.months)
+
+        print(f"\n{'query':<34} {'flat ms':>10} {'partitioned ms':>15} {'partitions read':>16}")
+        for label, sql, params in queries(start, args.months):
+            flat_ms, _ = await measure(conn, sql.format(table=FLAT), params)
+            part_ms, scanned = await measure(conn, sql.format(table=PARTITIONED), params)
+            print(f"{label:<34} {flat_ms:>10,.1f} {part_ms:>15,.1f} {scanned:>10}/{args.months}")
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+감사 로그 수집 부하 테스트
+
+AuditEmitter 가 일정한 속도로 이벤트를 만들어 일괄 수집 API(POST /audit-logs/bulk)로 보내고,
+저장된 이벤트 수/초와 이벤트 생성 후 저장까지의 지연(lag)을 측정합니다.
+HTTP 는 ASGI 전송 계층으로 앱에 직접 연결하며, DB 는 INSERT 를 세는 메모리 클라이언트를 사용합니다.
+(--insert-delay 로 배치 INSERT 한 번의 DB 지연을 흉내낼 수 있습니다.)
+
+사용법: python scripts/load_test_audit_ingest.py [--rate 10000] [--seconds 10] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import httpx
+from fastapi import FastAPI
+
+from services.admin_api.lib.database import get_prisma
+from services.admin_api.lib.routes import audit
+from shared.utils.audit_emitter import AuditEmitter
+
+
+class CountingAuditLog:
+    """create_many 로 저장된 행 수와 지연을 기록하는 메모리 테이블"""
+
+    def __init__(self, insert_delay: float):
+        self.insert_delay = insert_delay
+        self.rows = 0
+        self.statements = 0
+        self.lags = []
+
+    async def create_many(self, data, skip_duplicates=None):
+        if self.insert_delay:
+            await asyncio.sleep(self.insert_delay)
+        now = datetime.now(timezone.utc)
+        self.rows += len(data)
+        self.statements += 1
+        # 배치의 가장 오래된 이벤트 기준 지연
+        self.lags.append((now - min(row["timestamp"] for row in data)).total_seconds())
+        return len(data)
+
+
+class CountingPrisma:
+    def __init__(self, insert_delay: float):
+        self.auditlog = CountingAuditLog(insert_delay)
+
+
+async def produce(emitter: AuditEmitter, rate: int, seconds: float) -> int:
+    """10ms 단위로 rate 에 맞춰 이벤트 생성"""
+    tick = 0.01
+    per_tick = max(1, int(rate * tick))
+    emitted = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for _ in range(per_tick):
+            emitter.emit({
+                "level": "info",
+                "service": "fleet",
+                "category": "operation",
+                "message": "차량 상태 변경",
+                "user_id": f"user-{emitted % 500}",
+                "resource": "vehicle",
+                "resource_id": f"vehicle-{emitted % 5000}",
+                "success": True,
+            })
+            emitted += 1
+        # 목표 시각까지 대기 (밀린 만큼은 다음 틱에서 따라잡음)
+        target = started + (emitted / rate)
+        await asyncio.sleep(max(0.0, target - time.perf_counter()))
+    return emitted
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=10_000, help="초당 생성 이벤트 수")
+    parser.add_argument("--seconds", type=float, default=10.0, help="부하 지속 시간(초)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="전송 배치 크기")
+    parser.add_argument("--insert-delay", type=float, default=0.005, help="배치 INSERT 1회 지연(초)")
+    args = parser.parse_args()
+
+    db = CountingPrisma(args.insert_delay)
+    app = FastAPI()
+    app.include_router(audit.router, prefix="/api/admin")
+    app.dependency_overrides[get_prisma] = lambda: db
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        emitter = AuditEmitter(
+            base_url="http://admin-api/api/admin",
+            batch_size=args.batch_size,
+            spill_dir=spill_dir,
+            transport=httpx.ASGITransport(app=app),
+        )
+        async with emitter:
+            started = time.perf_counter()
+            emitted = await produce(emitter, args.rate, args.seconds)
+            produced_elapsed = time.perf_counter() - started
+            await emitter.flush()
+            elapsed = time.perf_counter() - started
+
+    table = db.auditlog
+    assert table.rows == emitted, f"저장 누락: {emitted - table.rows}건"
+    lags = sorted(table.lags)
+    print(f"emitted  : {emitted:,} events in {produced_elapsed:.1f}s ({emitted / produced_elapsed:,.0f}/s)")
+    print(f"stored   : {table.rows:,} rows, {table.statements:,} INSERT statements, {table.rows / elapsed:,.0f}/s")
+    print(f"spilled  : {emitter.spilled:,}, rejected: {emitter.rejected:,}")
+    print(
+        f"lag      : median {statistics.median(lags) * 1000:,.0f}ms, "
+        f"p99 {lags[int(len(lags) * 0.99)] * 1000:,.0f}ms, max {lags[-1] * 1000:,.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta, date
 from typing import Optional, List, Dict, Any
 import pandas as pd
 import io
+from shared.utils.server_launcher import default_response_class, run_server
 from .database import get_db, init_db
 from .models import Order, Payment, Customer, Vehicle, Technician, Service, Part, Inventory
 from .schemas import (
@@ -23,7 +24,8 @@ from .utils import calculate_metrics, generate_report
 app = FastAPI(
     title="CarGoro Analytics API",
     description="분석 및 보고서 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=default_response_class(),
 )
 
 # CORS 설정
@@ -505,5 +507,4 @@ async def get_realtime_metrics(
     }
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8003)
+    run_server(app, host="0.0.0.0", port=8003)
@@ -0,0 +1,122 @@
+"""
+인증 캐시 모듈
+
+세션별 사용자/권한 조회 결과를 TTL + LRU 로 캐시하고, 같은 키의 동시 조회는 한 번만 실행합니다(single-flight).
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """TTL 과 최대 크기(LRU)를 가진 비동기 캐시"""
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        """
+        캐시 초기화
+
+        Args:
+            ttl: 기본 만료 시간(초), 0 이하이면 캐시하지 않음
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            clock: 시간 함수 (테스트용)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """만료되지 않은 값 반환 (없으면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl 은 기본값보다 짧게만 지정 가능)"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목 제거"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        self._data.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader 를 한 번만 실행해 저장
+
+        같은 키를 동시에 요청하면 먼저 시작한 조회 결과를 함께 기다립니다.
+        조회가 실패하면 예외를 기다리던 모든 호출자에게 전달하고 캐시하지 않습니다.
+        먼저 시작한 조회가 취소되면 기다리던 호출자는 취소되지 않고 다시 조회합니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 조회하는 코루틴 함수
+            ttl: 이 항목의 만료 시간(초)
+
+        Returns:
+            캐시된 값 또는 새로 조회한 값
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self.hits += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 먼저 조회하던 호출자가 취소된 경우에만 다시 시도 (이 호출자가 취소되었으면 전파)
+                if not inflight.cancelled():
+                    raise
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 호출자가 없어도 "exception was never retrieved" 경고가 나지 않도록 처리
+            future.exception()
+            raise
+        else:
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
@@ -4,42 +4,256 @@ Clerk 인증 통합 모듈
 Clerk 인증 서비스와 통합하여 인증 및 권한 관리 기능을 제공합니다.
 """
 
+import asyncio
+import logging
 import os
+import time
 import httpx
-from typing import Dict, List, Optional, Any, Union
+import jwt
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+from .cache import AsyncTTLCache
+
+logger = logging.getLogger("clerk-auth")
+
 # Clerk API 설정
 CLERK_API_KEY = os.getenv("CLERK_API_KEY", "YOUR_CLERK_API_KEY")
 CLERK_API_BASE_URL = os.getenv("CLERK_API_BASE_URL", "https://api.clerk.dev/v1")
+CLERK_JWKS_URL = os.getenv("CLERK_JWKS_URL", f"{CLERK_API_BASE_URL}/jwks")
+# 세션 토큰 발급자(iss) 와 허용된 요청 출처(azp) 검증 (비어 있으면 검증하지 않음)
+CLERK_ISSUER = os.getenv("CLERK_ISSUER") or None
+CLERK_AUTHORIZED_PARTIES = [
+    party.strip() for party in os.getenv("CLERK_AUTHORIZED_PARTIES", "").split(",") if party.strip()
+]
+# 캐시 설정 (초)
+CLERK_JWKS_TTL = float(os.getenv("CLERK_JWKS_TTL", "3600"))
+CLERK_USER_CACHE_TTL = float(os.getenv("CLERK_USER_CACHE_TTL", "60"))
+CLERK_USER_CACHE_SIZE = int(os.getenv("CLERK_USER_CACHE_SIZE", "10000"))
 
 # HTTP 보안 의존성
 security = HTTPBearer()
 
 
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+class JWKSCache:
+    """
+    Clerk JWKS 공개키 캐시
+
+    TTL 이 지나면 기존 키로 검증을 계속하면서 백그라운드에서 갱신하고,
+    모르는 kid 가 들어오면 (키 교체) 최소 간격을 지켜 즉시 다시 조회합니다.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: float = CLERK_JWKS_TTL,
+        min_refresh_interval: float = 30.0,
+    ):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def refresh(self) -> None:
+        """JWKS 를 다시 조회 (동시 호출은 한 번만 실행)"""
+        started = time.monotonic()
+        async with self._lock:
+            if self._fetched_at >= started:
+                return
+            jwks = await self._fetch()
+            keys = {}
+            for key_data in jwks.get("keys", []):
+                try:
+                    key = jwt.PyJWK.from_dict(key_data)
+                except jwt.PyJWTError as e:
+                    logger.warning(f"지원하지 않는 JWKS 키 무시: {e}")
+                    continue
+                keys[key.key_id or ""] = key
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"JWKS 갱신 실패, 기존 키를 계속 사용합니다: {e}")
+
+    async def get_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """
+        kid 에 해당하는 공개키 반환
+
+        Raises:
+            HTTPException: 키를 찾을 수 없는 경우
+        """
+        kid = kid or ""
+        age = time.monotonic() - self._fetched_at
+        if not self._keys:
+            await self.refresh()
+        elif age > self.ttl and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._fetched_at > self.min_refresh_interval:
+            await self.refresh()
+            key = self._keys.get(kid)
+        if key is None:
+            raise _unauthorized("인증 실패: 알 수 없는 서명 키")
+        return key
+
+
 class ClerkAuth:
     """Clerk 인증 서비스와 통합하는 클래스"""
 
-    def __init__(self, api_key: str = CLERK_API_KEY, base_url: str = CLERK_API_BASE_URL):
+    def __init__(
+        self,
+        api_key: str = CLERK_API_KEY,
+        base_url: str = CLERK_API_BASE_URL,
+        jwks_url: Optional[str] = None,
+        issuer: Optional[str] = CLERK_ISSUER,
+        authorized_parties: Optional[List[str]] = None,
+        user_cache_ttl: float = CLERK_USER_CACHE_TTL,
+        user_cache_size: int = CLERK_USER_CACHE_SIZE,
+        jwks_ttl: float = CLERK_JWKS_TTL,
+        leeway: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Clerk 인증 관리자 초기화
 
         Args:
             api_key: Clerk API 키
             base_url: Clerk API 기본 URL
+            jwks_url: 세션 토큰 서명 공개키(JWKS) URL
+            issuer: 허용할 토큰 발급자 (None 이면 검증하지 않음)
+            authorized_parties: 허용할 azp 목록 (비어 있으면 검증하지 않음)
+            user_cache_ttl: 세션별 사용자/권한 캐시 만료 시간(초)
+            user_cache_size: 캐시할 최대 세션 수
+            jwks_ttl: JWKS 갱신 주기(초)
+            leeway: 만료 시간 검증 허용 오차(초)
+            transport: HTTP 전송 계층 (테스트/벤치마크용 스텁 서버 연결)
         """
         self.api_key = api_key
         self.base_url = base_url
+        self.jwks_url = jwks_url or (CLERK_JWKS_URL if base_url == CLERK_API_BASE_URL else f"{base_url}/jwks")
+        self.issuer = issuer
+        self.authorized_parties = CLERK_AUTHORIZED_PARTIES if authorized_parties is None else authorized_parties
+        self.leeway = leeway
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.jwks = JWKSCache(self._fetch_jwks, ttl=jwks_ttl)
+        self.user_cache = AsyncTTLCache(ttl=user_cache_ttl, maxsize=user_cache_size)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Clerk API 호출에 재사용하는 커넥션 풀 클라이언트"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                transport=self._transport,
+                timeout=httpx.Timeout(10.0, connect=5.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """HTTP 클라이언트 연결 종료 (앱 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_jwks(self) -> Dict[str, Any]:
+        response = await self.client.get(self.jwks_url)
+        response.raise_for_status()
+        return response.json()
+
+    async def verify_session_token(self, token: str) -> Dict[str, Any]:
+        """
+        세션 토큰(JWT)을 캐시된 JWKS 로 로컬 검증
+
+        Args:
+            token: Clerk 세션 토큰
+
+        Returns:
+            토큰 클레임
+
+        Raises:
+            HTTPException: 토큰이 유효하지 않은 경우
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            raise _unauthorized("인증 실패: 유효하지 않은 토큰")
+
+        key = await self.jwks.get_key(header.get("kid"))
+        try:
+            claims = jwt.decode(
+                token,
+                key.key,
+                algorithms=[key.algorithm_name or "RS256"],
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={"require": ["exp", "sub"], "verify_aud": False},
+            )
+        except jwt.ExpiredSignatureError:
+            raise _unauthorized("인증 실패: 만료된 토큰")
+        except jwt.PyJWTError:
+            raise _unauthorized("인증 실패: 유효하지 않은 토큰")
+
+        if self.authorized_parties and claims.get("azp") and claims["azp"] not in self.authorized_parties:
+            raise _unauthorized("인증 실패: 허용되지 않은 요청 출처")
+        return claims
+
+    async def _load_user(self, user_id: str) -> Dict[str, Any]:
+        """사용자 정보와 권한을 동시에 조회"""
+        user_response, permissions = await asyncio.gather(
+            self.client.get(f"{self.base_url}/users/{user_id}"),
+            self.get_user_permissions(user_id),
+        )
+        if user_response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"사용자 ID {user_id}를 찾을 수 없습니다",
+            )
+
+        user_data = user_response.json()
+        # 권한 정보 포함
+        user_data["permissions"] = permissions
+        return user_data
+
+    async def _load_session_user(self, session_id: str) -> Dict[str, Any]:
+        """JWT 가 아닌 세션 ID 토큰: 세션 API 로 사용자 ID 를 확인한 뒤 사용자 조회"""
+        response = await self.client.get(f"{self.base_url}/sessions/{session_id}")
+        if response.status_code != 200:
+            raise _unauthorized("인증 실패: 유효하지 않은 토큰")
+
+        user_id = response.json().get("user_id")
+        if not user_id:
+            raise _unauthorized("인증 실패: 사용자 ID를 찾을 수 없음")
+        return await self._load_user(user_id)
 
     async def get_user_by_token(self, token: str) -> Dict[str, Any]:
         """
         세션 토큰으로 사용자 정보 조회
 
+        JWT 세션 토큰은 네트워크 호출 없이 검증하고, 사용자/권한 정보는 세션별로 캐시합니다.
+        반환된 사전은 캐시와 공유되므로 수정하지 마세요.
+
         Args:
             token: Clerk 세션 토큰
 
@@ -50,48 +264,16 @@ class ClerkAuth:
             HTTPException: 토큰이 유효하지 않거나 사용자를 찾을 수 없는 경우
         """
         try:
-            # 토큰 확인 API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/sessions/{token}",
-                    headers=self.headers
-                )
-
-                if response.status_code != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="인증 실패: 유효하지 않은 토큰",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-
-                session_data = response.json()
-                user_id = session_data.get("user_id")
-
-                if not user_id:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="인증 실패: 사용자 ID를 찾을 수 없음",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-
-                # 사용자 정보 조회
-                user_response = await client.get(
-                    f"{self.base_url}/users/{user_id}",
-                    headers=self.headers
+            if token.count(".") == 2:
+                claims = await self.verify_session_token(token)
+                user_id = claims["sub"]
+                # 토큰 만료 이후까지 캐시하지 않음
+                ttl = max(claims["exp"] - time.time(), 0)
+                return await self.user_cache.get_or_load(
+                    claims.get("sid") or user_id, lambda: self._load_user(user_id), ttl=ttl
                 )
 
-                if user_response.status_code != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"사용자 ID {user_id}를 찾을 수 없습니다",
-                    )
-
-                user_data = user_response.json()
-
-                # 권한 정보 포함
-                user_data["permissions"] = await self.get_user_permissions(user_id)
-
-                return user_data
+            return await self.user_cache.get_or_load(token, lambda: self._load_session_user(token))
 
         except HTTPException:
             raise
@@ -101,6 +283,15 @@ class ClerkAuth:
                 detail=f"인증 서버 오류: {str(e)}",
             )
 
+    def invalidate_session(self, session_id: str) -> None:
+        """
+        세션의 캐시된 사용자/권한 정보 제거 (권한 변경, 로그아웃 시)
+
+        Args:
+            session_id: 세션 ID (JWT 의 sid 클레임 또는 세션 토큰)
+        """
+        self.user_cache.invalidate(session_id)
+
     async def get_user_permissions(self, user_id: str) -> List[str]:
         """
         사용자의 권한 목록 조회
@@ -113,22 +304,43 @@ class ClerkAuth:
         """
         try:
             # 사용자 메타데이터 조회에서 권한 정보 가져오기
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/users/{user_id}/metadata",
-                    headers=self.headers
-                )
+            response = await self.client.get(f"{self.base_url}/users/{user_id}/metadata")
 
-                if response.status_code != 200:
-                    return []
+            if response.status_code != 200:
+                return []
 
-                metadata = response.json()
-                permissions = metadata.get("public", {}).get("permissions", [])
+            metadata = response.json()
+            permissions = metadata.get("public", {}).get("permissions", [])
 
-                return permissions
+            return permissions
         except Exception:
             return []
 
+    @staticmethod
+    def user_has_permission(user: Dict[str, Any], required_permission: str) -> bool:
+        """
+        조회된 사용자 정보에 특정 권한이 있는지 확인
+
+        Args:
+            user: 사용자 정보
+            required_permission: 필요한 권한
+
+        Returns:
+            권한 보유 여부
+        """
+        # 시스템 관리자는 모든 권한을 가짐
+        if user.get("public_metadata", {}).get("role") == "admin":
+            return True
+
+        # 권한 목록 확인
+        return required_permission in user.get("permissions", [])
+
+    @staticmethod
+    def user_has_role(user: Dict[str, Any], role: str) -> bool:
+        """조회된 사용자 정보에 특정 역할이 있는지 확인 (관리자는 모든 역할 허용)"""
+        user_role = user.get("public_metadata", {}).get("role", "")
+        return user_role == role or user_role == "admin"
+
     async def verify_permission(self, token: str, required_permission: str) -> bool:
         """
         사용자가 특정 권한을 가지고 있는지 확인
@@ -142,14 +354,7 @@ class ClerkAuth:
         """
         try:
             user = await self.get_user_by_token(token)
-
-            # 시스템 관리자는 모든 권한을 가짐
-            if user.get("public_metadata", {}).get("role") == "admin":
-                return True
-
-            # 권한 목록 확인
-            permissions = user.get("permissions", [])
-            return required_permission in permissions
+            return self.user_has_permission(user, required_permission)
         except Exception:
             return False
 
@@ -184,7 +389,7 @@ class ClerkAuth:
         async def check_permission(
             current_user: Dict[str, Any] = Depends(self.get_current_user)
         ) -> Dict[str, Any]:
-            if not await self.verify_permission(current_user.get("id"), permission):
+            if not self.user_has_permission(current_user, permission):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"권한 부족: {permission} 권한이 필요합니다",
@@ -205,8 +410,7 @@ class ClerkAuth:
         async def check_role(
             current_user: Dict[str, Any] = Depends(self.get_current_user)
         ) -> Dict[str, Any]:
-            user_role = current_user.get("public_metadata", {}).get("role", "")
-            if user_role != role and user_role != "admin":
+            if not self.user_has_role(current_user, role):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"권한 부족: {role} 역할이 필요합니다",
@@ -6,140 +6,187 @@ API 엔드포인트에 대한 인증 및 권한 관리를 위한 미들웨어 
 
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from typing import Callable, Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 
 from .clerk_auth import clerk_auth
+from .route_matcher import RouteTrie
 
 logger = logging.getLogger("auth-middleware")
 
+# 검사 결과: (거부 응답 또는 None, 인증된 사용자 또는 None)
+AuthResult = Tuple[Optional[JSONResponse], Optional[Dict[str, Any]]]
+
+
+def _deny(status_code: int, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"detail": detail})
+
 
 class AuthMiddleware:
-    """인증 및 권한 관리 미들웨어 클래스"""
+    """
+    인증 및 권한 관리 미들웨어 클래스
+
+    경로 규칙은 등록 시 트라이로 컴파일되며, 등록한 경로는 하위 경로까지 포함합니다
+    (패턴 문법은 route_matcher 참고). 앱에는 순수 ASGI 미들웨어로 연결합니다:
+
+        app.add_middleware(AuthASGIMiddleware, auth=auth_middleware)
+    """
 
     def __init__(self):
         """미들웨어 초기화"""
-        self.public_paths = set()
-        self.protected_paths = {}
-        self.role_protected_paths = {}
+        self.public_paths: RouteTrie[bool] = RouteTrie()
+        self.protected_paths: RouteTrie[str] = RouteTrie()
+        self.role_protected_paths: RouteTrie[str] = RouteTrie()
 
     def register_public_path(self, path: str, methods: List[str] = None):
         """
         공개 경로 등록 (인증 불필요)
 
         Args:
-            path: API 경로
+            path: API 경로 패턴
             methods: HTTP 메소드 목록 (None이면 모든 메소드)
         """
-        if methods:
-            for method in methods:
-                self.public_paths.add(f"{method.upper()}:{path}")
-        else:
-            self.public_paths.add(f"*:{path}")
+        self.public_paths.insert(path, True, methods)
 
     def register_protected_path(self, path: str, permission: str, methods: List[str] = None):
         """
         보호된 경로 등록 (특정 권한 필요)
 
         Args:
-            path: API 경로
+            path: API 경로 패턴
             permission: 필요한 권한
             methods: HTTP 메소드 목록 (None이면 모든 메소드)
         """
-        if methods:
-            for method in methods:
-                self.protected_paths[f"{method.upper()}:{path}"] = permission
-        else:
-            self.protected_paths[f"*:{path}"] = permission
+        self.protected_paths.insert(path, permission, methods)
 
     def register_role_path(self, path: str, role: str, methods: List[str] = None):
         """
         역할 보호 경로 등록 (특정 역할 필요)
 
         Args:
-            path: API 경로
+            path: API 경로 패턴
             role: 필요한 역할
             methods: HTTP 메소드 목록 (None이면 모든 메소드)
         """
-        if methods:
-            for method in methods:
-                self.role_protected_paths[f"{method.upper()}:{path}"] = role
-        else:
-            self.role_protected_paths[f"*:{path}"] = role
+        self.role_protected_paths.insert(path, role, methods)
 
-    async def __call__(self, request: Request, call_next: Callable):
+    def resolve(self, method: str, path: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
-        미들웨어 핵심 로직
+        요청에 적용할 규칙 조회
 
-        Args:
-            request: FastAPI 요청 객체
-            call_next: 다음 미들웨어 호출 함수
+        공개 경로라도 더 구체적인 보호/역할 규칙이 있으면 인증을 요구합니다.
 
         Returns:
-            HTTP 응답
+            (공개 여부, 필요한 권한, 필요한 역할)
+        """
+        public = self.public_paths.lookup(method, path)
+        permission = self.protected_paths.lookup(method, path)
+        role = self.role_protected_paths.lookup(method, path)
+
+        if public and all(rule is None or public[0] >= rule[0] for rule in (permission, role)):
+            return True, None, None
+        return False, permission[1] if permission else None, role[1] if role else None
+
+    async def authorize(self, method: str, path: str, token: Optional[str]) -> AuthResult:
         """
-        path = request.url.path
-        method = request.method
+        요청 인증/권한 검사
+
+        Args:
+            method: HTTP 메소드
+            path: 요청 경로
+            token: Bearer 토큰
 
-        # 요청 경로 키
-        path_key = f"{method}:{path}"
-        wildcard_key = f"*:{path}"
+        Returns:
+            (거부 응답 또는 None, 조회된 사용자 또는 None)
+        """
+        public, permission, role = self.resolve(method, path)
 
         # 공개 경로 확인
-        if path_key in self.public_paths or wildcard_key in self.public_paths:
-            return await call_next(request)
+        if public:
+            return None, None
 
         # 인증 토큰 확인
-        token = clerk_auth.get_client_token(request)
         if not token:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "인증이 필요합니다"},
-            )
+            return _deny(status.HTTP_401_UNAUTHORIZED, "인증이 필요합니다"), None
+
+        if not permission and not role:
+            return None, None
 
         try:
+            # 권한/역할 검사에 필요한 사용자 정보는 한 번만 조회 (세션별 캐시)
+            user = await clerk_auth.get_user_by_token(token)
+
             # 보호된 경로 확인
-            if path_key in self.protected_paths:
-                permission = self.protected_paths[path_key]
-                if not await clerk_auth.verify_permission(token, permission):
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": f"권한 부족: {permission} 권한이 필요합니다"},
-                    )
-            elif wildcard_key in self.protected_paths:
-                permission = self.protected_paths[wildcard_key]
-                if not await clerk_auth.verify_permission(token, permission):
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": f"권한 부족: {permission} 권한이 필요합니다"},
-                    )
+            if permission and not clerk_auth.user_has_permission(user, permission):
+                return _deny(status.HTTP_403_FORBIDDEN, f"권한 부족: {permission} 권한이 필요합니다"), None
 
             # 역할 보호 경로 확인
-            if path_key in self.role_protected_paths or wildcard_key in self.role_protected_paths:
-                role = self.role_protected_paths.get(path_key) or self.role_protected_paths.get(wildcard_key)
-                user = await clerk_auth.get_user_by_token(token)
-                user_role = user.get("public_metadata", {}).get("role", "")
-
-                if user_role != role and user_role != "admin":
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": f"권한 부족: {role} 역할이 필요합니다"},
-                    )
+            if role and not clerk_auth.user_has_role(user, role):
+                return _deny(status.HTTP_403_FORBIDDEN, f"권한 부족: {role} 역할이 필요합니다"), None
 
-            # 인증 및 권한 검사 통과, 다음 핸들러로 진행
-            return await call_next(request)
+            # 인증 및 권한 검사 통과
+            return None, user
 
         except HTTPException as e:
-            return JSONResponse(
-                status_code=e.status_code,
-                content={"detail": e.detail},
-            )
+            return _deny(e.status_code, e.detail), None
         except Exception as e:
             logger.error(f"인증 미들웨어 오류: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={"detail": "서버 오류가 발생했습니다"},
-            )
+            return _deny(status.HTTP_500_INTERNAL_SERVER_ERROR, "서버 오류가 발생했습니다"), None
+
+    async def __call__(self, request: Request, call_next: Callable):
+        """
+        HTTP 미들웨어 방식 호환 진입점 (@app.middleware("http"))
+
+        새 코드는 요청/응답 래핑 비용이 없는 AuthASGIMiddleware 를 사용하세요.
+
+        Args:
+            request: FastAPI 요청 객체
+            call_next: 다음 미들웨어 호출 함수
+
+        Returns:
+            HTTP 응답
+        """
+        response, user = await self.authorize(
+            request.method, request.url.path, clerk_auth.get_client_token(request)
+        )
+        if response is not None:
+            return response
+        if user is not None:
+            request.state.user = user
+        return await call_next(request)
+
+
+class AuthASGIMiddleware:
+    """
+    순수 ASGI 인증 미들웨어
+
+    통과한 요청의 사용자 정보는 request.state.user 로 전달합니다.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]], auth: Optional[AuthMiddleware] = None):
+        self.app = app
+        self.auth = auth or auth_middleware
+
+    @staticmethod
+    def _token(scope: Dict[str, Any]) -> Optional[str]:
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                header = value.decode("latin-1")
+                return header[7:] if header.startswith("Bearer ") else None
+        return None
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response, user = await self.auth.authorize(scope["method"], scope["path"], self._token(scope))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        if user is not None:
+            scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
 
 
 # 기본 인증 미들웨어 인스턴스
@@ -0,0 +1,103 @@
+"""
+비밀번호 해싱 (동시 실행 수 제한)
+
+bcrypt 해시/검증은 한 번에 수백 ms 동안 CPU 를 사용하므로 async 핸들러에서 바로 호출하면
+그동안 이벤트 루프 전체가 멈춥니다. PasswordHasher 는 해싱을 크기가 정해진 스레드 풀에서 실행하고
+(bcrypt 는 해싱 중 GIL 을 놓음), 자리를 기다리다 queue_timeout 을 넘기면 PasswordHashingBusy 를 발생시킵니다.
+verify_and_update() 는 저장된 해시가 현재 라운드 수와 다르면 새 해시를 함께 돌려줍니다.
+
+auth 패키지는 backend/services 만 경로에 두고 불러오는 곳(벤치마크 스크립트 등)이 있으므로
+공용 모듈(shared.utils.password_hasher)의 async API 와 같은 동작을 여기에 둡니다.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Tuple
+
+from passlib.context import CryptContext
+
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0")) or None
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+
+# 작업자 수를 지정하지 않았을 때 상한 (CPU 수와 비교해 작은 값 사용)
+DEFAULT_MAX_WORKERS = 4
+
+
+class PasswordHashingBusy(Exception):
+    """해싱 작업자 자리를 queue_timeout 안에 얻지 못함 (요청 폭주)"""
+
+
+class PasswordHasher:
+    """크기가 정해진 스레드 풀에서 비밀번호를 해싱/검증"""
+
+    def __init__(self, rounds: int = 12, max_workers: Optional[int] = None, queue_timeout: float = 5.0):
+        self.rounds = rounds
+        self.max_workers = max_workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        self.queue_timeout = queue_timeout
+        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        # 통계
+        self.rejected = 0
+        self.rehashed = 0
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # 세마포어는 생성한 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _run(self, name: str, *args: Any) -> Any:
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PasswordHashingBusy(f"비밀번호 해싱 대기 시간 초과 ({self.queue_timeout}초)")
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, getattr(self.context, name), *args)
+        finally:
+            slots.release()
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return await self._run("hash", password)
+
+    async def verify(self, password: str, hashed: Optional[str]) -> bool:
+        """비밀번호 검증"""
+        valid, _ = await self.verify_and_update(password, hashed)
+        return valid
+
+    async def verify_and_update(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱
+
+        Returns:
+            (일치 여부, 새 해시) - 저장된 해시가 현재 설정과 다를 때만 새 해시가 있음
+        """
+        if not hashed:
+            return False, None
+        valid, new_hash = await self._run("verify_and_update", password, hashed)
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """프로세스 전역 비밀번호 해싱 서비스 (PASSWORD_HASH_* 환경 변수 사용)"""
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher(
+            rounds=PASSWORD_HASH_ROUNDS,
+            max_workers=PASSWORD_HASH_WORKERS,
+            queue_timeout=PASSWORD_HASH_QUEUE_TIMEOUT,
+        )
+    return _hasher
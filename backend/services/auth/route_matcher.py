@@ -0,0 +1,147 @@
+"""
+경로 패턴 매칭 모듈
+
+등록된 경로 패턴을 세그먼트 단위 트라이로 컴파일해 요청 경로와 가장 구체적인 규칙을 찾습니다.
+
+패턴 문법:
+- /api/vehicles        : 해당 경로와 모든 하위 경로 (/api/vehicles/123, /api/vehicles/123/logs)
+- /api/vehicles/{id}   : 한 세그먼트 파라미터
+- /api/vehicles/*      : 임의의 한 세그먼트
+- /api/vehicles/**     : 임의의 하위 경로 (0개 이상 세그먼트)
+- 끝에 $ 를 붙이면 하위 경로를 포함하지 않음 (/api/vehicles$)
+
+여러 규칙이 맞으면 앞쪽 세그먼트부터 비교해 리터럴 > 파라미터 > 와일드카드 순으로 구체적인 규칙,
+같은 패턴이면 정확히 일치하는 규칙 > 하위 경로 규칙, 특정 메소드 규칙 > 모든 메소드(*) 규칙을 선택합니다.
+"""
+
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+ANY_METHOD = "*"
+
+# 세그먼트 종류별 우선순위 (클수록 구체적)
+_LITERAL = 2
+_PARAM = 1
+_WILDCARD = 0
+# 패턴 끝 종류: 정확히 일치 > 세그먼트 비교 값 > 하위 경로 포함
+_EXACT_END = 3
+_PREFIX_END = -1
+
+
+def split_path(path: str) -> List[str]:
+    """경로를 세그먼트 목록으로 변환 (빈 세그먼트와 끝 슬래시 무시)"""
+    return [segment for segment in path.split("/") if segment]
+
+
+class _Node:
+    __slots__ = ("literals", "param", "wildcard", "exact", "prefix")
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.param: Optional["_Node"] = None
+        self.wildcard: Optional["_Node"] = None
+        # method -> 값
+        self.exact: Dict[str, Any] = {}
+        self.prefix: Dict[str, Any] = {}
+
+
+class RouteTrie(Generic[T]):
+    """경로 패턴 트라이"""
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, pattern: str, value: T, methods: Optional[List[str]] = None) -> None:
+        """
+        패턴 등록
+
+        Args:
+            pattern: 경로 패턴
+            value: 일치할 때 반환할 값
+            methods: HTTP 메소드 목록 (None이면 모든 메소드)
+        """
+        exact = pattern.endswith("$")
+        segments = split_path(pattern.rstrip("$"))
+        subtree = False
+        if segments and segments[-1] == "**":
+            segments.pop()
+            subtree = True
+
+        node = self._root
+        for segment in segments:
+            if segment.startswith("{") and segment.endswith("}"):
+                node.param = node.param or _Node()
+                node = node.param
+            elif segment == "*":
+                node.wildcard = node.wildcard or _Node()
+                node = node.wildcard
+            else:
+                node = node.literals.setdefault(segment, _Node())
+
+        # ** 또는 $ 없는 일반 패턴은 하위 경로까지 포함
+        target = node.exact if exact and not subtree else node.prefix
+        for method in methods or [ANY_METHOD]:
+            key = method.upper()
+            if key not in target:
+                self._size += 1
+            target[key] = value
+
+    @staticmethod
+    def _pick(rules: Dict[str, T], method: str) -> Tuple[Optional[T], int]:
+        if method in rules:
+            return rules[method], 1
+        if ANY_METHOD in rules:
+            return rules[ANY_METHOD], 0
+        return None, 0
+
+    def _candidates(
+        self, node: _Node, segments: List[str], index: int, method: str, score: Tuple[int, ...]
+    ) -> Iterator[Tuple[Tuple[int, ...], T]]:
+        if node.prefix:
+            value, method_rank = self._pick(node.prefix, method)
+            if value is not None:
+                yield score + (_PREFIX_END, method_rank), value
+
+        if index == len(segments):
+            if node.exact:
+                value, method_rank = self._pick(node.exact, method)
+                if value is not None:
+                    yield score + (_EXACT_END, method_rank), value
+            return
+
+        child = node.literals.get(segments[index])
+        if child is not None:
+            yield from self._candidates(child, segments, index + 1, method, score + (_LITERAL,))
+        if node.param is not None:
+            yield from self._candidates(node.param, segments, index + 1, method, score + (_PARAM,))
+        if node.wildcard is not None:
+            yield from self._candidates(node.wildcard, segments, index + 1, method, score + (_WILDCARD,))
+
+    def lookup(self, method: str, path: str) -> Optional[Tuple[Tuple[int, ...], T]]:
+        """
+        요청에 가장 구체적으로 일치하는 규칙의 (구체성 점수, 값)
+
+        점수는 튜플 비교로 다른 트라이의 결과와 구체성을 비교할 수 있습니다.
+
+        Args:
+            method: HTTP 메소드
+            path: 요청 경로
+
+        Returns:
+            (점수, 값) 또는 None
+        """
+        best: Optional[Tuple[Tuple[int, ...], T]] = None
+        for score, value in self._candidates(self._root, split_path(path), 0, method.upper(), ()):
+            if best is None or score > best[0]:
+                best = (score, value)
+        return best
+
+    def match(self, method: str, path: str) -> Optional[T]:
+        """요청에 가장 구체적으로 일치하는 규칙의 값 (없으면 None)"""
+        best = self.lookup(method, path)
+        return best[1] if best else None
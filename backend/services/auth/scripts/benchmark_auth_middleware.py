@@ -0,0 +1,145 @@
+"""
+인증 미들웨어 벤치마크 스크립트
+
+500개 경로 규칙을 등록하고 다음을 측정합니다.
+- 규칙 조회: 트라이(RouteTrie) vs 정규식 목록 순차 검사
+- 미들웨어 오버헤드: 미들웨어 없음 / call_next 방식(BaseHTTPMiddleware) / 순수 ASGI (AuthASGIMiddleware)
+
+Clerk 호출을 제외한 미들웨어 자체 비용만 보기 위해 요청은 공개 경로로 보냅니다.
+
+사용법: python scripts/benchmark_auth_middleware.py [조회 횟수] [요청 수]
+"""
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from auth.middleware import AuthASGIMiddleware, AuthMiddleware
+
+RESOURCES = [f"resource{i}" for i in range(100)]
+METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+
+def build_rules(auth: AuthMiddleware):
+    """리소스 100개 x 경로 5종 = 500개 규칙"""
+    patterns = []
+    for resource in RESOURCES:
+        for suffix, register in (
+            ("", auth.register_public_path),
+            ("/{id}", auth.register_public_path),
+            ("/{id}/history", auth.register_public_path),
+            ("/reports/*", auth.register_public_path),
+            ("/admin", auth.register_role_path),
+        ):
+            pattern = f"/api/{resource}{suffix}"
+            if register is auth.register_role_path:
+                register(pattern, "admin")
+            else:
+                register(pattern, ["GET"])
+            patterns.append(pattern)
+    return patterns
+
+
+def compile_regex(pattern: str):
+    body = re.sub(r"\{[^/]+\}", "[^/]+", pattern).replace("*", "[^/]+")
+    return re.compile(f"^{body}(/.*)?$")
+
+
+def sample_paths(count: int):
+    random.seed(7)
+    paths = []
+    for _ in range(count):
+        resource = random.choice(RESOURCES)
+        paths.append(random.choice([
+            f"/api/{resource}",
+            f"/api/{resource}/{random.randint(1, 10**6)}",
+            f"/api/{resource}/{random.randint(1, 10**6)}/history",
+            f"/api/{resource}/reports/monthly",
+        ]))
+    return paths
+
+
+def bench_lookup(auth: AuthMiddleware, patterns, lookups: int):
+    paths = sample_paths(lookups)
+
+    started = time.perf_counter()
+    for path in paths:
+        public, _, _ = auth.resolve("GET", path)
+        assert public
+    trie = (time.perf_counter() - started) / lookups
+
+    regexes = [(compile_regex(pattern), pattern) for pattern in patterns]
+    started = time.perf_counter()
+    for path in paths:
+        # 순차 검사는 가장 구체적인 규칙을 고르기 위해 모든 규칙을 확인해야 함
+        matched = [pattern for regex, pattern in regexes if regex.match(path)]
+        assert matched
+    linear = (time.perf_counter() - started) / lookups
+
+    print(f"lookup  trie   : {trie * 1e6:7.2f} us/op  ({len(auth.public_paths) + len(auth.role_protected_paths)} rules)")
+    print(f"lookup  regex  : {linear * 1e6:7.2f} us/op  (linear scan, {linear / trie:.0f}x slower)")
+
+
+async def bench_app(label: str, app, paths):
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    def scope(path):
+        return {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+            "query_string": b"", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+        }
+
+    for path in paths[:200]:
+        await app(scope(path), receive, send)
+    started = time.perf_counter()
+    for path in paths:
+        await app(scope(path), receive, send)
+    elapsed = time.perf_counter() - started
+    print(f"request {label:14}: {len(paths) / elapsed:9,.0f} req/s  {elapsed / len(paths) * 1e6:7.1f} us/req")
+    return elapsed
+
+
+async def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    auth = AuthMiddleware()
+    patterns = build_rules(auth)
+    bench_lookup(auth, patterns, lookups)
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    routes = [Route("/{path:path}", ok)]
+    paths = sample_paths(requests)
+    bare = await bench_app("no middleware", Starlette(routes=routes), paths)
+    call_next = await bench_app(
+        "call_next", Starlette(routes=routes, middleware=[Middleware(BaseHTTPMiddleware, dispatch=auth)]), paths
+    )
+    pure = await bench_app(
+        "pure ASGI", Starlette(routes=routes, middleware=[Middleware(AuthASGIMiddleware, auth=auth)]), paths
+    )
+    print(
+        f"overhead call_next: {(call_next - bare) / len(paths) * 1e6:.1f} us/req, "
+        f"pure ASGI: {(pure - bare) / len(paths) * 1e6:.1f} us/req"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
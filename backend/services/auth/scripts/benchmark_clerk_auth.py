@@ -0,0 +1,142 @@
+"""
+Clerk 인증 벤치마크 스크립트
+
+로컬 Clerk 스텁(JWKS, 세션, 사용자, 메타데이터 API + 호출당 지연)을 ASGI 로 띄우고 두 방식을 비교합니다.
+- legacy: 요청마다 새 HTTP 클라이언트로 세션 -> 사용자 -> 메타데이터를 순차 호출 (기존 구현)
+- cached: JWT 로컬 검증 + 세션별 사용자/권한 캐시 + 공유 클라이언트 (ClerkAuth)
+
+사용법: python scripts/benchmark_clerk_auth.py [요청 수] [동시성] [세션 수] [스텁 지연(ms)]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI
+
+from auth.clerk_auth import ClerkAuth
+
+BASE_URL = "http://clerk.local/v1"
+KID = "bench-key"
+
+
+class ClerkStub:
+    """세션 토큰을 발급하고 Clerk Backend API 일부를 흉내 내는 스텁"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.sessions = {}
+
+    def issue(self, user_id: str) -> str:
+        """사용자의 세션 토큰(JWT) 발급 (세션 API 용으로 세션 ID 도 등록)"""
+        session_id = f"sess_{uuid.uuid4().hex}"
+        self.sessions[session_id] = user_id
+        now = int(time.time())
+        return jwt.encode(
+            {"sub": user_id, "sid": session_id, "iat": now, "nbf": now, "exp": now + 600},
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": KID},
+        )
+
+    def create_app(self) -> FastAPI:
+        app = FastAPI()
+        public_jwk = jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True)
+
+        async def hit(name: str):
+            self.calls[name] += 1
+            await asyncio.sleep(self.latency)
+
+        @app.get("/v1/jwks")
+        async def jwks():
+            await hit("jwks")
+            return {"keys": [{**public_jwk, "kid": KID, "alg": "RS256", "use": "sig"}]}
+
+        @app.get("/v1/sessions/{session_id}")
+        async def session(session_id: str):
+            await hit("sessions")
+            return {"id": session_id, "user_id": self.sessions.get(session_id)}
+
+        @app.get("/v1/users/{user_id}")
+        async def user(user_id: str):
+            await hit("users")
+            return {"id": user_id, "public_metadata": {"role": "fleet_manager"}}
+
+        @app.get("/v1/users/{user_id}/metadata")
+        async def metadata(user_id: str):
+            await hit("metadata")
+            return {"public": {"permissions": ["vehicles:read", "vehicles:write"]}}
+
+        return app
+
+
+async def legacy_get_user_by_token(transport: httpx.AsyncBaseTransport, session_id: str) -> dict:
+    """기존 구현과 같은 호출 패턴 (새 클라이언트, 순차 호출 3회)"""
+    async with httpx.AsyncClient(transport=transport) as client:
+        session = (await client.get(f"{BASE_URL}/sessions/{session_id}")).json()
+        user = (await client.get(f"{BASE_URL}/users/{session['user_id']}")).json()
+    async with httpx.AsyncClient(transport=transport) as client:
+        metadata = (await client.get(f"{BASE_URL}/users/{user['id']}/metadata")).json()
+    user["permissions"] = metadata["public"]["permissions"]
+    return user
+
+
+async def measure(label: str, stub: ClerkStub, call, tokens, total: int, concurrency: int):
+    stub.calls.clear()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            user = await call(tokens[index % len(tokens)])
+            latencies.append(time.perf_counter() - started)
+            assert "vehicles:read" in user["permissions"]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(total)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(
+        f"[{label:7}] {total / elapsed:,.0f} req/s "
+        f"p50={statistics.median(latencies) * 1000:.2f}ms p99={latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f}ms "
+        f"stub calls={dict(stub.calls)}"
+    )
+
+
+async def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    session_count = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    latency = (float(sys.argv[4]) if len(sys.argv) > 4 else 20) / 1000
+
+    stub = ClerkStub(latency)
+    transport = httpx.ASGITransport(app=stub.create_app())
+    tokens = [stub.issue(f"user_{index % 50}") for index in range(session_count)]
+    session_ids = [jwt.decode(token, options={"verify_signature": False})["sid"] for token in tokens]
+
+    await measure(
+        "legacy", stub, lambda session_id: legacy_get_user_by_token(transport, session_id),
+        session_ids, total, concurrency,
+    )
+
+    clerk = ClerkAuth(api_key="sk_test_bench", base_url=BASE_URL, transport=transport)
+    try:
+        await measure("cached", stub, clerk.get_user_by_token, tokens, total, concurrency)
+        print(f"user cache: hits={clerk.user_cache.hits} misses={clerk.user_cache.misses}")
+    finally:
+        await clerk.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
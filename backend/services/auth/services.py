@@ -7,11 +7,9 @@
 import jwt
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from .password_hasher import get_password_hasher
 
 # JWT 설정
 SECRET_KEY = "your_super_secret_key_change_in_production"
@@ -19,8 +17,8 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 
-# 비밀번호 해싱 및 검증 함수
-def hash_password(password: str) -> str:
+# 비밀번호 해싱 및 검증 함수 (작업자 풀에서 실행해 이벤트 루프를 막지 않음)
+async def hash_password(password: str) -> str:
     """
     비밀번호를 안전하게 해싱하여 반환
 
@@ -30,10 +28,10 @@ def hash_password(password: str) -> str:
     Returns:
         해싱된 비밀번호
     """
-    return pwd_context.hash(password)
+    return await get_password_hasher().hash(password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호가 해시된 비밀번호와 일치하는지 확인
 
@@ -44,7 +42,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         비밀번호 일치 여부
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await get_password_hasher().verify(plain_password, hashed_password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증과 함께 현재 해싱 설정으로 다시 해싱
+
+    Args:
+        plain_password: 검증할 원본 비밀번호
+        hashed_password: 저장된 해시 비밀번호
+
+    Returns:
+        (비밀번호 일치 여부, 새 해시) - 저장된 해시의 라운드 수/스킴이 현재 설정과 다를 때만 새 해시가 있으며,
+        로그인 성공 시 저장하면 됩니다
+    """
+    return await get_password_hasher().verify_and_update(plain_password, hashed_password)
 
 
 # 토큰 관련 함수
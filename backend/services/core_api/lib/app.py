@@ -1,21 +1,23 @@
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 import os
 from datetime import datetime, timedelta
 import jwt
-from passlib.context import CryptContext
 
 try:
     from clerk_sdk_python import Clerk
 except ImportError:
     # Clerk is optional for testing
     Clerk = None
+import asyncio
 import asyncpg
 import json
 import logging
 import sys
+import time
+from collections import OrderedDict
 
 # 로깅 설정
 logging.basicConfig(
@@ -31,13 +33,12 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 JWT_SECRET = os.getenv("JWT_SECRET", "your-super-secret-key-change-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION = 60 * 24  # 24시간
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "30"))  # 초, 0 이면 캐시 사용 안 함
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
 
 # Clerk 클라이언트 초기화
 clerk = Clerk(secret_key=CLERK_SECRET_KEY) if CLERK_SECRET_KEY else None
 
-# 패스워드 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # 애플리케이션 초기화
 app = FastAPI(
     title="CarGoro Core API",
@@ -194,18 +195,198 @@ def create_jwt_token(data: dict, expires_delta: timedelta = None):
     return encoded_jwt
 
 
-async def verify_token(token: str, conn):
+# 권한 조회 쿼리
+# asyncpg 는 연결마다 쿼리 문자열을 키로 prepared statement 를 캐시하므로
+# 쿼리는 상수로 두고 매번 같은 문자열로 실행합니다 (두 번째 실행부터 parse/plan 생략).
+
+# 사용자(활성) + 조직 역할 + 권한(역할 권한 ∪ 개별 권한)을 한 번에 조회
+# 조직 멤버가 아니면 역할/권한은 빈 배열, 비활성/없는 사용자면 행 없음
+PRINCIPAL_QUERY = """
+WITH member_roles AS (
+    SELECT r.id, r.name
+    FROM organization_members om
+    JOIN roles r ON r.id = om.role_id
+    WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
+)
+SELECT
+    u.id AS user_id,
+    ARRAY(SELECT name FROM member_roles ORDER BY name) AS roles,
+    ARRAY(
+        SELECT p.name
+        FROM permissions p
+        WHERE EXISTS (SELECT 1 FROM member_roles)
+          AND p.id IN (
+              SELECT rp.permission_id
+              FROM role_permissions rp
+              JOIN member_roles mr ON mr.id = rp.role_id
+              UNION ALL
+              SELECT up.permission_id
+              FROM user_permissions up
+              WHERE up.user_id = u.id
+          )
+    ) AS permissions
+FROM users u
+WHERE u.id = $1 AND u.active = true
+"""
+
+# 조직 내 역할과 역할별 권한 (권한 컬럼은 array_agg 로 묶어 역할당 한 행)
+USER_ROLES_QUERY = """
+SELECT
+    r.id,
+    r.name,
+    r.description,
+    array_agg(p.id ORDER BY p.id) FILTER (WHERE p.id IS NOT NULL) AS permission_ids,
+    array_agg(p.name ORDER BY p.id) FILTER (WHERE p.id IS NOT NULL) AS permission_names,
+    array_agg(p.description ORDER BY p.id) FILTER (WHERE p.id IS NOT NULL) AS permission_descriptions,
+    array_agg(p.scope ORDER BY p.id) FILTER (WHERE p.id IS NOT NULL) AS permission_scopes
+FROM organization_members om
+JOIN roles r ON r.id = om.role_id
+LEFT JOIN role_permissions rp ON rp.role_id = r.id
+LEFT JOIN permissions p ON p.id = rp.permission_id
+WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
+GROUP BY r.id, r.name, r.description
+ORDER BY r.id
+"""
+
+
+class Principal(BaseModel):
+    """조직 기준 사용자 인증 주체 (역할 이름, 권한 이름)"""
+
+    userId: str
+    organizationId: Optional[str] = None
+    roles: List[str] = []
+    permissions: FrozenSet[str] = frozenset()
+
+    model_config = {"frozen": True}
+
+
+class PrincipalCache:
+    """
+    (사용자, 조직)별 Principal TTL 캐시
+
+    - 캐시에 없으면 PRINCIPAL_QUERY 한 번으로 채움
+    - 같은 키를 동시에 조회하면 쿼리는 한 번만 실행
+    - 멤버십/역할/권한/사용자 상태 변경 시 invalidate_* 로 무효화
+      (프로세스 안에서만 적용되므로 다른 워커의 캐시는 TTL 이 지나면 갱신)
+    """
+
+    def __init__(self, ttl: float = PRINCIPAL_CACHE_TTL, max_entries: int = PRINCIPAL_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (user_id, organization_id) -> (만료 시각, Principal)
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._loading: Dict[tuple, asyncio.Future] = {}
+        # 무효화 횟수 (조회 중 무효화되면 조회 결과를 캐시하지 않음)
+        self._generation = 0
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, user_id: str, organization_id: Optional[str] = None) -> None:
+        """사용자의 특정 조직(없으면 모든 조직) 캐시 제거"""
+        self._generation += 1
+        user_id = str(user_id)
+        if organization_id is not None:
+            self._entries.pop((user_id, str(organization_id)), None)
+            return
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+    def invalidate_organization(self, organization_id: str) -> None:
+        """조직의 모든 멤버 캐시 제거"""
+        self._generation += 1
+        organization_id = str(organization_id)
+        for key in [key for key in self._entries if key[1] == organization_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """모든 캐시 제거 (역할-권한 매핑 변경 시)"""
+        self._generation += 1
+        self._entries.clear()
+
+    async def get(self, user_id: str, organization_id: Optional[str], conn=None) -> Optional[Principal]:
+        """
+        Principal 조회 (비활성/없는 사용자면 None, 캐시하지 않음)
+
+        conn 을 넘기지 않으면 캐시에 없을 때만 풀에서 연결을 가져옵니다.
+        """
+        key = (str(user_id), str(organization_id) if organization_id else None)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+
+        self.misses += 1
+        while True:
+            loading = self._loading.get(key)
+            if loading is None:
+                break
+            try:
+                return await asyncio.shield(loading)
+            except asyncio.CancelledError:
+                # 먼저 조회하던 요청이 취소된 경우에만 다시 시도
+                # (기다리던 다른 요청이 먼저 조회를 시작했으면 그 결과를 기다림)
+                if not loading.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        generation = self._generation
+        try:
+            principal = await self._load(key, conn)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 예외를 조회하지 않았다는 경고가 나오지 않도록 처리
+            future.exception()
+            raise
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+        future.set_result(principal)
+        if principal is not None and self.ttl > 0 and generation == self._generation:
+            self._entries[key] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return principal
+
+    async def _load(self, key: tuple, conn) -> Optional[Principal]:
+        user_id, organization_id = key
+        if conn is None:
+            async with db_pool.acquire() as connection:
+                record = await connection.fetchrow(PRINCIPAL_QUERY, user_id, organization_id)
+        else:
+            record = await conn.fetchrow(PRINCIPAL_QUERY, user_id, organization_id)
+        if record is None:
+            return None
+        return Principal(
+            userId=str(record["user_id"]),
+            organizationId=organization_id,
+            roles=list(record["roles"]),
+            permissions=frozenset(record["permissions"]),
+        )
+
+
+principal_cache = PrincipalCache()
+
+
+async def verify_token(token: str, conn=None):
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = payload.get("userId")
         if user_id is None:
             return None
 
-        # 사용자 존재 확인
-        user = await conn.fetchrow(
-            "SELECT * FROM users WHERE id = $1 AND active = true", user_id
-        )
-        if not user:
+        # 사용자 존재(활성) 확인 - Principal 캐시 사용
+        principal = await principal_cache.get(user_id, payload.get("organizationId"), conn)
+        if principal is None:
             return None
 
         return payload
@@ -214,44 +395,10 @@ async def verify_token(token: str, conn):
 
 
 async def get_user_permissions(user_id: str, organization_id: str, conn):
-    # 사용자 역할 가져오기
-    role_query = """
-    SELECT r.*
-    FROM roles r
-    JOIN organization_members om ON r.id = om.role_id
-    WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
-    """
-    role = await conn.fetchrow(role_query, user_id, organization_id)
-
-    if not role:
+    principal = await principal_cache.get(user_id, organization_id, conn)
+    if principal is None:
         return []
-
-    # 역할에 할당된 권한 가져오기
-    permission_query = """
-    SELECT p.*
-    FROM permissions p
-    JOIN role_permissions rp ON p.id = rp.permission_id
-    WHERE rp.role_id = $1
-    """
-    permissions = await conn.fetch(permission_query, role["id"])
-
-    # 사용자에게 직접 할당된 권한 가져오기
-    direct_permission_query = """
-    SELECT p.*
-    FROM permissions p
-    JOIN user_permissions up ON p.id = up.permission_id
-    WHERE up.user_id = $1
-    """
-    direct_permissions = await conn.fetch(direct_permission_query, user_id)
-
-    # 권한 이름 목록 생성
-    permission_names = set()
-    for p in permissions:
-        permission_names.add(p["name"])
-    for p in direct_permissions:
-        permission_names.add(p["name"])
-
-    return list(permission_names)
+    return list(principal.permissions)
 
 
 # 엔드포인트
@@ -375,6 +522,7 @@ async def create_membership(membership: MembershipCreate, conn=Depends(get_db_co
             membership.isOwner,
             membership.isAdmin,
         )
+        principal_cache.invalidate(membership.userId, membership.organizationId)
 
         return {
             "id": str(member_record["id"]),
@@ -428,36 +576,20 @@ async def get_user_organizations(user_id: str, conn=Depends(get_db_conn)):
 
 @app.get("/api/users/{user_id}/roles", response_model=List[RoleResponse])
 async def get_user_roles(user_id: str, organization_id: str, conn=Depends(get_db_conn)):
-    # 사용자의 역할 조회
-    role_query = """
-    SELECT r.*
-    FROM roles r
-    JOIN organization_members om ON r.id = om.role_id
-    WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
-    """
-    role_records = await conn.fetch(role_query, user_id, organization_id)
+    # 사용자의 역할과 역할별 권한을 한 번에 조회
+    role_records = await conn.fetch(USER_ROLES_QUERY, user_id, organization_id)
 
     roles = []
     for role in role_records:
-        # 역할에 할당된 권한 조회
-        permission_query = """
-        SELECT p.*
-        FROM permissions p
-        JOIN role_permissions rp ON p.id = rp.permission_id
-        WHERE rp.role_id = $1
-        """
-        permission_records = await conn.fetch(permission_query, role["id"])
-
-        permissions = []
-        for perm in permission_records:
-            permissions.append(
-                {
-                    "id": perm["id"],
-                    "name": perm["name"],
-                    "description": perm["description"],
-                    "scope": perm["scope"],
-                }
+        permissions = [
+            {"id": perm_id, "name": name, "description": description, "scope": scope}
+            for perm_id, name, description, scope in zip(
+                role["permission_ids"] or [],
+                role["permission_names"] or [],
+                role["permission_descriptions"] or [],
+                role["permission_scopes"] or [],
             )
+        ]
 
         roles.append(
             {
@@ -476,7 +608,7 @@ async def login_for_access_token(
     clerk_id: str, organization_id: Optional[str] = None, conn=Depends(get_db_conn)
 ):
     # Clerk ID로 사용자 찾기
-    user_query = "SELECT * FROM users WHERE clerk_id = $1 AND active = true"
+    user_query = "SELECT id FROM users WHERE clerk_id = $1 AND active = true"
     user = await conn.fetchrow(user_query, clerk_id)
 
     if not user:
@@ -504,24 +636,16 @@ async def login_for_access_token(
     user_id = str(user["id"])
     token_data = {"userId": user_id}
 
-    # 조직 및 권한 정보 추가
+    # 조직 및 권한 정보 추가 (역할/권한은 Principal 조회 한 번)
     if organization_id:
-        # 해당 조직의 멤버십 확인
-        membership_query = """
-        SELECT om.*, r.name as role_name
-        FROM organization_members om
-        JOIN roles r ON om.role_id = r.id
-        WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
-        """
-        membership = await conn.fetchrow(membership_query, user_id, organization_id)
+        # 토큰에는 최신 권한을 넣도록 캐시를 비우고 조회
+        principal_cache.invalidate(user_id, organization_id)
+        principal = await principal_cache.get(user_id, organization_id, conn)
 
-        if membership:
+        if principal and principal.roles:
             token_data["organizationId"] = organization_id
-            token_data["roles"] = [membership["role_name"]]
-
-            # 권한 목록 가져오기
-            permissions = await get_user_permissions(user_id, organization_id, conn)
-            token_data["permissions"] = permissions
+            token_data["roles"] = principal.roles
+            token_data["permissions"] = sorted(principal.permissions)
 
     # 토큰 생성
     access_token = create_jwt_token(token_data)
@@ -534,8 +658,9 @@ async def login_for_access_token(
 
 
 @app.get("/api/auth/validate")
-async def validate_token(token: str, conn=Depends(get_db_conn)):
-    payload = await verify_token(token, conn)
+async def validate_token(token: str):
+    # 캐시에 Principal 이 있으면 DB 연결을 가져오지 않음
+    payload = await verify_token(token)
 
     if not payload:
         raise HTTPException(
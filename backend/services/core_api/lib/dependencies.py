@@ -6,6 +6,10 @@ from typing import Optional
 import os
 import logging
 from prisma import Prisma
+from prisma.enums import UserRole
+
+from shared.database.client_registry import prisma_registry
+from .services.permission_engine import permission_engine
 
 # 환경 변수 로드
 SECRET_KEY = os.getenv("JWT_SECRET", "토큰_생성에_사용할_시크릿_키_실제_환경에서는_환경변수로_관리")
@@ -17,14 +21,10 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 # 로깅 설정
 logger = logging.getLogger("core-api")
 
-# 데이터베이스 연결 의존성 (Prisma ORM)
+# 데이터베이스 연결 의존성 (Prisma ORM, 애플리케이션 수명 동안 공유되는 클라이언트)
 async def get_db():
-    prisma = Prisma()
-    await prisma.connect()
-    try:
+    async with prisma_registry.session() as prisma:
         yield prisma
-    finally:
-        await prisma.disconnect()
 
 # 현재 인증된 사용자 가져오기
 async def get_current_user(token: str = Depends(oauth2_scheme), prisma: Prisma = Depends(get_db)):
@@ -45,10 +45,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), prisma: Prisma =
         logger.error(f"토큰 검증 오류: {str(e)}")
         raise credentials_exception
 
-    # 사용자 조회
-    user = await prisma.user.find_unique(
-        where={"id": user_id}
-    )
+    # 사용자 조회 (권한 엔진 캐시)
+    user = await permission_engine.get_user(user_id, prisma)
 
     if user is None or not user.isActive:
         raise credentials_exception
@@ -70,32 +68,8 @@ def permission_required(required_permission: str):
         current_user = Depends(get_current_user),
         prisma: Prisma = Depends(get_db)
     ):
-        # 관리자는 모든 권한을 가짐
-        if current_user.role == UserRole.ADMIN:
-            return current_user
-
-        # 역할 기반 권한 조회
-        role_permissions = await prisma.rolepermission.find_many(
-            where={"role": current_user.role},
-            include={"permission": True}
-        )
-
-        # 사용자 특정 권한 조회
-        user_permissions = await prisma.userpermission.find_many(
-            where={"userId": current_user.id, "granted": True},
-            include={"permission": True}
-        )
-
-        # 권한 목록 생성
-        permission_codes = set()
-        for rp in role_permissions:
-            permission_codes.add(rp.permission.code)
-
-        for up in user_permissions:
-            permission_codes.add(up.permission.code)
-
-        # 권한 확인
-        if required_permission not in permission_codes:
+        # 권한 확인 (관리자는 모든 권한을 가짐)
+        if not await permission_engine.has_permission(current_user, required_permission, prisma):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"이 작업을 수행할 권한이 없습니다. '{required_permission}' 권한이 필요합니다."
@@ -107,40 +81,12 @@ def permission_required(required_permission: str):
 
 # 권한 확인 헬퍼 함수
 async def has_permission(user, permission_code: str, prisma: Prisma) -> bool:
-    """사용자가 특정 권한을 가지고 있는지 확인"""
-    from prisma.models import UserRole
-
-    # 관리자는 모든 권한을 가짐
-    if user.role == UserRole.ADMIN:
-        return True
-
-    # 역할 기반 권한 조회
-    role_permissions = await prisma.rolepermission.find_many(
-        where={"role": user.role},
-        include={"permission": True}
-    )
-
-    # 사용자 특정 권한 조회
-    user_permissions = await prisma.userpermission.find_many(
-        where={"userId": user.id, "granted": True},
-        include={"permission": True}
-    )
-
-    # 권한 목록 생성
-    permission_codes = set()
-    for rp in role_permissions:
-        permission_codes.add(rp.permission.code)
-
-    for up in user_permissions:
-        permission_codes.add(up.permission.code)
-
-    return permission_code in permission_codes
+    """사용자가 특정 권한을 가지고 있는지 확인 (미리 계산된 권한 집합 조회)"""
+    return await permission_engine.has_permission(user, permission_code, prisma)
 
 # 조직 관리자 권한 확인 함수
 async def has_organization_admin(user, organization_id: str, prisma: Prisma) -> bool:
     """사용자가 특정 조직의 관리자 권한을 가지고 있는지 확인"""
-    from prisma.enums import UserRole
-
     # 시스템 관리자는 모든 조직에 대한 권한을 가짐
     if user.role == UserRole.ADMIN:
         return True
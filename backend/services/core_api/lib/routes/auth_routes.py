@@ -5,8 +5,9 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 import jwt
 import secrets
-from passlib.context import CryptContext
+from shared.utils.password_hasher import get_password_hasher
 from ..dependencies import get_db, get_current_user
+from ..services.permission_engine import permission_engine
 from ..models import TokenResponse, UserResponse
 from prisma.models import User, UserPermission, RolePermission
 from ..utils.response_utils import create_response, ApiResponse, unauthorized_exception, bad_request_exception
@@ -17,9 +18,6 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24시간
 REFRESH_TOKEN_EXPIRE_DAYS = 30  # 30일
 
-# 패스워드 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 스키마
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 
@@ -41,13 +39,13 @@ class ConfirmResetPasswordRequest(BaseModel):
     token: str
     new_password: str
 
-# 비밀번호 검증
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# 비밀번호 검증 (공용 작업자 풀에서 실행, 이벤트 루프를 막지 않음)
+async def verify_password(plain_password, hashed_password):
+    return await get_password_hasher().verify(plain_password, hashed_password)
 
 # 비밀번호 해싱
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await get_password_hasher().hash(password)
 
 # 사용자 인증
 async def authenticate_user(email: str, password: str, db):
@@ -58,9 +56,17 @@ async def authenticate_user(email: str, password: str, db):
     if not user or not user.isActive:
         return False
 
-    if not verify_password(password, user.passwordHash):
+    valid, new_hash = await get_password_hasher().verify_and_update(password, user.passwordHash)
+    if not valid:
         return False
 
+    # 해싱 설정(라운드 수 등)이 바뀐 경우 로그인하면서 새 해시로 교체
+    if new_hash:
+        user = await db.user.update(
+            where={"id": user.id},
+            data={"passwordHash": new_hash}
+        )
+
     return user
 
 # JWT 토큰 생성 (액세스 토큰)
@@ -106,28 +112,8 @@ async def login_for_access_token(
         data={"updatedAt": datetime.utcnow()}
     )
 
-    # 사용자 권한 조회
-    permissions = []
-
-    # 역할 기반 권한 조회
-    role_permissions = await db.rolePermission.find_many(
-        where={"role": user.role},
-        include={"permission": True}
-    )
-
-    # 사용자 특정 권한 조회
-    user_permissions = await db.userPermission.find_many(
-        where={"userId": user.id, "granted": True},
-        include={"permission": True}
-    )
-
-    # 권한 목록 생성
-    for rp in role_permissions:
-        permissions.append(rp.permission.code)
-
-    for up in user_permissions:
-        if up.permission.code not in permissions:
-            permissions.append(up.permission.code)
+    # 사용자 권한 조회 (역할 권한 + 사용자 특정 권한)
+    permissions = sorted(await permission_engine.user_permissions(user, db))
 
     # 토큰 데이터 준비
     token_data = {
@@ -206,28 +192,8 @@ async def refresh_access_token(
     if not user or not user.isActive:
         raise credentials_exception
 
-    # 사용자 권한 조회
-    permissions = []
-
-    # 역할 기반 권한 조회
-    role_permissions = await db.rolePermission.find_many(
-        where={"role": user.role},
-        include={"permission": True}
-    )
-
-    # 사용자 특정 권한 조회
-    user_permissions = await db.userPermission.find_many(
-        where={"userId": user.id, "granted": True},
-        include={"permission": True}
-    )
-
-    # 권한 목록 생성
-    for rp in role_permissions:
-        permissions.append(rp.permission.code)
-
-    for up in user_permissions:
-        if up.permission.code not in permissions:
-            permissions.append(up.permission.code)
+    # 사용자 권한 조회 (역할 권한 + 사용자 특정 권한)
+    permissions = sorted(await permission_engine.user_permissions(user, db))
 
     # 토큰 데이터 준비
     token_data = {
@@ -273,7 +239,7 @@ async def register_user(
         raise bad_request_exception("이미 사용 중인 이메일입니다.", "EMAIL_ALREADY_EXISTS")
 
     # 비밀번호 해싱
-    hashed_password = get_password_hash(password)
+    hashed_password = await get_password_hash(password)
 
     # 사용자 생성
     user = await db.user.create(
@@ -326,11 +292,11 @@ async def change_password(
     로그인한 사용자의 비밀번호를 변경합니다.
     """
     # 현재 비밀번호 확인
-    if not verify_password(data.current_password, current_user.passwordHash):
+    if not await verify_password(data.current_password, current_user.passwordHash):
         raise bad_request_exception("현재 비밀번호가 일치하지 않습니다.", "PASSWORD_MISMATCH")
 
     # 새 비밀번호 해싱
-    hashed_password = get_password_hash(data.new_password)
+    hashed_password = await get_password_hash(data.new_password)
 
     # 비밀번호 업데이트
     await db.user.update(
@@ -340,6 +306,7 @@ async def change_password(
             "updatedAt": datetime.utcnow()
         }
     )
+    permission_engine.invalidate_user(current_user.id)
 
     # 모든 기존 세션 무효화
     await db.session.delete_many(
@@ -409,7 +376,7 @@ async def confirm_password_reset(
         raise bad_request_exception("유효하지 않거나 만료된 재설정 토큰입니다.", "INVALID_OR_EXPIRED_RESET_TOKEN")
 
     # 새 비밀번호 해싱
-    hashed_password = get_password_hash(data.new_password)
+    hashed_password = await get_password_hash(data.new_password)
 
     # 비밀번호 업데이트
     await db.user.update(
@@ -419,6 +386,7 @@ async def confirm_password_reset(
             "updatedAt": datetime.utcnow()
         }
     )
+    permission_engine.invalidate_user(reset_record.userId)
 
     # 모든 기존 세션 무효화
     await db.session.delete_many(
@@ -451,36 +419,7 @@ async def verify_permission(
     사용자가 특정 권한을 가지고 있는지 확인합니다.
     """
     # 관리자는 모든 권한을 가짐
-    if current_user.role == "ADMIN":
-        return {"hasPermission": True}
-
-    # 역할 기반 권한 확인
-    role_permission = await db.rolePermission.find_first(
-        where={
-            "role": current_user.role,
-            "permission": {
-                "code": permission
-            }
-        },
-        include={"permission": True}
-    )
-
-    if role_permission:
-        return {"hasPermission": True}
-
-    # 사용자 특정 권한 확인
-    user_permission = await db.userPermission.find_first(
-        where={
-            "userId": current_user.id,
-            "granted": True,
-            "permission": {
-                "code": permission
-            }
-        },
-        include={"permission": True}
-    )
-
-    return {"hasPermission": user_permission is not None}
+    return {"hasPermission": await permission_engine.has_permission(current_user, permission, db)}
 
 # 외부 모듈에서 사용할 함수
 async def get_current_user_from_token(token: str, db):
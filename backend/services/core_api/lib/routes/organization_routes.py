@@ -41,7 +41,7 @@ async def get_organizations(
     시스템에 등록된 모든 조직(정비소, 법인 등) 목록을 조회합니다.
     """
     # 권한 확인 - 슈퍼어드민이 아니면 자신이 속한 조직만 볼 수 있음
-    is_admin = await has_permission(current_user.id, "org:sys_domains:read")
+    is_admin = await has_permission(current_user, "org:sys_domains:read", db)
 
     # 쿼리 필터 구성
     where = {}
@@ -95,7 +95,7 @@ async def create_organization(
     새로운 조직(정비소, 법인 등)을 시스템에 등록합니다.
     """
     # 슈퍼어드민 권한 확인
-    has_admin = await has_permission(current_user.id, "org:sys_domains:manage")
+    has_admin = await has_permission(current_user, "org:sys_domains:manage", db)
     if not has_admin:
         raise permission_denied_exception("조직 생성")
 
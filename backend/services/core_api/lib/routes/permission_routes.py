@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Optional
 from pydantic import BaseModel
 from ..dependencies import get_current_user, get_db, admin_required
+from ..services.permission_engine import permission_engine
 from ..models import PermissionCreate, PermissionUpdate, PermissionResponse
 from ..models import RolePermissionCreate, UserPermissionCreate
 from prisma.models import User
@@ -128,6 +129,8 @@ async def update_permission(
     updated_permission = await db.permission.update(
         where={"id": permission_id}, data=update_data
     )
+    # 권한 코드가 바뀌면 미리 계산된 권한 집합도 다시 계산
+    permission_engine.clear()
 
     return PermissionResponse.from_orm(updated_permission)
 
@@ -179,6 +182,7 @@ async def assign_permission_to_role(
                 "permissionId": role_permission.permission_id,
             }
         )
+        permission_engine.invalidate_roles()
 
         return {
             "id": role_perm.id,
@@ -219,6 +223,7 @@ async def remove_permission_from_role(
 
     # 역할에서 권한 제거
     await db.rolePermission.delete(where={"id": role_permission.id})
+    permission_engine.invalidate_roles()
 
     return None
 
@@ -267,6 +272,7 @@ async def assign_permission_to_user(
                 "granted": user_permission.granted,
             }
         )
+    permission_engine.invalidate_user(user_permission.user_id)
 
     return {
         "id": user_perm.id,
@@ -301,5 +307,6 @@ async def remove_permission_from_user(
 
     # 사용자에게서 권한 제거
     await db.userPermission.delete(where={"id": user_permission.id})
+    permission_engine.invalidate_user(user_id)
 
     return None
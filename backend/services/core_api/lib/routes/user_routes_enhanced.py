@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import List, Optional
 from pydantic import BaseModel
 from ..dependencies import get_current_user, get_db, has_permission
+from ..services.permission_engine import permission_engine
 from ..models import UserCreate, UserUpdate, UserResponse, UserWithPermissions
 from prisma.models import User
 from prisma.enums import UserRole
@@ -25,7 +26,7 @@ async def get_users(
     시스템에 등록된 사용자 목록을 조회합니다. 관리자 권한이 필요합니다.
     """
     # 권한 확인
-    has_admin = await has_permission(current_user.id, "org:admin_users:manage")
+    has_admin = await has_permission(current_user, "org:admin_users:manage", db)
     if not has_admin:
         raise permission_denied_exception("사용자 관리")
 
@@ -86,7 +87,7 @@ async def get_user(
     """
     # 자신의 정보 또는 관리자 권한 확인
     is_self = current_user.id == user_id
-    has_admin = await has_permission(current_user.id, "org:admin_users:manage")
+    has_admin = await has_permission(current_user, "org:admin_users:manage", db)
 
     if not (is_self or has_admin):
         raise permission_denied_exception("사용자 정보 접근")
@@ -123,7 +124,7 @@ async def update_user(
     자신의 정보 또는 관리자 권한이 필요합니다.
     """
     # 권한 확인 (자신의 계정이거나 관리자만 수정 가능)
-    has_admin = await has_permission(current_user.id, "org:admin_users:manage")
+    has_admin = await has_permission(current_user, "org:admin_users:manage", db)
     if current_user.id != user_id and not has_admin:
         raise permission_denied_exception("사용자 정보 수정")
 
@@ -147,6 +148,7 @@ async def update_user(
             where={"id": user_id},
             data=update_data
         )
+        permission_engine.invalidate_user(user_id)
 
         return create_response(
             success=True,
@@ -171,7 +173,7 @@ async def delete_user(
     관리자 권한이 필요합니다.
     """
     # 관리자 권한 확인
-    has_admin = await has_permission(current_user.id, "org:admin_users:manage")
+    has_admin = await has_permission(current_user, "org:admin_users:manage", db)
     if not has_admin:
         raise permission_denied_exception("사용자 삭제")
 
@@ -188,6 +190,7 @@ async def delete_user(
             where={"id": user_id},
             data={"isActive": False}
         )
+        permission_engine.invalidate_user(user_id)
 
         return create_response(
             success=True,
@@ -14,7 +14,6 @@ import logging
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi.exceptions import RequestValidationError
-import uvicorn
 
 # 환경 변수 로드
 load_dotenv()
@@ -25,6 +24,9 @@ from routes.auth_routes import router as auth_router
 from routes.user_routes_enhanced import router as user_router
 from routes.organization_routes import router as organization_router
 from routes.permission_routes import router as permission_router
+from shared.database.client_registry import prisma_registry
+from shared.utils.password_hasher import PasswordHashingBusy, close_password_hasher
+from shared.utils.server_launcher import default_response_class, run_server
 
 # 로깅 설정
 logging.basicConfig(
@@ -47,10 +49,13 @@ async def lifespan(app: FastAPI):
     """
     # 앱 시작 시 실행될 코드
     logger.info(f"서버 시작 (환경: {ENV})")
+    await prisma_registry.startup()
 
     yield
 
     # 앱 종료 시 실행될 코드
+    await prisma_registry.shutdown()
+    close_password_hasher()
     logger.info("서버 종료")
 
 
@@ -59,6 +64,7 @@ app = FastAPI(
     title="CarGoro Core API",
     description="인증, 사용자 관리 및 권한 관리 API",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
@@ -103,6 +109,20 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """로그인 폭주로 비밀번호 해싱 대기 시간을 넘긴 요청"""
+    from shared.utils.response_utils import create_error_response
+
+    response = create_error_response(
+        message="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        error_code="PASSWORD_HASHING_BUSY",
+    )
+    response.headers["Retry-After"] = "1"
+    return response
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     """일반 예외 처리기"""
@@ -171,4 +191,4 @@ async def not_found_handler(request: Request, exc):
 # 서버 실행 (직접 실행 시에만)
 if __name__ == "__main__":
     print(f"FastAPI 서버 시작 중... (Host: {host}, Port: {port})")
-    uvicorn.run("server:app", host=host, port=port, reload=reload)
+    run_server(app, app_path="server:app", host=host, port=port, reload=reload)
@@ -0,0 +1,198 @@
+"""
+권한 엔진
+
+역할별 권한 집합을 한 번에 미리 계산해 버전이 붙은 frozenset 으로 보관하고,
+사용자 정보와 사용자 개별 권한(override)은 TTL 캐시에 보관합니다.
+캐시가 채워진 뒤의 권한 확인은 DB 조회 없이 집합 조회만으로 끝납니다.
+
+권한 부여/회수, 사용자 수정 시 invalidate_* 로 무효화합니다.
+무효화는 프로세스 안에서만 적용되므로 다른 워커의 캐시는 TTL 이 지나면 갱신됩니다.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+ADMIN_ROLE = "ADMIN"
+
+
+def _role_key(role: Any) -> str:
+    """Prisma enum/문자열 역할을 같은 키로 변환"""
+    return str(getattr(role, "value", role))
+
+
+class PermissionEngine:
+    """역할 권한 스냅샷과 사용자 캐시를 관리하는 권한 엔진"""
+
+    def __init__(self, role_ttl: float = 300.0, user_ttl: float = 60.0, max_users: int = 10_000):
+        """
+        Args:
+            role_ttl: 역할 권한 스냅샷 만료 시간(초)
+            user_ttl: 사용자/개별 권한 캐시 만료 시간(초)
+            max_users: 캐시할 최대 사용자 수 (초과 시 가장 오래 사용하지 않은 사용자 제거)
+        """
+        self.role_ttl = role_ttl
+        self.user_ttl = user_ttl
+        self.max_users = max_users
+        # 역할 스냅샷 버전 (무효화할 때마다 증가)
+        self.version = 0
+        self._roles: Dict[str, FrozenSet[str]] = {}
+        self._roles_loaded_at = float("-inf")
+        self._roles_version = -1
+        self._roles_lock = asyncio.Lock()
+        # user_id -> (만료 시각, 사용자)
+        self._users: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # user_id -> (만료 시각, 개별 부여 권한)
+        self._grants: "OrderedDict[str, Tuple[float, FrozenSet[str]]]" = OrderedDict()
+        # 사용자 무효화 횟수 (조회 중 무효화되면 조회 결과를 캐시하지 않음)
+        self._user_generation = 0
+
+    # ---------- 무효화 ----------
+
+    def invalidate_roles(self) -> None:
+        """역할-권한 변경 시 스냅샷 무효화 (다음 확인 때 다시 계산)"""
+        self.version += 1
+
+    def invalidate_user(self, user_id: str) -> None:
+        """사용자 정보/개별 권한 변경 시 해당 사용자 캐시 제거"""
+        self._user_generation += 1
+        self._users.pop(user_id, None)
+        self._grants.pop(user_id, None)
+
+    def clear(self) -> None:
+        """모든 캐시 제거"""
+        self.invalidate_roles()
+        self._user_generation += 1
+        self._users.clear()
+        self._grants.clear()
+
+    # ---------- 캐시 내부 ----------
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Optional[Any]:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_set(self, cache: OrderedDict, key: str, value: Any) -> None:
+        cache[key] = (time.monotonic() + self.user_ttl, value)
+        cache.move_to_end(key)
+        while len(cache) > self.max_users:
+            cache.popitem(last=False)
+
+    def _roles_fresh(self) -> bool:
+        return (
+            self._roles_version == self.version
+            and time.monotonic() - self._roles_loaded_at < self.role_ttl
+        )
+
+    async def _load_roles(self, db) -> Dict[str, FrozenSet[str]]:
+        """모든 역할의 권한 집합을 한 번의 쿼리로 계산"""
+        if self._roles_fresh():
+            return self._roles
+        async with self._roles_lock:
+            if self._roles_fresh():
+                return self._roles
+            version = self.version
+            role_permissions = await db.rolepermission.find_many(include={"permission": True})
+            grouped: Dict[str, set] = {}
+            for rp in role_permissions:
+                grouped.setdefault(_role_key(rp.role), set()).add(rp.permission.code)
+            self._roles = {role: frozenset(codes) for role, codes in grouped.items()}
+            self._roles_version = version
+            self._roles_loaded_at = time.monotonic()
+            return self._roles
+
+    async def _load_grants(self, user_ids: Iterable[str], db) -> Dict[str, FrozenSet[str]]:
+        """사용자 개별 권한 (캐시에 없는 사용자만 한 번의 IN 쿼리로 조회)"""
+        result: Dict[str, FrozenSet[str]] = {}
+        missing: List[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            grants = self._cache_get(self._grants, user_id)
+            if grants is None:
+                missing.append(user_id)
+            else:
+                result[user_id] = grants
+
+        if missing:
+            generation = self._user_generation
+            user_permissions = await db.userpermission.find_many(
+                where={"userId": {"in": missing}, "granted": True},
+                include={"permission": True},
+            )
+            grouped: Dict[str, set] = {user_id: set() for user_id in missing}
+            for up in user_permissions:
+                grouped[up.userId].add(up.permission.code)
+            for user_id, codes in grouped.items():
+                grants = frozenset(codes)
+                if generation == self._user_generation:
+                    self._cache_set(self._grants, user_id, grants)
+                result[user_id] = grants
+        return result
+
+    # ---------- 조회 ----------
+
+    async def get_user(self, user_id: str, db) -> Optional[Any]:
+        """사용자 조회 (캐시)"""
+        user = self._cache_get(self._users, user_id)
+        if user is None:
+            generation = self._user_generation
+            user = await db.user.find_unique(where={"id": user_id})
+            if user is not None and generation == self._user_generation:
+                self._cache_set(self._users, user_id, user)
+        return user
+
+    async def role_permissions(self, role: Any, db) -> FrozenSet[str]:
+        """역할의 권한 집합"""
+        roles = await self._load_roles(db)
+        return roles.get(_role_key(role), frozenset())
+
+    async def user_permissions(self, user: Any, db) -> FrozenSet[str]:
+        """사용자의 전체 권한 집합 (역할 권한 + 개별 부여 권한)"""
+        roles = await self._load_roles(db)
+        grants = await self._load_grants([user.id], db)
+        return roles.get(_role_key(user.role), frozenset()) | grants[user.id]
+
+    async def has_permission(self, user: Any, permission_code: str, db) -> bool:
+        """사용자가 특정 권한을 가지고 있는지 확인 (관리자는 모든 권한)"""
+        if _role_key(user.role) == ADMIN_ROLE:
+            return True
+        roles = await self._load_roles(db)
+        if permission_code in roles.get(_role_key(user.role), ()):
+            return True
+        grants = await self._load_grants([user.id], db)
+        return permission_code in grants[user.id]
+
+    async def has_permissions(self, user: Any, permission_codes: Iterable[str], db) -> Dict[str, bool]:
+        """여러 권한을 한 번에 확인"""
+        codes = list(permission_codes)
+        if _role_key(user.role) == ADMIN_ROLE:
+            return {code: True for code in codes}
+        permissions = await self.user_permissions(user, db)
+        return {code: code in permissions for code in codes}
+
+    async def users_with_permission(self, users: Iterable[Any], permission_code: str, db) -> Dict[str, bool]:
+        """여러 사용자의 권한 보유 여부를 한 번에 확인 (개별 권한은 IN 쿼리 한 번)"""
+        users = list(users)
+        roles = await self._load_roles(db)
+        result: Dict[str, bool] = {}
+        pending = []
+        for user in users:
+            role = _role_key(user.role)
+            if role == ADMIN_ROLE or permission_code in roles.get(role, ()):
+                result[user.id] = True
+            else:
+                pending.append(user.id)
+        if pending:
+            grants = await self._load_grants(pending, db)
+            for user_id in pending:
+                result[user_id] = permission_code in grants[user_id]
+        return result
+
+
+# 프로세스 전역 권한 엔진
+permission_engine = PermissionEngine()
@@ -0,0 +1,313 @@
+"""
+인증 검증/권한 조회 벤치마크 스크립트 (lib/app.py asyncpg 경로)
+
+임시 스키마에 사용자/조직/역할/권한 데이터를 만들고 다음을 비교합니다.
+- /api/auth/validate 초당 처리 요청 수
+  - legacy: 요청마다 SELECT * FROM users (기존 verify_token)
+  - principal (캐시 없음): PRINCIPAL_QUERY 한 번 (PRINCIPAL_CACHE_TTL=0 과 같음)
+  - principal (캐시): (사용자, 조직)별 Principal TTL 캐시
+- 권한 조회(get_user_permissions): 기존 3번 왕복 vs PRINCIPAL_QUERY 1번
+- 역할 조회(get_user_roles): 기존 역할마다 권한 쿼리(N+1) vs USER_ROLES_QUERY 1번
+새 쿼리 결과가 기존 쿼리 결과와 같은지도 확인합니다.
+
+실제 PostgreSQL(DATABASE_URL)이 필요하며, 벤치마크가 끝나면 임시 스키마를 삭제합니다.
+
+사용법: python scripts/benchmark_auth_validate.py [--requests 20000] [--concurrency 20] [--principals 1000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+import uuid
+
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib")
+sys.path.insert(0, LIB_DIR)
+
+import asyncpg
+import httpx
+
+import app as core_app
+
+# app.py 가 INFO 로깅을 설정하므로 요청마다 찍히는 httpx 로그는 끔
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+SCHEMA = "bench_principal"
+
+SCHEMA_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+SET search_path TO {SCHEMA};
+CREATE TABLE users (
+    id uuid PRIMARY KEY,
+    clerk_id text UNIQUE NOT NULL,
+    email text NOT NULL,
+    first_name text,
+    last_name text,
+    phone_number text,
+    profile_image text,
+    active boolean NOT NULL DEFAULT true,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    last_login timestamptz
+);
+CREATE TABLE organizations (id uuid PRIMARY KEY, name text NOT NULL);
+CREATE TABLE roles (id serial PRIMARY KEY, name text NOT NULL, description text);
+CREATE TABLE permissions (id serial PRIMARY KEY, name text NOT NULL, description text, scope text NOT NULL);
+CREATE TABLE role_permissions (role_id int REFERENCES roles, permission_id int REFERENCES permissions,
+                               PRIMARY KEY (role_id, permission_id));
+CREATE TABLE user_permissions (user_id uuid REFERENCES users, permission_id int REFERENCES permissions,
+                               PRIMARY KEY (user_id, permission_id));
+CREATE TABLE organization_members (
+    id serial PRIMARY KEY,
+    user_id uuid REFERENCES users,
+    organization_id uuid REFERENCES organizations,
+    role_id int REFERENCES roles,
+    status text NOT NULL DEFAULT 'active',
+    UNIQUE (user_id, organization_id)
+);
+"""
+
+# 기존 lib/app.py 쿼리 (비교용)
+LEGACY_USER_QUERY = "SELECT * FROM users WHERE id = $1 AND active = true"
+LEGACY_ROLE_QUERY = """
+SELECT r.*
+FROM roles r
+JOIN organization_members om ON r.id = om.role_id
+WHERE om.user_id = $1 AND om.organization_id = $2 AND om.status = 'active'
+"""
+LEGACY_ROLE_PERMISSION_QUERY = """
+SELECT p.*
+FROM permissions p
+JOIN role_permissions rp ON p.id = rp.permission_id
+WHERE rp.role_id = $1
+"""
+LEGACY_DIRECT_PERMISSION_QUERY = """
+SELECT p.*
+FROM permissions p
+JOIN user_permissions up ON p.id = up.permission_id
+WHERE up.user_id = $1
+"""
+
+
+async def legacy_permissions(user_id, organization_id, conn):
+    role = await conn.fetchrow(LEGACY_ROLE_QUERY, user_id, organization_id)
+    if not role:
+        return []
+    permissions = await conn.fetch(LEGACY_ROLE_PERMISSION_QUERY, role["id"])
+    direct_permissions = await conn.fetch(LEGACY_DIRECT_PERMISSION_QUERY, user_id)
+    return list({p["name"] for p in permissions} | {p["name"] for p in direct_permissions})
+
+
+async def legacy_roles(user_id, organization_id, conn):
+    roles = []
+    for role in await conn.fetch(LEGACY_ROLE_QUERY, user_id, organization_id):
+        permission_records = await conn.fetch(LEGACY_ROLE_PERMISSION_QUERY, role["id"])
+        roles.append(
+            {
+                "id": role["id"],
+                "name": role["name"],
+                "description": role["description"],
+                "permissions": [
+                    {"id": p["id"], "name": p["name"], "description": p["description"], "scope": p["scope"]}
+                    for p in sorted(permission_records, key=lambda p: p["id"])
+                ],
+            }
+        )
+    return roles
+
+
+async def seed(conn, args, rng):
+    await conn.execute(SCHEMA_SQL)
+    users = [uuid.uuid4() for _ in range(args.users)]
+    organizations = [uuid.uuid4() for _ in range(args.organizations)]
+    await conn.copy_records_to_table(
+        "users",
+        schema_name=SCHEMA,
+        columns=["id", "clerk_id", "email", "first_name", "last_name", "phone_number", "profile_image", "active"],
+        records=[
+            (u, f"clerk_{i}", f"user{i}@example.com", "길동", "홍", "010-0000-0000",
+             f"https://cdn.example.com/profile/{u}.png", rng.random() > 0.02)
+            for i, u in enumerate(users)
+        ],
+    )
+    await conn.copy_records_to_table(
+        "organizations", schema_name=SCHEMA, records=[(o, f"조직 {i}") for i, o in enumerate(organizations)]
+    )
+    await conn.executemany(
+        "INSERT INTO roles (name, description) VALUES ($1, $2)",
+        [(f"ROLE_{i}", f"역할 {i}") for i in range(args.roles)],
+    )
+    await conn.executemany(
+        "INSERT INTO permissions (name, description, scope) VALUES ($1, $2, $3)",
+        [(f"resource_{i // 4}:{['read', 'write', 'delete', 'admin'][i % 4]}", f"권한 {i}", "organization")
+         for i in range(args.permissions)],
+    )
+    await conn.copy_records_to_table(
+        "role_permissions",
+        schema_name=SCHEMA,
+        records=[
+            (role_id, permission_id)
+            for role_id in range(1, args.roles + 1)
+            for permission_id in rng.sample(range(1, args.permissions + 1), args.permissions_per_role)
+        ],
+    )
+    await conn.copy_records_to_table(
+        "user_permissions",
+        schema_name=SCHEMA,
+        records=[
+            (u, permission_id)
+            for u in users if rng.random() < 0.2
+            for permission_id in rng.sample(range(1, args.permissions + 1), 3)
+        ],
+    )
+    members = []
+    for u in users:
+        for o in rng.sample(organizations, rng.randint(1, 3)):
+            members.append((u, o, rng.randint(1, args.roles), "active" if rng.random() > 0.05 else "inactive"))
+    await conn.copy_records_to_table(
+        "organization_members",
+        schema_name=SCHEMA,
+        columns=["user_id", "organization_id", "role_id", "status"],
+        records=members,
+    )
+    await conn.execute("ANALYZE")
+    return [(str(u), str(o)) for u, o, _, _ in members]
+
+
+async def legacy_verify_token(token: str, conn=None):
+    """기존 verify_token (요청마다 연결을 가져와 SELECT * FROM users)"""
+    try:
+        payload = core_app.jwt.decode(token, core_app.JWT_SECRET, algorithms=[core_app.JWT_ALGORITHM])
+    except core_app.jwt.PyJWTError:
+        return None
+    async with core_app.db_pool.acquire() as conn:
+        user = await conn.fetchrow(LEGACY_USER_QUERY, payload["userId"])
+    return payload if user else None
+
+
+async def measure(tokens, total: int, concurrency: int) -> float:
+    """/api/auth/validate 를 total 번 호출하고 초당 요청 수 반환"""
+    transport = httpx.ASGITransport(app=core_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = iter(range(total))
+
+        async def worker():
+            for n in queue:
+                response = await client.get("/api/auth/validate", params={"token": tokens[n % len(tokens)]})
+                if response.status_code not in (200, 401):
+                    response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - started)
+
+
+async def measure_calls(pool, func, pairs, total: int, concurrency: int) -> float:
+    """func(user_id, organization_id, conn) 를 total 번 호출하고 초당 호출 수 반환"""
+    queue = iter(range(total))
+
+    async def worker():
+        for n in queue:
+            user_id, organization_id = pairs[n % len(pairs)]
+            async with pool.acquire() as conn:
+                await func(user_id, organization_id, conn)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - started)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--requests", type=int, default=20000, help="측정마다 보내는 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--principals", type=int, default=1000, help="토큰을 발급할 (사용자, 조직) 수")
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--organizations", type=int, default=200)
+    parser.add_argument("--roles", type=int, default=12)
+    parser.add_argument("--permissions", type=int, default=240)
+    parser.add_argument("--permissions-per-role", type=int, default=40)
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("DATABASE_URL 또는 --database-url 이 필요합니다")
+
+    rng = random.Random(49)
+    setup = await asyncpg.connect(args.database_url)
+    try:
+        members = await seed(setup, args, rng)
+        pool = await asyncpg.create_pool(args.database_url, server_settings={"search_path": SCHEMA})
+        try:
+            pairs = rng.sample(members, args.principals)
+
+            # 결과 비교: 권한 목록과 역할 목록이 기존 쿼리와 같아야 함
+            # (비활성 사용자는 기존 권한 쿼리가 권한을 돌려주지만 Principal 은 None)
+            no_cache = core_app.PrincipalCache(ttl=0)
+            mismatches = inactive = 0
+            async with pool.acquire() as conn:
+                for user_id, organization_id in pairs:
+                    principal = await no_cache.get(user_id, organization_id, conn)
+                    if principal is None:
+                        inactive += 1
+                    elif set(await legacy_permissions(user_id, organization_id, conn)) != (
+                        set(principal.permissions) if principal.roles else set()
+                    ):
+                        mismatches += 1
+                    if await legacy_roles(user_id, organization_id, conn) != await core_app.get_user_roles(
+                        user_id, organization_id, conn
+                    ):
+                        mismatches += 1
+            print(
+                f"{len(pairs):,} principals checked against legacy queries, "
+                f"mismatches {mismatches} (inactive users skipped: {inactive})"
+            )
+
+            async def new_permissions(user_id, organization_id, conn):
+                return await no_cache.get(user_id, organization_id, conn)
+
+            total, concurrency = args.requests, args.concurrency
+            print(f"\npermission / role hydration ({total:,} calls, concurrency {concurrency})")
+            for name, func in [
+                ("get_user_permissions legacy (3 queries)", legacy_permissions),
+                ("get_user_permissions principal (1 query)", new_permissions),
+                ("get_user_roles legacy (1 + N queries)", legacy_roles),
+                ("get_user_roles array_agg (1 query)", core_app.get_user_roles),
+            ]:
+                await measure_calls(pool, func, pairs, concurrency, concurrency)
+                rate = await measure_calls(pool, func, pairs, total, concurrency)
+                print(f"  {name:<42} {rate:>8,.0f} calls/s")
+
+            # 토큰: 활성 사용자 + 비활성 사용자(401) 섞음
+            tokens = [
+                core_app.create_jwt_token({"userId": user_id, "organizationId": organization_id})
+                for user_id, organization_id in pairs
+            ]
+            core_app.db_pool = pool
+            verify_token = core_app.verify_token
+            print(f"\n/api/auth/validate ({total:,} requests, concurrency {concurrency}, {len(tokens):,} tokens)")
+            for name, verify, cache in [
+                ("legacy SELECT *", legacy_verify_token, None),
+                ("principal, no cache", verify_token, core_app.PrincipalCache(ttl=0)),
+                ("principal, cached", verify_token, core_app.PrincipalCache(ttl=30)),
+            ]:
+                # 같은 앱(미들웨어 포함)에서 verify_token 만 바꿔 측정
+                core_app.verify_token = verify
+                if cache is not None:
+                    core_app.principal_cache = cache
+                await measure(tokens, concurrency, concurrency)
+                rate = await measure(tokens, total, concurrency)
+                stats = f"  hits {cache.hits:,} misses {cache.misses:,}" if cache and cache.ttl else ""
+                print(f"  {name:<42} {rate:>8,.0f} req/s{stats}")
+            core_app.verify_token = verify_token
+        finally:
+            await pool.close()
+    finally:
+        await setup.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await setup.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""
+Prisma 클라이언트 수명 벤치마크 스크립트
+
+단순 조회 엔드포인트를 두 방식으로 호출해 초당 처리 요청 수를 비교합니다.
+- per-request: 요청마다 Prisma() 생성 후 connect/disconnect (기존 get_db 방식)
+- shared: 애플리케이션 수명 동안 공유하는 레지스트리 클라이언트 (prisma_registry)
+
+실제 DB(DATABASE_URL)가 필요합니다.
+
+사용법: python scripts/benchmark_db_client.py [요청 수] [동시성]
+"""
+import asyncio
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, BACKEND_DIR)
+
+import httpx
+from fastapi import Depends, FastAPI
+from prisma import Prisma
+
+from shared.database.client_registry import prisma_registry
+
+
+async def per_request_db():
+    prisma = Prisma()
+    await prisma.connect()
+    try:
+        yield prisma
+    finally:
+        await prisma.disconnect()
+
+
+async def shared_db():
+    async with prisma_registry.session() as prisma:
+        yield prisma
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/per-request")
+    async def read_per_request(prisma: Prisma = Depends(per_request_db)):
+        return await prisma.query_raw("SELECT 1 AS ok")
+
+    @app.get("/shared")
+    async def read_shared(prisma: Prisma = Depends(shared_db)):
+        return await prisma.query_raw("SELECT 1 AS ok")
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> float:
+    """요청 total 개를 concurrency 개씩 동시에 보내고 초당 요청 수 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            response = await client.get(path)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    app = create_app()
+    await prisma_registry.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 워밍업
+            await measure(client, "/shared", concurrency, concurrency)
+            # 요청마다 쿼리 엔진을 새로 띄우므로 동시성을 높이면 DB 연결이 고갈될 수 있음
+            per_request = await measure(client, "/per-request", max(total // 10, 1), min(concurrency, 4))
+            shared = await measure(client, "/shared", total, concurrency)
+    finally:
+        await prisma_registry.shutdown()
+
+    print(f"per-request connect: {per_request:,.1f} req/s")
+    print(f"shared registry    : {shared:,.1f} req/s ({shared / per_request:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""
+비밀번호 해싱 벤치마크 스크립트
+
+로그인 요청 폭주 중에 관련 없는 엔드포인트(/ping)의 응답 시간을 비교합니다.
+- blocking: async 핸들러에서 CryptContext.verify 직접 호출 (기존 방식, 검증 동안 이벤트 루프 정지)
+- thread / process: 공용 PasswordHasher 의 작업자 풀에서 검증 (동시 실행 수 제한, 대기 시간 초과 시 503)
+
+앱은 httpx ASGITransport 로 같은 이벤트 루프에서 실행하므로 DB 나 서버 프로세스가 필요 없습니다.
+/ping 은 PING_INTERVAL 마다 보낼 예정 시각을 정해 두고 예정 시각부터 응답까지를 측정합니다
+(루프가 멈춰 보내지 못한 요청의 대기 시간도 포함). 로그인 응답 시간은 폭주 시작 시각부터 잽니다.
+
+사용법: python scripts/benchmark_password_hashing.py [--logins 200] [--rounds 12] [--modes blocking,thread,process]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, BACKEND_DIR)
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from passlib.context import CryptContext
+
+from shared.utils.password_hasher import PasswordHasher, PasswordHashingBusy
+
+PASSWORD = "correct horse battery staple"
+# 관련 없는 엔드포인트 호출 간격(초)
+PING_INTERVAL = 0.01
+
+
+def create_app(mode: str, context: CryptContext, hasher: PasswordHasher, stored_hash: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.exception_handler(PasswordHashingBusy)
+    async def busy(request, exc):
+        return JSONResponse({"code": "PASSWORD_HASHING_BUSY"}, status_code=503)
+
+    @app.post("/login")
+    async def login():
+        if mode == "blocking":
+            valid = context.verify(PASSWORD, stored_hash)
+        else:
+            valid = await hasher.verify(PASSWORD, stored_hash)
+        return {"valid": valid}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def percentile(values, ratio: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+async def run_mode(mode: str, args) -> None:
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=args.rounds)
+    stored_hash = context.hash(PASSWORD)
+    hasher = PasswordHasher(
+        rounds=args.rounds,
+        max_workers=args.workers,
+        queue_timeout=args.queue_timeout,
+        executor=mode if mode != "blocking" else "thread",
+    )
+    app = create_app(mode, context, hasher, stored_hash)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        await client.get("/ping")
+        if mode != "blocking":
+            await client.post("/login")  # 작업자 풀 준비
+
+        logins_done = asyncio.Event()
+        ping_latencies = []
+
+        async def pinger():
+            scheduled = time.perf_counter()
+            while not logins_done.is_set():
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                await client.get("/ping")
+                now = time.perf_counter()
+                # 루프가 멈춰 있던 동안 보냈어야 할 요청은 예정 시각부터 기다린 것으로 계산
+                while scheduled <= now:
+                    ping_latencies.append(now - scheduled)
+                    scheduled += PING_INTERVAL
+
+        async def login():
+            response = await client.post("/login")
+            return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        ping_task = asyncio.create_task(pinger())
+        results = await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        logins_done.set()
+        await ping_task
+
+    hasher.shutdown()
+    accepted = [latency for code, latency in results if code == 200]
+    rejected = sum(1 for code, _ in results if code == 503)
+    print(f"{mode:<9} burst {elapsed:6.1f} s  "
+          f"logins ok {len(accepted):>4} (p50 {statistics.median(accepted or [0]):.2f} s) 503 {rejected:>4}  "
+          f"/ping n={len(ping_latencies):>5} p50 {statistics.median(ping_latencies) * 1000:8.1f} ms  "
+          f"p99 {percentile(ping_latencies, 0.99) * 1000:8.1f} ms  max {max(ping_latencies) * 1000:8.1f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200, help="동시에 보내는 로그인 요청 수")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt 라운드 수")
+    parser.add_argument("--workers", type=int, default=None, help="해싱 작업자 수 (기본: CPU 수, 최대 4)")
+    parser.add_argument("--queue-timeout", type=float, default=120.0, help="해싱 작업자 대기 최대 시간(초)")
+    parser.add_argument("--modes", default="blocking,thread,process", help="비교할 방식 (쉼표 구분)")
+    args = parser.parse_args()
+
+    print(f"{args.logins} concurrent logins, bcrypt rounds {args.rounds}, cpu {os.cpu_count()}")
+    for mode in args.modes.split(","):
+        await run_mode(mode.strip(), args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+"""
+권한 엔진 검증 스크립트
+
+쿼리 수를 세는 메모리 DB 로 권한 엔진을 실행해 다음을 확인합니다.
+- 캐시가 채워진 뒤의 권한 확인은 DB 쿼리 0회
+- 역할 권한 변경/사용자 권한 회수 후 무효화하면 새 권한이 반영됨
+- 여러 사용자의 권한 확인은 개별 권한 IN 쿼리 1회
+- 기존 방식(요청마다 역할/사용자 권한 쿼리 2회)과 확인 속도 비교
+
+사용법: python scripts/check_permission_engine.py [확인 횟수]
+"""
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.services.permission_engine import PermissionEngine
+
+
+class CountingTable:
+    def __init__(self, name: str, rows, queries: Counter):
+        self.name = name
+        self.rows = rows
+        self.queries = queries
+
+    @staticmethod
+    def _match(row, where):
+        for key, condition in (where or {}).items():
+            value = getattr(row, key)
+            if isinstance(condition, dict) and "in" in condition:
+                if value not in condition["in"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    async def find_many(self, where=None, include=None):
+        self.queries[self.name] += 1
+        return [row for row in self.rows if self._match(row, where)]
+
+    async def find_unique(self, where):
+        self.queries[self.name] += 1
+        return next((row for row in self.rows if self._match(row, where)), None)
+
+
+class CountingDB:
+    def __init__(self, users, role_permissions, user_permissions):
+        self.queries: Counter = Counter()
+        self.user = CountingTable("user", users, self.queries)
+        self.rolepermission = CountingTable("rolepermission", role_permissions, self.queries)
+        self.userpermission = CountingTable("userpermission", user_permissions, self.queries)
+
+    @property
+    def total(self) -> int:
+        return sum(self.queries.values())
+
+
+def permission(code: str):
+    return SimpleNamespace(code=code)
+
+
+async def legacy_has_permission(user, code: str, db) -> bool:
+    """기존 구현: 확인할 때마다 역할 권한과 사용자 권한을 조회"""
+    if user.role == "ADMIN":
+        return True
+    role_permissions = await db.rolepermission.find_many(where={"role": user.role})
+    user_permissions = await db.userpermission.find_many(where={"userId": user.id, "granted": True})
+    codes = {rp.permission.code for rp in role_permissions} | {up.permission.code for up in user_permissions}
+    return code in codes
+
+
+async def main():
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    users = [SimpleNamespace(id=f"user-{i}", role="MANAGER" if i % 2 else "STAFF", isActive=True) for i in range(100)]
+    role_permissions = [
+        SimpleNamespace(role="MANAGER", permission=permission(f"perm:{i}")) for i in range(50)
+    ] + [SimpleNamespace(role="STAFF", permission=permission(f"perm:{i}")) for i in range(10)]
+    user_permissions = [
+        SimpleNamespace(userId="user-0", granted=True, permission=permission("reports:export")),
+    ]
+    db = CountingDB(users, role_permissions, user_permissions)
+    engine = PermissionEngine()
+    staff = await engine.get_user("user-0", db)
+
+    # 캐시 채우기
+    assert await engine.has_permission(staff, "reports:export", db)
+    assert not await engine.has_permission(staff, "perm:30", db)
+
+    # 1) 캐시된 권한 확인은 DB 쿼리 0회
+    before = db.total
+    started = time.perf_counter()
+    for i in range(checks):
+        user = await engine.get_user("user-0", db)
+        await engine.has_permission(user, f"perm:{i % 60}", db)
+    cached_elapsed = time.perf_counter() - started
+    assert db.total == before, f"캐시된 권한 확인에서 DB 쿼리 발생: {db.total - before}"
+    print(f"cached : {checks:,} checks, 0 queries, {checks / cached_elapsed:,.0f} checks/s")
+
+    # 2) 무효화 후 변경 반영
+    role_permissions.append(SimpleNamespace(role="STAFF", permission=permission("perm:30")))
+    engine.invalidate_roles()
+    assert await engine.has_permission(staff, "perm:30", db)
+    user_permissions.clear()
+    engine.invalidate_user(staff.id)
+    assert not await engine.has_permission(staff, "reports:export", db)
+    print("invalidation: role grant and user revoke reflected")
+
+    # 3) 여러 사용자 확인은 개별 권한 쿼리 1회
+    engine.clear()
+    await engine.role_permissions("STAFF", db)
+    before = db.queries["userpermission"]
+    result = await engine.users_with_permission(users, "perm:40", db)
+    assert db.queries["userpermission"] - before == 1
+    assert sum(result.values()) == 50
+    print("batched: 100 users checked with 1 user-permission query")
+
+    # 4) 기존 방식
+    legacy_checks = min(checks, 20_000)
+    before = db.total
+    started = time.perf_counter()
+    for i in range(legacy_checks):
+        await legacy_has_permission(staff, f"perm:{i % 60}", db)
+    legacy_elapsed = time.perf_counter() - started
+    print(
+        f"legacy : {legacy_checks:,} checks, {db.total - before:,} queries, "
+        f"{legacy_checks / legacy_elapsed:,.0f} checks/s (in-memory DB, no network)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,6 +16,7 @@ from prisma import Prisma
 from shared.utils.logging_utils import setup_logger
 from shared.utils.response_utils import ApiException, ErrorResponse
 from shared.config.settings import get_settings
+from shared.utils.server_launcher import default_response_class
 
 # 라우터 임포트
 from .routes import delivery_routes
@@ -54,6 +55,7 @@ app = FastAPI(
     title="CarGoro Delivery API",
     description="탁송 관리, 기사 일정 관리, 경로 관리, 탁송 이력 관리 API",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
@@ -5,7 +5,6 @@ Delivery API 서비스 진입점
 """
 import os
 import sys
-import uvicorn
 import argparse
 
 # 현재 디렉토리를 모듈 검색 경로에 추가
@@ -13,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # 표준화된 서버 모듈 임포트
 from lib.server import app
+from shared.utils.server_launcher import run_server
 
 # 서버 실행 (직접 실행 시에만)
 if __name__ == "__main__":
@@ -20,4 +20,4 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8308, help="Port to run the server on")
     args = parser.parse_args()
     port = int(os.getenv("PORT", str(args.port)))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    run_server(app, app_path="lib.server:app", host="0.0.0.0", port=port)
@@ -85,6 +85,33 @@ class DrivingRecordResponse(DrivingRecordBase):
     )
 
 
+# 일괄 생성 요청당 최대 운행 기록 수
+MAX_BULK_DRIVING_RECORDS = 50_000
+
+
+class DrivingRecordBulkCreate(BaseModel):
+    """운행 기록 일괄 생성 모델 (텔레매틱스 게이트웨이 업로드)"""
+
+    records: List[Dict[str, Any]] = Field(
+        ..., description="운행 기록 목록 (DrivingRecordCreate 형식)", max_length=MAX_BULK_DRIVING_RECORDS
+    )
+
+
+class DrivingRecordBulkError(BaseModel):
+    """운행 기록 일괄 생성 항목별 오류"""
+
+    index: int = Field(..., description="요청 내 항목 위치")
+    errors: List[str] = Field(..., description="오류 메시지 목록")
+
+
+class DrivingRecordBulkResult(BaseModel):
+    """운행 기록 일괄 생성 결과"""
+
+    accepted: int = Field(..., description="저장된 운행 기록 수")
+    rejected: List[DrivingRecordBulkError] = Field(..., description="저장하지 않은 항목과 오류")
+    vehicles_updated: int = Field(..., description="주행거리를 갱신한 차량 수")
+
+
 class DrivingRecordFilters(BaseModel):
     """운행 기록 필터링 모델"""
 
@@ -156,6 +156,43 @@ class MaintenanceResponse(MaintenanceBase):
     )
 
 
+# 가져오기 요청당 최대 유지보수 기록 수
+MAX_BULK_MAINTENANCE_RECORDS = 5_000
+
+
+class MaintenanceImport(MaintenanceCreate):
+    """과거 유지보수 기록 가져오기 모델 (완료된 정비 이력 포함)"""
+
+    status: MaintenanceStatus = Field(MaintenanceStatus.COMPLETED, description="상태")
+    actual_date: Optional[datetime] = Field(None, description="실제 수행 날짜")
+    actual_cost: Optional[float] = Field(None, description="실제 비용", ge=0)
+    invoice_number: Optional[str] = Field(None, description="청구서 번호")
+    warranty_info: Optional[str] = Field(None, description="보증 정보")
+
+
+class MaintenanceBulkCreate(BaseModel):
+    """유지보수 기록 일괄 가져오기 모델"""
+
+    records: List[Dict[str, Any]] = Field(
+        ..., description="유지보수 기록 목록 (MaintenanceImport 형식)", max_length=MAX_BULK_MAINTENANCE_RECORDS
+    )
+
+
+class MaintenanceBulkError(BaseModel):
+    """유지보수 기록 일괄 가져오기 항목별 오류"""
+
+    index: int = Field(..., description="요청 내 항목 위치")
+    errors: List[str] = Field(..., description="오류 메시지 목록")
+
+
+class MaintenanceBulkResult(BaseModel):
+    """유지보수 기록 일괄 가져오기 결과"""
+
+    accepted: int = Field(..., description="저장된 유지보수 기록 수")
+    parts_created: int = Field(..., description="저장된 부품 수")
+    rejected: List[MaintenanceBulkError] = Field(..., description="저장하지 않은 항목과 오류")
+
+
 class MaintenanceScheduleSettings(BaseModel):
     """유지보수 일정 설정 모델"""
 
@@ -3,7 +3,7 @@
 알림 모델 정의
 """
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 from ..models.contract import to_camel
@@ -50,3 +50,16 @@ class NotificationResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
     )
+
+
+class NotificationListResponse(BaseModel):
+    """알림 목록 한 페이지 (최신순 키셋 페이지네이션)"""
+
+    items: List[NotificationResponse] = Field(..., description="알림 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
+
+
+class NotificationCount(BaseModel):
+    """알림 수 (읽지 않은 수, 일괄 읽음 처리 수)"""
+
+    count: int = Field(..., description="알림 수")
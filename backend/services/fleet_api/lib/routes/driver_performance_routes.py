@@ -16,7 +16,7 @@ from ..models.driver_performance import (
     DriverScoreCategory,
 )
 from ..utils.auth import get_current_user
-from ..utils.model_conversion import model_to_db_dict, db_to_model
+from ..utils.model_conversion import model_to_db_dict, db_to_model, register_models
 from ..utils.response_utils import (
     ApiResponse,
     create_response,
@@ -34,6 +34,9 @@ db = Prisma()
 router = APIRouter(tags=["driver-performance"])
 logger = logging.getLogger(__name__)
 
+# 응답 모델 필드 맵을 임포트 시 미리 계산
+register_models(DriverPerformanceResponse)
+
 # 리소스 타입 상수
 RESOURCE_TYPE = "운전자 성능 데이터"
 
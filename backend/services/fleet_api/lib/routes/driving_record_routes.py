@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import json
 import math
 import logging
+from prisma import Json
 from prisma.errors import PrismaError
 
 from ..models.driver_performance import (
+    DrivingRecordBulkCreate,
+    DrivingRecordBulkError,
+    DrivingRecordBulkResult,
     DrivingRecordCreate,
     DrivingRecordUpdate,
     DrivingRecordResponse,
@@ -13,6 +18,9 @@ from ..models.driver_performance import (
     DrivingRecordListResponse,
 )
 from ..utils.auth import get_current_user
+from ..services.scoring_worker import scoring_worker
+from ..utils.bulk_utils import create_many_chunked, find_existing_ids, validate_items
+from ..utils.model_conversion import snake_to_camel
 from ..utils.response_utils import (
     ApiResponse,
     ApiException,
@@ -32,6 +40,23 @@ db = Prisma()
 router = APIRouter(tags=["driving-records"])
 logger = logging.getLogger(__name__)
 
+# 차량별 주행거리 증가분을 한 문장으로 반영 ($1: [{"id": ..., "delta": ...}] JSON)
+INCREMENT_MILEAGE_SQL = (
+    'UPDATE "Vehicle" AS v SET "mileage" = COALESCE(v."mileage", 0) + d.delta, "updatedAt" = now() '
+    "FROM json_to_recordset($1::json) AS d(id text, delta int) "
+    "WHERE v.id = d.id"
+)
+
+
+def to_driving_record_data(record: DrivingRecordCreate) -> Dict[str, Any]:
+    """운행 기록 모델을 DB 데이터로 변환 (최상위 키만 camelCase 로, 경로 데이터는 그대로)"""
+    data = {snake_to_camel(key): value for key, value in record.model_dump().items()}
+    if data.get("routeData") is not None:
+        data["routeData"] = Json(data["routeData"])
+    else:
+        data.pop("routeData", None)
+    return data
+
 
 @router.post(
     "/driving-records",
@@ -62,40 +87,16 @@ async def create_driving_record(
         if not vehicle:
             raise not_found_exception("차량", record_data.vehicle_id)
 
-        # 운행 기록 생성
-        record_data_dict = record_data.model_dump()
-
-        # camelCase로 변환 (Prisma DB 필드명과 일치)
-        record_data_dict["driverId"] = record_data_dict.pop("driver_id")
-        record_data_dict["vehicleId"] = record_data_dict.pop("vehicle_id")
-        record_data_dict["startTime"] = record_data_dict.pop("start_time")
-        record_data_dict["endTime"] = record_data_dict.pop("end_time")
-
-        if "start_location" in record_data_dict:
-            record_data_dict["startLocation"] = record_data_dict.pop("start_location")
-        if "end_location" in record_data_dict:
-            record_data_dict["endLocation"] = record_data_dict.pop("end_location")
-        if "avg_speed" in record_data_dict:
-            record_data_dict["avgSpeed"] = record_data_dict.pop("avg_speed")
-        if "max_speed" in record_data_dict:
-            record_data_dict["maxSpeed"] = record_data_dict.pop("max_speed")
-        if "fuel_consumption" in record_data_dict:
-            record_data_dict["fuelConsumption"] = record_data_dict.pop("fuel_consumption")
-        if "hard_brake_count" in record_data_dict:
-            record_data_dict["hardBrakeCount"] = record_data_dict.pop("hard_brake_count")
-        if "hard_accel_count" in record_data_dict:
-            record_data_dict["hardAccelCount"] = record_data_dict.pop("hard_accel_count")
-        if "idling_duration" in record_data_dict:
-            record_data_dict["idlingDuration"] = record_data_dict.pop("idling_duration")
-        if "route_data" in record_data_dict:
-            record_data_dict["routeData"] = record_data_dict.pop("route_data")
+        # 운행 기록 생성 (camelCase 로 변환해 Prisma DB 필드명과 일치)
+        record_data_dict = to_driving_record_data(record_data)
 
         new_record = await db.drivingrecord.create(data=record_data_dict)
+        scoring_worker.mark_dirty([record_data.start_time])
 
-        # 차량 상태 및 주행거리 업데이트
+        # 차량 주행거리 업데이트 (동시 요청에도 누락되지 않도록 DB 에서 증가)
         await db.vehicle.update(
             where={"id": record_data.vehicle_id},
-            data={"mileage": vehicle.mileage + int(record_data.distance)},
+            data={"mileage": {"increment": int(record_data.distance)}},
         )
 
         # camelCase DB 데이터를 snake_case로 변환
@@ -116,6 +117,82 @@ async def create_driving_record(
         raise server_error_exception(f"운행 기록 생성 중 오류가 발생했습니다: {str(e)}")
 
 
+@router.post(
+    "/driving-records/bulk",
+    response_model=ApiResponse[DrivingRecordBulkResult],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_driving_records_bulk(
+    payload: DrivingRecordBulkCreate,
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    운행 기록을 일괄 생성합니다. (텔레매틱스 게이트웨이의 교대 종료 업로드용)
+
+    항목별로 검증하고 운전자/차량 존재 여부는 각각 IN 쿼리로 한 번에 확인합니다.
+    유효한 기록의 배치 INSERT 와 차량별로 합산한 주행거리 증가는 하나의 트랜잭션으로 반영하며,
+    저장하지 않은 항목은 위치와 오류를 반환합니다.
+    """
+    try:
+        # 인증된 사용자만 운행 기록 생성 가능
+        if not current_user:
+            raise unauthorized_exception("인증되지 않은 사용자입니다.")
+
+        valid, rejected = validate_items(DrivingRecordCreate, payload.records)
+
+        # 운전자/차량 존재 여부 확인 (각각 IN 쿼리)
+        drivers = await find_existing_ids(db.driver, {record.driver_id for _, record in valid})
+        vehicles = await find_existing_ids(db.vehicle, {record.vehicle_id for _, record in valid})
+
+        records: List[Dict[str, Any]] = []
+        mileage: Dict[str, int] = {}
+        for index, record in valid:
+            errors = []
+            if record.driver_id not in drivers:
+                errors.append(f"운전자를 찾을 수 없습니다: {record.driver_id}")
+            if record.vehicle_id not in vehicles:
+                errors.append(f"차량을 찾을 수 없습니다: {record.vehicle_id}")
+            if errors:
+                rejected[index] = errors
+                continue
+            records.append(to_driving_record_data(record))
+            # 단건 생성과 같이 운행마다 정수 km 로 반영
+            mileage[record.vehicle_id] = mileage.get(record.vehicle_id, 0) + int(record.distance)
+
+        # 기록 저장과 주행거리 증가를 함께 반영 (중간에 실패하면 모두 취소)
+        if records:
+            async with db.tx() as transaction:
+                await create_many_chunked(transaction.drivingrecord, records)
+                increments = [{"id": vehicle_id, "delta": delta} for vehicle_id, delta in mileage.items() if delta]
+                if increments:
+                    await transaction.execute_raw(INCREMENT_MILEAGE_SQL, json.dumps(increments))
+            scoring_worker.mark_dirty(record["startTime"] for record in records)
+
+        if rejected:
+            logger.warning(f"운행 기록 일괄 생성: {len(rejected)}건 제외")
+
+        result = DrivingRecordBulkResult(
+            accepted=len(records),
+            rejected=[
+                DrivingRecordBulkError(index=index, errors=errors) for index, errors in sorted(rejected.items())
+            ],
+            vehicles_updated=len(mileage) if records else 0,
+        )
+        return create_response(
+            data=result,
+            message=f"운행 기록 {len(records)}건이 저장되었습니다."
+        )
+
+    except PrismaError as e:
+        logger.error(f"Prisma 오류: {str(e)}")
+        raise server_error_exception("운행 기록 일괄 생성 중 데이터베이스 오류가 발생했습니다.")
+    except ApiException:
+        raise
+    except Exception as e:
+        logger.error(f"예상치 못한 오류: {str(e)}")
+        raise server_error_exception(f"운행 기록 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
+
 @router.get("/driving-records", response_model=ApiResponse[List[DrivingRecordResponse]])
 async def get_driving_records(
     driver_id: Optional[str] = None,
@@ -299,6 +376,8 @@ async def update_driving_record(
         updated_record = await db.drivingrecord.update(
             where={"id": record_id}, data=update_data
         )
+        # 시작 시각이 바뀌어 다른 기간으로 옮겨 간 경우 이전/새 기간 모두 재계산
+        scoring_worker.mark_dirty([existing_record.startTime, updated_record.startTime])
 
         response_data = DrivingRecordResponse.model_validate(updated_record)
 
@@ -349,6 +428,7 @@ async def delete_driving_record(
 
         # 운행 기록 삭제
         await db.drivingrecord.delete(where={"id": record_id})
+        scoring_worker.mark_dirty([existing_record.startTime])
 
         return None
 
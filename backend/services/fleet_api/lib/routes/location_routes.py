@@ -15,6 +15,7 @@ from ..utils.response_utils import (
     validation_exception,
     server_error_exception,
 )
+from shared.utils.event_bus import VEHICLE_LOCATION_UPDATED, get_event_bus
 import logging
 
 router = APIRouter(
@@ -39,6 +40,24 @@ def get_prisma():
     return prisma
 
 
+async def publish_location_updated(location: VehicleLocationResponse) -> None:
+    """GraphQL 구독(vehicleLocationUpdated)으로 전달할 위치 갱신 이벤트 발행"""
+    await get_event_bus().publish(
+        VEHICLE_LOCATION_UPDATED,
+        {
+            "id": location.id,
+            "vehicle_id": location.vehicle_id,
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+            "altitude": location.altitude,
+            "heading": location.heading,
+            "speed": location.speed,
+            "accuracy": location.accuracy,
+            "timestamp": location.updated_at,
+        },
+    )
+
+
 # 차량 위치 정보 생성
 @router.post("/", response_model=ApiResponse, status_code=201)
 async def create_vehicle_location(
@@ -69,6 +88,8 @@ async def create_vehicle_location(
         location_response = VehicleLocationResponse.model_validate_obj(new_location)
         location_response.license_plate = vehicle.license_plate
 
+        await publish_location_updated(location_response)
+
         return create_response(data=location_response)
     except HTTPException:
         raise
@@ -267,6 +288,8 @@ async def update_vehicle_location(
             else None
         )
 
+        await publish_location_updated(location_response)
+
         return create_response(data=location_response)
     except HTTPException:
         raise
@@ -2,14 +2,19 @@
 차량 유지보수 관련 API 라우트
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
+from uuid import uuid4
 import math
 import logging
 from prisma.errors import PrismaError
 
 from ..models.maintenance import (
+    MaintenanceBulkCreate,
+    MaintenanceBulkError,
+    MaintenanceBulkResult,
     MaintenanceCreate,
+    MaintenanceImport,
     MaintenanceUpdate,
     MaintenanceResponse,
     MaintenancePartCreate,
@@ -19,7 +24,8 @@ from ..models.maintenance import (
     MaintenanceType,
 )
 from ..utils.auth import get_current_user
-from ..utils.model_conversion import model_to_db_dict, db_to_model
+from ..utils.bulk_utils import create_many_chunked, find_existing_ids, validate_items
+from ..utils.model_conversion import model_to_db_dict, db_to_model, register_models
 from ..utils.response_utils import (
     ApiResponse,
     create_response,
@@ -37,10 +43,22 @@ db = Prisma()
 router = APIRouter(tags=["maintenance"])
 logger = logging.getLogger(__name__)
 
+# 응답 모델 필드 맵을 임포트 시 미리 계산
+register_models(MaintenanceResponse)
+
 # 리소스 타입 상수
 RESOURCE_TYPE = "유지보수 기록"
 
 
+def to_part_rows(parts: Iterable[Any], maintenance_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """부품 모델 목록을 DB 데이터로 변환 (maintenance_id 가 있으면 외래 키 포함, create_many 용)"""
+    rows = [model_to_db_dict(part) for part in parts]
+    if maintenance_id is not None:
+        for row in rows:
+            row["maintenanceId"] = maintenance_id
+    return rows
+
+
 @router.post(
     "/maintenance",
     response_model=ApiResponse[MaintenanceResponse],
@@ -66,19 +84,12 @@ async def create_maintenance(
         # DB 데이터 변환 (snake_case -> camelCase)
         maintenance_data_dict = model_to_db_dict(maintenance_data, exclude={"parts"})
 
-        # 유지보수 데이터 생성
-        new_maintenance = await db.maintenance.create(data=maintenance_data_dict)
-
-        # 부품 데이터 추가
+        # 부품은 중첩 생성으로 유지보수 기록과 한 번에 저장 (같은 트랜잭션, 다시 조회하지 않음)
         if maintenance_data.parts:
-            for part in maintenance_data.parts:
-                part_dict = model_to_db_dict(part)
-                part_dict["maintenanceId"] = new_maintenance.id
-                await db.maintenancepart.create(data=part_dict)
-
-        # 생성된 유지보수 기록 조회 (부품 포함)
-        created_maintenance = await db.maintenance.find_unique(
-            where={"id": new_maintenance.id}, include={"parts": True}
+            maintenance_data_dict["parts"] = {"create": to_part_rows(maintenance_data.parts)}
+
+        created_maintenance = await db.maintenance.create(
+            data=maintenance_data_dict, include={"parts": True}
         )
 
         # 결과 변환
@@ -97,6 +108,70 @@ async def create_maintenance(
         raise server_error_exception(str(e))
 
 
+@router.post(
+    "/maintenance/bulk",
+    response_model=ApiResponse[MaintenanceBulkResult],
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_maintenance_bulk(
+    payload: MaintenanceBulkCreate, current_user: dict = Depends(get_current_user)
+):
+    """
+    과거 유지보수 기록을 부품과 함께 일괄 가져옵니다.
+
+    항목별로 검증하고 차량 존재 여부는 IN 쿼리로 한 번에 확인합니다.
+    기록 ID 를 미리 만들어 유지보수 기록과 부품을 각각 배치 INSERT 하며, 모두 하나의 트랜잭션으로 반영합니다.
+    저장하지 않은 항목은 위치와 오류를 반환합니다.
+    """
+    try:
+        # 인증된 사용자만 유지보수 기록 생성 가능
+        if not current_user:
+            raise unauthorized_exception()
+
+        valid, rejected = validate_items(MaintenanceImport, payload.records)
+
+        # 차량 존재 여부 확인 (IN 쿼리)
+        vehicles = await find_existing_ids(db.vehicle, {record.vehicle_id for _, record in valid})
+
+        maintenance_rows: List[Dict[str, Any]] = []
+        part_rows: List[Dict[str, Any]] = []
+        for index, record in valid:
+            if record.vehicle_id not in vehicles:
+                rejected[index] = [f"차량을 찾을 수 없습니다: {record.vehicle_id}"]
+                continue
+            row = model_to_db_dict(record, exclude={"parts"})
+            row["id"] = str(uuid4())
+            maintenance_rows.append(row)
+            part_rows.extend(to_part_rows(record.parts or [], row["id"]))
+
+        # 기록과 부품을 함께 반영 (중간에 실패하면 모두 취소)
+        if maintenance_rows:
+            async with db.tx() as transaction:
+                await create_many_chunked(transaction.maintenance, maintenance_rows)
+                await create_many_chunked(transaction.maintenancepart, part_rows)
+
+        if rejected:
+            logger.warning(f"유지보수 기록 일괄 가져오기: {len(rejected)}건 제외")
+
+        result = MaintenanceBulkResult(
+            accepted=len(maintenance_rows),
+            parts_created=len(part_rows) if maintenance_rows else 0,
+            rejected=[
+                MaintenanceBulkError(index=index, errors=errors) for index, errors in sorted(rejected.items())
+            ],
+        )
+        return create_response(
+            data=result,
+            message=f"{RESOURCE_TYPE} {len(maintenance_rows)}건이 저장되었습니다.",
+        )
+
+    except Exception as e:
+        logger.error(f"유지보수 기록 일괄 가져오기 오류: {str(e)}")
+        if isinstance(e, HTTPException):
+            raise e
+        raise server_error_exception(str(e))
+
+
 @router.get(
     "/maintenance/{maintenance_id}",
     response_model=ApiResponse[MaintenanceResponse],
@@ -146,40 +221,27 @@ async def update_maintenance(
     특정 ID의 유지보수 기록을 업데이트합니다.
     """
     try:
-        # 유지보수 기록 존재 확인
-        existing_maintenance = await db.maintenance.find_unique(
-            where={"id": maintenance_id}
-        )
-
-        if not existing_maintenance:
-            raise not_found_exception(RESOURCE_TYPE, maintenance_id)
-
-        # DB 데이터 변환
-        db_data = model_to_db_dict(maintenance_data, exclude={"parts"})
-
-        # 업데이트
-        updated_maintenance = await db.maintenance.update(
-            where={"id": maintenance_id},
-            data=db_data,
-        )
-
-        # 부품 업데이트 처리 (필요한 경우)
-        if maintenance_data.parts is not None:
-            # 기존 부품 삭제
-            await db.maintenancepart.delete_many(
-                where={"maintenance_id": maintenance_id}
+        # DB 데이터 변환 (요청에 포함된 필드만 변경)
+        db_data = model_to_db_dict(maintenance_data, exclude={"parts"}, exclude_unset=True)
+
+        # 부품 교체와 기록 업데이트를 한 트랜잭션으로 처리 (기록이 없으면 롤백)
+        async with db.tx() as transaction:
+            if maintenance_data.parts is not None:
+                # 기존 부품 삭제 후 새 부품을 중첩 생성
+                await transaction.maintenancepart.delete_many(
+                    where={"maintenanceId": maintenance_id}
+                )
+                if maintenance_data.parts:
+                    db_data["parts"] = {"create": to_part_rows(maintenance_data.parts)}
+
+            result_maintenance = await transaction.maintenance.update(
+                where={"id": maintenance_id},
+                data=db_data,
+                include={"parts": True},
             )
 
-            # 새로운 부품 추가
-            for part in maintenance_data.parts:
-                part_dict = model_to_db_dict(part)
-                part_dict["maintenanceId"] = maintenance_id
-                await db.maintenancepart.create(data=part_dict)
-
-        # 업데이트된 기록 조회
-        result_maintenance = await db.maintenance.find_unique(
-            where={"id": maintenance_id}, include={"parts": True}
-        )
+            if not result_maintenance:
+                raise not_found_exception(RESOURCE_TYPE, maintenance_id)
 
         # 결과 변환
         result = db_to_model(MaintenanceResponse, result_maintenance)
@@ -219,7 +281,7 @@ async def delete_maintenance(
 
         # 관련 부품 데이터 삭제
         await db.maintenancepart.delete_many(
-            where={"maintenance_id": maintenance_id}
+            where={"maintenanceId": maintenance_id}
         )
 
         # 유지보수 기록 삭제
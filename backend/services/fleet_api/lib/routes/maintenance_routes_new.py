@@ -19,7 +19,7 @@ from ..models.maintenance import (
     MaintenanceType,
 )
 from ..utils.auth import get_current_user
-from ..utils.model_conversion import model_to_db_dict, db_to_model
+from ..utils.model_conversion import model_to_db_dict, db_to_model, register_models
 from ..utils.response_utils import (
     ApiResponse,
     create_response,
@@ -37,6 +37,9 @@ db = Prisma()
 router = APIRouter(tags=["maintenance"])
 logger = logging.getLogger(__name__)
 
+# 응답 모델 필드 맵을 임포트 시 미리 계산
+register_models(MaintenanceResponse)
+
 # 리소스 타입 상수
 RESOURCE_TYPE = "유지보수 기록"
 
@@ -3,10 +3,21 @@
 알림(Notifications) 관리 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
-from typing import List, Optional
+from typing import Optional
 from prisma import Prisma
-from ..models.notification import NotificationCreate, NotificationResponse
-from ..utils.response_utils import create_response, not_found_exception, server_error_exception
+from ..models.notification import (
+    NotificationCount,
+    NotificationCreate,
+    NotificationListResponse,
+    NotificationResponse,
+)
+from ..services import notifications
+from ..utils.response_utils import (
+    create_response,
+    not_found_exception,
+    server_error_exception,
+    validation_exception,
+)
 
 router = APIRouter(
     prefix="/notifications",
@@ -14,37 +25,47 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# 알림 목록 조회
-@router.get("", response_model=List[NotificationResponse])
+# 알림 목록 조회 (최신순, 키셋 페이지네이션)
+@router.get("", response_model=NotificationListResponse)
 async def get_notifications(
     target_type: Optional[str] = Query(None),
     target_id: Optional[str] = Query(None),
     type: Optional[str] = Query(None),  # will map to field 'type'
     is_read: Optional[bool] = Query(None),
     severity: Optional[str] = Query(None),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     page_size: int = Query(20, ge=1, le=100),
     prisma: Prisma = Depends(),
 ):
     try:
-        where: dict = {}
-        if target_type:
-            where['target_type'] = target_type
-        if target_id:
-            where['target_id'] = target_id
-        if type:
-            where['type'] = type
-        if severity:
-            where['severity'] = severity
-        if is_read is not None:
-            where['is_read'] = is_read
-
-        skip = (page - 1) * page_size
-        items = await prisma.notification.find_many(where=where, skip=skip, take=page_size)
-        return [NotificationResponse.model_validate(item) for item in items]
+        items, next_cursor = await notifications.fetch_notification_page(
+            prisma,
+            page_size,
+            cursor=cursor,
+            target_type=target_type,
+            target_id=target_id,
+            type=type,
+            severity=severity,
+            is_read=is_read,
+        )
+        return NotificationListResponse(
+            items=[NotificationResponse.model_validate(item) for item in items],
+            next_cursor=next_cursor,
+        )
+    except ValueError as e:
+        raise validation_exception({"message": str(e), "cursor": cursor})
     except Exception as e:
         raise server_error_exception(f"알림 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
+# 읽지 않은 알림 수 조회 (대상별 카운터 조회)
+@router.get("/unread-count", response_model=NotificationCount)
+async def get_unread_count(
+    target_id: Optional[str] = Query(None),
+    prisma: Prisma = Depends(),
+):
+    count = await notifications.get_unread_count(prisma, target_id)
+    return NotificationCount(count=count)
+
 # 특정 알림 조회
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
@@ -63,7 +84,7 @@ async def create_notification(
     prisma: Prisma = Depends(),
 ):
     try:
-        new_notif = await prisma.notification.create(data=notification.model_dump())
+        new_notif = await notifications.create_notification(prisma, notification.model_dump())
         return NotificationResponse.model_validate(new_notif)
     except Exception as e:
         raise server_error_exception(f"알림 생성 중 오류가 발생했습니다: {str(e)}")
@@ -74,27 +95,21 @@ async def mark_as_read(
     notification_id: str = Path(...),
     prisma: Prisma = Depends(),
 ):
+    await notifications.mark_read(prisma, notification_id)
     notif = await prisma.notification.find_unique(where={"id": notification_id})
     if not notif:
         raise not_found_exception("Notification", notification_id)
-    updated = await prisma.notification.update(
-        where={"id": notification_id}, data={"is_read": True}
-    )
-    return NotificationResponse.model_validate(updated)
+    return NotificationResponse.model_validate(notif)
 
-# 모든 알림 읽음 처리
-@router.post("/mark-all-read", response_model=List[NotificationResponse])
+# 모든 알림 읽음 처리 (읽음 처리한 수만 반환)
+@router.post("/mark-all-read", response_model=NotificationCount)
 async def mark_all_as_read(
     target_id: Optional[str] = Body(None),
     prisma: Prisma = Depends(),
 ):
     try:
-        where: dict = {"is_read": False}
-        if target_id:
-            where['target_id'] = target_id
-        await prisma.notification.update_many(where=where, data={"is_read": True})
-        items = await prisma.notification.find_many(where={"is_read": True, **({"target_id": target_id} if target_id else {})})
-        return [NotificationResponse.model_validate(item) for item in items]
+        count = await notifications.mark_all_read(prisma, target_id)
+        return NotificationCount(count=count)
     except Exception as e:
         raise server_error_exception(f"알림 일괄 읽음 처리 중 오류가 발생했습니다: {str(e)}")
 
@@ -104,20 +119,6 @@ async def delete_notification(
     notification_id: str = Path(...),
     prisma: Prisma = Depends(),
 ):
-    notif = await prisma.notification.find_unique(where={"id": notification_id})
-    if not notif:
+    if not await notifications.delete_notification(prisma, notification_id):
         raise not_found_exception("Notification", notification_id)
-    await prisma.notification.delete(where={"id": notification_id})
     return None
-
-# 읽지 않은 알림 수 조회
-@router.get("/unread-count")
-async def get_unread_count(
-    target_id: Optional[str] = Query(None),
-    prisma: Prisma = Depends(),
-):
-    where: dict = {"is_read": False}
-    if target_id:
-        where['target_id'] = target_id
-    count = await prisma.notification.count(where=where)
-    return {"count": count}
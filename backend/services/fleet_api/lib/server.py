@@ -17,6 +17,8 @@ from prisma import Prisma
 from shared.utils.logging_utils import setup_logger
 from shared.utils.response_utils import ApiException, ErrorResponse
 from shared.config.settings import get_settings
+from shared.utils.server_launcher import default_response_class
+from shared.utils.event_bus import close_event_bus
 
 # 라우터 임포트
 from lib.routes import (
@@ -33,6 +35,8 @@ from lib.routes.notification_routes import (
     router as notification_router,
 )  # 알림 라우터 import
 from lib.routes.assignment_routes import router as assignment_router
+from lib.services.scoring_worker import scoring_worker
+from lib.services.notifications import close_unread_count_publisher
 
 # 환경 설정 로드
 settings = get_settings()
@@ -57,12 +61,18 @@ async def lifespan(app: FastAPI):
         prisma = Prisma()
         await prisma.connect()
         logger.info("데이터베이스 연결 성공")
+
+        # 운행 기록 변경 기간의 운전자 성과 점수 재계산 워커
+        await scoring_worker.start(prisma)
     except Exception as e:
         logger.error(f"데이터베이스 연결 오류: {str(e)}")
 
     yield
 
     # 앱 종료 시 실행될 코드
+    await scoring_worker.stop()
+    await close_unread_count_publisher()
+    await close_event_bus()
     try:
         if prisma:
             await prisma.disconnect()
@@ -77,6 +87,7 @@ app = FastAPI(
     title="CarGoro Fleet API",
     description="차량 관리, 계약 관리, 운전자 관리, 주행 기록 관리 API",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
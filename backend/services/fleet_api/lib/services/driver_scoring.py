@@ -0,0 +1,277 @@
+"""
+운전자 성과 점수 계산 엔진
+
+운행 기록을 운전자 x 집계 기간(PerformancePeriod)별로 집계하고 점수와 전체 운전자 대비 백분위를 계산합니다.
+모든 계산은 pandas/NumPy 벡터 연산으로 수행하며 DB 입출력과 분리되어 있어 워커 스레드에서 실행할 수 있습니다.
+
+점수 (0-100):
+- 안전(safety): 100km 당 위험 이벤트(급제동 + 급가속 + 과속 운행 x 2) 수에 비례해 감점
+- 친환경(eco): 기간 내 전체 운전자 연비 중앙값 대비 연비(70%) + 공회전 비율(30%)
+  (연료 데이터가 없으면 공회전 비율만 사용)
+- 종합(overall): 안전 60% + 친환경 40%
+"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ..models.driver_performance import PerformancePeriod
+
+# 기간 유형별 pandas Period 빈도 (주는 월요일 시작)
+PERIOD_FREQ = {
+    PerformancePeriod.DAILY: "D",
+    PerformancePeriod.WEEKLY: "W-SUN",
+    PerformancePeriod.MONTHLY: "M",
+    PerformancePeriod.QUARTERLY: "Q",
+    PerformancePeriod.YEARLY: "Y",
+}
+
+# 과속으로 보는 최고 속도(km/h)
+SPEEDING_THRESHOLD_KMH = 110.0
+# 한 번에 저장할 성과 행 수
+UPSERT_CHUNK = 5000
+
+# 100km 당 위험 이벤트 1회당 감점
+SAFETY_PENALTY_PER_EVENT_RATE = 10.0
+SAFETY_WEIGHT = 0.6
+ECO_WEIGHT = 0.4
+
+RECORD_COLUMNS = [
+    "driverId", "startTime", "endTime", "distance", "maxSpeed",
+    "fuelConsumption", "hardBrakeCount", "hardAccelCount", "idlingDuration",
+]
+
+
+def records_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """DB 조회 결과(행 사전 목록)를 계산용 DataFrame 으로 변환"""
+    frame = pd.DataFrame(rows, columns=RECORD_COLUMNS)
+    for column in ("startTime", "endTime"):
+        frame[column] = pd.to_datetime(frame[column], utc=True).dt.tz_localize(None)
+    for column in ("distance", "maxSpeed", "fuelConsumption"):
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+    for column in ("hardBrakeCount", "hardAccelCount", "idlingDuration"):
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").fillna(0).astype("int64")
+    return frame
+
+
+def aggregate_records(records: pd.DataFrame, period: PerformancePeriod) -> pd.DataFrame:
+    """
+    운전자 x 기간별 운행 기록 집계
+
+    Args:
+        records: records_frame() 형식의 운행 기록
+        period: 집계 기간 유형
+
+    Returns:
+        (driverId, periodStart) 별 집계 DataFrame (periodEnd 는 다음 기간 시작, 미포함)
+    """
+    periods = records["startTime"].dt.to_period(PERIOD_FREQ[period])
+    minutes = (records["endTime"] - records["startTime"]).dt.total_seconds().clip(lower=0) / 60
+    fuel = records["fuelConsumption"]
+    frame = pd.DataFrame({
+        "driverId": records["driverId"],
+        "periodStart": periods.dt.start_time,
+        "periodEnd": (periods + 1).dt.start_time,
+        "distance": records["distance"],
+        "minutes": minutes,
+        "maxSpeed": records["maxSpeed"],
+        "hardBrakeCount": records["hardBrakeCount"],
+        "hardAccelCount": records["hardAccelCount"],
+        "idlingDuration": records["idlingDuration"],
+        "speeding": (records["maxSpeed"] > SPEEDING_THRESHOLD_KMH).astype("int64"),
+        # 연비는 연료 기록이 있는 운행만으로 계산
+        "fuel": fuel,
+        "fuelDistance": records["distance"].where(fuel > 0),
+    })
+
+    grouped = frame.groupby(["driverId", "periodStart", "periodEnd"], sort=False)
+    aggregated = grouped.agg(
+        tripCount=("distance", "size"),
+        totalDistance=("distance", "sum"),
+        drivingMinutes=("minutes", "sum"),
+        maxSpeed=("maxSpeed", "max"),
+        hardBrakeCount=("hardBrakeCount", "sum"),
+        hardAccelerationCount=("hardAccelCount", "sum"),
+        idlingDuration=("idlingDuration", "sum"),
+        speedingIncidents=("speeding", "sum"),
+        fuelConsumption=("fuel", "sum"),
+        fuelDistance=("fuelDistance", "sum"),
+    ).reset_index()
+    return aggregated
+
+
+def score_aggregates(aggregated: pd.DataFrame) -> pd.DataFrame:
+    """집계 결과에 점수와 기간 내 백분위 추가"""
+    frame = aggregated.copy()
+    distance = frame["totalDistance"].to_numpy()
+    hours = frame["drivingMinutes"].to_numpy() / 60
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frame["avgSpeed"] = np.where(hours > 0, distance / hours, np.nan)
+        fuel = frame["fuelConsumption"].to_numpy()
+        frame["avgFuelEfficiency"] = np.where(fuel > 0, frame["fuelDistance"].to_numpy() / fuel, np.nan)
+
+        # 안전 점수: 100km 당 위험 이벤트 수
+        events = (
+            frame["hardBrakeCount"].to_numpy()
+            + frame["hardAccelerationCount"].to_numpy()
+            + 2 * frame["speedingIncidents"].to_numpy()
+        )
+        event_rate = np.where(distance > 0, events / distance * 100, 0.0)
+        safety = np.clip(100 - SAFETY_PENALTY_PER_EVENT_RATE * event_rate, 0, 100)
+
+        # 친환경 점수: 기간 내 연비 중앙값 대비 연비 + 공회전 비율
+        median_efficiency = frame.groupby("periodStart")["avgFuelEfficiency"].transform("median").to_numpy()
+        fuel_part = np.clip(50 * frame["avgFuelEfficiency"].to_numpy() / median_efficiency, 0, 100)
+        idle_ratio = np.where(
+            frame["drivingMinutes"].to_numpy() > 0,
+            frame["idlingDuration"].to_numpy() / frame["drivingMinutes"].to_numpy(),
+            0.0,
+        )
+        idle_part = np.clip(100 * (1 - 2 * idle_ratio), 0, 100)
+        eco = np.where(np.isnan(fuel_part), idle_part, 0.7 * fuel_part + 0.3 * idle_part)
+
+    overall = SAFETY_WEIGHT * safety + ECO_WEIGHT * eco
+    frame["safetyScore"] = np.rint(safety).astype("int64")
+    frame["ecoScore"] = np.rint(eco).astype("int64")
+    frame["overallScore"] = np.rint(overall).astype("int64")
+
+    # 같은 기간의 전체 운전자 대비 백분위 (높을수록 상위)
+    by_period = frame.groupby("periodStart")
+    frame["safetyPercentile"] = (by_period["safetyScore"].rank(pct=True) * 100).round(1)
+    frame["overallPercentile"] = (by_period["overallScore"].rank(pct=True) * 100).round(1)
+    return frame
+
+
+def compute_scores(records: pd.DataFrame, period: PerformancePeriod) -> pd.DataFrame:
+    """운행 기록으로 운전자 x 기간별 성과와 점수 계산"""
+    if records.empty:
+        return pd.DataFrame()
+    return score_aggregates(aggregate_records(records, period))
+
+
+def performance_frame(scores: pd.DataFrame, period: PerformancePeriod) -> pd.DataFrame:
+    """점수 DataFrame 을 DriverPerformance 컬럼 구성으로 변환"""
+    if scores.empty:
+        return pd.DataFrame()
+    return pd.DataFrame({
+        "driverId": scores["driverId"],
+        "period": period.value,
+        "periodStart": scores["periodStart"],
+        "periodEnd": scores["periodEnd"],
+        "tripCount": scores["tripCount"],
+        "totalDistance": scores["totalDistance"].round(2),
+        "drivingTime": np.rint(scores["drivingMinutes"]).astype("int64"),
+        "avgSpeed": scores["avgSpeed"].round(2),
+        "maxSpeed": scores["maxSpeed"],
+        "hardBrakeCount": scores["hardBrakeCount"],
+        "hardAccelerationCount": scores["hardAccelerationCount"],
+        "idlingDuration": scores["idlingDuration"],
+        "speedingIncidents": scores["speedingIncidents"],
+        "fuelConsumption": scores["fuelConsumption"].round(2),
+        "avgFuelEfficiency": scores["avgFuelEfficiency"].round(2),
+        "safetyScore": scores["safetyScore"],
+        "ecoScore": scores["ecoScore"],
+        "overallScore": scores["overallScore"],
+        "safetyPercentile": scores["safetyPercentile"],
+        "overallPercentile": scores["overallPercentile"],
+    })
+
+
+def performance_payloads(performances: pd.DataFrame, chunk_size: int = None) -> List[str]:
+    """
+    저장용 JSON 배열 문자열 목록 (chunk_size 행씩)
+
+    DataFrame.to_json 으로 바로 직렬화해 행마다 파이썬 사전을 만들지 않습니다. (NaN 은 null)
+    """
+    chunk_size = chunk_size or UPSERT_CHUNK
+    return [
+        performances.iloc[start:start + chunk_size].to_json(orient="records", date_format="iso")
+        for start in range(0, len(performances), chunk_size)
+    ]
+
+
+# 기간 x 운전자 성과 저장 (있으면 갱신) - $1: performance_payloads() JSON
+UPSERT_PERFORMANCE_SQL = """
+INSERT INTO "DriverPerformance" (
+    "id", "driverId", "period", "periodStart", "periodEnd", "tripCount", "totalDistance", "drivingTime",
+    "avgSpeed", "maxSpeed", "hardBrakeCount", "hardAccelerationCount", "idlingDuration", "speedingIncidents",
+    "fuelConsumption", "avgFuelEfficiency", "safetyScore", "ecoScore", "overallScore",
+    "safetyPercentile", "overallPercentile", "createdAt", "updatedAt"
+)
+SELECT
+    gen_random_uuid()::text, r."driverId", r."period", r."periodStart", r."periodEnd", r."tripCount",
+    r."totalDistance", r."drivingTime", r."avgSpeed", r."maxSpeed", r."hardBrakeCount",
+    r."hardAccelerationCount", r."idlingDuration", r."speedingIncidents", r."fuelConsumption",
+    r."avgFuelEfficiency", r."safetyScore", r."ecoScore", r."overallScore",
+    r."safetyPercentile", r."overallPercentile", now(), now()
+FROM json_to_recordset($1::json) AS r(
+    "driverId" text, "period" text, "periodStart" timestamp, "periodEnd" timestamp, "tripCount" int,
+    "totalDistance" float8, "drivingTime" int, "avgSpeed" float8, "maxSpeed" float8, "hardBrakeCount" int,
+    "hardAccelerationCount" int, "idlingDuration" int, "speedingIncidents" int, "fuelConsumption" float8,
+    "avgFuelEfficiency" float8, "safetyScore" int, "ecoScore" int, "overallScore" int,
+    "safetyPercentile" float8, "overallPercentile" float8
+)
+ON CONFLICT ("driverId", "periodStart", "periodEnd") DO UPDATE SET
+    "period" = EXCLUDED."period",
+    "tripCount" = EXCLUDED."tripCount",
+    "totalDistance" = EXCLUDED."totalDistance",
+    "drivingTime" = EXCLUDED."drivingTime",
+    "avgSpeed" = EXCLUDED."avgSpeed",
+    "maxSpeed" = EXCLUDED."maxSpeed",
+    "hardBrakeCount" = EXCLUDED."hardBrakeCount",
+    "hardAccelerationCount" = EXCLUDED."hardAccelerationCount",
+    "idlingDuration" = EXCLUDED."idlingDuration",
+    "speedingIncidents" = EXCLUDED."speedingIncidents",
+    "fuelConsumption" = EXCLUDED."fuelConsumption",
+    "avgFuelEfficiency" = EXCLUDED."avgFuelEfficiency",
+    "safetyScore" = EXCLUDED."safetyScore",
+    "ecoScore" = EXCLUDED."ecoScore",
+    "overallScore" = EXCLUDED."overallScore",
+    "safetyPercentile" = EXCLUDED."safetyPercentile",
+    "overallPercentile" = EXCLUDED."overallPercentile",
+    "updatedAt" = now()
+"""
+
+# 기간 성과 중 이번 계산에 없는 운전자 행 삭제 - $1/$2: 기간 시작/끝, $3: 운전자 ID JSON 배열
+DELETE_STALE_PERFORMANCE_SQL = """
+DELETE FROM "DriverPerformance"
+WHERE "periodStart" = $1::timestamp AND "periodEnd" = $2::timestamp
+  AND "driverId" NOT IN (SELECT json_array_elements_text($3::json))
+"""
+
+SELECT_RECORDS_SQL = (
+    'SELECT "driverId", "startTime", "endTime", "distance", "maxSpeed", "fuelConsumption", '
+    '"hardBrakeCount", "hardAccelCount", "idlingDuration" '
+    'FROM "DrivingRecord" WHERE "startTime" >= $1::timestamp AND "startTime" < $2::timestamp'
+)
+
+
+async def load_records(db, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """기간 내 시작한 운행 기록 조회 (점수 계산에 필요한 컬럼만)"""
+    return await db.query_raw(SELECT_RECORDS_SQL, start.isoformat(), end.isoformat())
+
+
+async def save_performances(
+    db, window_start: datetime, window_end: datetime, payloads: List[str], driver_ids: List[str]
+) -> int:
+    """
+    한 기간의 performance_payloads() 결과 저장 (청크당 문장 1회)
+
+    같은 트랜잭션에서 이번 계산에 없는 운전자(기간 내 운행 기록이 모두 삭제/이동된 운전자)의
+    기존 성과 행을 삭제합니다. driver_ids 가 비어 있으면 기간의 성과 행을 모두 삭제합니다.
+
+    Returns:
+        삭제한 성과 행 수
+    """
+    async with db.tx() as transaction:
+        for payload in payloads:
+            await transaction.execute_raw(UPSERT_PERFORMANCE_SQL, payload)
+        return await transaction.execute_raw(
+            DELETE_STALE_PERFORMANCE_SQL,
+            window_start.isoformat(),
+            window_end.isoformat(),
+            json.dumps(driver_ids),
+        )
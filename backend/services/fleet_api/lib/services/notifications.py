@@ -0,0 +1,296 @@
+"""
+알림 읽지 않은 수 카운터와 키셋 페이지네이션
+
+대상(target_id)별 읽지 않은 알림 수를 NotificationUnreadCounter 에 유지합니다.
+알림 생성/읽음/삭제와 같은 트랜잭션에서 카운터를 증감하므로 배지 조회는 기본 키 조회 한 번이고,
+읽음/삭제는 조건부 UPDATE/DELETE 의 RETURNING 으로 실제로 바뀐 알림만 반영해 동시 요청에도 어긋나지 않습니다.
+카운터가 바뀌면 (REALTIME_API_URL 이 설정된 경우) 새 값을 모아 realtime 서비스로 전송합니다.
+"""
+import asyncio
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 대상이 없는 알림의 카운터 키
+UNTARGETED = ""
+
+# 카운터 증감 후 새 값 반환 ($1: target_id, $2: 증감)
+ADJUST_UNREAD_SQL = (
+    'INSERT INTO "NotificationUnreadCounter" AS c ("target_id", "count", "updated_at") '
+    "VALUES ($1, GREATEST($2::int, 0), now()) "
+    'ON CONFLICT ("target_id") DO UPDATE SET "count" = GREATEST(c."count" + $2::int, 0), "updated_at" = now() '
+    'RETURNING "count"'
+)
+
+# 읽지 않은 알림만 읽음 처리 (이미 읽었으면 행 없음)
+MARK_READ_SQL = (
+    'UPDATE "Notification" SET "is_read" = true, "updated_at" = now() '
+    'WHERE "id" = $1 AND "is_read" = false '
+    'RETURNING COALESCE("target_id", \'\') AS target_id'
+)
+
+DELETE_SQL = (
+    'DELETE FROM "Notification" WHERE "id" = $1 '
+    'RETURNING "is_read", COALESCE("target_id", \'\') AS target_id'
+)
+
+# 일괄 읽음 처리와 대상별 카운터 차감을 한 문장으로 (대상별 읽음 처리 수와 새 카운터 값 반환)
+MARK_ALL_READ_SQL = """
+WITH flipped AS (
+    UPDATE "Notification" SET "is_read" = true, "updated_at" = now()
+    WHERE "is_read" = false{target_condition}
+    RETURNING COALESCE("target_id", '') AS target_id
+), per_target AS (
+    SELECT target_id, count(*)::int AS read FROM flipped GROUP BY target_id
+), counters AS (
+    UPDATE "NotificationUnreadCounter" AS c
+    SET "count" = GREATEST(c."count" - p.read, 0), "updated_at" = now()
+    FROM per_target AS p
+    WHERE c."target_id" = p.target_id
+    RETURNING c."target_id", c."count"
+)
+SELECT p.target_id, p.read, COALESCE(c."count", 0) AS count
+FROM per_target AS p LEFT JOIN counters AS c ON c."target_id" = p.target_id
+"""
+
+TOTAL_UNREAD_SQL = 'SELECT COALESCE(SUM("count"), 0)::int AS count FROM "NotificationUnreadCounter"'
+
+# 알림 테이블 기준으로 카운터 재계산 (최초 배포/점검용)
+REBUILD_COUNTERS_SQL = """
+WITH actual AS (
+    SELECT COALESCE("target_id", '') AS target_id, count(*)::int AS count
+    FROM "Notification" WHERE "is_read" = false GROUP BY 1
+), upserted AS (
+    INSERT INTO "NotificationUnreadCounter" ("target_id", "count", "updated_at")
+    SELECT target_id, count, now() FROM actual
+    ON CONFLICT ("target_id") DO UPDATE SET "count" = EXCLUDED."count", "updated_at" = now()
+    WHERE "NotificationUnreadCounter"."count" <> EXCLUDED."count"
+    RETURNING 1
+), cleared AS (
+    UPDATE "NotificationUnreadCounter" SET "count" = 0, "updated_at" = now()
+    WHERE "count" <> 0 AND "target_id" NOT IN (SELECT target_id FROM actual)
+    RETURNING 1
+)
+SELECT (SELECT count(*) FROM upserted)::int + (SELECT count(*) FROM cleared)::int AS fixed
+"""
+
+
+def encode_cursor(created_at: datetime, notification_id: str) -> str:
+    """키셋 커서 인코딩"""
+    return base64.urlsafe_b64encode(json.dumps([created_at.isoformat(), notification_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """키셋 커서 디코딩 (잘못된 커서는 ValueError)"""
+    try:
+        created_at, notification_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(notification_id)
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def build_notification_where(cursor: Optional[str] = None, **filters: Any) -> Dict[str, Any]:
+    """알림 조회 조건 (값이 있는 필터와 커서 이후 조건)"""
+    conditions: List[Dict[str, Any]] = [{key: value} for key, value in filters.items() if value is not None]
+    if cursor:
+        # (created_at, id) 내림차순에서 커서 다음 행
+        created_at, notification_id = decode_cursor(cursor)
+        conditions.append(
+            {
+                "OR": [
+                    {"created_at": {"lt": created_at}},
+                    {"created_at": created_at, "id": {"lt": notification_id}},
+                ]
+            }
+        )
+    return {"AND": conditions} if conditions else {}
+
+
+async def fetch_notification_page(
+    db, limit: int, cursor: Optional[str] = None, **filters: Any
+) -> Tuple[list, Optional[str]]:
+    """최신순 알림 한 페이지와 다음 페이지 커서"""
+    items = await db.notification.find_many(
+        where=build_notification_where(cursor, **filters),
+        take=limit + 1,
+        order=[{"created_at": "desc"}, {"id": "desc"}],
+    )
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return items, next_cursor
+
+
+async def _adjust(db, target_id: str, delta: int) -> int:
+    rows = await db.query_raw(ADJUST_UNREAD_SQL, target_id, delta)
+    return int(rows[0]["count"])
+
+
+async def create_notification(db, data: Dict[str, Any]):
+    """알림 생성과 대상 카운터 증가"""
+    async with db.tx() as transaction:
+        notification = await transaction.notification.create(data=data)
+        count = await _adjust(transaction, data.get("target_id") or UNTARGETED, 1)
+    publish_unread_counts({notification.target_id or UNTARGETED: count})
+    return notification
+
+
+async def mark_read(db, notification_id: str) -> bool:
+    """
+    알림 읽음 처리
+
+    Returns:
+        이번에 읽음으로 바뀌었는지 여부 (이미 읽었거나 없으면 False)
+    """
+    async with db.tx() as transaction:
+        rows = await transaction.query_raw(MARK_READ_SQL, notification_id)
+        if not rows:
+            return False
+        target_id = rows[0]["target_id"]
+        count = await _adjust(transaction, target_id, -1)
+    publish_unread_counts({target_id: count})
+    return True
+
+
+async def delete_notification(db, notification_id: str) -> bool:
+    """
+    알림 삭제 (읽지 않은 알림이면 카운터 차감)
+
+    Returns:
+        삭제 여부
+    """
+    async with db.tx() as transaction:
+        rows = await transaction.query_raw(DELETE_SQL, notification_id)
+        if not rows:
+            return False
+        count = None
+        if not rows[0]["is_read"]:
+            count = await _adjust(transaction, rows[0]["target_id"], -1)
+    if count is not None:
+        publish_unread_counts({rows[0]["target_id"]: count})
+    return True
+
+
+async def mark_all_read(db, target_id: Optional[str] = None) -> int:
+    """
+    읽지 않은 알림 일괄 읽음 처리 (target_id 가 없으면 전체)
+
+    Returns:
+        읽음 처리한 알림 수
+    """
+    if target_id:
+        rows = await db.query_raw(MARK_ALL_READ_SQL.format(target_condition=' AND "target_id" = $1'), target_id)
+    else:
+        rows = await db.query_raw(MARK_ALL_READ_SQL.format(target_condition=""))
+    publish_unread_counts({row["target_id"]: int(row["count"]) for row in rows})
+    return sum(int(row["read"]) for row in rows)
+
+
+async def get_unread_count(db, target_id: Optional[str] = None) -> int:
+    """읽지 않은 알림 수 (대상별은 기본 키 조회, 전체는 카운터 합계)"""
+    if target_id is None:
+        rows = await db.query_raw(TOTAL_UNREAD_SQL)
+        return int(rows[0]["count"]) if rows else 0
+    counter = await db.notificationunreadcounter.find_unique(where={"target_id": target_id})
+    return counter.count if counter else 0
+
+
+async def rebuild_unread_counters(db) -> int:
+    """
+    알림 테이블 기준으로 카운터 재계산
+
+    Returns:
+        값이 달라 고친 카운터 수
+    """
+    rows = await db.query_raw(REBUILD_COUNTERS_SQL)
+    return int(rows[0]["fixed"]) if rows else 0
+
+
+class UnreadCountPublisher:
+    """바뀐 읽지 않은 수를 모아 realtime 서비스로 전송 (대상별 최신 값만, interval 초마다 한 번)"""
+
+    def __init__(
+        self,
+        base_url: str,
+        interval: float = 0.2,
+        timeout: float = 2.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.interval = interval
+        self._client = httpx.AsyncClient(timeout=timeout, transport=transport)
+        self._pending: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, counts: Dict[str, int]) -> None:
+        """전송 대기열에 추가 (대상이 없는 알림의 카운터는 보내지 않음)"""
+        self._pending.update((target_id, count) for target_id, count in counts.items() if target_id)
+        if self._pending and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """대기 중인 값을 한 번에 전송 (실패해도 다음 변경 때 최신 값이 다시 전송됨)"""
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            response = await self._client.post(
+                f"{self.base_url}/api/notifications/unread-counts",
+                json=[{"targetId": target_id, "count": count} for target_id, count in batch.items()],
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"읽지 않은 알림 수 전송 실패 ({len(batch)}건): {str(e)}")
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        await self._client.aclose()
+
+
+_publisher: Optional[UnreadCountPublisher] = None
+
+
+def get_unread_count_publisher() -> Optional[UnreadCountPublisher]:
+    """프로세스 전역 전송기 (REALTIME_API_URL 미설정 시 None)"""
+    global _publisher
+    if _publisher is None:
+        from shared.config.settings import get_settings
+
+        base_url = get_settings().realtime_api_url
+        if base_url:
+            _publisher = UnreadCountPublisher(base_url)
+    return _publisher
+
+
+def publish_unread_counts(counts: Dict[str, int]) -> None:
+    """바뀐 카운터 값을 realtime 서비스로 전송 예약 (설정이 없으면 무시)"""
+    if not counts:
+        return
+    publisher = get_unread_count_publisher()
+    if publisher is not None:
+        publisher.publish(counts)
+
+
+async def close_unread_count_publisher() -> None:
+    """앱 종료 시 남은 값을 전송하고 전송기 정리"""
+    global _publisher
+    if _publisher is not None:
+        await _publisher.close()
+        _publisher = None
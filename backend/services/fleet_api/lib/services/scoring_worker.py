@@ -0,0 +1,191 @@
+"""
+운전자 성과 점수 재계산 워커
+
+운행 기록이 생성/수정/삭제되면 mark_dirty() 로 해당 운행이 속한 기간(일/주/월/분기/연)을 표시하고,
+백그라운드 작업이 표시된 기간만 다시 계산합니다.
+백분위는 같은 기간의 전체 운전자 기준이므로 기간 단위로 전체 운전자를 함께 다시 계산합니다.
+
+pandas 계산은 전용 스레드에서 실행해 요청 처리 이벤트 루프를 막지 않습니다.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Optional, Set, Tuple
+
+from ..models.driver_performance import PerformancePeriod
+
+logger = logging.getLogger(__name__)
+
+SCORED_PERIODS = (
+    PerformancePeriod.DAILY,
+    PerformancePeriod.WEEKLY,
+    PerformancePeriod.MONTHLY,
+    PerformancePeriod.QUARTERLY,
+    PerformancePeriod.YEARLY,
+)
+
+PeriodKey = Tuple[PerformancePeriod, datetime]
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + (day.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def to_naive_utc(moment: datetime) -> datetime:
+    """시간대가 있는 시각은 UTC 로 변환해 시간대 정보를 제거 (운행 기록/성과 기간은 naive UTC)"""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def period_window(period: PerformancePeriod, moment: datetime) -> Tuple[datetime, datetime]:
+    """시각이 속한 기간의 [시작, 끝) (주는 월요일 시작, UTC 기준)"""
+    day = to_naive_utc(moment).date()
+    if period == PerformancePeriod.DAILY:
+        start, end = day, day + timedelta(days=1)
+    elif period == PerformancePeriod.WEEKLY:
+        start = day - timedelta(days=day.weekday())
+        end = start + timedelta(days=7)
+    elif period == PerformancePeriod.MONTHLY:
+        start = day.replace(day=1)
+        end = _add_months(start, 1)
+    elif period == PerformancePeriod.QUARTERLY:
+        start = date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+        end = _add_months(start, 3)
+    elif period == PerformancePeriod.YEARLY:
+        start, end = date(day.year, 1, 1), date(day.year + 1, 1, 1)
+    else:
+        raise ValueError(f"점수를 계산하지 않는 기간 유형입니다: {period}")
+    return datetime.combine(start, datetime.min.time()), datetime.combine(end, datetime.min.time())
+
+
+class DriverScoringWorker:
+    """표시된 기간의 운전자 성과 점수를 백그라운드에서 재계산"""
+
+    def __init__(self, debounce: float = 5.0, periods: Iterable[PerformancePeriod] = SCORED_PERIODS):
+        """
+        Args:
+            debounce: 첫 표시 후 재계산까지 대기 시간(초) (연속 업로드를 한 번에 처리)
+            periods: 점수를 계산할 기간 유형
+        """
+        self.debounce = debounce
+        self.periods = tuple(periods)
+        self._dirty: Set[PeriodKey] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._db = None
+
+    def mark_dirty(self, start_times: Iterable[datetime]) -> None:
+        """운행 시작 시각이 속한 모든 기간을 재계산 대상으로 표시 (시간대가 있으면 UTC 기준)"""
+        for moment in start_times:
+            if moment is None:
+                continue
+            moment = to_naive_utc(moment)
+            for period in self.periods:
+                self._dirty.add((period, period_window(period, moment)[0]))
+        if self._dirty:
+            self._wakeup.set()
+
+    def mark_range(self, start: datetime, end: datetime) -> None:
+        """기간 내 모든 날짜를 재계산 대상으로 표시 (초기 계산/전체 재계산용)"""
+        days = (end.date() - start.date()).days + 1
+        self.mark_dirty(start + timedelta(days=offset) for offset in range(days))
+
+    @property
+    def pending(self) -> int:
+        """재계산 대기 중인 기간 수"""
+        return len(self._dirty)
+
+    async def start(self, db) -> None:
+        """백그라운드 작업 시작 (앱 시작 시 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._db = db
+        self._wakeup = asyncio.Event()
+        if self._dirty:
+            self._wakeup.set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-scoring")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        백그라운드 작업 종료
+
+        표시된 기간은 메모리에만 있으므로 같은 워커 객체를 다시 start() 하면 이어서 처리하지만,
+        프로세스가 재시작되면 사라집니다. (재시작 후에는 mark_range() 로 다시 표시)
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.debounce)
+            self._wakeup.clear()
+            await self.process_pending()
+
+    async def process_pending(self) -> int:
+        """표시된 기간을 모두 재계산 (실패한 기간은 다시 표시)"""
+        keys, self._dirty = self._dirty, set()
+        # 짧은 기간부터 처리해 최근 일/주 점수가 먼저 갱신되도록 함
+        order = {period: index for index, period in enumerate(SCORED_PERIODS)}
+        processed = 0
+        for period, start in sorted(keys, key=lambda key: (order[key[0]], key[1])):
+            try:
+                processed += await self.recompute(period, start)
+            except Exception as e:
+                logger.error(f"운전자 성과 재계산 실패 ({period.value} {start:%Y-%m-%d}): {str(e)}")
+                self._dirty.add((period, start))
+        return processed
+
+    async def recompute(self, period: PerformancePeriod, start: datetime) -> int:
+        """
+        한 기간의 전체 운전자 성과 재계산
+
+        Returns:
+            저장한 성과 행 수
+        """
+        from .driver_scoring import (
+            compute_scores,
+            load_records,
+            performance_frame,
+            performance_payloads,
+            records_frame,
+            save_performances,
+        )
+
+        window_start, window_end = period_window(period, start)
+        rows = await load_records(self._db, window_start, window_end)
+
+        def score():
+            performances = performance_frame(compute_scores(records_frame(rows), period), period)
+            if performances.empty:
+                return [], []
+            return performances["driverId"].tolist(), performance_payloads(performances)
+
+        # 운행 기록이 없어도 저장 단계에서 기존 성과 행을 삭제해야 하므로 계속 진행
+        driver_ids, payloads = [], []
+        if rows:
+            loop = asyncio.get_running_loop()
+            driver_ids, payloads = await loop.run_in_executor(self._executor, score)
+        removed = await save_performances(self._db, window_start, window_end, payloads, driver_ids)
+        logger.info(
+            f"운전자 성과 재계산 ({period.value} {window_start:%Y-%m-%d}): "
+            f"운행 {len(rows)}건, 운전자 {len(driver_ids)}명, 삭제 {removed}건"
+        )
+        return len(driver_ids)
+
+
+# 프로세스 전역 점수 재계산 워커
+scoring_worker = DriverScoringWorker()
@@ -0,0 +1,51 @@
+"""
+일괄 생성/가져오기 API 공통 유틸리티
+"""
+from typing import Any, Dict, Iterable, List, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+# 일괄 생성 시 INSERT 한 번에 넣는 행 수와 존재 확인 IN 쿼리 한 번에 넣는 ID 수
+BULK_INSERT_CHUNK = 1000
+ID_LOOKUP_CHUNK = 10_000
+
+
+def validate_items(
+    model_class: Type[T], items: Iterable[Dict[str, Any]]
+) -> Tuple[List[Tuple[int, T]], Dict[int, List[str]]]:
+    """
+    항목별 모델 검증
+
+    Returns:
+        ([(위치, 모델)], {위치: 오류 메시지 목록})
+    """
+    valid: List[Tuple[int, T]] = []
+    rejected: Dict[int, List[str]] = {}
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, model_class.model_validate(item)))
+        except ValidationError as e:
+            rejected[index] = [
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors()
+            ]
+    return valid, rejected
+
+
+async def find_existing_ids(model, ids: Iterable[str]) -> Set[str]:
+    """주어진 ID 중 존재하는 ID (IN 쿼리, ID_LOOKUP_CHUNK 개씩)"""
+    ids = list(ids)
+    existing: Set[str] = set()
+    for start in range(0, len(ids), ID_LOOKUP_CHUNK):
+        rows = await model.find_many(where={"id": {"in": ids[start:start + ID_LOOKUP_CHUNK]}})
+        existing.update(row.id for row in rows)
+    return existing
+
+
+async def create_many_chunked(model, rows: List[Dict[str, Any]], chunk_size: int = BULK_INSERT_CHUNK) -> int:
+    """행을 chunk_size 개씩 나눠 create_many (트랜잭션 클라이언트의 모델을 넘기면 함께 커밋/롤백)"""
+    created = 0
+    for start in range(0, len(rows), chunk_size):
+        created += await model.create_many(data=rows[start:start + chunk_size])
+    return created
@@ -6,7 +6,6 @@
 
 import os
 import sys
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -14,11 +13,14 @@ from fastapi.middleware.cors import CORSMiddleware
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
 
+from shared.utils.server_launcher import default_response_class, run_server
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="CarGoro Fleet API",
     description="차량 관리 및 플릿 운영 API 서비스",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -99,4 +101,4 @@ if __name__ == "__main__":
     print(f"📖 API 문서: http://localhost:{port}/docs")
     print(f"💚 헬스 체크: http://localhost:{port}/health")
 
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=False, log_level="info")
+    run_server(app, host="0.0.0.0", port=port, log_level="info")
@@ -0,0 +1,165 @@
+"""
+운행 기록 일괄 생성 벤치마크
+
+쿼리마다 지연(왕복 시간)을 주는 메모리 DB 로 다음 두 방식을 비교합니다.
+- 단건 API 를 운행마다 호출 (운전자/차량 조회 2회 + INSERT + 주행거리 UPDATE)
+- 일괄 API 한 번 호출 (운전자/차량 IN 쿼리 + 배치 INSERT + 주행거리 UPDATE 1회, 트랜잭션)
+
+사용법: python scripts/benchmark_bulk_driving_records.py [--trips 50000] [--latency-ms 1.0]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.models.driver_performance import DrivingRecordBulkCreate, DrivingRecordCreate
+from lib.routes import driving_record_routes
+
+
+class LatencyTable:
+    def __init__(self, name: str, db: "LatencyDB", rows=None):
+        self.name = name
+        self.db = db
+        self.rows = {row.id: row for row in rows or []}
+
+    async def _round_trip(self):
+        self.db.queries[self.name] += 1
+        await asyncio.sleep(self.db.latency)
+
+    async def find_unique(self, where):
+        await self._round_trip()
+        return self.rows.get(where["id"])
+
+    async def find_many(self, where):
+        await self._round_trip()
+        return [self.rows[i] for i in where["id"]["in"] if i in self.rows]
+
+    async def create(self, data):
+        await self._round_trip()
+        self.db.inserted += 1
+        now = datetime.now()
+        return {"id": f"record-{self.db.inserted}", "createdAt": now, "updatedAt": now, **data}
+
+    async def create_many(self, data):
+        await self._round_trip()
+        self.db.inserted += len(data)
+        return len(data)
+
+    async def update(self, where, data):
+        await self._round_trip()
+        row = self.rows[where["id"]]
+        mileage = data["mileage"]
+        row.mileage += mileage["increment"] if isinstance(mileage, dict) else mileage
+        return row
+
+
+class LatencyDB:
+    """쿼리마다 latency 초를 기다리고 쿼리 수를 세는 메모리 DB"""
+
+    def __init__(self, drivers, vehicles, latency: float):
+        self.latency = latency
+        self.queries: Counter = Counter()
+        self.inserted = 0
+        self.driver = LatencyTable("driver", self, drivers)
+        self.vehicle = LatencyTable("vehicle", self, vehicles)
+        self.drivingrecord = LatencyTable("drivingrecord", self)
+
+    def tx(self):
+        return self
+
+    async def __aenter__(self):
+        self.queries["transaction"] += 1
+        await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.sleep(self.latency)
+
+    async def execute_raw(self, query, increments):
+        self.queries["execute_raw"] += 1
+        await asyncio.sleep(self.latency)
+        for item in json.loads(increments):
+            self.vehicle.rows[item["id"]].mileage += item["delta"]
+        return len(self.vehicle.rows)
+
+    @property
+    def total(self) -> int:
+        return sum(self.queries.values())
+
+
+def make_trips(count: int, drivers, vehicles):
+    rng = random.Random(42)
+    base = datetime(2025, 6, 1, 6)
+    trips = []
+    for i in range(count):
+        start = base + timedelta(minutes=rng.randint(0, 60 * 12))
+        trips.append({
+            "driver_id": rng.choice(drivers).id,
+            "vehicle_id": rng.choice(vehicles).id,
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=rng.randint(5, 120))).isoformat(),
+            "distance": round(rng.uniform(1, 150), 1),
+            "avg_speed": round(rng.uniform(20, 90), 1),
+            "hard_brake_count": rng.randint(0, 5),
+        })
+    # 잘못된 항목 (존재하지 않는 차량, 음수 거리)
+    trips[0]["vehicle_id"] = "vehicle-missing"
+    trips[1]["distance"] = -1
+    return trips
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trips", type=int, default=50_000)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="쿼리 1회 왕복 지연(ms)")
+    parser.add_argument("--single-sample", type=int, default=1000, help="단건 방식으로 실행할 운행 수 (결과는 환산)")
+    args = parser.parse_args()
+
+    drivers = [SimpleNamespace(id=f"driver-{i}") for i in range(800)]
+    vehicles = [SimpleNamespace(id=f"vehicle-{i}", mileage=10_000) for i in range(500)]
+    trips = make_trips(args.trips, drivers, vehicles)
+    user = {"id": "gateway"}
+
+    # 단건 API 반복 호출 (샘플 실행 후 환산)
+    db = LatencyDB(drivers, vehicles, args.latency_ms / 1000)
+    driving_record_routes.db = db
+    sample = trips[2:2 + args.single_sample]
+    started = time.perf_counter()
+    for trip in sample:
+        await driving_record_routes.create_driving_record(DrivingRecordCreate.model_validate(trip), user)
+    single_elapsed = (time.perf_counter() - started) * (args.trips / len(sample))
+    single_queries = db.total * args.trips // len(sample)
+
+    # 일괄 API 한 번 호출
+    vehicles = [SimpleNamespace(id=f"vehicle-{i}", mileage=10_000) for i in range(500)]
+    db = LatencyDB(drivers, vehicles, args.latency_ms / 1000)
+    driving_record_routes.db = db
+    started = time.perf_counter()
+    response = await driving_record_routes.create_driving_records_bulk(DrivingRecordBulkCreate(records=trips), user)
+    bulk_elapsed = time.perf_counter() - started
+    result = response.data
+
+    expected_mileage = Counter()
+    for trip in trips[2:]:
+        expected_mileage[trip["vehicle_id"]] += int(trip["distance"])
+    assert result.accepted == args.trips - 2 and [e.index for e in result.rejected] == [0, 1]
+    assert all(v.mileage == 10_000 + expected_mileage[v.id] for v in vehicles)
+
+    print(f"trips: {args.trips:,}, query latency {args.latency_ms}ms")
+    print(f"single: {single_queries:,} queries, {single_elapsed:,.1f}s (extrapolated from {len(sample):,} trips)")
+    print(
+        f"bulk  : {db.total:,} queries {dict(db.queries)}, {bulk_elapsed:,.2f}s, "
+        f"{result.accepted:,} accepted, {len(result.rejected)} rejected, {result.vehicles_updated} vehicles updated"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
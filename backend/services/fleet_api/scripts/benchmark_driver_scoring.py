@@ -0,0 +1,99 @@
+"""
+운전자 성과 점수 계산 벤치마크
+
+합성 운행 기록(기본 1만 명 x 100만 운행, 1년)으로 기간 유형별 전체 계산 시간과
+하루치 운행이 추가됐을 때 영향을 받는 기간만 다시 계산하는 시간을 측정합니다.
+워커의 기간 계산(period_window)이 pandas 기간과 일치하는지도 확인합니다.
+
+사용법: python scripts/benchmark_driver_scoring.py [--drivers 10000] [--trips 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from lib.services.driver_scoring import compute_scores, performance_frame, performance_payloads
+from lib.services.scoring_worker import SCORED_PERIODS, period_window
+
+
+def make_records(drivers: int, trips: int, start: datetime, days: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start_times = pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days * 86_400, trips), unit="s")
+    durations = pd.to_timedelta(rng.integers(5, 180, trips), unit="m")
+    distance = rng.gamma(2.0, 15.0, trips).round(1)
+    fuel = np.where(rng.random(trips) < 0.8, (distance / rng.normal(12, 2, trips).clip(5)).round(2), np.nan)
+    return pd.DataFrame({
+        # 운전자마다 운행 빈도가 다르도록 치우친 분포
+        "driverId": pd.Series(rng.zipf(1.3, trips) % drivers).map("driver-{}".format),
+        "startTime": start_times,
+        "endTime": start_times + durations,
+        "distance": distance,
+        "maxSpeed": rng.normal(95, 15, trips).round(1),
+        "fuelConsumption": fuel,
+        "hardBrakeCount": rng.poisson(0.4, trips),
+        "hardAccelCount": rng.poisson(0.3, trips),
+        "idlingDuration": rng.poisson(4, trips),
+    })
+
+
+def check_windows(records: pd.DataFrame) -> None:
+    """워커의 period_window 와 pandas 기간 시작이 같은지 확인"""
+    from lib.services.driver_scoring import PERIOD_FREQ
+
+    sample = records["startTime"].sample(2000, random_state=1)
+    for period in SCORED_PERIODS:
+        expected = sample.dt.to_period(PERIOD_FREQ[period]).dt.start_time
+        actual = [period_window(period, moment.to_pydatetime())[0] for moment in sample]
+        assert list(expected) == actual, f"{period.value} 기간 불일치"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--drivers", type=int, default=10_000)
+    parser.add_argument("--trips", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    start = datetime(2025, 1, 1)
+    started = time.perf_counter()
+    records = make_records(args.drivers, args.trips, start, args.days)
+    print(f"generated {len(records):,} trips for {records['driverId'].nunique():,} drivers "
+          f"in {time.perf_counter() - started:.1f}s")
+    check_windows(records)
+
+    print(f"\n{'period':<10} {'rows':>10} {'score s':>9} {'to json s':>11}")
+    total = 0.0
+    for period in SCORED_PERIODS:
+        started = time.perf_counter()
+        scores = compute_scores(records, period)
+        scored = time.perf_counter() - started
+        started = time.perf_counter()
+        performances = performance_frame(scores, period)
+        performance_payloads(performances)
+        converted = time.perf_counter() - started
+        total += scored + converted
+        assert scores["overallScore"].between(0, 100).all()
+        print(f"{period.value:<10} {len(performances):>10,} {scored:>9.2f} {converted:>11.2f}")
+    print(f"{'full':<10} {'':>10} {total:>9.2f}s (all periods)")
+
+    # 하루치 운행 추가: 해당 일/주/월/분기/연 기간만 다시 계산
+    day = start + timedelta(days=args.days // 2)
+    started = time.perf_counter()
+    touched = 0
+    for period in SCORED_PERIODS:
+        window_start, window_end = period_window(period, day)
+        window = records[(records["startTime"] >= window_start) & (records["startTime"] < window_end)]
+        performances = performance_frame(compute_scores(window, period), period)
+        performance_payloads(performances)
+        touched += len(performances)
+    print(f"incremental (one day touched): {touched:,} performance rows in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+유지보수 기록 + 부품 저장 벤치마크
+
+쿼리마다 지연(왕복 시간)을 주는 메모리 DB 로 부품 20개짜리 유지보수 기록에 대해 비교합니다.
+- 이전 방식: 기록 INSERT 후 부품마다 INSERT, 마지막에 부품 포함 재조회 (업데이트도 부품마다 INSERT)
+- 현재 방식: 부품 중첩 생성 한 번 (업데이트는 트랜잭션 안에서 부품 삭제 + 중첩 생성)
+- 과거 기록 가져오기: 기록/부품 배치 INSERT 를 한 트랜잭션으로
+
+사용법: python scripts/benchmark_maintenance_parts.py [--records 2000] [--parts 20] [--latency-ms 1.0]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.models.maintenance import MaintenanceBulkCreate, MaintenanceCreate, MaintenanceResponse, MaintenanceUpdate
+from lib.routes import maintenance_routes
+from lib.utils.model_conversion import db_to_model, model_to_db_dict
+
+
+class LatencyTable:
+    def __init__(self, name: str, db: "LatencyDB", rows=None):
+        self.name = name
+        self.db = db
+        self.rows = {row["id"]: row for row in rows or []}
+
+    async def _round_trip(self):
+        self.db.queries[f"{self.name}"] += 1
+        await asyncio.sleep(self.db.latency)
+
+    def _new_row(self, data):
+        now = datetime.now()
+        row = {"id": str(uuid.uuid4()), "createdAt": now, "updatedAt": now, **data}
+        if self.name == "maintenance":
+            row.setdefault("status", "SCHEDULED")
+        return row
+
+    def _with_parts(self, row, include):
+        if not include:
+            return row
+        parts = [part for part in self.db.maintenancepart.rows.values() if part["maintenanceId"] == row["id"]]
+        return {**row, "parts": parts}
+
+    def _store_nested_parts(self, row_id, data):
+        nested = data.pop("parts", None)
+        for part in (nested or {}).get("create", []):
+            part = self.db.maintenancepart._new_row({**part, "maintenanceId": row_id})
+            self.db.maintenancepart.rows[part["id"]] = part
+
+    async def find_unique(self, where, include=None):
+        await self._round_trip()
+        row = self.rows.get(where["id"])
+        return self._with_parts(row, include) if row else None
+
+    async def find_many(self, where):
+        await self._round_trip()
+        return [SimpleNamespace(**self.rows[i]) for i in where["id"]["in"] if i in self.rows]
+
+    async def create(self, data, include=None):
+        await self._round_trip()
+        data = dict(data)
+        row = self._new_row({k: v for k, v in data.items() if k != "parts"})
+        self._store_nested_parts(row["id"], data)
+        self.rows[row["id"]] = row
+        return self._with_parts(row, include)
+
+    async def create_many(self, data):
+        await self._round_trip()
+        for item in data:
+            row = self._new_row(item)
+            self.rows[row["id"]] = row
+        return len(data)
+
+    async def update(self, where, data, include=None):
+        await self._round_trip()
+        row = self.rows.get(where["id"])
+        if row is None:
+            return None
+        data = dict(data)
+        self._store_nested_parts(row["id"], data)
+        row.update(data, updatedAt=datetime.now())
+        return self._with_parts(row, include)
+
+    async def delete_many(self, where):
+        await self._round_trip()
+        doomed = [key for key, row in self.rows.items() if row["maintenanceId"] == where["maintenanceId"]]
+        for key in doomed:
+            del self.rows[key]
+        return len(doomed)
+
+
+class LatencyDB:
+    """쿼리마다 latency 초를 기다리고 쿼리 수를 세는 메모리 DB"""
+
+    def __init__(self, vehicles, latency: float):
+        self.latency = latency
+        self.queries: Counter = Counter()
+        self.vehicle = LatencyTable("vehicle", self, vehicles)
+        self.maintenance = LatencyTable("maintenance", self)
+        self.maintenancepart = LatencyTable("maintenancepart", self)
+
+    def tx(self):
+        return self
+
+    async def __aenter__(self):
+        self.queries["transaction"] += 1
+        await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.sleep(self.latency)
+
+    @property
+    def total(self) -> int:
+        return sum(self.queries.values())
+
+
+# 이전 구현 (부품마다 INSERT 후 재조회)
+async def legacy_create(db, maintenance_data: MaintenanceCreate):
+    await db.vehicle.find_unique(where={"id": maintenance_data.vehicle_id})
+    new_maintenance = await db.maintenance.create(data=model_to_db_dict(maintenance_data, exclude={"parts"}))
+    for part in maintenance_data.parts or []:
+        part_dict = model_to_db_dict(part)
+        part_dict["maintenanceId"] = new_maintenance["id"]
+        await db.maintenancepart.create(data=part_dict)
+    created = await db.maintenance.find_unique(where={"id": new_maintenance["id"]}, include={"parts": True})
+    return db_to_model(MaintenanceResponse, created)
+
+
+async def legacy_update(db, maintenance_id: str, maintenance_data: MaintenanceUpdate):
+    await db.maintenance.find_unique(where={"id": maintenance_id})
+    db_data = model_to_db_dict(maintenance_data, exclude={"parts"}, exclude_unset=True)
+    await db.maintenance.update(where={"id": maintenance_id}, data=db_data)
+    await db.maintenancepart.delete_many(where={"maintenanceId": maintenance_id})
+    for part in maintenance_data.parts:
+        part_dict = model_to_db_dict(part)
+        part_dict["maintenanceId"] = maintenance_id
+        await db.maintenancepart.create(data=part_dict)
+    updated = await db.maintenance.find_unique(where={"id": maintenance_id}, include={"parts": True})
+    return db_to_model(MaintenanceResponse, updated)
+
+
+def make_records(count: int, parts: int, vehicles):
+    rng = random.Random(11)
+    base = datetime(2020, 1, 1)
+    records = []
+    for i in range(count):
+        records.append({
+            "vehicle_id": rng.choice(vehicles)["id"],
+            "maintenance_type": rng.choice(["REGULAR", "REPAIR", "OIL_CHANGE"]),
+            "description": f"정비 {i}",
+            "scheduled_date": (base + timedelta(days=rng.randint(0, 1500))).isoformat(),
+            "status": "COMPLETED",
+            "parts": [
+                {"name": f"부품 {p}", "part_number": f"P-{p:04d}", "quantity": rng.randint(1, 4),
+                 "unit_price": round(rng.uniform(5_000, 200_000), -2)}
+                for p in range(parts)
+            ],
+        })
+    # 잘못된 항목 (존재하지 않는 차량, 수량 0)
+    records[0]["vehicle_id"] = "vehicle-missing"
+    records[1]["parts"][0]["quantity"] = 0
+    return records
+
+
+def report(label: str, db: LatencyDB, elapsed: float, operations: int):
+    print(f"{label:<34} {db.total / operations:>8.1f} queries/op {elapsed / operations * 1000:>9.1f} ms/op")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=2000, help="가져오기 기록 수")
+    parser.add_argument("--parts", type=int, default=20, help="기록당 부품 수")
+    parser.add_argument("--single", type=int, default=100, help="단건 생성/수정 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="쿼리 1회 왕복 지연(ms)")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    vehicles = [{"id": f"vehicle-{i}"} for i in range(300)]
+    records = make_records(max(args.records, args.single + 2), args.parts, vehicles)
+    samples = [MaintenanceCreate.model_validate(record) for record in records[2:args.single + 2]]
+    user = {"id": "admin"}
+    print(f"{args.parts} parts per record, query latency {args.latency_ms}ms\n")
+
+    # 단건 생성
+    db = LatencyDB(vehicles, latency)
+    started = time.perf_counter()
+    for sample in samples:
+        assert len((await legacy_create(db, sample)).parts) == args.parts
+    report("create  legacy (per-part INSERT)", db, time.perf_counter() - started, len(samples))
+
+    db = LatencyDB(vehicles, latency)
+    maintenance_routes.db = db
+    started = time.perf_counter()
+    created = []
+    for sample in samples:
+        response = await maintenance_routes.create_maintenance(sample, user)
+        assert len(response.data.parts) == args.parts
+        created.append(response.data.id)
+    report("create  nested write", db, time.perf_counter() - started, len(samples))
+
+    # 부품 전체 교체 업데이트
+    update = MaintenanceUpdate(description="부품 교체", parts=[part.model_dump() for part in samples[0].parts])
+    legacy_db = LatencyDB(vehicles, latency)
+    legacy_db.maintenance.rows = db.maintenance.rows
+    legacy_db.maintenancepart.rows = db.maintenancepart.rows
+    started = time.perf_counter()
+    for maintenance_id in created:
+        assert len((await legacy_update(legacy_db, maintenance_id, update)).parts) == args.parts
+    report("update  legacy (per-part INSERT)", legacy_db, time.perf_counter() - started, len(created))
+
+    db.queries.clear()
+    started = time.perf_counter()
+    for maintenance_id in created:
+        response = await maintenance_routes.update_maintenance(maintenance_id, update, user)
+        assert len(response.data.parts) == args.parts
+    report("update  transaction + nested", db, time.perf_counter() - started, len(created))
+
+    # 과거 기록 가져오기
+    db = LatencyDB(vehicles, latency)
+    maintenance_routes.db = db
+    payload = MaintenanceBulkCreate(records=records[:args.records])
+    started = time.perf_counter()
+    response = await maintenance_routes.import_maintenance_bulk(payload, user)
+    elapsed = time.perf_counter() - started
+    result = response.data
+    assert result.accepted == args.records - 2 and [e.index for e in result.rejected] == [0, 1]
+    assert len(db.maintenancepart.rows) == result.parts_created == (args.records - 2) * args.parts
+    print(
+        f"\nimport  {result.accepted:,} records / {result.parts_created:,} parts: "
+        f"{db.total} queries {dict(db.queries)}, {elapsed:.2f}s "
+        f"(legacy per-record path ~{(args.parts + 3) * result.accepted:,} queries)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
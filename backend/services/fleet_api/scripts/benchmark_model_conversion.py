@@ -0,0 +1,132 @@
+"""
+모델 키 변환 마이크로벤치마크
+
+운행 기록 형태의 DB 행(camelCase) 10만 건을 snake_case 로 바꾸고 응답 모델로 변환하는 시간을
+이전 구현(키마다 re.sub, 항상 재귀)과 공유 구현(키 변환 캐시, 모델 필드 맵, 평평한 행 fast path)으로 비교합니다.
+
+사용법: python scripts/benchmark_model_conversion.py [--rows 100000] [--nested-ratio 0.1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../"))
+
+from lib.models.driver_performance import DrivingRecordResponse
+from shared.utils import model_conversion
+
+
+# 이전 구현 (서비스별 lib/utils/model_conversion.py 에 복제돼 있던 코드)
+def legacy_snake_to_camel(snake_str):
+    components = snake_str.split("_")
+    return components[0] + "".join(x.title() for x in components[1:])
+
+
+def legacy_camel_to_snake(camel_str):
+    import re
+
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", camel_str).lower()
+
+
+def legacy_convert(data, convert_key):
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            value = legacy_convert(value, convert_key)
+        elif isinstance(value, list):
+            value = [legacy_convert(item, convert_key) if isinstance(item, dict) else item for item in value]
+        result[convert_key(key)] = value
+    return result
+
+
+def make_rows(count: int, nested_ratio: float):
+    rng = random.Random(3)
+    base = datetime(2025, 6, 1)
+    rows = []
+    for i in range(count):
+        start = base + timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        row = {
+            "id": f"record-{i}",
+            "driverId": f"driver-{rng.randint(0, 999)}",
+            "vehicleId": f"vehicle-{rng.randint(0, 499)}",
+            "startTime": start,
+            "endTime": start + timedelta(minutes=rng.randint(5, 180)),
+            "startLocation": "서울",
+            "endLocation": "부산",
+            "distance": round(rng.uniform(1, 300), 1),
+            "avgSpeed": round(rng.uniform(20, 90), 1),
+            "maxSpeed": round(rng.uniform(60, 140), 1),
+            "fuelConsumption": round(rng.uniform(1, 30), 2),
+            "hardBrakeCount": rng.randint(0, 5),
+            "hardAccelCount": rng.randint(0, 5),
+            "idlingDuration": rng.randint(0, 30),
+            "routeData": None,
+            "notes": None,
+            "createdAt": start,
+            "updatedAt": start,
+        }
+        if rng.random() < nested_ratio:
+            row["routeData"] = {"type": "LineString", "coordinates": [[127.0, 37.5], [129.0, 35.1]]}
+        rows.append(row)
+    return rows
+
+
+def timed(label: str, func, rows):
+    started = time.perf_counter()
+    result = func(rows)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:>7.3f}s  {len(rows) / elapsed:>12,.0f} rows/s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--nested-ratio", type=float, default=0.1, help="routeData(중첩 JSON)가 있는 행 비율")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.nested_ratio)
+    model_conversion.register_models(DrivingRecordResponse)
+    print(f"rows: {len(rows):,} ({args.nested_ratio:.0%} nested)\n")
+
+    print("camelCase -> snake_case keys")
+    legacy_keys, legacy_elapsed = timed(
+        "  legacy", lambda rows: [legacy_convert(row, legacy_camel_to_snake) for row in rows], rows
+    )
+    shared_keys, shared_elapsed = timed(
+        "  shared", lambda rows: [model_conversion.convert_dict_keys_to_snake(row) for row in rows], rows
+    )
+    assert shared_keys == legacy_keys
+    print(f"  speedup {legacy_elapsed / shared_elapsed:.1f}x\n")
+
+    print("snake_case -> camelCase keys")
+    legacy_back, legacy_elapsed = timed(
+        "  legacy", lambda rows: [legacy_convert(row, legacy_snake_to_camel) for row in rows], legacy_keys
+    )
+    shared_back, shared_elapsed = timed(
+        "  shared", lambda rows: [model_conversion.convert_dict_keys_to_camel(row) for row in rows], shared_keys
+    )
+    assert shared_back == legacy_back == rows
+    print(f"  speedup {legacy_elapsed / shared_elapsed:.1f}x\n")
+
+    print("DB row -> DrivingRecordResponse")
+    legacy_models, legacy_elapsed = timed(
+        "  legacy",
+        lambda rows: [DrivingRecordResponse(**legacy_convert(row, legacy_camel_to_snake)) for row in rows],
+        rows,
+    )
+    shared_models, shared_elapsed = timed(
+        "  shared", lambda rows: model_conversion.db_rows_to_models(DrivingRecordResponse, rows), rows
+    )
+    assert shared_models == legacy_models
+    print(f"  speedup {legacy_elapsed / shared_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
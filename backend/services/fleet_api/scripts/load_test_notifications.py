@@ -0,0 +1,272 @@
+"""
+알림 카운터/키셋 페이지네이션 부하 테스트
+
+별도 스키마에 합성 알림(기본 1천만 건, 대상 10만, 70% 읽음)을 만들고 다음을 비교합니다.
+- 배지 조회: 읽지 않은 알림 COUNT(*) vs 대상별 카운터 기본 키 조회 (알림이 많은 대상/무작위 대상)
+- 목록: OFFSET 페이지 vs (created_at, id) 키셋 페이지 (같은 깊이)
+- 일괄 읽음: UPDATE 후 읽은 알림 전체 재조회 vs 카운터를 함께 갱신하는 한 문장
+- 동시성: 생성/읽음/삭제를 동시에 실행한 뒤 카운터가 실제 읽지 않은 수와 일치하는지 확인
+
+서비스와 같은 SQL(lib.services.notifications)을 asyncpg 로 직접 실행합니다.
+
+사용법: DATABASE_URL=postgresql://... python scripts/load_test_notifications.py [--rows 10000000] [--targets 100000]
+        --skip-load 로 이미 만든 테이블을 재사용합니다.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncpg
+
+from lib.services.notifications import (
+    ADJUST_UNREAD_SQL,
+    DELETE_SQL,
+    MARK_ALL_READ_SQL,
+    MARK_READ_SQL,
+    REBUILD_COUNTERS_SQL,
+)
+
+SCHEMA = "notification_load"
+LOAD_BATCH = 1_000_000
+REPEATS = 200
+
+DDL = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    """
+    CREATE TABLE "Notification" (
+        "id" text PRIMARY KEY,
+        "type" text NOT NULL,
+        "title" text NOT NULL,
+        "message" text NOT NULL,
+        "severity" text NOT NULL,
+        "is_read" boolean NOT NULL DEFAULT false,
+        "target_type" text,
+        "target_id" text,
+        "created_at" timestamp(3) NOT NULL DEFAULT now(),
+        "updated_at" timestamp(3)
+    )
+    """,
+    """
+    CREATE TABLE "NotificationUnreadCounter" (
+        "target_id" text PRIMARY KEY,
+        "count" integer NOT NULL DEFAULT 0,
+        "updated_at" timestamp(3) NOT NULL
+    )
+    """,
+]
+
+# Prisma 스키마의 인덱스와 동일 (적재 후 생성)
+INDEXES = [
+    'CREATE INDEX ON "Notification" ("created_at", "id")',
+    'CREATE INDEX ON "Notification" ("target_id", "created_at", "id")',
+    'CREATE INDEX ON "Notification" ("target_id", "is_read")',
+]
+
+# 5% 는 대상 없음, 나머지는 소수 대상에 몰리도록 치우친 분포 (random()^3), 1년에 걸쳐 생성, 약 70% 읽음
+GENERATE_SQL = """
+INSERT INTO "Notification"
+SELECT
+    'n' || g,
+    (ARRAY['license_expiry','vehicle_maintenance','performance_review','safety_alert','system'])[1 + g % 5],
+    'title ' || g,
+    'message ' || g,
+    (ARRAY['info','success','warning','error'])[1 + g % 4],
+    random() < 0.7,
+    CASE WHEN g % 20 = 0 THEN NULL ELSE 'driver' END,
+    CASE WHEN g % 20 = 0 THEN NULL ELSE 'driver-' || floor($2 * power(random(), 3))::int END,
+    now() - ((1 - g::float8 / $1) * interval '365 days'),
+    NULL
+FROM generate_series($3::bigint, $4::bigint) AS g
+"""
+
+COUNT_UNREAD_SQL = 'SELECT count(*) FROM "Notification" WHERE "is_read" = false AND "target_id" = $1'
+COUNTER_SQL = 'SELECT "count" FROM "NotificationUnreadCounter" WHERE "target_id" = $1'
+OFFSET_PAGE_SQL = (
+    'SELECT * FROM "Notification" WHERE "target_id" = $1 '
+    'ORDER BY "created_at" DESC, "id" DESC OFFSET $2 LIMIT $3'
+)
+KEYSET_PAGE_SQL = (
+    'SELECT * FROM "Notification" WHERE "target_id" = $1 AND ("created_at", "id") < ($2, $3) '
+    'ORDER BY "created_at" DESC, "id" DESC LIMIT $4'
+)
+GLOBAL_OFFSET_SQL = 'SELECT * FROM "Notification" ORDER BY "created_at" DESC, "id" DESC OFFSET $1 LIMIT $2'
+GLOBAL_KEYSET_SQL = (
+    'SELECT * FROM "Notification" WHERE ("created_at", "id") < ($1, $2) '
+    'ORDER BY "created_at" DESC, "id" DESC LIMIT $3'
+)
+LEGACY_MARK_ALL_SQL = 'UPDATE "Notification" SET "is_read" = true WHERE "is_read" = false AND "target_id" = $1'
+LEGACY_READ_ITEMS_SQL = 'SELECT * FROM "Notification" WHERE "is_read" = true AND "target_id" = $1'
+
+# 카운터와 실제 읽지 않은 수가 다른 대상 수
+CHECK_SQL = """
+SELECT count(*) FROM (
+    SELECT COALESCE("target_id", '') AS target_id, count(*)::int AS count
+    FROM "Notification" WHERE "is_read" = false GROUP BY 1
+) AS a
+FULL JOIN "NotificationUnreadCounter" AS c ON c."target_id" = a.target_id
+WHERE COALESCE(a.count, 0) <> COALESCE(c."count", 0)
+"""
+
+
+async def timed(conn, sql: str, *args) -> float:
+    started = time.perf_counter()
+    await conn.fetch(sql, *args)
+    return (time.perf_counter() - started) * 1000
+
+
+async def load(conn, rows: int, targets: int) -> None:
+    for statement in DDL:
+        await conn.execute(statement)
+    started = time.perf_counter()
+    for low in range(0, rows, LOAD_BATCH):
+        high = min(rows, low + LOAD_BATCH) - 1
+        await conn.execute(GENERATE_SQL, float(rows), targets, low, high)
+        print(f"\rloading {high + 1:,}/{rows:,}", end="", flush=True)
+    print(f"  ({time.perf_counter() - started:,.0f}s)")
+    started = time.perf_counter()
+    for statement in INDEXES:
+        await conn.execute(statement)
+    await conn.execute('ANALYZE "Notification"')
+    print(f"indexes + analyze: {time.perf_counter() - started:,.0f}s")
+
+
+def summary(label: str, samples) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<36} median {statistics.median(samples):>9.2f} ms   p95 {p95:>9.2f} ms")
+
+
+async def run_mix(pool, seconds: float, workers: int) -> dict:
+    """생성/읽음/삭제를 서비스와 같은 트랜잭션 단위로 동시에 실행"""
+    deadline = time.perf_counter() + seconds
+    done = {"create": 0, "read": 0, "delete": 0}
+
+    async def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        created = []
+        while time.perf_counter() < deadline:
+            target_id = f"driver-{rng.randrange(50)}"  # 소수 대상에 몰아 경합 유발
+            action = rng.random()
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    if action < 0.5 or not created:
+                        notification_id = str(uuid.uuid4())
+                        await conn.execute(
+                            'INSERT INTO "Notification" ("id", "type", "title", "message", "severity", '
+                            '"target_type", "target_id") VALUES ($1, \'system\', \'t\', \'m\', \'info\', '
+                            "'driver', $2)",
+                            notification_id,
+                            target_id,
+                        )
+                        await conn.fetch(ADJUST_UNREAD_SQL, target_id, 1)
+                        created.append(notification_id)
+                        done["create"] += 1
+                    elif action < 0.8:
+                        rows = await conn.fetch(MARK_READ_SQL, rng.choice(created))
+                        if rows:
+                            await conn.fetch(ADJUST_UNREAD_SQL, rows[0]["target_id"], -1)
+                        done["read"] += 1
+                    else:
+                        notification_id = created.pop(rng.randrange(len(created)))
+                        rows = await conn.fetch(DELETE_SQL, notification_id)
+                        if rows and not rows[0]["is_read"]:
+                            await conn.fetch(ADJUST_UNREAD_SQL, rows[0]["target_id"], -1)
+                        done["delete"] += 1
+            # 가끔 같은 대상의 일괄 읽음 처리를 섞어 단건 읽음/삭제와 경합시킴
+            if rng.random() < 0.1:
+                async with pool.acquire() as conn:
+                    await conn.fetch(MARK_ALL_READ_SQL.format(target_condition=' AND "target_id" = $1'), target_id)
+
+    await asyncio.gather(*(worker(seed) for seed in range(workers)))
+    return done
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--targets", type=int, default=100_000)
+    parser.add_argument("--mix-seconds", type=float, default=10.0, help="동시성 테스트 시간(초)")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--skip-load", action="store_true")
+    args = parser.parse_args()
+
+    settings = {"search_path": SCHEMA}
+    conn = await asyncpg.connect(os.environ["DATABASE_URL"], server_settings=settings)
+    if not args.skip_load:
+        await load(conn, args.rows, args.targets)
+
+    total = await conn.fetchval('SELECT count(*) FROM "Notification"')
+    print(f"notifications: {total:,}")
+
+    started = time.perf_counter()
+    fixed = await conn.fetchval(REBUILD_COUNTERS_SQL)
+    print(f"rebuild counters: {fixed:,} counters written in {time.perf_counter() - started:.1f}s")
+
+    rng = random.Random(5)
+    targets = [f"driver-{rng.randrange(args.targets)}" for _ in range(REPEATS)]
+
+    busiest = [f"driver-{i}" for i in range(10)]  # 분포상 알림이 가장 많은 대상
+
+    print("\nunread badge")
+    summary("COUNT(*) unread, random target", [await timed(conn, COUNT_UNREAD_SQL, t) for t in targets])
+    summary("counter lookup, random target", [await timed(conn, COUNTER_SQL, t) for t in targets])
+    summary("COUNT(*) unread, busiest targets", [await timed(conn, COUNT_UNREAD_SQL, t) for t in busiest * 2])
+    summary("counter lookup, busiest targets", [await timed(conn, COUNTER_SQL, t) for t in busiest * 2])
+    summary("COUNT(*) unread (all)", [await timed(conn, 'SELECT count(*) FROM "Notification" WHERE "is_read" = false')
+                                      for _ in range(3)])
+    summary("SUM(counters) (all)", [await timed(conn, 'SELECT SUM("count") FROM "NotificationUnreadCounter"')
+                                    for _ in range(3)])
+
+    print("\nlisting, 20 per page")
+    offset_samples, keyset_samples = [], []
+    for target_id in targets[:50]:
+        rows = await conn.fetch(OFFSET_PAGE_SQL, target_id, 60, 21)
+        if len(rows) < 21:
+            continue
+        last = rows[-2]
+        offset_samples.append(await timed(conn, OFFSET_PAGE_SQL, target_id, 80, 20))
+        keyset_samples.append(await timed(conn, KEYSET_PAGE_SQL, target_id, last["created_at"], last["id"], 20))
+    summary("per target, page 5 OFFSET", offset_samples)
+    summary("per target, page 5 keyset", keyset_samples)
+    depth = min(total - 21, 5_000_000)
+    anchor = (await conn.fetch(GLOBAL_OFFSET_SQL, depth - 1, 1))[0]
+    summary(f"all, OFFSET {depth:,}", [await timed(conn, GLOBAL_OFFSET_SQL, depth, 20) for _ in range(3)])
+    summary("all, keyset at same depth", [await timed(conn, GLOBAL_KEYSET_SQL, anchor["created_at"], anchor["id"], 20)
+                                         for _ in range(20)])
+
+    print("\nmark all read (busiest targets)")
+    legacy, current, returned = [], [], []
+    for target_id in busiest:
+        # 같은 대상으로 비교하도록 이전 방식은 실행 후 되돌림
+        transaction = conn.transaction()
+        await transaction.start()
+        started = time.perf_counter()
+        await conn.execute(LEGACY_MARK_ALL_SQL, target_id)
+        returned.append(len(await conn.fetch(LEGACY_READ_ITEMS_SQL, target_id)))
+        legacy.append((time.perf_counter() - started) * 1000)
+        await transaction.rollback()
+        current.append(await timed(conn, MARK_ALL_READ_SQL.format(target_condition=' AND "target_id" = $1'), target_id))
+    summary(f"update + return all read (~{statistics.mean(returned):.0f} rows)", legacy)
+    summary("update + counters, count only", current)
+
+    print(f"\nconcurrent create/read/delete, {args.workers} workers, {args.mix_seconds:.0f}s")
+    pool = await asyncpg.create_pool(os.environ["DATABASE_URL"], min_size=args.workers, max_size=args.workers,
+                                     server_settings=settings)
+    done = await run_mix(pool, args.mix_seconds, args.workers)
+    await pool.close()
+    mismatched = await conn.fetchval(CHECK_SQL)
+    print(f"  operations: {done}, counters out of sync: {mismatched}")
+    await conn.close()
+    assert mismatched == 0
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
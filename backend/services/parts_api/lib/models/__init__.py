@@ -28,6 +28,8 @@ from .models import (
     InventoryCreate,
     InventoryUpdate,
     InventoryResponse,
+    InventoryAdjustmentItem,
+    InventoryAdjustmentBatch,
     OrderSummary
 )
 
@@ -55,5 +57,7 @@ __all__ = [
     "InventoryCreate",
     "InventoryUpdate",
     "InventoryResponse",
+    "InventoryAdjustmentItem",
+    "InventoryAdjustmentBatch",
     "OrderSummary"
 ]
@@ -250,6 +250,15 @@ class InventoryMovementResponse(InventoryMovementBase):
 
     model_config = {"from_attributes": True}
 
+# 재고 조정 모델
+class InventoryAdjustmentItem(BaseModel):
+    part_id: str  # 부품 ID
+    quantity_change: int  # 재고 수량 변경 (양수는 증가, 음수는 감소)
+
+class InventoryAdjustmentBatch(BaseModel):
+    adjustments: List[InventoryAdjustmentItem] = Field(..., min_length=1, max_length=1000)  # 조정 목록
+    reference_id: Optional[str] = None  # 참조 ID (주문, 정비 등)
+
 # 주문 요약 모델
 class OrderSummary(BaseModel):
     total_orders: int
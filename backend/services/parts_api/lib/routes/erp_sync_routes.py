@@ -11,7 +11,7 @@ from fastapi import (
     BackgroundTasks,
 )
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import math
 import logging
 import json
@@ -32,7 +32,8 @@ from ..models.erp_sync import (
     SyncDirection,
     ERPSystem,
 )
-from ..services.erp_sync_service import ERPSyncService
+from ..dependencies import get_prisma
+from ..services.erp_sync_service import STALE_RUN_TIMEOUT, ERPSyncService
 from ..utils.auth import get_current_user
 from ..utils.response_utils import (
     ApiResponse,
@@ -42,7 +43,7 @@ from ..utils.response_utils import (
     server_error_exception,
     conflict_exception,
 )
-from ..utils.model_conversion import model_to_db_dict, db_to_model
+from ..utils.model_conversion import model_to_db_dict, db_to_model, db_rows_to_models, register_models
 
 # Prisma 클라이언트 초기화
 from prisma import Prisma
@@ -51,6 +52,9 @@ db = Prisma()
 
 router = APIRouter(tags=["erp-sync"])
 logger = logging.getLogger(__name__)
+
+# 응답 모델 필드 맵을 임포트 시 미리 계산
+register_models(ERPSyncConfigResponse)
 erp_sync_service = ERPSyncService()
 
 # 리소스 타입 상수
@@ -141,7 +145,7 @@ async def list_erp_sync_configs(
         )
 
         # 응답 데이터 변환
-        config_responses = [db_to_model(ERPSyncConfigResponse, config) for config in configs]
+        config_responses = db_rows_to_models(ERPSyncConfigResponse, configs)
 
         response = ERPSyncConfigListResponse(
             items=config_responses,
@@ -289,3 +293,76 @@ async def delete_erp_sync_config(
         if isinstance(e, HTTPException):
             raise e
         raise server_error_exception(str(e))
+
+
+@router.post(
+    "/erp-sync",
+    response_model=ApiResponse[SyncDataResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def run_erp_sync(
+    request: SyncDataRequest,
+    background_tasks: BackgroundTasks,
+    prisma: Prisma = Depends(get_prisma),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+):
+    """ERP 데이터 동기화 실행 (백그라운드, 이전 실패 지점부터 재개)"""
+    try:
+        config = await prisma.erpsyncconfig.find_unique(
+            where={"id": request.config_id}
+        )
+        if not config:
+            raise not_found_exception(RESOURCE_TYPE, request.config_id)
+
+        # 같은 설정의 동기화는 동시에 하나만 실행
+        # 진행 건수가 STALE_RUN_TIMEOUT 동안 갱신되지 않은 로그는 프로세스 중단 등으로 멈춘 실행이므로
+        # 실패로 정리하고 새로 시작 (체크포인트가 남아 있어 중단 지점부터 재개)
+        stale_before = datetime.now(timezone.utc) - STALE_RUN_TIMEOUT
+        abandoned = await prisma.erpsynclog.update_many(
+            where={"configId": config.id, "status": "IN_PROGRESS", "updatedAt": {"lt": stale_before}},
+            data={
+                "status": "FAILED",
+                "endTime": datetime.now(),
+                "errorDetails": "응답 없이 중단된 동기화 (새 실행에서 재개)",
+            },
+        )
+        if abandoned:
+            logger.warning(f"중단된 ERP 동기화 로그 {abandoned}건을 실패로 처리: 설정 ID {config.id}")
+
+        running = await prisma.erpsynclog.find_first(
+            where={"configId": config.id, "status": "IN_PROGRESS"}
+        )
+        if running:
+            raise conflict_exception(LOG_RESOURCE_TYPE, "status")
+
+        direction = request.direction or config.syncDirection
+        direction = str(getattr(direction, "value", direction)).upper()
+        sync_log = await prisma.erpsynclog.create(
+            data={
+                "configId": config.id,
+                "status": "IN_PROGRESS",
+                "startTime": datetime.now(),
+                "direction": direction,
+                "organizationId": config.organizationId,
+            }
+        )
+
+        background_tasks.add_task(
+            erp_sync_service.sync_data, config, sync_log.id, direction, request.filters
+        )
+
+        return create_response(
+            data=SyncDataResponse(
+                sync_log_id=sync_log.id,
+                status=SyncStatus.IN_PROGRESS,
+                message="ERP 동기화가 시작되었습니다.",
+                details={"direction": direction},
+            ),
+            message="ERP 동기화가 시작되었습니다.",
+        )
+
+    except Exception as e:
+        logger.error(f"ERP 동기화 실행 오류: {str(e)}")
+        if isinstance(e, HTTPException):
+            raise e
+        raise server_error_exception(str(e))
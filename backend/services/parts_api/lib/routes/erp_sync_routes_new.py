@@ -42,7 +42,7 @@ from ..utils.response_utils import (
     server_error_exception,
     conflict_exception,
 )
-from ..utils.model_conversion import model_to_db_dict, db_to_model
+from ..utils.model_conversion import model_to_db_dict, db_to_model, db_rows_to_models, register_models
 
 # Prisma 클라이언트 초기화
 from prisma import Prisma
@@ -51,6 +51,9 @@ db = Prisma()
 
 router = APIRouter(tags=["erp-sync"])
 logger = logging.getLogger(__name__)
+
+# 응답 모델 필드 맵을 임포트 시 미리 계산
+register_models(ERPSyncConfigResponse)
 erp_sync_service = ERPSyncService()
 
 # 리소스 타입 상수
@@ -141,7 +144,7 @@ async def list_erp_sync_configs(
         )
 
         # 응답 데이터 변환
-        config_responses = [db_to_model(ERPSyncConfigResponse, config) for config in configs]
+        config_responses = db_rows_to_models(ERPSyncConfigResponse, configs)
 
         response = ERPSyncConfigListResponse(
             items=config_responses,
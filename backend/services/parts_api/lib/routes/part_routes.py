@@ -3,7 +3,21 @@ from typing import List, Optional
 from prisma import Prisma
 from datetime import datetime
 from ..dependencies import get_prisma
-from ..models import PartCreate, PartUpdate, PartResponse, PartStatus, PartType
+from ..models import (
+    PartCreate,
+    PartUpdate,
+    PartResponse,
+    PartStatus,
+    PartType,
+    InventoryAdjustmentBatch,
+)
+from ..services.part_catalog import fetch_catalog_page, serialize_parts
+from ..services.inventory_ledger import (
+    InventoryAdjustmentError,
+    aggregate_adjustments,
+    apply_inventory_adjustments,
+    find_missing_suppliers,
+)
 from ..utils.response_utils import (
     ApiResponse,
     create_response,
@@ -38,13 +52,12 @@ async def create_part(part: PartCreate, prisma: Prisma = Depends(get_prisma)):
         if existing_part:
             raise conflict_exception(RESOURCE_TYPE, "part_number")
 
-        # 공급업체 확인 (있는 경우)
+        # 공급업체 확인 (있는 경우, IN 쿼리 한 번)
         if part.supplier_ids:
-            for supplier_id in part.supplier_ids:
-                supplier = await prisma.supplier.find_unique(where={"id": supplier_id})
+            missing_suppliers = await find_missing_suppliers(prisma, part.supplier_ids)
 
-                if not supplier:
-                    raise not_found_exception("공급업체", supplier_id)
+            if missing_suppliers:
+                raise not_found_exception("공급업체", missing_suppliers[0])
 
         # 재고 상태 결정
         status = PartStatus.IN_STOCK
@@ -142,9 +155,8 @@ async def get_all_parts(
             where=where, skip=skip, take=limit, order={"name": "asc"}
         )
 
-        # 응답 객체로 변환
-        # 응답 객체로 변환 (datetime 직렬화를 위해 model_dump(mode="json") 사용)
-        part_responses = [PartResponse.model_validate(part).model_dump(mode="json") for part in parts]
+        # 응답 객체로 변환 (DB 행은 신뢰할 수 있으므로 행별 Pydantic 검증 생략)
+        part_responses = serialize_parts(parts)
 
         return create_response(
             data=part_responses,
@@ -158,6 +170,40 @@ async def get_all_parts(
         raise server_error_exception(f"부품 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+# 부품 카탈로그 조회 (키셋 커서 페이지네이션)
+@router.get("/catalog", response_model=ApiResponse)
+async def get_part_catalog(
+    q: Optional[str] = Query(None, description="부품 번호 접두사 또는 부품명 검색어"),
+    part_type: Optional[PartType] = None,
+    status: Optional[PartStatus] = None,
+    in_stock_only: bool = False,
+    supplier_id: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 meta.nextCursor"),
+    limit: int = Query(100, ge=1, le=500),
+    prisma: Prisma = Depends(get_prisma),
+):
+    try:
+        part_responses, next_cursor = await fetch_catalog_page(
+            prisma,
+            limit,
+            q=q,
+            part_type=part_type,
+            status=status,
+            in_stock_only=in_stock_only,
+            supplier_id=supplier_id,
+            cursor=cursor,
+        )
+
+        return create_response(
+            data=part_responses, per_page=limit, next_cursor=next_cursor
+        )
+    except ValueError as e:
+        raise validation_exception({"message": str(e), "cursor": cursor})
+    except Exception as e:
+        logger.error(f"부품 카탈로그 조회 실패: {str(e)}")
+        raise server_error_exception(f"부품 카탈로그 조회 중 오류가 발생했습니다: {str(e)}")
+
+
 # 특정 부품 조회
 @router.get("/{part_id}", response_model=ApiResponse)
 async def get_part(
@@ -242,46 +288,22 @@ async def update_inventory(
     prisma: Prisma = Depends(get_prisma),
 ):
     try:
-        # 기존 부품 확인
-        existing_part = await prisma.part.find_unique(where={"id": part_id})
+        updated_parts = await apply_inventory_adjustments(
+            prisma, {part_id: quantity_change}
+        )
 
-        if not existing_part:
+        return create_response(data=serialize_parts(updated_parts)[0])
+    except InventoryAdjustmentError as e:
+        failure = e.failures[0]
+        if failure["reason"] == "not_found":
             raise not_found_exception(RESOURCE_TYPE, part_id)
-
-        # 재고 감소 시 충분한 재고 확인
-        if quantity_change < 0 and existing_part.quantity + quantity_change < 0:
-            raise validation_exception(
-                {
-                    "message": "재고가 부족합니다.",
-                    "current_quantity": existing_part.quantity,
-                    "requested_change": quantity_change,
-                }
-            )
-
-        # 새 수량 계산
-        new_quantity = existing_part.quantity + quantity_change
-
-        # 상태 결정
-        status = existing_part.status
-        if new_quantity == 0:
-            status = PartStatus.OUT_OF_STOCK
-        elif new_quantity <= existing_part.min_quantity:
-            status = PartStatus.LOW_STOCK
-        else:
-            status = PartStatus.IN_STOCK
-
-        # 업데이트 실행
-        updated_part = await prisma.part.update(
-            where={"id": part_id},
-            data={
-                "quantity": new_quantity,
-                "status": status,
-                "updated_at": datetime.now(),
-            },
+        raise validation_exception(
+            {
+                "message": "재고가 부족합니다.",
+                "current_quantity": failure["current_quantity"],
+                "requested_change": quantity_change,
+            }
         )
-
-        part_data = PartResponse.model_validate(updated_part).model_dump(mode="json")
-        return create_response(data=part_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -289,6 +311,34 @@ async def update_inventory(
         raise server_error_exception(f"재고 조정 중 오류가 발생했습니다: {str(e)}")
 
 
+# 재고 일괄 조정 (하나라도 실패하면 전체 롤백)
+@router.post("/inventory/adjustments", response_model=ApiResponse)
+async def adjust_inventory_batch(
+    batch: InventoryAdjustmentBatch,
+    prisma: Prisma = Depends(get_prisma),
+):
+    try:
+        deltas = aggregate_adjustments(
+            (item.part_id, item.quantity_change) for item in batch.adjustments
+        )
+        updated_parts = await apply_inventory_adjustments(prisma, deltas)
+
+        return create_response(data=serialize_parts(updated_parts))
+    except InventoryAdjustmentError as e:
+        raise validation_exception(
+            {
+                "message": "재고 조정에 실패하여 전체 변경이 취소되었습니다.",
+                "reference_id": batch.reference_id,
+                "failures": e.failures,
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"재고 일괄 조정 실패: {str(e)}")
+        raise server_error_exception(f"재고 일괄 조정 중 오류가 발생했습니다: {str(e)}")
+
+
 # 부품 삭제
 @router.delete("/{part_id}", response_model=ApiResponse)
 async def delete_part(
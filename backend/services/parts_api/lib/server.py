@@ -16,6 +16,7 @@ from contextlib import asynccontextmanager
 from shared.utils.logging_utils import setup_logger
 from shared.utils.response_utils import ApiException, ErrorResponse
 from shared.config.settings import get_settings
+from shared.utils.server_launcher import default_response_class
 
 # 환경 설정 로드
 settings = get_settings()
@@ -28,6 +29,8 @@ from .routes import part_router, supplier_router, erp_sync_router
 
 # dependencies.py에서 prisma 클라이언트와 의존성 함수 임포트
 from .dependencies import get_prisma, close_prisma
+from shared.database.client_registry import prisma_registry
+from .services.part_catalog import ensure_catalog_indexes
 
 # Prisma 클라이언트 인스턴스 생성
 prisma = None
@@ -41,8 +44,10 @@ async def lifespan(app: FastAPI):
     # 앱 시작 시 실행될 코드
     logger.info(f"서버 시작 (환경: {settings.ENV})")
     global prisma
+    await prisma_registry.startup()
     prisma = await get_prisma()
     logger.info("데이터베이스 연결 성공")
+    await ensure_catalog_indexes(prisma)
 
     yield
 
@@ -56,6 +61,7 @@ app = FastAPI(
     title="CarGoro Parts API",
     description="부품 관리, 재고 관리, 공급업체 관리, 주문 관리 및 ERP 연동 API",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
@@ -147,7 +153,8 @@ async def root():
 # 헬스 체크 엔드포인트
 @app.get("/health")
 async def health_check():
+    database = await prisma_registry.health_check()
     return {
-        "status": "healthy",
-        "database": "connected" if prisma is not None else "disconnected",
+        "status": "healthy" if database["healthy"] else "degraded",
+        "database": "connected" if database["healthy"] else "disconnected",
     }
@@ -0,0 +1,216 @@
+"""
+ERP 어댑터 모듈
+
+ERP 시스템별 HTTP 프로토콜 차이(경로, 페이지 토큰, 변경분 필터)를 캡슐화합니다.
+- OData (SAP, Microsoft Dynamics): $filter / $top, 다음 페이지는 @odata.nextLink
+- Oracle REST: q=LastUpdateDate>..., offset/limit, hasMore
+- 사용자 정의: updated_since / cursor / limit, next_cursor
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger("parts-api:erp-sync")
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class ERPRequestError(Exception):
+    """ERP 요청 실패 (재시도 후에도 실패)"""
+
+
+def format_watermark(value: datetime) -> str:
+    """워터마크를 UTC ISO-8601 문자열로 변환"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ERPAdapter:
+    """ERP 어댑터 기본 클래스"""
+
+    system = "CUSTOM"
+    parts_path = "/parts"
+    export_path = "/parts/batch"
+    # ERP 시스템별 동시 요청 상한
+    max_concurrency = 4
+    max_retries = 3
+    retry_backoff = 0.5
+    # 로컬 필드 -> ERP 필드 기본 매핑 (설정의 mappingConfig 가 우선)
+    default_mapping: Dict[str, str] = {}
+
+    _semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __init__(self, connection_url: str, username: str, password: str):
+        self.base_url = connection_url.rstrip("/")
+        self.auth = (username, password)
+
+    @classmethod
+    def semaphore(cls) -> asyncio.Semaphore:
+        """같은 ERP 시스템에 대한 동시 요청을 제한하는 세마포어 (동기화 실행 간 공유)"""
+        if cls.system not in ERPAdapter._semaphores:
+            ERPAdapter._semaphores[cls.system] = asyncio.Semaphore(cls.max_concurrency)
+        return ERPAdapter._semaphores[cls.system]
+
+    def create_client(self, timeout: float = 30.0) -> httpx.AsyncClient:
+        """실행 단위로 재사용하는 커넥션 풀 클라이언트"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            auth=self.auth,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """세마포어 안에서 요청하고 일시적 오류는 지수 백오프로 재시도"""
+        last_error: Optional[str] = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.semaphore():
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    response.raise_for_status()
+                    return response
+                last_error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                last_error = str(e) or type(e).__name__
+            except httpx.HTTPStatusError as e:
+                raise ERPRequestError(f"{method} {url} 실패: HTTP {e.response.status_code}") from e
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+
+        raise ERPRequestError(f"{method} {url} 실패 ({self.max_retries}회 재시도): {last_error}")
+
+    def page_request(
+        self, since: Optional[datetime], cursor: Optional[str], limit: int, filters: Dict[str, Any]
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """한 페이지 요청의 (URL, 쿼리 파라미터)"""
+        if cursor:
+            return self.parts_path, {"cursor": cursor, "limit": limit}
+        params: Dict[str, Any] = {"limit": limit, **filters}
+        if since:
+            params["updated_since"] = format_watermark(since)
+        return self.parts_path, params
+
+    def parse_page(self, payload: Dict[str, Any], cursor: Optional[str], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """응답에서 (레코드 목록, 다음 페이지 커서) 추출"""
+        return payload.get("items", []), payload.get("next_cursor")
+
+    async def fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        since: Optional[datetime],
+        cursor: Optional[str],
+        limit: int,
+        filters: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """변경분 한 페이지 조회"""
+        url, params = self.page_request(since, cursor, limit, filters)
+        response = await self.request(client, "GET", url, params=params)
+        return self.parse_page(response.json(), cursor, limit)
+
+    async def push_batch(self, client: httpx.AsyncClient, records: List[Dict[str, Any]]) -> None:
+        """레코드 묶음 전송"""
+        await self.request(client, "POST", self.export_path, json={"items": records})
+
+
+class ODataAdapter(ERPAdapter):
+    """OData v4 어댑터 (다음 페이지 URL 을 커서로 사용)"""
+
+    updated_field = "LastChangeDateTime"
+
+    def page_request(self, since, cursor, limit, filters):
+        if cursor:
+            # nextLink 는 skiptoken 이 포함된 전체 URL (파라미터를 넘기면 쿼리 문자열이 대체됨)
+            return cursor, None
+        params: Dict[str, Any] = {"$top": limit, "$orderby": f"{self.updated_field} asc"}
+        clauses = [f"{self.updated_field} gt {format_watermark(since)}"] if since else []
+        clauses.extend(f"{key} eq '{value}'" for key, value in filters.items() if not isinstance(value, (list, dict)))
+        if clauses:
+            params["$filter"] = " and ".join(clauses)
+        return self.parts_path, params
+
+    def parse_page(self, payload, cursor, limit):
+        return payload.get("value", []), payload.get("@odata.nextLink")
+
+
+class SAPAdapter(ODataAdapter):
+    system = "SAP"
+    parts_path = "/sap/opu/odata4/sap/api_product/srvd_a2x/sap/product/0001/Product"
+    export_path = "/sap/opu/odata4/sap/api_product/srvd_a2x/sap/product/0001/Product/batch"
+    updated_field = "LastChangeDateTime"
+    default_mapping = {
+        "part_number": "Product",
+        "name": "ProductDescription",
+        "price": "StandardPrice",
+        "manufacturer": "ManufacturerNumber",
+    }
+
+
+class DynamicsAdapter(ODataAdapter):
+    system = "MICROSOFT_DYNAMICS"
+    parts_path = "/data/ReleasedProductsV2"
+    export_path = "/data/ReleasedProductsV2/batch"
+    updated_field = "ModifiedDateTime"
+    default_mapping = {
+        "part_number": "ItemNumber",
+        "name": "ProductName",
+        "price": "SalesPrice",
+    }
+
+
+class OracleAdapter(ERPAdapter):
+    """Oracle Fusion REST 어댑터 (offset/limit + hasMore)"""
+
+    system = "ORACLE"
+    parts_path = "/fscmRestApi/resources/latest/itemsV2"
+    export_path = "/fscmRestApi/resources/latest/itemsV2/batch"
+    default_mapping = {
+        "part_number": "ItemNumber",
+        "name": "ItemDescription",
+        "price": "ListPrice",
+    }
+
+    def page_request(self, since, cursor, limit, filters):
+        params: Dict[str, Any] = {
+            "limit": limit,
+            "offset": int(cursor or 0),
+            "orderBy": "LastUpdateDate:asc",
+            "onlyData": "true",
+        }
+        clauses = [f"LastUpdateDate>{format_watermark(since)}"] if since else []
+        clauses.extend(f"{key}={value}" for key, value in filters.items() if not isinstance(value, (list, dict)))
+        if clauses:
+            params["q"] = ";".join(clauses)
+        return self.parts_path, params
+
+    def parse_page(self, payload, cursor, limit):
+        items = payload.get("items", [])
+        next_cursor = str(int(cursor or 0) + len(items)) if payload.get("hasMore") else None
+        return items, next_cursor
+
+
+class CustomAdapter(ERPAdapter):
+    system = "CUSTOM"
+
+
+ERP_ADAPTERS = {
+    adapter.system: adapter
+    for adapter in (SAPAdapter, OracleAdapter, DynamicsAdapter, CustomAdapter)
+}
+
+
+def get_adapter(config: Any) -> ERPAdapter:
+    """설정의 ERP 시스템 유형에 맞는 어댑터 생성"""
+    erp_system = str(getattr(config.erpSystem, "value", config.erpSystem)).upper()
+    if erp_system not in ERP_ADAPTERS:
+        raise ValueError(f"지원되지 않는 ERP 시스템: {erp_system}")
+    return ERP_ADAPTERS[erp_system](config.connectionUrl, config.username, config.password)
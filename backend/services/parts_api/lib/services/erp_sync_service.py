@@ -1,29 +1,236 @@
+"""
+ERP 동기화 엔진
+
+- 워터마크(lastSyncTime) 이후 변경분만 페이지 단위로 가져오기
+- 부품(part) 테이블에 청크 단위 일괄 upsert (INSERT ... ON CONFLICT)
+- 페이지 조회와 저장을 겹쳐 처리하고, ERP 시스템별 동시 요청 수 제한
+- 페이지마다 체크포인트를 저장하여 실패한 동기화를 중단 지점부터 재개
+  (양방향 동기화에서 끝난 단계는 완료로 표시하여 재개 시 다시 실행하지 않음)
+- 양방향 동기화는 가져오기와 내보내기가 같은 실행 시작 시각을 사용하여, 방금 가져온 행을 다시 내보내지 않음
+"""
 import asyncio
 import json
 import logging
-import requests
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from prisma import Prisma
-from prisma.errors import PrismaError
 
-logger = logging.getLogger(__name__)
+from ..dependencies import get_prisma
+from ..models import PartStatus, PartType
+from .erp_adapters import ERPAdapter, get_adapter
+
+logger = logging.getLogger("parts-api:erp-sync")
+
+# 기본 페이지/청크 크기
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 500
+# 저장을 기다리는 동안 미리 받아 둘 페이지 수 (메모리 상한)
+DEFAULT_PREFETCH_PAGES = 2
+# 로그에 남길 실패 항목 수
+MAX_ERROR_DETAILS = 20
+# 진행 중(IN_PROGRESS) 로그가 이 시간 동안 갱신되지 않으면 중단된 실행으로 간주
+# (체크포인트를 저장할 때마다 로그 진행 건수를 갱신하므로 updatedAt 이 하트비트 역할)
+STALE_RUN_TIMEOUT = timedelta(minutes=15)
+
+CHECKPOINT_TABLE_DDL = (
+    'CREATE TABLE IF NOT EXISTS "erp_sync_checkpoint" ('
+    "config_id TEXT NOT NULL, "
+    "phase TEXT NOT NULL, "
+    "sync_log_id TEXT NOT NULL, "
+    "watermark TIMESTAMPTZ, "
+    "run_started_at TIMESTAMPTZ NOT NULL, "
+    "cursor TEXT, "
+    "processed INTEGER NOT NULL DEFAULT 0, "
+    "success INTEGER NOT NULL DEFAULT 0, "
+    "failed INTEGER NOT NULL DEFAULT 0, "
+    "completed BOOLEAN NOT NULL DEFAULT false, "
+    "updated_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+    "PRIMARY KEY (config_id, phase))"
+)
+# completed 컬럼이 없던 때 만든 체크포인트 테이블 보정
+CHECKPOINT_COMPLETED_DDL = (
+    'ALTER TABLE "erp_sync_checkpoint" ADD COLUMN IF NOT EXISTS completed BOOLEAN NOT NULL DEFAULT false'
+)
+# ON CONFLICT (part_number) 대상 유니크 인덱스
+PART_NUMBER_UNIQUE_DDL = 'CREATE UNIQUE INDEX IF NOT EXISTS part_part_number_key ON "part" (part_number)'
+
+# upsert 대상 컬럼 (순서 고정)
+UPSERT_COLUMNS: Tuple[str, ...] = (
+    "part_number",
+    "name",
+    "description",
+    "part_type",
+    "price",
+    "manufacturer",
+    "quantity",
+    "min_quantity",
+    "location",
+)
+# 매핑에 없어도 upsert 시 항상 설정되는 컬럼
+REQUIRED_COLUMNS = frozenset({"part_number", "name", "price"})
+# mappingConfig 에서 허용하는 로컬 필드 별칭
+FIELD_ALIASES = {"part_name": "name"}
+
+_PART_TYPES = {part_type.value: part_type for part_type in PartType}
+
+
+class RecordError(ValueError):
+    """ERP 레코드를 부품으로 변환할 수 없음"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _load_json(value: Any) -> Dict[str, Any]:
+    if not value:
+        return {}
+    if isinstance(value, str):
+        return json.loads(value)
+    return dict(value)
+
+
+def resolve_mapping(adapter: ERPAdapter, mapping_config: Dict[str, Any]) -> Dict[str, str]:
+    """로컬 필드 -> ERP 필드 매핑 (어댑터 기본값 + 설정)"""
+    mapping = {column: column for column in UPSERT_COLUMNS}
+    mapping.update(adapter.default_mapping)
+    for local_field, erp_field in mapping_config.items():
+        local_field = FIELD_ALIASES.get(local_field, local_field)
+        if local_field in mapping and isinstance(erp_field, str):
+            mapping[local_field] = erp_field
+    return mapping
+
+
+def initial_status(quantity: int, min_quantity: int) -> PartStatus:
+    """신규 부품의 재고 상태"""
+    if quantity <= 0:
+        return PartStatus.OUT_OF_STOCK
+    if quantity <= min_quantity:
+        return PartStatus.LOW_STOCK
+    return PartStatus.IN_STOCK
+
+
+def map_record(record: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+    """ERP 레코드 -> part 행"""
+    get = record.get
+    part_number = get(mapping["part_number"])
+    name = get(mapping["name"])
+    price = get(mapping["price"])
+    if not part_number or not name:
+        raise RecordError(f"부품 번호/이름 누락: {part_number!r}")
+    try:
+        price = float(price)
+        quantity = int(get(mapping["quantity"]) or 0)
+        min_quantity = int(get(mapping["min_quantity"]) or 5)
+    except (TypeError, ValueError) as e:
+        raise RecordError(f"{part_number}: 숫자 필드 오류 ({e})") from e
+    if price < 0:
+        raise RecordError(f"{part_number}: 음수 가격")
+
+    part_type = str(get(mapping["part_type"]) or PartType.OTHER.value).lower()
+    return {
+        "part_number": str(part_number),
+        "name": str(name),
+        "description": get(mapping["description"]),
+        # 알 수 없는 유형은 기타로 저장 (아래 SQL 에 리터럴로 들어가므로 열거형 값만 허용)
+        "part_type": _PART_TYPES.get(part_type, PartType.OTHER),
+        "price": price,
+        "manufacturer": str(get(mapping["manufacturer"]) or ""),
+        "quantity": quantity,
+        "min_quantity": min_quantity,
+        "location": get(mapping["location"]),
+    }
+
+
+def to_erp_record(part: Any, mapping: Dict[str, str]) -> Dict[str, Any]:
+    """part 행 -> ERP 레코드 (내보내기)"""
+    record = {}
+    for column, erp_field in mapping.items():
+        value = getattr(part, column, None)
+        record[erp_field] = value.value if isinstance(value, (PartType, PartStatus)) else value
+    return record
+
+
+def build_upsert_sql(row_count: int, update_columns: Tuple[str, ...], part_types: List[PartType], statuses: List[PartStatus]) -> str:
+    """
+    청크 upsert SQL 생성
+
+    part_type/status 는 열거형 컬럼이므로 검증된 열거형 값을 리터럴로, 나머지는 $n 파라미터로 바인딩합니다.
+    매핑에 없는 컬럼은 기존 값을 덮어쓰지 않고, 값이 바뀌지 않은 행은 갱신하지 않습니다.
+    """
+    bound_columns = [column for column in UPSERT_COLUMNS if column != "part_type"]
+    per_row = len(bound_columns) + 1  # + id
+    values = []
+    for index in range(row_count):
+        base = index * per_row
+        params = [f"${base + offset}" for offset in range(1, per_row + 1)]
+        values.append(
+            f"({params[0]}, {', '.join(params[1:4])}, '{part_types[index].value}', "
+            f"{', '.join(params[4:])}, '{statuses[index].value}', '{{}}', '{{}}', now(), now())"
+        )
+
+    assignments = [f"{column} = EXCLUDED.{column}" for column in update_columns]
+    if "quantity" in update_columns:
+        min_ref = "EXCLUDED.min_quantity" if "min_quantity" in update_columns else '"part".min_quantity'
+        assignments.append(
+            "status = CASE "
+            f"WHEN \"part\".status = '{PartStatus.DISCONTINUED.value}' THEN \"part\".status "
+            f"WHEN EXCLUDED.quantity <= 0 THEN '{PartStatus.OUT_OF_STOCK.value}' "
+            f"WHEN EXCLUDED.quantity <= {min_ref} THEN '{PartStatus.LOW_STOCK.value}' "
+            f"ELSE '{PartStatus.IN_STOCK.value}' END"
+        )
+    assignments.append("updated_at = now()")
+    changed = " OR ".join(f'"part".{column} IS DISTINCT FROM EXCLUDED.{column}' for column in update_columns)
+
+    return (
+        'INSERT INTO "part" (id, part_number, name, description, part_type, price, manufacturer, '
+        "quantity, min_quantity, location, status, supplier_ids, compatible_vehicles, created_at, updated_at) "
+        f"VALUES {', '.join(values)} "
+        f"ON CONFLICT (part_number) DO UPDATE SET {', '.join(assignments)} "
+        f"WHERE {changed}"
+    )
 
 
 class ERPSyncService:
     """
     ERP 시스템과의 데이터 동기화를 처리하는 서비스 클래스
+
+    Prisma 클라이언트는 애플리케이션에서 주입받으며, 실행마다 연결/해제하지 않습니다.
     """
 
-    def __init__(self):
-        self.db = Prisma()
-        self.erp_adapters = {
-            "SAP": self._sync_sap,
-            "ORACLE": self._sync_oracle,
-            "MICROSOFT_DYNAMICS": self._sync_dynamics,
-            "CUSTOM": self._sync_custom,
-        }
+    def __init__(
+        self,
+        prisma: Optional[Prisma] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+    ):
+        self._prisma = prisma
+        self.page_size = page_size
+        self.chunk_size = chunk_size
+        self.prefetch_pages = prefetch_pages
+        self._checkpoint_ready = False
+
+    async def _db(self) -> Prisma:
+        if self._prisma is None:
+            self._prisma = await get_prisma()
+        return self._prisma
+
+    async def _ensure_tables(self, db: Prisma) -> None:
+        if self._checkpoint_ready:
+            return
+        await db.execute_raw(CHECKPOINT_TABLE_DDL)
+        await db.execute_raw(CHECKPOINT_COMPLETED_DDL)
+        await db.execute_raw(PART_NUMBER_UNIQUE_DDL)
+        self._checkpoint_ready = True
 
     async def sync_data(
         self,
@@ -34,299 +241,371 @@ class ERPSyncService:
     ):
         """
         ERP 시스템과 데이터 동기화를 수행하는 백그라운드 작업
+
+        이전 실행이 중간에 실패했다면 체크포인트부터 이어서 처리합니다.
         """
+        db = await self._db()
         try:
-            # Prisma 연결 확인
-            if not self.db.is_connected():
-                await self.db.connect()
-
-            # 동기화 시작
+            await self._ensure_tables(db)
             logger.info(f"ERP 동기화 시작: 설정 ID {config.id}, 로그 ID {sync_log_id}")
 
-            # 시스템 유형에 따른 동기화 함수 호출
-            erp_system = config.erpSystem
-            if erp_system in self.erp_adapters:
-                result = await self.erp_adapters[erp_system](config, direction, filters)
-            else:
-                result = {
-                    "success": False,
-                    "message": f"지원되지 않는 ERP 시스템: {erp_system}",
-                    "processed": 0,
-                    "success_count": 0,
-                    "failed_count": 0,
-                    "error_details": None,
-                }
+            adapter = get_adapter(config)
+            mapping = resolve_mapping(adapter, _load_json(config.mappingConfig))
+            merged_filters = {**_load_json(config.filters), **(filters or {})}
+
+            direction = str(getattr(direction, "value", direction)).upper()
+            phases = ["IMPORT", "EXPORT"] if direction == "BIDIRECTIONAL" else [direction]
+
+            totals = {"processed": 0, "success": 0, "failed": 0}
+            errors: List[str] = []
+            run_started_at = None
+            async with adapter.create_client() as client:
+                for phase in phases:
+                    checkpoint = await self._load_checkpoint(db, config, phase, sync_log_id, run_started_at)
+                    # 이후 단계(내보내기)도 첫 단계의 시작 시각을 상한으로 사용
+                    run_started_at = run_started_at or checkpoint["run_started_at"]
+                    # 이전 실행에서 끝난 단계(뒤 단계에서 실패해 재개한 경우)는 다시 실행하지 않고 건수만 합산
+                    if not checkpoint["completed"]:
+                        if phase == "IMPORT":
+                            await self._run_import(db, adapter, client, mapping, merged_filters, checkpoint, errors)
+                        elif phase == "EXPORT":
+                            await self._run_export(db, adapter, client, mapping, checkpoint, errors)
+                        else:
+                            raise ValueError(f"지원되지 않는 동기화 방향: {phase}")
+                        checkpoint["completed"] = True
+                        await self._save_checkpoint(db, checkpoint)
+                    for key in totals:
+                        totals[key] += checkpoint[key]
 
-            # 동기화 로그 업데이트
             await self._update_sync_log(
+                db,
                 sync_log_id,
-                result["success"],
-                result["message"],
-                result["processed"],
-                result["success_count"],
-                result["failed_count"],
-                result["error_details"],
+                True,
+                totals["processed"],
+                totals["success"],
+                totals["failed"],
+                "\n".join(errors[:MAX_ERROR_DETAILS]) or None,
             )
 
-            # 성공적인 동기화인 경우 설정의 마지막 동기화 시간 업데이트
-            if result["success"]:
-                await self.db.erpsyncconfig.update(
-                    where={"id": config.id},
-                    data={"lastSyncTime": datetime.now()},
-                )
+            # 다음 증분 동기화의 기준 시각: 이번 실행 시작 시각 (실행 중 변경분은 다음 실행에서 다시 가져옴)
+            await db.erpsyncconfig.update(
+                where={"id": config.id},
+                data={"lastSyncTime": run_started_at},
+            )
+            await db.execute_raw(
+                'DELETE FROM "erp_sync_checkpoint" WHERE config_id = $1', config.id
+            )
 
-            logger.info(f"ERP 동기화 완료: 설정 ID {config.id}, 로그 ID {sync_log_id}")
+            logger.info(
+                f"ERP 동기화 완료: 설정 ID {config.id}, 로그 ID {sync_log_id}, "
+                f"처리 {totals['processed']}건 (실패 {totals['failed']}건)"
+            )
 
         except Exception as e:
+            # 체크포인트는 남겨 두어 다음 실행에서 재개
             logger.error(f"ERP 동기화 중 오류 발생: {str(e)}")
-            # 동기화 로그 업데이트 (실패)
             try:
-                await self._update_sync_log(
-                    sync_log_id,
-                    False,
-                    "동기화 중 예외 발생",
-                    0,
-                    0,
-                    0,
-                    str(e),
-                )
+                await self._update_sync_log(db, sync_log_id, False, None, None, None, str(e))
             except Exception as log_error:
                 logger.error(f"로그 업데이트 중 오류: {str(log_error)}")
-        finally:
-            # Prisma 연결 해제
-            if self.db.is_connected():
-                await self.db.disconnect()
 
-    async def _update_sync_log(
+    async def _load_checkpoint(
         self,
-        log_id: str,
-        success: bool,
-        message: str,
-        processed: int,
-        success_count: int,
-        failed_count: int,
-        error_details: Optional[str] = None,
-    ):
-        """
-        동기화 로그를 업데이트합니다.
-        """
-        try:
-            status = "COMPLETED" if success else "FAILED"
-            if success and failed_count > 0:
-                status = "PARTIAL"
-
-            await self.db.erpsynclog.update(
-                where={"id": log_id},
-                data={
-                    "status": status,
-                    "endTime": datetime.now(),
-                    "totalItems": processed,
-                    "processedItems": processed,
-                    "successItems": success_count,
-                    "failedItems": failed_count,
-                    "errorDetails": error_details,
-                },
-            )
-        except PrismaError as e:
-            logger.error(f"동기화 로그 업데이트 중 Prisma 오류: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"동기화 로그 업데이트 중 오류: {str(e)}")
-            raise
-
-    async def _sync_sap(
-        self, config: Any, direction: str, filters: Dict[str, Any] = None
+        db: Prisma,
+        config: Any,
+        phase: str,
+        sync_log_id: str,
+        run_started_at: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
-        SAP ERP 시스템과 데이터 동기화
+        체크포인트 조회 (없으면 워터마크 기준으로 새로 시작)
+
+        run_started_at 이 주어지면 (앞 단계가 있는 실행) 새 체크포인트도 같은 시작 시각을 사용합니다.
+        시작 시각은 DB 시계 기준이어야 upsert 가 기록하는 updated_at(now()) 과 비교할 수 있습니다.
         """
-        try:
-            logger.info(f"SAP 동기화 시작: 방향={direction}")
-
-            # SAP 연결 정보
-            connection_url = config.connectionUrl
-            username = config.username
-            password = config.password
-            mapping_config = json.loads(config.mappingConfig)
-
-            # 동기화 방향에 따른 처리
-            if direction == "IMPORT":
-                # SAP에서 데이터 가져오기
-                result = await self._import_from_sap(
-                    connection_url, username, password, mapping_config, filters
-                )
-            elif direction == "EXPORT":
-                # SAP로 데이터 내보내기
-                result = await self._export_to_sap(
-                    connection_url, username, password, mapping_config, filters
-                )
-            else:  # BIDIRECTIONAL
-                # 양방향 동기화
-                import_result = await self._import_from_sap(
-                    connection_url, username, password, mapping_config, filters
+        rows = await db.query_raw(
+            'SELECT watermark, run_started_at, cursor, processed, success, failed, completed '
+            'FROM "erp_sync_checkpoint" WHERE config_id = $1 AND phase = $2',
+            config.id,
+            phase,
+        )
+        if rows:
+            row = rows[0]
+            checkpoint = {
+                "config_id": config.id,
+                "phase": phase,
+                "sync_log_id": sync_log_id,
+                "watermark": _as_datetime(row["watermark"]),
+                "run_started_at": run_started_at or _as_datetime(row["run_started_at"]),
+                "cursor": row["cursor"],
+                "processed": int(row["processed"]),
+                "success": int(row["success"]),
+                "failed": int(row["failed"]),
+                "completed": bool(row["completed"]),
+            }
+            if checkpoint["completed"]:
+                logger.info(f"ERP 동기화 재개: 설정 ID {config.id}, {phase} 단계는 이미 완료되어 건너뜀")
+            else:
+                logger.info(
+                    f"ERP 동기화 재개: 설정 ID {config.id}, {phase}, 처리 {checkpoint['processed']}건 이후"
                 )
-                export_result = await self._export_to_sap(
-                    connection_url, username, password, mapping_config, filters
+            return checkpoint
+
+        if run_started_at is None:
+            rows = await db.query_raw("SELECT now() AS now")
+            run_started_at = _as_datetime(rows[0]["now"]) if rows else _utcnow()
+        return {
+            "config_id": config.id,
+            "phase": phase,
+            "sync_log_id": sync_log_id,
+            "watermark": _as_datetime(config.lastSyncTime),
+            "run_started_at": run_started_at,
+            "cursor": None,
+            "processed": 0,
+            "success": 0,
+            "failed": 0,
+            "completed": False,
+        }
+
+    async def _save_checkpoint(self, db: Prisma, checkpoint: Dict[str, Any]) -> None:
+        watermark = checkpoint["watermark"]
+        await db.execute_raw(
+            'INSERT INTO "erp_sync_checkpoint" '
+            "(config_id, phase, sync_log_id, watermark, run_started_at, cursor, processed, success, failed, "
+            "completed, updated_at) "
+            "VALUES ($1, $2, $3, $4::timestamptz, $5::timestamptz, $6, $7, $8, $9, $10, now()) "
+            "ON CONFLICT (config_id, phase) DO UPDATE SET sync_log_id = EXCLUDED.sync_log_id, "
+            "cursor = EXCLUDED.cursor, processed = EXCLUDED.processed, success = EXCLUDED.success, "
+            "failed = EXCLUDED.failed, completed = EXCLUDED.completed, updated_at = now()",
+            checkpoint["config_id"],
+            checkpoint["phase"],
+            checkpoint["sync_log_id"],
+            watermark.isoformat() if watermark else None,
+            checkpoint["run_started_at"].isoformat(),
+            checkpoint["cursor"],
+            checkpoint["processed"],
+            checkpoint["success"],
+            checkpoint["failed"],
+            checkpoint["completed"],
+        )
+        # 진행 상황을 로그에도 반영
+        await db.erpsynclog.update(
+            where={"id": checkpoint["sync_log_id"]},
+            data={
+                "processedItems": checkpoint["processed"],
+                "successItems": checkpoint["success"],
+                "failedItems": checkpoint["failed"],
+            },
+        )
+
+    async def _run_import(
+        self,
+        db: Prisma,
+        adapter: ERPAdapter,
+        client: Any,
+        mapping: Dict[str, str],
+        filters: Dict[str, Any],
+        checkpoint: Dict[str, Any],
+        errors: List[str],
+    ) -> None:
+        """ERP -> part 가져오기 (조회와 저장을 겹쳐 처리)"""
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch_pages)
+
+        async def produce() -> None:
+            cursor = checkpoint["cursor"]
+            while True:
+                records, next_cursor = await adapter.fetch_page(
+                    client, checkpoint["watermark"], cursor, self.page_size, filters
                 )
+                await pages.put((records, next_cursor))
+                if not next_cursor or not records:
+                    break
+                cursor = next_cursor
 
-                # 결과 병합
-                result = {
-                    "success": import_result["success"] and export_result["success"],
-                    "message": f"가져오기: {import_result['message']}, 내보내기: {export_result['message']}",
-                    "processed": import_result["processed"]
-                    + export_result["processed"],
-                    "success_count": import_result["success_count"]
-                    + export_result["success_count"],
-                    "failed_count": import_result["failed_count"]
-                    + export_result["failed_count"],
-                    "error_details": (
-                        import_result["error_details"]
-                        if import_result["error_details"]
-                        else export_result["error_details"]
-                    ),
-                }
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                get_page = asyncio.create_task(pages.get())
+                done, _ = await asyncio.wait({get_page, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if get_page not in done:
+                    # 생산자가 먼저 끝났다면 예외를 전파하고, 정상 종료라면 남은 페이지를 기다림
+                    if producer.exception():
+                        get_page.cancel()
+                        raise producer.exception()
+                    await get_page
+                records, next_cursor = get_page.result()
 
-            return result
+                for start in range(0, len(records), self.chunk_size):
+                    success, failed = await self._upsert_chunk(
+                        db, records[start:start + self.chunk_size], mapping, errors
+                    )
+                    checkpoint["success"] += success
+                    checkpoint["failed"] += failed
+                checkpoint["processed"] += len(records)
+                checkpoint["cursor"] = next_cursor
+                await self._save_checkpoint(db, checkpoint)
 
-        except Exception as e:
-            logger.error(f"SAP 동기화 중 오류: {str(e)}")
-            return {
-                "success": False,
-                "message": f"SAP 동기화 실패: {str(e)}",
-                "processed": 0,
-                "success_count": 0,
-                "failed_count": 0,
-                "error_details": str(e),
-            }
+                if not next_cursor or not records:
+                    break
+        finally:
+            if not producer.done():
+                producer.cancel()
 
-    async def _import_from_sap(
+    async def _upsert_chunk(
         self,
-        connection_url: str,
-        username: str,
-        password: str,
-        mapping_config: Dict[str, Any],
-        filters: Dict[str, Any] = None,
-    ) -> Dict[str, Any]:
+        db: Prisma,
+        records: List[Dict[str, Any]],
+        mapping: Dict[str, str],
+        errors: List[str],
+    ) -> Tuple[int, int]:
         """
-        SAP에서 데이터를 가져옵니다.
-        실제 구현에서는 SAP API를 호출하고 데이터를 로컬 데이터베이스에 저장합니다.
+        청크 일괄 upsert, 실패 시 행 단위로 재시도하여 불량 행만 걸러냄
+
+        레코드가 실제로 보낸 필드만 갱신하도록 갱신 컬럼 조합별로 나누어 upsert 합니다.
+        (보내지 않은 필드는 map_record 의 기본값이 아니라 기존 값을 유지)
         """
-        try:
-            # 이 부분은 실제 SAP API 호출 코드로 대체해야 함
-            # 예시를 위한 더미 구현
-            logger.info(f"SAP 데이터 가져오기 호출: {connection_url}")
-            logger.info(f"필터: {filters}")
-
-            # 더미 결과 - 실제 구현에서는 실제 SAP API 결과를 처리해야 함
-            return {
-                "success": True,
-                "message": "SAP에서 데이터를 성공적으로 가져왔습니다.",
-                "processed": 50,
-                "success_count": 48,
-                "failed_count": 2,
-                "error_details": "일부 항목에 유효하지 않은 값이 있습니다.",
-            }
+        rows: Dict[str, Tuple[Dict[str, Any], Tuple[str, ...]]] = {}
+        failed = 0
+        for record in records:
+            try:
+                row = map_record(record, mapping)
+            except RecordError as e:
+                failed += 1
+                errors.append(str(e))
+                continue
+            update_columns = tuple(
+                column
+                for column in UPSERT_COLUMNS
+                if column != "part_number" and (column in REQUIRED_COLUMNS or mapping[column] in record)
+            )
+            # 같은 청크 안의 중복 부품 번호는 마지막 값만 사용 (ON CONFLICT 는 같은 행을 두 번 갱신할 수 없음)
+            rows[row["part_number"]] = (row, update_columns)
 
-        except Exception as e:
-            logger.error(f"SAP에서 데이터 가져오기 중 오류: {str(e)}")
-            return {
-                "success": False,
-                "message": f"SAP에서 데이터 가져오기 실패: {str(e)}",
-                "processed": 0,
-                "success_count": 0,
-                "failed_count": 0,
-                "error_details": str(e),
-            }
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row, update_columns in rows.values():
+            groups.setdefault(update_columns, []).append(row)
+
+        success = 0
+        for update_columns, batch in groups.items():
+            group_success, group_failed = await self._upsert_group(db, batch, update_columns, errors)
+            success += group_success
+            failed += group_failed
+        return success, failed
 
-    async def _export_to_sap(
+    async def _upsert_group(
         self,
-        connection_url: str,
-        username: str,
-        password: str,
-        mapping_config: Dict[str, Any],
-        filters: Dict[str, Any] = None,
-    ) -> Dict[str, Any]:
-        """
-        데이터를 SAP로 내보냅니다.
-        실제 구현에서는 로컬 데이터베이스에서 데이터를 가져와 SAP API로 전송합니다.
-        """
+        db: Prisma,
+        batch: List[Dict[str, Any]],
+        update_columns: Tuple[str, ...],
+        errors: List[str],
+    ) -> Tuple[int, int]:
+        """갱신 컬럼이 같은 행 묶음 upsert"""
         try:
-            # 이 부분은 실제 SAP API 호출 코드로 대체해야 함
-            # 예시를 위한 더미 구현
-            logger.info(f"SAP 데이터 내보내기 호출: {connection_url}")
-            logger.info(f"필터: {filters}")
-
-            # 더미 결과 - 실제 구현에서는 실제 SAP API 결과를 처리해야 함
-            return {
-                "success": True,
-                "message": "데이터를 SAP로 성공적으로 내보냈습니다.",
-                "processed": 30,
-                "success_count": 30,
-                "failed_count": 0,
-                "error_details": None,
-            }
-
+            await self._execute_upsert(db, batch, update_columns)
+            return len(batch), 0
         except Exception as e:
-            logger.error(f"SAP로 데이터 내보내기 중 오류: {str(e)}")
-            return {
-                "success": False,
-                "message": f"SAP로 데이터 내보내기 실패: {str(e)}",
-                "processed": 0,
-                "success_count": 0,
-                "failed_count": 0,
-                "error_details": str(e),
-            }
+            logger.warning(f"청크 upsert 실패, 행 단위로 재시도: {str(e)}")
 
-    async def _sync_oracle(
-        self, config: Any, direction: str, filters: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
-        """
-        Oracle ERP 시스템과 데이터 동기화
-        """
-        # Oracle ERP 동기화 구현
-        # 예시를 위한 더미 구현
-        logger.info(f"Oracle 동기화 시작: 방향={direction}")
-        return {
-            "success": True,
-            "message": "Oracle 동기화가 완료되었습니다.",
-            "processed": 40,
-            "success_count": 40,
-            "failed_count": 0,
-            "error_details": None,
-        }
+        success = failed = 0
+        for row in batch:
+            try:
+                await self._execute_upsert(db, [row], update_columns)
+                success += 1
+            except Exception as e:
+                failed += 1
+                errors.append(f"{row['part_number']}: {str(e)}")
+        return success, failed
 
-    async def _sync_dynamics(
-        self, config: Any, direction: str, filters: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
-        """
-        Microsoft Dynamics ERP 시스템과 데이터 동기화
-        """
-        # Microsoft Dynamics ERP 동기화 구현
-        # 예시를 위한 더미 구현
-        logger.info(f"Microsoft Dynamics 동기화 시작: 방향={direction}")
-        return {
-            "success": True,
-            "message": "Microsoft Dynamics 동기화가 완료되었습니다.",
-            "processed": 35,
-            "success_count": 32,
-            "failed_count": 3,
-            "error_details": "일부 항목에 호환되지 않는 필드가 있습니다.",
-        }
+    async def _execute_upsert(self, db: Prisma, rows: List[Dict[str, Any]], update_columns: Tuple[str, ...]) -> None:
+        params: List[Any] = []
+        part_types = []
+        statuses = []
+        for row in rows:
+            params.append(str(uuid.uuid4()))
+            params.extend(row[column] for column in UPSERT_COLUMNS if column != "part_type")
+            part_types.append(row["part_type"])
+            statuses.append(initial_status(row["quantity"], row["min_quantity"]))
+        await db.execute_raw(build_upsert_sql(len(rows), update_columns, part_types, statuses), *params)
 
-    async def _sync_custom(
-        self, config: Any, direction: str, filters: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
+    async def _run_export(
+        self,
+        db: Prisma,
+        adapter: ERPAdapter,
+        client: Any,
+        mapping: Dict[str, str],
+        checkpoint: Dict[str, Any],
+        errors: List[str],
+    ) -> None:
+        """part -> ERP 내보내기 (id 키셋 순회, 어댑터 동시성만큼 묶음 병렬 전송)"""
+        updated_at: Dict[str, Any] = {"lte": checkpoint["run_started_at"]}
+        if checkpoint["watermark"]:
+            updated_at["gt"] = checkpoint["watermark"]
+
+        while True:
+            window: List[List[Any]] = []
+            cursor = checkpoint["cursor"]
+            for _ in range(adapter.max_concurrency):
+                where: Dict[str, Any] = {"updated_at": updated_at}
+                if cursor:
+                    where["id"] = {"gt": cursor}
+                parts = await db.part.find_many(where=where, order={"id": "asc"}, take=self.chunk_size)
+                if not parts:
+                    break
+                window.append(parts)
+                cursor = parts[-1].id
+                if len(parts) < self.chunk_size:
+                    break
+
+            if not window:
+                return
+
+            results = await asyncio.gather(
+                *(adapter.push_batch(client, [to_erp_record(part, mapping) for part in parts]) for parts in window),
+                return_exceptions=True,
+            )
+            for parts, result in zip(window, results):
+                checkpoint["processed"] += len(parts)
+                if isinstance(result, Exception):
+                    checkpoint["failed"] += len(parts)
+                    errors.append(f"내보내기 실패 ({parts[0].id}~{parts[-1].id}): {str(result)}")
+                else:
+                    checkpoint["success"] += len(parts)
+            checkpoint["cursor"] = cursor
+            await self._save_checkpoint(db, checkpoint)
+
+            if len(window[-1]) < self.chunk_size:
+                return
+
+    async def _update_sync_log(
+        self,
+        db: Prisma,
+        log_id: str,
+        success: bool,
+        processed: Optional[int],
+        success_count: Optional[int],
+        failed_count: Optional[int],
+        error_details: Optional[str] = None,
+    ):
         """
-        사용자 정의 ERP 시스템과 데이터 동기화
+        동기화 로그를 업데이트합니다.
+        실패 시에는 체크포인트까지 반영된 진행 건수를 유지합니다.
         """
-        # 사용자 정의 ERP 동기화 구현
-        # 예시를 위한 더미 구현
-        logger.info(f"사용자 정의 ERP 동기화 시작: 방향={direction}")
-        return {
-            "success": True,
-            "message": "사용자 정의 ERP 동기화가 완료되었습니다.",
-            "processed": 20,
-            "success_count": 18,
-            "failed_count": 2,
-            "error_details": "일부 항목을 처리할 수 없습니다.",
+        status = "COMPLETED" if success else "FAILED"
+        if success and failed_count:
+            status = "PARTIAL"
+
+        data: Dict[str, Any] = {
+            "status": status,
+            "endTime": datetime.now(),
+            "errorDetails": error_details,
         }
+        if processed is not None:
+            data.update(
+                {
+                    "totalItems": processed,
+                    "processedItems": processed,
+                    "successItems": success_count,
+                    "failedItems": failed_count,
+                }
+            )
+        await db.erpsynclog.update(where={"id": log_id}, data=data)
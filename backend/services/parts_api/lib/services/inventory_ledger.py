@@ -0,0 +1,131 @@
+"""
+재고 원장 모듈
+
+여러 부품의 재고 증감을 한 트랜잭션에서 원자적으로 적용합니다.
+- 감소는 조건부 UPDATE (quantity >= 감소량) 로만 적용되어 동시 주문에도 재고가 음수가 되지 않음
+- 하나라도 실패하면 전체 롤백
+- 재고 상태(PartStatus)는 DB 에서 수량 기준으로 다시 계산
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from prisma import Prisma
+
+from ..models import PartStatus
+
+logger = logging.getLogger("parts-api:inventory")
+
+# (상태, 조건) - 단종 부품은 수량이 바뀌어도 상태를 유지
+STATUS_RULES: Tuple[Tuple[PartStatus, str], ...] = (
+    (PartStatus.OUT_OF_STOCK, "quantity <= 0"),
+    (PartStatus.LOW_STOCK, "quantity > 0 AND quantity <= min_quantity"),
+    (PartStatus.IN_STOCK, "quantity > min_quantity"),
+)
+
+
+class InventoryAdjustmentError(Exception):
+    """재고 조정 실패 (전체 롤백됨)"""
+
+    def __init__(self, failures: List[Dict[str, Any]]):
+        self.failures = failures
+        super().__init__(f"재고 조정 실패: {len(failures)}건")
+
+
+class _RollbackAdjustments(Exception):
+    """트랜잭션 롤백용 내부 예외"""
+
+    def __init__(self, part_ids: List[str]):
+        self.part_ids = part_ids
+        super().__init__(",".join(part_ids))
+
+
+def aggregate_adjustments(adjustments: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+    """같은 부품의 증감량을 합산"""
+    deltas: Dict[str, int] = {}
+    for part_id, quantity_change in adjustments:
+        deltas[part_id] = deltas.get(part_id, 0) + quantity_change
+    return deltas
+
+
+async def find_missing_suppliers(prisma: Prisma, supplier_ids: List[str]) -> List[str]:
+    """존재하지 않는 공급업체 ID 목록 (IN 쿼리 한 번)"""
+    if not supplier_ids:
+        return []
+    suppliers = await prisma.supplier.find_many(where={"id": {"in": list(set(supplier_ids))}})
+    found = {supplier.id for supplier in suppliers}
+    return [supplier_id for supplier_id in supplier_ids if supplier_id not in found]
+
+
+async def _recompute_status(tx: Any, part_ids: List[str]) -> None:
+    """수량 기준으로 재고 상태를 DB 에서 다시 계산"""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(part_ids) + 1))
+    for status, condition in STATUS_RULES:
+        await tx.execute_raw(
+            f"UPDATE \"part\" SET status = '{status.value}' "
+            f"WHERE id IN ({placeholders}) AND {condition} "
+            f"AND status NOT IN ('{PartStatus.DISCONTINUED.value}', '{status.value}')",
+            *part_ids,
+        )
+
+
+async def _describe_failures(prisma: Prisma, deltas: Dict[str, int], part_ids: List[str]) -> List[Dict[str, Any]]:
+    parts = await prisma.part.find_many(where={"id": {"in": part_ids}})
+    current = {part.id: part.quantity for part in parts}
+    failures = []
+    for part_id in part_ids:
+        if part_id not in current:
+            failures.append({"part_id": part_id, "reason": "not_found"})
+        else:
+            failures.append(
+                {
+                    "part_id": part_id,
+                    "reason": "insufficient_stock",
+                    "current_quantity": current[part_id],
+                    "requested_change": deltas[part_id],
+                }
+            )
+    return failures
+
+
+async def apply_inventory_adjustments(prisma: Prisma, deltas: Dict[str, int]) -> List[Any]:
+    """
+    재고 증감을 한 트랜잭션에서 적용하고 갱신된 부품 목록을 반환합니다.
+
+    실패한 항목이 있으면 아무것도 적용하지 않고 InventoryAdjustmentError 를 발생시킵니다.
+    """
+    if not deltas:
+        return []
+
+    # 동시 배치 간 교착을 피하기 위해 항상 같은 순서로 행 잠금
+    part_ids = sorted(deltas)
+    now = datetime.now()
+
+    try:
+        async with prisma.tx() as tx:
+            failed = []
+            for part_id in part_ids:
+                delta = deltas[part_id]
+                where: Dict[str, Any] = {"id": part_id}
+                if delta < 0:
+                    where["quantity"] = {"gte": -delta}
+
+                updated = await tx.part.update_many(
+                    where=where,
+                    data={"quantity": {"increment": delta}, "updated_at": now},
+                )
+                if updated == 0:
+                    failed.append(part_id)
+
+            if failed:
+                raise _RollbackAdjustments(failed)
+
+            await _recompute_status(tx, part_ids)
+            parts = await tx.part.find_many(where={"id": {"in": part_ids}})
+    except _RollbackAdjustments as e:
+        failures = await _describe_failures(prisma, deltas, e.part_ids)
+        logger.info(f"재고 조정 롤백: {failures}")
+        raise InventoryAdjustmentError(failures)
+
+    order = {part_id: index for index, part_id in enumerate(deltas)}
+    return sorted(parts, key=lambda part: order[part.id])
@@ -0,0 +1,177 @@
+"""
+부품 카탈로그 조회 모듈
+
+대량 목록 조회용 경로를 제공합니다.
+- 부품 번호/부품명 접두사 및 부분 문자열 검색 (pg_trgm GIN 인덱스 사용)
+- (name, id) 키셋 커서 페이지네이션 (offset/count 없음)
+- DB 에서 읽은 신뢰된 행을 Pydantic 검증 없이 바로 JSON 직렬화
+"""
+import base64
+import json
+import logging
+from datetime import date, datetime
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple, get_args
+
+from prisma import Prisma
+from pydantic import BaseModel
+
+from ..models import PartResponse, PartStatus, PartType
+
+logger = logging.getLogger("parts-api:catalog")
+
+# 카탈로그 검색용 인덱스 (ILIKE 'q%' / ILIKE '%q%' 를 GIN 트라이그램 인덱스로 처리)
+CATALOG_INDEX_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS part_part_number_trgm_idx ON "part" USING gin (part_number gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS part_name_trgm_idx ON "part" USING gin (name gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS part_name_id_idx ON "part" (name, id)',
+)
+
+# 응답 필드 (PartResponse 에서 한 번만 계산)
+PART_RESPONSE_FIELDS: Tuple[str, ...] = tuple(PartResponse.model_fields)
+_PART_RESPONSE_FIELD_SET = frozenset(PART_RESPONSE_FIELDS)
+_get_part_fields = attrgetter(*PART_RESPONSE_FIELDS)
+
+
+def _needs_conversion(annotation: Any) -> bool:
+    """JSON 변환이 필요한 타입(datetime/date/Enum, Optional 포함)인지 확인"""
+    candidates = get_args(annotation) or (annotation,)
+    return any(
+        isinstance(candidate, type) and issubclass(candidate, (date, Enum))
+        for candidate in candidates
+    )
+
+
+# datetime/Enum 처럼 JSON 변환이 필요한 필드만 따로 처리
+_CONVERTED_FIELDS: Tuple[str, ...] = tuple(
+    name
+    for name, field in PartResponse.model_fields.items()
+    if _needs_conversion(field.annotation)
+)
+
+async def ensure_catalog_indexes(prisma: Prisma) -> None:
+    """카탈로그 검색 인덱스 생성 (실패해도 서비스는 계속 동작)"""
+    for statement in CATALOG_INDEX_DDL:
+        try:
+            await prisma.execute_raw(statement)
+        except Exception as e:
+            logger.warning(f"카탈로그 인덱스 생성 실패 ({statement}): {str(e)}")
+
+
+def encode_cursor(name: str, part_id: str) -> str:
+    """키셋 커서 인코딩"""
+    return base64.urlsafe_b64encode(json.dumps([name, part_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """키셋 커서 디코딩 (잘못된 커서는 ValueError)"""
+    try:
+        name, part_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return str(name), str(part_id)
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def build_catalog_where(
+    q: Optional[str] = None,
+    part_type: Optional[PartType] = None,
+    status: Optional[PartStatus] = None,
+    in_stock_only: bool = False,
+    supplier_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """카탈로그 조회 조건 구성"""
+    conditions: List[Dict[str, Any]] = []
+
+    if q:
+        conditions.append(
+            {
+                "OR": [
+                    {"part_number": {"startswith": q, "mode": "insensitive"}},
+                    {"name": {"contains": q, "mode": "insensitive"}},
+                ]
+            }
+        )
+
+    if part_type:
+        conditions.append({"part_type": part_type})
+
+    if status:
+        conditions.append({"status": status})
+
+    if in_stock_only:
+        conditions.append({"quantity": {"gt": 0}})
+
+    if supplier_id:
+        conditions.append({"supplier_ids": {"has": supplier_id}})
+
+    if cursor:
+        last_name, last_id = decode_cursor(cursor)
+        conditions.append(
+            {
+                "OR": [
+                    {"name": {"gt": last_name}},
+                    {"name": last_name, "id": {"gt": last_id}},
+                ]
+            }
+        )
+
+    return {"AND": conditions} if conditions else {}
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # Pydantic 의 JSON 직렬화와 동일하게 UTC 는 'Z' 로 표기
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def serialize_part(part: Any) -> Dict[str, Any]:
+    """DB 에서 읽은 부품 한 건을 검증 없이 JSON 호환 dict 로 변환"""
+    if isinstance(part, BaseModel):
+        # Prisma 결과 모델: 검증 없이 Rust 직렬화기로 바로 덤프
+        result = part.model_dump(mode="json", include=_PART_RESPONSE_FIELD_SET)
+        if len(result) != len(PART_RESPONSE_FIELDS):
+            for field in PART_RESPONSE_FIELDS:
+                result.setdefault(field, None)
+        return result
+
+    result = dict(zip(PART_RESPONSE_FIELDS, _get_part_fields(part)))
+    for field in _CONVERTED_FIELDS:
+        value = result[field]
+        if value is not None:
+            result[field] = _json_value(value)
+    return result
+
+
+def serialize_parts(parts: Iterable[Any]) -> List[Dict[str, Any]]:
+    """부품 목록 직렬화"""
+    return [serialize_part(part) for part in parts]
+
+
+async def fetch_catalog_page(
+    prisma: Prisma,
+    limit: int,
+    **filters: Any,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """카탈로그 한 페이지와 다음 페이지 커서 반환"""
+    where = build_catalog_where(**filters)
+    parts = await prisma.part.find_many(
+        where=where,
+        take=limit + 1,
+        order=[{"name": "asc"}, {"id": "asc"}],
+    )
+
+    next_cursor = None
+    if len(parts) > limit:
+        parts = parts[:limit]
+        next_cursor = encode_cursor(parts[-1].name, parts[-1].id)
+
+    return serialize_parts(parts), next_cursor
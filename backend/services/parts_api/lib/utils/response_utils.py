@@ -12,6 +12,7 @@ class ResponseMeta(BaseModel):
     per_page: Optional[int] = None
     total_items: Optional[int] = None
     total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
     model_config = {
         # API 응답은 camelCase로 직렬화
@@ -119,14 +120,16 @@ def create_response(
     per_page: Optional[int] = None,
     total_items: Optional[int] = None,
     total_pages: Optional[int] = None,
+    next_cursor: Optional[str] = None,
 ) -> ApiResponse[T]:
     """표준 응답 객체를 생성하는 헬퍼 함수"""
     meta = None
-    if page is not None:
+    if page is not None or next_cursor is not None:
         meta = ResponseMeta(
             page=page,
             per_page=per_page,
             total_items=total_items,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
     return ApiResponse(data=data, meta=meta)
@@ -0,0 +1,151 @@
+"""
+ERP 동기화 엔진 벤치마크 스크립트
+
+가짜 ERP 서버(scripts/fake_erp_server.py)를 같은 프로세스에서 띄우고 실제 DB(DATABASE_URL)로 동기화합니다.
+- 전체 가져오기: 처리량(레코드/초)과 10만 건당 소요 시간
+- 재동기화(변경 없는 upsert): 10만 건당 최대 메모리(tracemalloc)
+- 증분 동기화: 워터마크 이후 변경분만 조회되는지 확인
+- 재개: 중간에 ERP 장애를 주입한 뒤 다시 실행하면 체크포인트부터 이어서 처리하는지 확인
+
+ERP 동기화 설정은 조직에 속하므로 DB 에 조직이 하나 이상 있어야 합니다.
+
+사용법: python scripts/benchmark_erp_sync.py [레코드 수] [ERP 시스템: SAP|ORACLE|MICROSOFT_DYNAMICS|CUSTOM]
+"""
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from prisma import Prisma
+
+from lib.services.erp_sync_service import DEFAULT_PAGE_SIZE, ERPSyncService
+from scripts.fake_erp_server import FakeERP, create_app
+
+PORT = 8911
+PART_NUMBER_PREFIX = "ERP-"
+
+
+async def start_fake_erp(erp: FakeERP) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(erp), host="127.0.0.1", port=PORT, log_level="warning")
+    )
+    asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    return server
+
+
+async def new_sync_log(prisma: Prisma, config) -> str:
+    sync_log = await prisma.erpsynclog.create(
+        data={
+            "configId": config.id,
+            "status": "IN_PROGRESS",
+            "startTime": datetime.now(),
+            "direction": "IMPORT",
+            "organizationId": config.organizationId,
+        }
+    )
+    return sync_log.id
+
+
+async def run(prisma: Prisma, service: ERPSyncService, config_id: str, label: str, record_count: int, trace: bool = False):
+    """동기화 1회 실행 및 측정"""
+    config = await prisma.erpsyncconfig.find_unique(where={"id": config_id})
+    log_id = await new_sync_log(prisma, config)
+
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await service.sync_data(config, log_id, "IMPORT")
+    elapsed = time.perf_counter() - started
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sync_log = await prisma.erpsynclog.find_unique(where={"id": log_id})
+    per_100k = elapsed * 100_000 / record_count if record_count else 0
+    line = (
+        f"[{label:11}] status={sync_log.status} processed={sync_log.processedItems or 0:,} "
+        f"failed={sync_log.failedItems or 0:,} elapsed={elapsed:.2f}s "
+        f"({(sync_log.processedItems or 0) / elapsed:,.0f} rec/s, {per_100k:.2f}s/100k)"
+    )
+    if trace:
+        line += f" peak_mem={peak / 1024 / 1024:.1f}MiB ({peak / 1024 / 1024 * 100_000 / record_count:.1f}MiB/100k)"
+    print(line)
+    return sync_log
+
+
+async def main():
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    erp_system = sys.argv[2] if len(sys.argv) > 2 else "CUSTOM"
+
+    erp = FakeERP(record_count)
+    server = await start_fake_erp(erp)
+    prisma = Prisma()
+    await prisma.connect()
+    try:
+        organization = await prisma.organization.find_first()
+        if not organization:
+            print("조직이 없습니다. 조직을 하나 생성한 뒤 다시 실행하세요.")
+            return
+
+        await prisma.part.delete_many(where={"part_number": {"startswith": PART_NUMBER_PREFIX}})
+        config = await prisma.erpsyncconfig.create(
+            data={
+                "name": f"ERP 벤치마크 {uuid.uuid4().hex[:8]}",
+                "erpSystem": erp_system,
+                "connectionUrl": f"http://127.0.0.1:{PORT}",
+                "username": "bench",
+                "password": "bench",
+                "organizationId": organization.id,
+            }
+        )
+        service = ERPSyncService(prisma)
+
+        # 1) 전체 가져오기 (신규 insert)
+        await run(prisma, service, config.id, "full", record_count)
+
+        # 2) 증분: 워터마크 이후 변경이 없으므로 0건
+        incremental = await run(prisma, service, config.id, "incremental", record_count)
+        assert (incremental.processedItems or 0) == 0, "증분 동기화가 기존 레코드를 다시 가져왔습니다"
+
+        # 3) 재동기화: 워터마크를 지우고 변경 없는 upsert 경로의 메모리 측정
+        await prisma.erpsyncconfig.update(where={"id": config.id}, data={"lastSyncTime": None})
+        await run(prisma, service, config.id, "resync", record_count, trace=True)
+
+        # 4) 재개: 절반 지점에서 ERP 장애 -> 장애 해제 후 이어서 처리
+        await prisma.erpsyncconfig.update(where={"id": config.id}, data={"lastSyncTime": None})
+        total_pages = -(-record_count // DEFAULT_PAGE_SIZE)
+        erp.fail_after = total_pages // 2
+        erp.pages_served = 0
+        failed = await run(prisma, service, config.id, "interrupted", record_count)
+        assert failed.status == "FAILED", "장애 주입이 동작하지 않았습니다"
+
+        erp.fail_after = None
+        erp.pages_served = 0
+        resumed = await run(prisma, service, config.id, "resumed", record_count)
+        assert resumed.processedItems == record_count, "재개 후 처리 건수가 전체와 다릅니다"
+        print(f"재개 실행에서 조회한 페이지: {erp.pages_served}/{total_pages}")
+        assert erp.pages_served <= total_pages - total_pages // 2 + 1, "처음부터 다시 조회했습니다"
+
+        stored = await prisma.part.count(where={"part_number": {"startswith": PART_NUMBER_PREFIX}})
+        print(f"저장된 부품 수: {stored:,}")
+        assert stored == record_count, "저장된 부품 수가 다릅니다"
+
+        await prisma.erpsynclog.delete_many(where={"configId": config.id})
+        await prisma.erpsyncconfig.delete(where={"id": config.id})
+        await prisma.part.delete_many(where={"part_number": {"startswith": PART_NUMBER_PREFIX}})
+    finally:
+        await prisma.disconnect()
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+재고 동시 차감 경합 테스트 스크립트
+
+재고 N개인 부품에 대해 100개의 -1 조정을 동시에 실행하고,
+정확히 N건만 성공하며 최종 재고가 0(품절)인지 확인합니다. 실제 DB(DATABASE_URL)가 필요합니다.
+
+사용법: python scripts/contention_inventory.py [초기 재고] [동시 요청 수]
+"""
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prisma import Prisma
+
+from lib.models import PartStatus, PartType
+from lib.services.inventory_ledger import InventoryAdjustmentError, apply_inventory_adjustments
+
+
+async def decrement(prisma: Prisma, part_id: str) -> bool:
+    try:
+        await apply_inventory_adjustments(prisma, {part_id: -1})
+        return True
+    except InventoryAdjustmentError:
+        return False
+
+
+async def main():
+    initial_quantity = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    prisma = Prisma()
+    await prisma.connect()
+    try:
+        part = await prisma.part.create(
+            data={
+                "part_number": f"CONTENTION-{uuid.uuid4().hex[:8]}",
+                "name": "경합 테스트 부품",
+                "manufacturer": "test",
+                "part_type": PartType.OTHER,
+                "price": 1.0,
+                "quantity": initial_quantity,
+                "min_quantity": 5,
+                "status": PartStatus.IN_STOCK,
+            }
+        )
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(decrement(prisma, part.id) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        final = await prisma.part.find_unique(where={"id": part.id})
+        succeeded = sum(results)
+        expected_success = min(initial_quantity, concurrency)
+        print(
+            f"성공 {succeeded}/{concurrency}, 최종 재고 {final.quantity}, "
+            f"상태 {final.status}, {elapsed * 1000:.1f}ms"
+        )
+
+        assert succeeded == expected_success, "성공 건수가 초기 재고와 다릅니다"
+        assert final.quantity == initial_quantity - expected_success, "최종 재고가 맞지 않습니다"
+        assert final.quantity >= 0, "재고가 음수가 되었습니다"
+
+        await prisma.part.delete(where={"id": part.id})
+    finally:
+        await prisma.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
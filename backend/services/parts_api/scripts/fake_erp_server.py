@@ -0,0 +1,177 @@
+"""
+로컬 가짜 ERP 서버
+
+ERP 어댑터가 사용하는 세 가지 프로토콜(OData, Oracle REST, 사용자 정의)을 같은 합성 데이터로 제공합니다.
+레코드는 요청 시점에 인덱스로부터 생성하므로 서버 메모리는 레코드 수와 무관합니다.
+
+- i 번째 레코드의 변경 시각은 BASE_TIME + i초 (워터마크 필터 확인용)
+- --fail-after N: N 페이지를 응답한 뒤부터 503 반환 (재개 시나리오 확인용, POST /_control 로 해제)
+
+사용법: python scripts/fake_erp_server.py [레코드 수] [--port 8910] [--fail-after N]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from lib.services.erp_adapters import CustomAdapter, DynamicsAdapter, OracleAdapter, SAPAdapter
+from lib.services.erp_sync_service import resolve_mapping
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+PART_TYPES = ("engine", "brake", "suspension", "electrical", "body", "fluid", "other")
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _first_index_after(since: Optional[datetime]) -> int:
+    """워터마크 이후 첫 레코드 인덱스"""
+    if since is None:
+        return 0
+    return max(0, int((since - BASE_TIME).total_seconds()) + 1)
+
+
+class FakeERP:
+    """합성 부품 데이터와 장애 주입 상태"""
+
+    def __init__(self, record_count: int, fail_after: Optional[int] = None):
+        self.record_count = record_count
+        self.fail_after = fail_after
+        self.pages_served = 0
+        self.exported = 0
+
+    def record(self, index: int, mapping: Dict[str, str], updated_field: str) -> Dict[str, Any]:
+        values = {
+            "part_number": f"ERP-{index:08d}",
+            "name": f"ERP 부품 {index}",
+            "description": "ERP 동기화 부품",
+            "part_type": PART_TYPES[index % len(PART_TYPES)],
+            "price": 1000.0 + index % 500,
+            "manufacturer": "현대모비스",
+            "quantity": index % 40,
+            "min_quantity": 5,
+            "location": f"R-{index % 100:02d}",
+        }
+        record = {mapping[field]: value for field, value in values.items()}
+        record[updated_field] = (BASE_TIME + timedelta(seconds=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return record
+
+    def page(self, start: int, limit: int, mapping: Dict[str, str], updated_field: str) -> List[Dict[str, Any]]:
+        end = min(start + limit, self.record_count)
+        return [self.record(index, mapping, updated_field) for index in range(start, end)]
+
+    def check_failure(self) -> Optional[JSONResponse]:
+        if self.fail_after is not None and self.pages_served >= self.fail_after:
+            return JSONResponse(status_code=503, content={"error": "injected failure"})
+        self.pages_served += 1
+        return None
+
+
+def create_app(erp: FakeERP) -> FastAPI:
+    app = FastAPI(title="Fake ERP")
+
+    def odata_routes(adapter):
+        mapping = resolve_mapping(adapter, {})
+
+        @app.get(adapter.parts_path)
+        async def odata_page(request: Request):
+            failure = erp.check_failure()
+            if failure:
+                return failure
+            params = request.query_params
+            limit = int(params.get("$top", 1000))
+            if "$skiptoken" in params:
+                start = int(params["$skiptoken"])
+            else:
+                since = None
+                for clause in params.get("$filter", "").split(" and "):
+                    if clause.startswith(f"{adapter.updated_field} gt "):
+                        since = _parse_time(clause.split(" gt ", 1)[1])
+                start = _first_index_after(since)
+            items = erp.page(start, limit, mapping, adapter.updated_field)
+            payload: Dict[str, Any] = {"value": items}
+            if start + len(items) < erp.record_count:
+                payload["@odata.nextLink"] = str(
+                    request.url.include_query_params(**{"$skiptoken": start + len(items), "$top": limit})
+                )
+            return payload
+
+    def export_route(adapter):
+        @app.post(adapter.export_path)
+        async def export_batch(request: Request):
+            body = await request.json()
+            erp.exported += len(body.get("items", []))
+            return {"accepted": len(body.get("items", []))}
+
+    for adapter in (SAPAdapter, DynamicsAdapter):
+        odata_routes(adapter)
+
+    oracle_mapping = resolve_mapping(OracleAdapter, {})
+
+    @app.get(OracleAdapter.parts_path)
+    async def oracle_page(request: Request):
+        failure = erp.check_failure()
+        if failure:
+            return failure
+        params = request.query_params
+        limit = int(params.get("limit", 1000))
+        since = None
+        for clause in params.get("q", "").split(";"):
+            if clause.startswith("LastUpdateDate>"):
+                since = _parse_time(clause.split(">", 1)[1])
+        start = _first_index_after(since) + int(params.get("offset", 0))
+        items = erp.page(start, limit, oracle_mapping, "LastUpdateDate")
+        return {"items": items, "count": len(items), "hasMore": start + len(items) < erp.record_count}
+
+    custom_mapping = resolve_mapping(CustomAdapter, {})
+
+    @app.get(CustomAdapter.parts_path)
+    async def custom_page(request: Request):
+        failure = erp.check_failure()
+        if failure:
+            return failure
+        params = request.query_params
+        limit = int(params.get("limit", 1000))
+        if "cursor" in params:
+            start = int(params["cursor"])
+        else:
+            since = _parse_time(params["updated_since"]) if "updated_since" in params else None
+            start = _first_index_after(since)
+        items = erp.page(start, limit, custom_mapping, "updated_at")
+        next_start = start + len(items)
+        return {"items": items, "next_cursor": str(next_start) if next_start < erp.record_count else None}
+
+    for adapter in (SAPAdapter, DynamicsAdapter, OracleAdapter, CustomAdapter):
+        export_route(adapter)
+
+    @app.post("/_control")
+    async def control(request: Request):
+        body = await request.json()
+        erp.fail_after = body.get("fail_after")
+        erp.pages_served = 0
+        return {"fail_after": erp.fail_after}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 가짜 ERP 서버")
+    parser.add_argument("records", type=int, nargs="?", default=100_000)
+    parser.add_argument("--port", type=int, default=8910)
+    parser.add_argument("--fail-after", type=int, default=None)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(FakeERP(args.records, args.fail_after)), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 import os
 import requests
 import base64
+from shared.utils.server_launcher import default_response_class, run_server
 from .database import get_db, init_db
 from .models import Payment, PaymentMethod, Subscription, PointTransaction, User
 from .schemas import (
@@ -23,7 +24,8 @@ from .auth import get_current_user
 app = FastAPI(
     title="CarGoro Payment API",
     description="결제 및 구독 관리 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=default_response_class(),
 )
 
 # CORS 설정
@@ -442,5 +444,4 @@ async def award_points(user_id: str, amount: int, description: str, db: Session)
 from sqlalchemy import func
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    run_server(app, host="0.0.0.0", port=8002)
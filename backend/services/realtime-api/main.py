@@ -1,6 +1,5 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
 from .routes import router
 from .websocket_manager import WebSocketManager
 import asyncio
@@ -46,8 +45,12 @@ async def shutdown_event():
     print("👋 CarGoro Realtime API 서버가 종료됩니다.")
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
+    # 컨테이너 이미지에는 shared 가 없으므로 직접 실행할 때만 불러옴
+    from shared.utils.server_launcher import run_server
+
+    run_server(
+        app,
+        app_path="main:app",
         host="0.0.0.0",
         port=8001,
         reload=True,
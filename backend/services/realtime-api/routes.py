@@ -1,5 +1,5 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 import json
 import asyncio
 from datetime import datetime
@@ -8,6 +8,7 @@ from ..auth import get_current_user_ws
 from ..models import User, Message, Notification
 from ..database import get_db
 from sqlalchemy.orm import Session
+from pydantic import BaseModel
 
 router = APIRouter()
 manager = WebSocketManager()
@@ -206,6 +207,28 @@ async def send_notification(
     
     return {"status": "success", "notification_id": str(notification.id)}
 
+class UnreadCount(BaseModel):
+    """대상별 읽지 않은 알림 수 (fleet_api 카운터 변경분)"""
+    targetId: str
+    count: int
+
+@router.post("/api/notifications/unread-counts")
+async def push_unread_counts(counts: List[UnreadCount]):
+    """읽지 않은 알림 수 배지 갱신 전송 (접속 중인 대상에게만)"""
+    sent = 0
+    for item in counts:
+        if manager.is_user_online(item.targetId):
+            await manager.send_to_client(item.targetId, {
+                "type": "notificationUnreadCount",
+                "data": {
+                    "count": item.count,
+                    "timestamp": datetime.utcnow().isoformat()
+                }
+            })
+            sent += 1
+
+    return {"status": "success", "sent": sent}
+
 @router.post("/api/work-orders/{order_id}/broadcast")
 async def broadcast_work_order_update(
     order_id: str,
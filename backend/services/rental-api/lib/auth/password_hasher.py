@@ -0,0 +1,69 @@
+"""
+비밀번호 해싱 (동시 실행 수 제한)
+
+bcrypt 해시/검증은 한 번에 수백 ms 동안 CPU 를 사용하므로 로그인이 몰리면 스레드 풀이
+해싱으로 가득 차 다른 요청까지 밀립니다. PasswordHasher 는 동시 해싱 수를 max_workers 로 제한하고,
+자리를 기다리다 queue_timeout 을 넘기면 PasswordHashingBusy 를 발생시켜 503 으로 응답하게 합니다.
+verify_and_update() 는 저장된 해시가 현재 라운드 수와 다르면 새 해시를 함께 돌려줍니다.
+
+rental-api 컨테이너는 이 서비스 디렉터리만 포함하므로 공용 모듈(shared.utils.password_hasher)의
+동기 API 와 같은 동작을 여기에 둡니다. 라우트가 모두 def(스레드 풀) 라 동기 API 만 제공합니다.
+"""
+import os
+import threading
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+# 작업자 수를 지정하지 않았을 때 상한 (CPU 수와 비교해 작은 값 사용)
+DEFAULT_MAX_WORKERS = 4
+
+
+class PasswordHashingBusy(Exception):
+    """해싱 자리를 queue_timeout 안에 얻지 못함 (요청 폭주)"""
+
+
+class PasswordHasher:
+    """동시 실행 수를 제한해 비밀번호를 해싱/검증"""
+
+    def __init__(self, rounds: int = 12, max_workers: Optional[int] = None, queue_timeout: float = 5.0):
+        self.rounds = rounds
+        self.max_workers = max_workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        self.queue_timeout = queue_timeout
+        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        # 통계
+        self.rejected = 0
+        self.rehashed = 0
+
+    def _run(self, name: str, *args):
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self.rejected += 1
+            raise PasswordHashingBusy(f"비밀번호 해싱 대기 시간 초과 ({self.queue_timeout}초)")
+        try:
+            return getattr(self.context, name)(*args)
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return self._run("hash", password)
+
+    def verify(self, password: str, hashed: Optional[str]) -> bool:
+        """비밀번호 검증"""
+        valid, _ = self.verify_and_update(password, hashed)
+        return valid
+
+    def verify_and_update(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱
+
+        Returns:
+            (일치 여부, 새 해시) - 저장된 해시가 현재 설정과 다를 때만 새 해시가 있음
+        """
+        if not hashed:
+            return False, None
+        valid, new_hash = self._run("verify_and_update", password, hashed)
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     db_pool_size: int = 10
     db_max_overflow: int = 20
     
+    # 통계 캐시 (초, 0이면 비활성화)
+    stats_cache_ttl_seconds: int = 30
+    
     # JWT
     secret_key: str = "your-secret-key-here"
     algorithm: str = "HS256"
@@ -33,6 +36,8 @@ class Settings(BaseSettings):
     csrf_secret_key: str = "csrf-secret-key"
     session_secret_key: str = "session-secret-key"
     bcrypt_rounds: int = 12
+    password_hash_workers: Optional[int] = None  # 동시 해싱 수 (기본: CPU 수, 최대 4)
+    password_hash_queue_timeout: float = 5.0  # 해싱 자리 대기 시간 (초과 시 503)
     
     # CORS
     cors_allowed_origins: List[str] = ["*"]
@@ -35,4 +35,8 @@ def init_db():
     """데이터베이스 초기화"""
     from .database import Base
     from .user import User  # User 모델 임포트 추가
+    from ..services.search_service import ensure_search_indexes
+    from ..services.lease_billing_service import ensure_billing_schema
     Base.metadata.create_all(bind=engine)
+    ensure_billing_schema(engine)
+    ensure_search_indexes(engine)
@@ -1,15 +1,17 @@
 """
 SQLAlchemy 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, ForeignKey, Enum, JSON
+# enums 모듈의 표준 라이브러리 Enum 이 SQLAlchemy Enum 을 덮어쓰지 않도록 먼저 임포트
+from .enums import *
+from sqlalchemy import (
+    Column, String, Integer, Float, DateTime, Boolean, ForeignKey, Enum, JSON, UniqueConstraint
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 import uuid
 
-from .enums import *
-
 Base = declarative_base()
 
 
@@ -158,12 +160,17 @@ class Reservation(Base):
 class Payment(Base):
     """결제 모델"""
     __tablename__ = "payments"
+    __table_args__ = (
+        # 리스 계약당 청구 기간별 결제는 하나만 존재 (청구 실행 멱등성)
+        UniqueConstraint("lease_contract_id", "billing_period", name="uq_payments_lease_period"),
+    )
 
     id = Column(String, primary_key=True, default=generate_uuid)
     customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
     rental_contract_id = Column(String, ForeignKey("rental_contracts.id"), nullable=True)
     lease_contract_id = Column(String, ForeignKey("lease_contracts.id"), nullable=True)
     contract_type = Column(String, nullable=False)  # 'RENTAL' or 'LEASE'
+    billing_period = Column(String(7), nullable=True)  # 'YYYY-MM', 리스 월 청구분
     amount = Column(Float, nullable=False)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING)
     payment_method = Column(Enum(PaymentMethod), nullable=False)
@@ -179,6 +186,25 @@ class Payment(Base):
     lease_contract = relationship("LeaseContract", back_populates="payments")
 
 
+class BillingRun(Base):
+    """리스 월 청구 실행 모델"""
+    __tablename__ = "billing_runs"
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    billing_period = Column(String(7), unique=True, nullable=False)  # 'YYYY-MM'
+    status = Column(Enum(BillingRunStatus), default=BillingRunStatus.RUNNING)
+    chunk_size = Column(Integer, nullable=False)
+    last_contract_id = Column(String, nullable=True)  # 재개 지점 (처리 완료된 마지막 계약 ID)
+    processed_contracts = Column(Integer, default=0)
+    created_payments = Column(Integer, default=0)
+    skipped_contracts = Column(Integer, default=0)
+    total_amount = Column(Float, default=0)
+    error = Column(String, nullable=True)
+    started_at = Column(DateTime, server_default=func.now())
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
 class MaintenanceRecord(Base):
     """정비 기록 모델"""
     __tablename__ = "maintenance_records"
@@ -122,3 +122,10 @@ class MaintenanceType(str, Enum):
     REGULAR = "REGULAR"      # 정기점검
     REPAIR = "REPAIR"        # 수리
     INSPECTION = "INSPECTION"  # 검사
+
+
+class BillingRunStatus(str, Enum):
+    """청구 실행 상태"""
+    RUNNING = "RUNNING"      # 실행중
+    COMPLETED = "COMPLETED"  # 완료
+    FAILED = "FAILED"        # 실패
@@ -17,9 +17,12 @@ from ..schemas.payment import (
     PaymentRefundRequest,
     PaymentStatistics,
     PaymentSummary,
-    BulkPaymentCreate
+    BulkPaymentCreate,
+    BillingRunRequest,
+    BillingRunResponse
 )
 from ..services.payment_service import PaymentService
+from ..services.lease_billing_service import LeaseBillingService
 from ..auth.utils import get_current_active_user, get_current_manager
 from ..models.user import User
 
@@ -170,6 +173,35 @@ def generate_monthly_lease_payments(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/billing-runs", response_model=BillingRunResponse)
+def run_lease_billing(
+    request: BillingRunRequest,
+    current_user: User = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """리스 월 청구 실행 (같은 기간 재실행 시 중단 지점부터 이어서 처리)"""
+    try:
+        run = LeaseBillingService.run_monthly_billing(
+            db, request.year, request.month, request.chunk_size
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"청구 실행 실패: {e}")
+    return BillingRunResponse.model_validate(run)
+
+
+@router.get("/billing-runs/{run_id}", response_model=BillingRunResponse)
+def get_billing_run(
+    run_id: str,
+    current_user: User = Depends(get_current_manager),
+    db: Session = Depends(get_db)
+):
+    """리스 월 청구 실행 결과 조회"""
+    run = LeaseBillingService.get_billing_run(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="청구 실행을 찾을 수 없습니다.")
+    return BillingRunResponse.model_validate(run)
+
+
 @router.post("/{payment_id}/remind")
 def send_payment_reminder(
     payment_id: str,
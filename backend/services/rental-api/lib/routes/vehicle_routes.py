@@ -45,18 +45,26 @@ def create_vehicle(
 
 @router.get("/", response_model=VehicleListResponse)
 def get_vehicles(
-    page: int = Query(1, ge=1),
+    page: int = Query(1, ge=1, description="페이지 번호 (search 사용 시에는 cursor 사용)"),
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[VehicleStatus] = None,
     category: Optional[VehicleCategory] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="검색 결과 다음 페이지 커서"),
     db: Session = Depends(get_db)
 ):
     """차량 목록 조회"""
     skip = (page - 1) * page_size
+    next_cursor = None
     
     if search:
-        vehicles = VehicleService.search_vehicles(db, search, skip, page_size)
+        # 검색 결과는 커서로만 페이지를 이동 (점수 순 정렬이라 offset 페이지를 지원하지 않음)
+        if page > 1:
+            raise HTTPException(status_code=400, detail="검색 결과는 page 대신 cursor 로 다음 페이지를 조회합니다.")
+        try:
+            vehicles, next_cursor = VehicleService.search_vehicles(db, search, page_size, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         total = len(vehicles)  # 실제로는 count 쿼리 필요
     else:
         vehicles = VehicleService.get_vehicles(db, skip, page_size, status, category)
@@ -68,7 +76,8 @@ def get_vehicles(
         items=items,
         total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=next_cursor
     )
 
 
@@ -56,6 +56,7 @@ class CustomerListResponse(BaseModel):
     total: int
     page: int = 1
     page_size: int = 20
+    next_cursor: Optional[str] = Field(None, description="검색 결과 다음 페이지 커서")
 
 
 class CustomerVerification(BaseModel):
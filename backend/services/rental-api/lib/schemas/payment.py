@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
-from ..models.enums import PaymentStatus, PaymentMethod
+from ..models.enums import PaymentStatus, PaymentMethod, BillingRunStatus
 
 
 class PaymentBase(BaseModel):
@@ -102,3 +102,29 @@ class BulkPaymentCreate(BaseModel):
     contract_ids: List[str] = Field(..., description="계약 ID 목록")
     due_date: datetime = Field(..., description="납부 예정일")
     payment_method: PaymentMethod = Field(default=PaymentMethod.BANK_TRANSFER)
+
+
+class BillingRunRequest(BaseModel):
+    """리스 월 청구 실행 요청"""
+    year: int = Field(..., ge=2000, le=2100, description="청구 연도")
+    month: int = Field(..., ge=1, le=12, description="청구 월")
+    chunk_size: int = Field(1000, ge=1, le=10000, description="청크당 계약 수")
+
+
+class BillingRunResponse(BaseModel):
+    """리스 월 청구 실행 결과"""
+    id: str
+    billing_period: str = Field(..., description="청구 기간 (YYYY-MM)")
+    status: BillingRunStatus
+    chunk_size: int
+    last_contract_id: Optional[str] = Field(None, description="마지막 처리 계약 ID")
+    processed_contracts: int = Field(..., description="처리한 계약 수")
+    created_payments: int = Field(..., description="생성한 결제 수")
+    skipped_contracts: int = Field(..., description="이미 청구되어 건너뛴 계약 수")
+    total_amount: float = Field(..., description="생성한 청구 총액")
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -3,12 +3,15 @@ FastAPI 서버 설정 (보안 강화)
 """
 import os
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+
+from .auth.password_hasher import PasswordHashingBusy
 from .models import init_db
 from .routes import (
     vehicle_routes, 
@@ -41,6 +44,8 @@ app = FastAPI(
     title="CarGoro 렌터카/리스 관리 API",
     description="차량 렌탈 및 리스 계약 통합 관리 시스템",
     version="1.0.0",
+    # 컨테이너 이미지에 shared 가 없으므로 server_launcher.default_response_class 대신 직접 지정 (orjson 은 requirements 에 포함)
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
     docs_url="/docs" if os.getenv("ENVIRONMENT", "development") == "development" else None,
     redoc_url="/redoc" if os.getenv("ENVIRONMENT", "development") == "development" else None,
@@ -50,6 +55,19 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, custom_rate_limit_exceeded_handler)
 
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    """로그인 폭주로 비밀번호 해싱 대기 시간을 넘긴 요청"""
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": "로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            "error": "password_hashing_busy"
+        },
+        headers={"Retry-After": "1"}
+    )
+
 # Trusted Host 미들웨어 (Host 헤더 검증)
 if os.getenv("ENVIRONMENT") == "production":
     app.add_middleware(
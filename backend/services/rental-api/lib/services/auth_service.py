@@ -10,6 +10,7 @@ from ..schemas.auth import UserCreate, UserUpdate
 from ..auth.utils import (
     get_password_hash,
     verify_password,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token,
     check_account_locked,
@@ -63,10 +64,15 @@ class AuthService:
             raise ValueError("계정이 잠겨있습니다. 잠시 후 다시 시도해주세요.")
         
         # 비밀번호 확인
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not valid:
             increment_login_attempts(db, user)
             return None
         
+        # 해싱 설정(bcrypt_rounds)이 바뀐 경우 새 해시로 교체 (아래 커밋에 포함)
+        if new_hash:
+            user.hashed_password = new_hash
+        
         # 로그인 성공
         reset_login_attempts(db, user)
         return user
@@ -1,13 +1,14 @@
 """
 고객 관리 서비스
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime
 
 from ..models.database import Customer, RentalContract, LeaseContract
 from ..models.enums import CustomerType, VerificationStatus
+from .search_service import SearchService
 from ..schemas.customer import (
     CustomerCreate,
     CustomerUpdate,
@@ -181,14 +182,8 @@ class CustomerService:
     def search_customers(
         db: Session,
         search_term: str,
-        skip: int = 0,
-        limit: int = 20
-    ) -> List[Customer]:
-        """고객 검색"""
-        search_pattern = f"%{search_term}%"
-        
-        return db.query(Customer).filter(
-            (Customer.name.ilike(search_pattern)) |
-            (Customer.email.ilike(search_pattern)) |
-            (Customer.phone.ilike(search_pattern))
-        ).offset(skip).limit(limit).all()
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Customer], Optional[str]]:
+        """고객 검색 (전화번호 접두사 + 트라이그램 유사도, 키셋 페이지네이션)"""
+        return SearchService.search(db, Customer, search_term, limit, cursor)
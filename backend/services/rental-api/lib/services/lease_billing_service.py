@@ -0,0 +1,229 @@
+"""
+리스 월 청구 실행 서비스
+
+청구 기간(YYYY-MM)의 활성 리스 계약 전체에 대해 결제를 일괄 생성한다.
+
+- 멱등성: (리스 계약, 청구 기간)당 결제 하나 (uq_payments_lease_period)
+- 청크 처리: 계약 ID 순으로 chunk_size 개씩 읽고 bulk insert 후 커밋
+- 재개: 청크마다 마지막 계약 ID 를 BillingRun 에 기록하고, 실패한 실행은 그 지점부터 다시 시작
+- 동시 실행: 기간별 BillingRun 행을 잠그고 선점한 요청만 청구하며, 나머지는 진행 중/완료된 실행을 그대로 반환
+"""
+import calendar
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import and_, insert, inspect, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.database import BillingRun, LeaseContract, Payment
+from ..models.enums import (
+    BillingRunStatus,
+    LeaseContractStatus,
+    PaymentMethod,
+    PaymentStatus,
+)
+from .payment_service import STATS_CACHE_NAMESPACE as PAYMENT_STATS_NAMESPACE
+from .stats_cache import stats_cache
+
+DEFAULT_CHUNK_SIZE = 1000
+# RUNNING 실행이 이 시간 동안 청크를 커밋하지 않으면 중단된 것으로 보고 다른 요청이 이어서 실행
+STALE_RUN_TIMEOUT = timedelta(minutes=10)
+
+# 기존 payments 테이블에 청구 기간 컬럼과 유니크 제약 추가 (create_all 은 기존 테이블을 바꾸지 않음)
+PAYMENT_BILLING_PERIOD_DDL = "ALTER TABLE payments ADD COLUMN billing_period VARCHAR(7)"
+PAYMENT_LEASE_PERIOD_UNIQUE_DDL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_payments_lease_period "
+    "ON payments (lease_contract_id, billing_period)"
+)
+
+
+def ensure_billing_schema(engine: Engine) -> None:
+    """payments.billing_period 컬럼과 (lease_contract_id, billing_period) 유니크 인덱스가 없으면 추가"""
+    columns = {column["name"] for column in inspect(engine).get_columns("payments")}
+    with engine.begin() as conn:
+        if "billing_period" not in columns:
+            conn.execute(text(PAYMENT_BILLING_PERIOD_DDL))
+        # 기존 결제는 billing_period 가 NULL 이므로 유니크 인덱스와 충돌하지 않음
+        conn.execute(text(PAYMENT_LEASE_PERIOD_UNIQUE_DDL))
+
+
+class LeaseBillingService:
+    """리스 월 청구 실행 서비스"""
+
+    @staticmethod
+    def billing_period(year: int, month: int) -> str:
+        """청구 기간 키 ('YYYY-MM')"""
+        return f"{year:04d}-{month:02d}"
+
+    @staticmethod
+    def get_billing_run(db: Session, run_id: str) -> Optional[BillingRun]:
+        """청구 실행 조회"""
+        return db.query(BillingRun).filter(BillingRun.id == run_id).first()
+
+    @staticmethod
+    def _due_date(period_start: datetime, contract_start: datetime) -> datetime:
+        """계약 시작일과 같은 날(해당 월에 없으면 말일)을 납부일로 사용"""
+        last_day = calendar.monthrange(period_start.year, period_start.month)[1]
+        return period_start.replace(day=min(contract_start.day, last_day))
+
+    @staticmethod
+    def _bill_chunk(
+        db: Session,
+        run: BillingRun,
+        period_start: datetime,
+        period_end: datetime
+    ) -> int:
+        """계약 한 청크를 청구하고 처리한 계약 수 반환"""
+        query = db.query(
+            LeaseContract.id,
+            LeaseContract.customer_id,
+            LeaseContract.monthly_payment,
+            LeaseContract.start_date
+        ).filter(
+            LeaseContract.status == LeaseContractStatus.ACTIVE,
+            LeaseContract.start_date < period_end,
+            LeaseContract.end_date >= period_start
+        )
+        if run.last_contract_id:
+            query = query.filter(LeaseContract.id > run.last_contract_id)
+
+        contracts = query.order_by(LeaseContract.id).limit(run.chunk_size).all()
+        if not contracts:
+            return 0
+
+        # 이미 청구된 계약 (이전 실행 또는 개별 생성 API 로 만든 같은 달 결제)
+        contract_ids = [contract.id for contract in contracts]
+        billed = {
+            row.lease_contract_id
+            for row in db.query(Payment.lease_contract_id).filter(
+                Payment.lease_contract_id.in_(contract_ids),
+                or_(
+                    Payment.billing_period == run.billing_period,
+                    and_(
+                        Payment.billing_period.is_(None),
+                        Payment.due_date >= period_start,
+                        Payment.due_date < period_end
+                    )
+                )
+            )
+        }
+
+        rows = [
+            {
+                "customer_id": contract.customer_id,
+                "lease_contract_id": contract.id,
+                "contract_type": "LEASE",
+                "billing_period": run.billing_period,
+                "amount": contract.monthly_payment,
+                "payment_method": PaymentMethod.BANK_TRANSFER,
+                "status": PaymentStatus.PENDING,
+                "due_date": LeaseBillingService._due_date(period_start, contract.start_date),
+            }
+            for contract in contracts
+            if contract.id not in billed
+        ]
+        if rows:
+            db.execute(insert(Payment), rows)
+
+        # 결제와 재개 지점을 같은 트랜잭션으로 커밋
+        run.last_contract_id = contract_ids[-1]
+        run.processed_contracts += len(contracts)
+        run.created_payments += len(rows)
+        run.skipped_contracts += len(contracts) - len(rows)
+        run.total_amount += sum(row["amount"] for row in rows)
+        run.updated_at = datetime.utcnow()
+        db.commit()
+        return len(contracts)
+
+    @staticmethod
+    def _claim_run(db: Session, period: str, chunk_size: int) -> Tuple[BillingRun, bool]:
+        """
+        기간의 청구 실행을 선점하고 (실행, 선점 여부) 반환
+
+        BillingRun 행을 잠근 상태에서 상태를 확인하므로 같은 기간의 요청 중 하나만 선점합니다.
+        완료되었거나 다른 요청이 진행 중(STALE_RUN_TIMEOUT 안에 청크를 커밋함)이면 선점하지 않습니다.
+        """
+        now = datetime.utcnow()
+        run = (
+            db.query(BillingRun)
+            .filter(BillingRun.billing_period == period)
+            .with_for_update()
+            .first()
+        )
+        if run is None:
+            run = BillingRun(
+                billing_period=period,
+                status=BillingRunStatus.RUNNING,
+                chunk_size=chunk_size,
+                processed_contracts=0,
+                created_payments=0,
+                skipped_contracts=0,
+                total_amount=0,
+                updated_at=now
+            )
+            db.add(run)
+            try:
+                db.commit()
+            except IntegrityError:
+                # 같은 기간의 실행을 다른 요청이 먼저 생성함
+                db.rollback()
+                run = db.query(BillingRun).filter(BillingRun.billing_period == period).one()
+                return run, False
+            return run, True
+
+        in_progress = (
+            run.status == BillingRunStatus.RUNNING
+            and run.updated_at is not None
+            and run.updated_at > now - STALE_RUN_TIMEOUT
+        )
+        if run.status == BillingRunStatus.COMPLETED or in_progress:
+            db.commit()  # 잠금 해제
+            return run, False
+
+        run.chunk_size = chunk_size
+        run.error = None
+        run.status = BillingRunStatus.RUNNING
+        run.updated_at = now
+        db.commit()
+        return run, True
+
+    @staticmethod
+    def run_monthly_billing(
+        db: Session,
+        year: int,
+        month: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BillingRun:
+        """
+        월 청구 실행 (완료된 기간은 그대로 반환, 실패한 기간은 이어서 실행)
+
+        같은 기간을 다른 요청이 실행 중이면 기다리지 않고 진행 중인 실행을 반환합니다.
+        """
+        period = LeaseBillingService.billing_period(year, month)
+        period_start = datetime(year, month, 1)
+        period_end = period_start + relativedelta(months=1)
+
+        run, claimed = LeaseBillingService._claim_run(db, period, chunk_size)
+        if not claimed:
+            return run
+
+        try:
+            while LeaseBillingService._bill_chunk(db, run, period_start, period_end):
+                pass
+        except Exception as e:
+            db.rollback()
+            run.status = BillingRunStatus.FAILED
+            run.error = str(e)[:1000]
+            db.commit()
+            raise
+        finally:
+            stats_cache.invalidate(PAYMENT_STATS_NAMESPACE)
+
+        run.status = BillingRunStatus.COMPLETED
+        run.finished_at = datetime.utcnow()
+        db.commit()
+        db.refresh(run)
+        return run
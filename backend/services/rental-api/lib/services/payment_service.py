@@ -3,7 +3,7 @@
 """
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, case
 from datetime import datetime, timedelta, date
 from dateutil.relativedelta import relativedelta
 
@@ -17,6 +17,9 @@ from ..schemas.payment import (
     PaymentStatistics,
     PaymentSummary
 )
+from .stats_cache import stats_cache
+
+STATS_CACHE_NAMESPACE = "payments"
 
 
 class PaymentService:
@@ -49,6 +52,7 @@ class PaymentService:
         db.add(db_payment)
         db.commit()
         db.refresh(db_payment)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_payment
 
@@ -119,6 +123,7 @@ class PaymentService:
         
         db.commit()
         db.refresh(payment)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return payment
 
@@ -163,6 +168,7 @@ class PaymentService:
         
         db.commit()
         db.refresh(payment)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return payment
 
@@ -182,49 +188,41 @@ class PaymentService:
     @staticmethod
     def get_payment_statistics(db: Session) -> PaymentStatistics:
         """결제 통계 조회"""
-        total_payments = db.query(func.count(Payment.id)).scalar()
-        
-        completed_payments = db.query(func.count(Payment.id)).filter(
-            Payment.status == PaymentStatus.COMPLETED
-        ).scalar()
-        
-        pending_payments = db.query(func.count(Payment.id)).filter(
-            Payment.status == PaymentStatus.PENDING
-        ).scalar()
-        
-        failed_payments = db.query(func.count(Payment.id)).filter(
-            Payment.status == PaymentStatus.FAILED
-        ).scalar()
-        
-        total_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.COMPLETED
-        ).scalar() or 0
-        
-        pending_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.PENDING
-        ).scalar() or 0
-        
-        # 연체 결제
-        overdue_payments_query = db.query(Payment).filter(
-            Payment.status == PaymentStatus.PENDING,
-            Payment.due_date < datetime.now()
+        return stats_cache.get_or_compute(
+            STATS_CACHE_NAMESPACE, "statistics",
+            lambda: PaymentService._compute_payment_statistics(db)
         )
-        
-        overdue_payments = overdue_payments_query.count()
-        overdue_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.PENDING,
-            Payment.due_date < datetime.now()
-        ).scalar() or 0
+
+    @staticmethod
+    def _compute_payment_statistics(db: Session) -> PaymentStatistics:
+        """결제 통계 계산 (조건부 집계 단일 쿼리)"""
+        now = datetime.now()
+        is_completed = Payment.status == PaymentStatus.COMPLETED
+        is_pending = Payment.status == PaymentStatus.PENDING
+        is_overdue = and_(is_pending, Payment.due_date < now)
+        
+        row = db.query(
+            func.count(Payment.id).label("total_payments"),
+            func.count(case((is_completed, Payment.id))).label("completed_payments"),
+            func.count(case((is_pending, Payment.id))).label("pending_payments"),
+            func.count(
+                case((Payment.status == PaymentStatus.FAILED, Payment.id))
+            ).label("failed_payments"),
+            func.sum(case((is_completed, Payment.amount), else_=0)).label("total_amount"),
+            func.sum(case((is_pending, Payment.amount), else_=0)).label("pending_amount"),
+            func.count(case((is_overdue, Payment.id))).label("overdue_payments"),
+            func.sum(case((is_overdue, Payment.amount), else_=0)).label("overdue_amount"),
+        ).one()
         
         return PaymentStatistics(
-            total_payments=total_payments,
-            completed_payments=completed_payments,
-            pending_payments=pending_payments,
-            failed_payments=failed_payments,
-            total_amount=float(total_amount),
-            pending_amount=float(pending_amount),
-            overdue_payments=overdue_payments,
-            overdue_amount=float(overdue_amount)
+            total_payments=row.total_payments,
+            completed_payments=row.completed_payments,
+            pending_payments=row.pending_payments,
+            failed_payments=row.failed_payments,
+            total_amount=float(row.total_amount or 0),
+            pending_amount=float(row.pending_amount or 0),
+            overdue_payments=row.overdue_payments,
+            overdue_amount=float(row.overdue_amount or 0)
         )
 
     @staticmethod
@@ -234,55 +232,60 @@ class PaymentService:
         month: int
     ) -> PaymentSummary:
         """월별 결제 요약"""
+        return stats_cache.get_or_compute(
+            STATS_CACHE_NAMESPACE, ("monthly_summary", year, month),
+            lambda: PaymentService._compute_monthly_summary(db, year, month)
+        )
+
+    @staticmethod
+    def _compute_monthly_summary(
+        db: Session,
+        year: int,
+        month: int
+    ) -> PaymentSummary:
+        """월별 결제 요약 계산 (조건부 집계 단일 쿼리)"""
         start_date = datetime(year, month, 1)
-        end_date = start_date + relativedelta(months=1) - timedelta(days=1)
-        
-        # 총 결제액
-        total_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.COMPLETED,
-            Payment.paid_date >= start_date,
-            Payment.paid_date <= end_date
-        ).scalar() or 0
-        
-        # 렌탈 결제액
-        rental_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.COMPLETED,
-            Payment.contract_type == "RENTAL",
-            Payment.paid_date >= start_date,
-            Payment.paid_date <= end_date
-        ).scalar() or 0
-        
-        # 리스 결제액
-        lease_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.COMPLETED,
-            Payment.contract_type == "LEASE",
-            Payment.paid_date >= start_date,
-            Payment.paid_date <= end_date
-        ).scalar() or 0
-        
-        # 결제 건수
-        payment_count = db.query(func.count(Payment.id)).filter(
-            Payment.paid_date >= start_date,
-            Payment.paid_date <= end_date
-        ).scalar()
-        
-        # 수금률 계산
-        due_amount = db.query(func.sum(Payment.amount)).filter(
-            Payment.due_date >= start_date,
-            Payment.due_date <= end_date
-        ).scalar() or 0
+        end_date = start_date + relativedelta(months=1)
+        
+        paid_in_month = and_(Payment.paid_date >= start_date, Payment.paid_date < end_date)
+        due_in_month = and_(Payment.due_date >= start_date, Payment.due_date < end_date)
+        completed_in_month = and_(Payment.status == PaymentStatus.COMPLETED, paid_in_month)
+        
+        row = db.query(
+            # 총 결제액
+            func.sum(case((completed_in_month, Payment.amount), else_=0)).label("total_amount"),
+            # 렌탈 결제액
+            func.sum(case(
+                (and_(completed_in_month, Payment.contract_type == "RENTAL"), Payment.amount),
+                else_=0
+            )).label("rental_amount"),
+            # 리스 결제액
+            func.sum(case(
+                (and_(completed_in_month, Payment.contract_type == "LEASE"), Payment.amount),
+                else_=0
+            )).label("lease_amount"),
+            # 결제 건수
+            func.count(case((paid_in_month, Payment.id))).label("payment_count"),
+            # 수금률 계산용 청구액
+            func.sum(case((due_in_month, Payment.amount), else_=0)).label("due_amount"),
+        ).filter(
+            or_(paid_in_month, due_in_month)
+        ).one()
+        
+        total_amount = float(row.total_amount or 0)
+        due_amount = float(row.due_amount or 0)
         
         collection_rate = 0.0
         if due_amount > 0:
-            collection_rate = (float(total_amount) / float(due_amount)) * 100
+            collection_rate = (total_amount / due_amount) * 100
         
         return PaymentSummary(
             year=year,
             month=month,
-            total_amount=float(total_amount),
-            rental_amount=float(rental_amount),
-            lease_amount=float(lease_amount),
-            payment_count=payment_count,
+            total_amount=total_amount,
+            rental_amount=float(row.rental_amount or 0),
+            lease_amount=float(row.lease_amount or 0),
+            payment_count=row.payment_count,
             collection_rate=collection_rate
         )
 
@@ -318,6 +321,7 @@ class PaymentService:
             payments.append(payment)
         
         db.commit()
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         return payments
 
     @staticmethod
@@ -3,7 +3,7 @@
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, case
 from datetime import datetime, timedelta, date
 
 from ..models.database import Reservation, Vehicle, Customer
@@ -13,6 +13,9 @@ from ..schemas.reservation import (
     ReservationUpdate,
     ReservationStatistics
 )
+from .stats_cache import stats_cache
+
+STATS_CACHE_NAMESPACE = "reservations"
 
 
 class ReservationService:
@@ -66,6 +69,7 @@ class ReservationService:
         db.add(db_reservation)
         db.commit()
         db.refresh(db_reservation)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_reservation
 
@@ -132,6 +136,7 @@ class ReservationService:
         db_reservation.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(db_reservation)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_reservation
 
@@ -156,6 +161,7 @@ class ReservationService:
         
         db.commit()
         db.refresh(db_reservation)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_reservation
 
@@ -196,6 +202,7 @@ class ReservationService:
         
         db.commit()
         db.refresh(db_reservation)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_reservation
 
@@ -220,6 +227,7 @@ class ReservationService:
         
         db.commit()
         db.refresh(db_reservation)
+        stats_cache.invalidate(STATS_CACHE_NAMESPACE)
         
         return db_reservation
 
@@ -269,33 +277,57 @@ class ReservationService:
     @staticmethod
     def get_reservation_statistics(db: Session) -> ReservationStatistics:
         """예약 통계 조회"""
-        total_reservations = db.query(func.count(Reservation.id)).scalar()
-        
-        pending_reservations = db.query(func.count(Reservation.id)).filter(
-            Reservation.status == ReservationStatus.PENDING
-        ).scalar()
-        
-        confirmed_reservations = db.query(func.count(Reservation.id)).filter(
-            Reservation.status == ReservationStatus.CONFIRMED
-        ).scalar()
+        return stats_cache.get_or_compute(
+            STATS_CACHE_NAMESPACE, ("statistics", date.today()),
+            lambda: ReservationService._compute_reservation_statistics(db)
+        )
+
+    @staticmethod
+    def _compute_reservation_statistics(db: Session) -> ReservationStatistics:
+        """예약 통계 계산 (조건부 집계 단일 쿼리)"""
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
         
-        cancelled_reservations = db.query(func.count(Reservation.id)).filter(
-            Reservation.status == ReservationStatus.CANCELLED
-        ).scalar()
+        is_upcoming = Reservation.status.in_(
+            [ReservationStatus.PENDING, ReservationStatus.CONFIRMED]
+        )
+        today_pickup = and_(
+            is_upcoming,
+            Reservation.pickup_date >= datetime.combine(today, datetime.min.time()),
+            Reservation.pickup_date <= datetime.combine(today, datetime.max.time())
+        )
+        week_pickup = and_(
+            is_upcoming,
+            Reservation.pickup_date >= datetime.combine(week_start, datetime.min.time()),
+            Reservation.pickup_date <= datetime.combine(week_end, datetime.max.time())
+        )
         
-        today_pickups = len(ReservationService.get_today_pickups(db))
-        this_week_pickups = len(ReservationService.get_week_pickups(db))
+        row = db.query(
+            func.count(Reservation.id).label("total"),
+            func.count(case(
+                (Reservation.status == ReservationStatus.PENDING, Reservation.id)
+            )).label("pending"),
+            func.count(case(
+                (Reservation.status == ReservationStatus.CONFIRMED, Reservation.id)
+            )).label("confirmed"),
+            func.count(case(
+                (Reservation.status == ReservationStatus.CANCELLED, Reservation.id)
+            )).label("cancelled"),
+            func.count(case((today_pickup, Reservation.id))).label("today_pickups"),
+            func.count(case((week_pickup, Reservation.id))).label("week_pickups"),
+        ).one()
         
         cancellation_rate = 0.0
-        if total_reservations > 0:
-            cancellation_rate = (cancelled_reservations / total_reservations) * 100
+        if row.total > 0:
+            cancellation_rate = (row.cancelled / row.total) * 100
         
         return ReservationStatistics(
-            total_reservations=total_reservations,
-            pending_reservations=pending_reservations,
-            confirmed_reservations=confirmed_reservations,
-            today_pickups=today_pickups,
-            this_week_pickups=this_week_pickups,
+            total_reservations=row.total,
+            pending_reservations=row.pending,
+            confirmed_reservations=row.confirmed,
+            today_pickups=row.today_pickups,
+            this_week_pickups=row.week_pickups,
             cancellation_rate=cancellation_rate
         )
 
@@ -0,0 +1,494 @@
+"""
+차량/고객 검색 서비스
+
+PostgreSQL에서는 pg_trgm 트라이그램(GIN) 인덱스로, 그 외 DB(SQLite/테스트)에서는
+프로세스 내 n-gram 역색인으로 검색한다. 두 경로 모두 같은 점수 체계를 사용한다.
+
+- 일치 = 부분 문자열 일치 OR 트라이그램 유사도 >= 0.3 OR 번호판/전화번호 접두사 일치
+- 점수 = 필드별 트라이그램 유사도의 최댓값 (+0.5 부분 문자열, +1.0 접두사 일치 시)
+- 정렬 = (점수 내림차순, id 오름차순), 커서 = 마지막 행의 (점수, id)
+- 페이지 이동은 커서로만 한다 (page/offset 없음)
+
+프로세스 내 인덱스는 커밋된 변경만 반영한다 (롤백된 flush 는 버림).
+"""
+import base64
+import bisect
+import heapq
+import json
+import math
+import threading
+from collections import defaultdict
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from sqlalchemy import Numeric, and_, case, cast, event, func, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, object_session
+
+from ..models.database import Customer, Vehicle
+
+# pg_trgm 기본 similarity threshold 와 동일
+SIMILARITY_THRESHOLD = 0.3
+PREFIX_BOOST = 1.0
+SUBSTRING_BOOST = 0.5
+SCORE_PRECISION = 4
+
+# 모델별 검색 필드 정의: (유사도 검색 필드, 접두사 검색 필드, 숫자만 비교하는 접두사 필드)
+SEARCH_FIELDS: Dict[type, Dict[str, Tuple[str, ...]]] = {
+    Vehicle: {
+        "similarity": ("registration_number", "make", "model"),
+        "prefix": ("registration_number",),
+        "digit_prefix": (),
+    },
+    Customer: {
+        "similarity": ("name", "email", "phone"),
+        "prefix": ("phone",),
+        "digit_prefix": ("phone",),
+    },
+}
+
+# PostgreSQL 전용 인덱스 (init_db 에서 생성)
+POSTGRES_INDEX_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_vehicles_registration_trgm "
+    "ON vehicles USING gin (registration_number gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_vehicles_make_trgm ON vehicles USING gin (make gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_vehicles_model_trgm ON vehicles USING gin (model gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_customers_name_trgm ON customers USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_customers_email_trgm ON customers USING gin (email gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_customers_phone_trgm ON customers USING gin (phone gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_customers_phone_digits_trgm "
+    "ON customers USING gin ((regexp_replace(phone, '[^0-9]', '', 'g')) gin_trgm_ops)",
+)
+
+
+def _normalize(value) -> str:
+    return str(value or "").lower().strip()
+
+
+def _digits(value) -> str:
+    return "".join(ch for ch in str(value or "") if ch.isdigit())
+
+
+def trigrams(value: str) -> Set[str]:
+    """pg_trgm 과 같은 방식(단어별 앞 2칸/뒤 1칸 패딩)으로 트라이그램 생성"""
+    grams: Set[str] = set()
+    for word in _normalize(value).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def encode_cursor(score: float, doc_id: str) -> str:
+    """키셋 커서 인코딩"""
+    raw = json.dumps([str(score), doc_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Decimal, str]]:
+    """키셋 커서 디코딩 (잘못된 커서는 ValueError)"""
+    if not cursor:
+        return None
+    try:
+        score, doc_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return Decimal(score), str(doc_id)
+    except Exception as exc:
+        raise ValueError("잘못된 커서입니다.") from exc
+
+
+class NgramIndex:
+    """프로세스 내 n-gram 역색인 (PostgreSQL 이 아닌 환경용)"""
+
+    def __init__(
+        self,
+        similarity_fields: Sequence[str],
+        prefix_fields: Sequence[str] = (),
+        digit_prefix_fields: Sequence[str] = (),
+    ):
+        self.similarity_fields = tuple(similarity_fields)
+        self.prefix_fields = tuple(prefix_fields)
+        self.digit_prefix_fields = tuple(digit_prefix_fields)
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._doc_grams: Dict[str, Tuple[Set[str], ...]] = {}
+        self._doc_text: Dict[str, Tuple[str, ...]] = {}
+        self._prefix_keys: Dict[str, List[str]] = {}
+        # 접두사 검색용 정렬 리스트: (정규화 값, doc_id)
+        self._sorted_keys: List[Tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_grams)
+
+    def _index_document(self, doc_id: str, values: Dict[str, object]) -> List[str]:
+        texts = tuple(_normalize(values.get(field)) for field in self.similarity_fields)
+        field_grams = tuple(trigrams(text) for text in texts)
+        self._doc_text[doc_id] = texts
+        self._doc_grams[doc_id] = field_grams
+        for grams in field_grams:
+            for gram in grams:
+                self._postings[gram].add(doc_id)
+
+        keys = [_normalize(values.get(field)) for field in self.prefix_fields]
+        keys += [_digits(values.get(field)) for field in self.digit_prefix_fields]
+        keys = [key for key in keys if key]
+        self._prefix_keys[doc_id] = keys
+        return keys
+
+    def add(self, doc_id: str, values: Dict[str, object]) -> None:
+        """문서 추가 (이미 있으면 교체)"""
+        with self._lock:
+            self.remove(doc_id)
+            for key in self._index_document(doc_id, values):
+                bisect.insort(self._sorted_keys, (key, doc_id))
+
+    def bulk_load(self, rows) -> None:
+        """(doc_id, values) 이터러블로 인덱스를 한 번에 구성 (기존 내용은 버림)"""
+        with self._lock:
+            self._postings.clear()
+            self._doc_grams.clear()
+            self._doc_text.clear()
+            self._prefix_keys.clear()
+            sorted_keys: List[Tuple[str, str]] = []
+            for doc_id, values in rows:
+                sorted_keys.extend((key, doc_id) for key in self._index_document(doc_id, values))
+            sorted_keys.sort()
+            self._sorted_keys = sorted_keys
+            self.loaded = True
+
+    def ensure_loaded(self, load_rows: Callable[[], Iterable[Tuple[str, Dict[str, object]]]]) -> None:
+        """
+        처음 사용할 때 한 번만 bulk_load
+
+        잠금을 잡은 뒤 loaded 를 다시 확인하므로, 동시에 들어온 첫 검색들 중 하나만 DB 에서 읽습니다.
+        """
+        if self.loaded:
+            return
+        with self._lock:
+            if not self.loaded:
+                self.bulk_load(load_rows())
+
+    def remove(self, doc_id: str) -> None:
+        """문서 삭제"""
+        with self._lock:
+            field_grams = self._doc_grams.pop(doc_id, None)
+            if field_grams is None:
+                return
+            self._doc_text.pop(doc_id, None)
+            for grams in field_grams:
+                for gram in grams:
+                    postings = self._postings.get(gram)
+                    if postings is not None:
+                        postings.discard(doc_id)
+                        if not postings:
+                            del self._postings[gram]
+            for key in self._prefix_keys.pop(doc_id, []):
+                pos = bisect.bisect_left(self._sorted_keys, (key, doc_id))
+                if pos < len(self._sorted_keys) and self._sorted_keys[pos] == (key, doc_id):
+                    del self._sorted_keys[pos]
+
+    def _prefix_matches(self, term: str) -> Set[str]:
+        prefixes = {_normalize(term)}
+        if self.digit_prefix_fields and _digits(term):
+            prefixes.add(_digits(term))
+        matches: Set[str] = set()
+        for prefix in prefixes:
+            if not prefix:
+                continue
+            pos = bisect.bisect_left(self._sorted_keys, (prefix, ""))
+            while pos < len(self._sorted_keys) and self._sorted_keys[pos][0].startswith(prefix):
+                matches.add(self._sorted_keys[pos][1])
+                pos += 1
+        return matches
+
+    def _substring_matches(self, term: str) -> Set[str]:
+        """기존 ILIKE '%term%' 과 같은 부분 문자열 일치"""
+        needle = _normalize(term)
+        if not needle:
+            return set()
+        inner = {
+            word[i:i + 3] for word in needle.split() for i in range(len(word) - 2)
+        }
+        if inner:
+            postings = sorted((self._postings.get(gram, set()) for gram in inner), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            # 3글자 미만: 검색어를 포함하는 트라이그램의 문서만 후보
+            candidates = set()
+            for gram, postings in self._postings.items():
+                if needle in gram:
+                    candidates |= postings
+        return {
+            doc_id for doc_id in candidates
+            if any(needle in text for text in self._doc_text[doc_id])
+        }
+
+    def _similarity_candidates(self, query_grams: Set[str]) -> Set[str]:
+        # 유사도가 threshold 이상이려면 최소 required 개의 트라이그램을 공유해야 하므로,
+        # 가장 짧은 (|Q| - required + 1)개 posting 중 하나에는 반드시 포함된다.
+        required = max(1, math.ceil(SIMILARITY_THRESHOLD * len(query_grams)))
+        postings = sorted((self._postings.get(gram, set()) for gram in query_grams), key=len)
+        candidates: Set[str] = set()
+        for posting in postings[:len(postings) - required + 1]:
+            candidates |= posting
+        return candidates
+
+    def search(
+        self,
+        term: str,
+        limit: int = 20,
+        after: Optional[Tuple[Decimal, str]] = None,
+    ) -> List[Tuple[Decimal, str]]:
+        """(점수, doc_id) 목록을 점수 내림차순, id 오름차순으로 반환"""
+        query_grams = trigrams(term)
+        with self._lock:
+            prefix_matches = self._prefix_matches(term)
+            substring_matches = self._substring_matches(term)
+            candidates = (
+                self._similarity_candidates(query_grams) | prefix_matches | substring_matches
+            )
+
+            scored: List[Tuple[Decimal, str]] = []
+            for doc_id in candidates:
+                best = 0.0
+                for grams in self._doc_grams[doc_id]:
+                    if not grams:
+                        continue
+                    shared = len(query_grams & grams)
+                    best = max(best, shared / (len(query_grams) + len(grams) - shared))
+                is_prefix = doc_id in prefix_matches
+                is_substring = doc_id in substring_matches
+                if not (is_prefix or is_substring) and best < SIMILARITY_THRESHOLD:
+                    continue
+                score = best
+                if is_prefix:
+                    score += PREFIX_BOOST
+                if is_substring:
+                    score += SUBSTRING_BOOST
+                scored.append((Decimal(str(round(score, SCORE_PRECISION))), doc_id))
+
+        if after is not None:
+            after_score, after_id = after
+            scored = [
+                item for item in scored
+                if item[0] < after_score or (item[0] == after_score and item[1] > after_id)
+            ]
+        return heapq.nsmallest(limit, scored, key=lambda item: (-item[0], item[1]))
+
+
+_indexes: Dict[type, NgramIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_ngram_index(model: Type) -> NgramIndex:
+    """모델별 프로세스 내 인덱스 반환"""
+    with _indexes_lock:
+        index = _indexes.get(model)
+        if index is None:
+            fields = SEARCH_FIELDS[model]
+            index = NgramIndex(
+                fields["similarity"], fields["prefix"], fields["digit_prefix"]
+            )
+            _indexes[model] = index
+        return index
+
+
+def _row_values(model: Type, target) -> Dict[str, object]:
+    fields = SEARCH_FIELDS[model]
+    names = set(fields["similarity"]) | set(fields["prefix"]) | set(fields["digit_prefix"])
+    return {name: getattr(target, name) for name in names}
+
+
+# session.info 에 쌓아 두는 커밋 대기 인덱스 변경 키
+_PENDING_KEY = "search_index_pending"
+
+
+def _queue_change(target, model: Type, values: Optional[Dict[str, object]]) -> None:
+    """flush 된 변경을 세션에 쌓아 둠 (values 가 None 이면 삭제)"""
+    session = object_session(target)
+    if session is None:
+        return
+    # 롤백된 savepoint 의 변경만 버릴 수 있도록 flush 시점의 (가장 안쪽) 트랜잭션을 기록
+    transaction = session.get_nested_transaction() or session.get_transaction()
+    session.info.setdefault(_PENDING_KEY, []).append((transaction, model, target.id, values))
+
+
+def _register_index_listeners(model: Type) -> None:
+    """ORM 쓰기를 세션에 쌓아 두고 커밋된 뒤에 프로세스 내 인덱스에 반영"""
+
+    def _upsert(mapper, connection, target):
+        _queue_change(target, model, _row_values(model, target))
+
+    def _delete(mapper, connection, target):
+        _queue_change(target, model, None)
+
+    event.listen(model, "after_insert", _upsert)
+    event.listen(model, "after_update", _upsert)
+    event.listen(model, "after_delete", _delete)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_changes(session: Session) -> None:
+    """커밋된 변경을 이미 로드된 인덱스에 반영"""
+    for _, model, doc_id, values in session.info.pop(_PENDING_KEY, ()):
+        index = _indexes.get(model)
+        if index is None or not index.loaded:
+            continue
+        if values is None:
+            index.remove(doc_id)
+        else:
+            index.add(doc_id, values)
+
+
+def _within(transaction, ancestor) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_changes(session: Session, previous_transaction) -> None:
+    """롤백된 트랜잭션(savepoint 면 그 안에서 flush 된 것만)의 변경을 버림"""
+    pending = session.info.get(_PENDING_KEY)
+    if not pending:
+        return
+    if previous_transaction.nested:
+        session.info[_PENDING_KEY] = [
+            change for change in pending if not _within(change[0], previous_transaction)
+        ]
+    else:
+        session.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted_changes(session: Session, transaction) -> None:
+    """커밋 없이 끝난 최상위 트랜잭션(close 등)의 남은 변경을 버림"""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+for _model in SEARCH_FIELDS:
+    _register_index_listeners(_model)
+
+
+def ensure_search_indexes(engine: Engine) -> None:
+    """PostgreSQL 이면 pg_trgm 확장과 트라이그램 인덱스 생성"""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for statement in POSTGRES_INDEX_DDL:
+            conn.execute(text(statement))
+
+
+class SearchService:
+    """트라이그램 검색 서비스"""
+
+    @staticmethod
+    def _escape_like(term: str) -> str:
+        return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _search_postgres(
+        db: Session,
+        model: Type,
+        term: str,
+        limit: int,
+        after: Optional[Tuple[Decimal, str]],
+    ) -> List[Tuple[Decimal, object]]:
+        fields = SEARCH_FIELDS[model]
+        columns = [getattr(model, name) for name in fields["similarity"]]
+        prefix = f"{SearchService._escape_like(term.strip())}%"
+
+        prefix_conditions = [
+            getattr(model, name).ilike(prefix, escape="\\") for name in fields["prefix"]
+        ]
+        digits = _digits(term)
+        if digits:
+            prefix_conditions = prefix_conditions + [
+                func.regexp_replace(getattr(model, name), "[^0-9]", "", "g").like(f"{digits}%")
+                for name in fields["digit_prefix"]
+            ]
+
+        contains = f"%{SearchService._escape_like(term.strip())}%"
+        substring_conditions = [column.ilike(contains, escape="\\") for column in columns]
+
+        similarity = func.greatest(*[func.similarity(column, term) for column in columns])
+        score = func.round(
+            cast(
+                similarity
+                + case((or_(*prefix_conditions), PREFIX_BOOST), else_=0.0)
+                + case((or_(*substring_conditions), SUBSTRING_BOOST), else_=0.0),
+                Numeric,
+            ),
+            SCORE_PRECISION,
+        )
+
+        # %, ILIKE 모두 pg_trgm GIN 인덱스를 사용한다
+        query = db.query(model, score.label("score")).filter(
+            or_(
+                *[column.op("%")(term) for column in columns],
+                *substring_conditions,
+                *prefix_conditions,
+            )
+        )
+        if after is not None:
+            after_score, after_id = after
+            query = query.filter(
+                or_(score < after_score, and_(score == after_score, model.id > after_id))
+            )
+        rows = query.order_by(score.desc(), model.id.asc()).limit(limit).all()
+        return [(Decimal(row.score), row[0]) for row in rows]
+
+    @staticmethod
+    def _search_ngram(
+        db: Session,
+        model: Type,
+        term: str,
+        limit: int,
+        after: Optional[Tuple[Decimal, str]],
+    ) -> List[Tuple[Decimal, object]]:
+        index = get_ngram_index(model)
+
+        def load_rows():
+            fields = SEARCH_FIELDS[model]
+            names = sorted(
+                set(fields["similarity"]) | set(fields["prefix"]) | set(fields["digit_prefix"])
+            )
+            columns = [getattr(model, name) for name in names]
+            rows = db.query(model.id, *columns).yield_per(10000)
+            return ((row[0], dict(zip(names, row[1:]))) for row in rows)
+
+        index.ensure_loaded(load_rows)
+
+        ranked = index.search(term, limit, after)
+        if not ranked:
+            return []
+        objects = {
+            obj.id: obj
+            for obj in db.query(model).filter(model.id.in_([doc_id for _, doc_id in ranked]))
+        }
+        return [(score, objects[doc_id]) for score, doc_id in ranked if doc_id in objects]
+
+    @staticmethod
+    def search(
+        db: Session,
+        model: Type,
+        search_term: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[object], Optional[str]]:
+        """검색 결과와 다음 페이지 커서 반환"""
+        after = decode_cursor(cursor)
+        if db.bind.dialect.name == "postgresql":
+            ranked = SearchService._search_postgres(db, model, search_term, limit + 1, after)
+        else:
+            ranked = SearchService._search_ngram(db, model, search_term, limit + 1, after)
+
+        next_cursor = None
+        if len(ranked) > limit:
+            ranked = ranked[:limit]
+            last_score, last_obj = ranked[-1]
+            next_cursor = encode_cursor(last_score, last_obj.id)
+        return [obj for _, obj in ranked], next_cursor
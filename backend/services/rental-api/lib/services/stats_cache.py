@@ -0,0 +1,60 @@
+"""
+대시보드 통계 캐시
+
+통계 쿼리 결과를 짧은 TTL 동안 프로세스 메모리에 보관한다.
+결제/예약 데이터가 바뀌면 해당 네임스페이스를 무효화한다.
+계산 도중 무효화되면 그 계산 결과는 이미 오래된 값일 수 있으므로 저장하지 않는다.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from ..config import settings
+
+
+class StatsCache:
+    """네임스페이스별 TTL 캐시"""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        # 네임스페이스별 무효화 횟수와 전체 제거 횟수 (계산 중 무효화 감지용)
+        self._generations: Dict[str, int] = {}
+        self._clears = 0
+
+    def get_or_compute(self, namespace: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """캐시된 값이 유효하면 반환하고, 아니면 계산 후 저장"""
+        if self.ttl_seconds <= 0:
+            return compute()
+
+        cache_key = (namespace, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry and entry[0] > now:
+                return entry[1]
+            generation = (self._generations.get(namespace, 0), self._clears)
+
+        value = compute()
+        with self._lock:
+            if generation == (self._generations.get(namespace, 0), self._clears):
+                self._entries[cache_key] = (now + self.ttl_seconds, value)
+        return value
+
+    def invalidate(self, namespace: str) -> None:
+        """네임스페이스의 모든 캐시 항목 제거"""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        """전체 캐시 제거"""
+        with self._lock:
+            self._clears += 1
+            self._entries.clear()
+
+
+# 전역 통계 캐시 인스턴스
+stats_cache = StatsCache(settings.stats_cache_ttl_seconds)
@@ -1,13 +1,14 @@
 """
 차량 관리 서비스
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime
 
 from ..models.database import Vehicle
 from ..models.enums import VehicleStatus
+from .search_service import SearchService
 from ..schemas.vehicle import (
     VehicleCreate,
     VehicleUpdate,
@@ -172,14 +173,8 @@ class VehicleService:
     def search_vehicles(
         db: Session,
         search_term: str,
-        skip: int = 0,
-        limit: int = 20
-    ) -> List[Vehicle]:
-        """차량 검색"""
-        search_pattern = f"%{search_term}%"
-        
-        return db.query(Vehicle).filter(
-            (Vehicle.registration_number.ilike(search_pattern)) |
-            (Vehicle.make.ilike(search_pattern)) |
-            (Vehicle.model.ilike(search_pattern))
-        ).offset(skip).limit(limit).all()
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Vehicle], Optional[str]]:
+        """차량 검색 (번호판 접두사 + 트라이그램 유사도, 키셋 페이지네이션)"""
+        return SearchService.search(db, Vehicle, search_term, limit, cursor)
@@ -3,10 +3,10 @@ Rental API 진입점
 """
 import os
 import sys
-import uvicorn
 
 # 현재 디렉토리를 모듈 검색 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
 
 # 표준화된 서버 모듈 임포트
 from lib.server import app
@@ -16,11 +16,29 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", "8004"))
     host = os.getenv("HOST", "0.0.0.0")
     reload = os.getenv("ENV", "development") == "development"
-    
-    uvicorn.run(
-        "main:app" if reload else app,
-        host=host,
-        port=port,
-        reload=reload,
-        log_level="info"
-    )
+
+    try:
+        # 저장소에서 실행하면 공용 실행기(SERVER_* 설정) 사용
+        from shared.utils.server_launcher import run_server
+    except ImportError:
+        # 컨테이너 이미지는 서비스 디렉터리만 포함하므로 uvicorn 으로 직접 실행
+        import uvicorn
+        from lib.config import settings
+
+        uvicorn.run(
+            "lib.server:app" if reload or settings.workers > 1 else app,
+            host=host,
+            port=port,
+            reload=reload,
+            workers=1 if reload else settings.workers,
+            log_level="info"
+        )
+    else:
+        run_server(
+            app,
+            app_path="lib.server:app",
+            host=host,
+            port=port,
+            reload=reload,
+            log_level="info"
+        )
@@ -0,0 +1,118 @@
+"""
+리스 월 청구 실행 벤치마크 스크립트
+
+합성 리스 계약을 적재하고 월 청구 실행 시간을 측정한다. 같은 기간을 다시 실행해
+중복 결제가 생성되지 않는지(멱등성)도 확인한다.
+
+사용법: DATABASE_URL=sqlite:///bench.db python scripts/benchmark_lease_billing.py [계약 수] [청크 크기]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import func
+
+from lib.models import SessionLocal, engine, init_db
+from lib.models.database import BillingRun, Customer, LeaseContract, Payment, Vehicle
+from lib.models.enums import (
+    CustomerType,
+    FuelType,
+    LeaseContractStatus,
+    LeaseType,
+    TransmissionType,
+    VehicleCategory,
+)
+from lib.services.lease_billing_service import LeaseBillingService
+
+
+def seed(db, contract_count: int):
+    """합성 리스 계약 적재"""
+    now = datetime.now()
+    suffix = str(time.time())
+    customer = Customer(
+        type=CustomerType.CORPORATE, name="벤치마크", email=f"bench-{suffix}@example.com",
+        phone="010-0000-0000", address="서울"
+    )
+    vehicle = Vehicle(
+        registration_number=f"BENCH-{suffix}", make="현대", model="쏘나타", year=2024,
+        color="black", vin=f"VIN-{suffix}", mileage=0, fuel_type=FuelType.GASOLINE,
+        transmission=TransmissionType.AUTOMATIC, category=VehicleCategory.MIDSIZE,
+        purchase_date=now, purchase_price=1, current_value=1,
+        last_maintenance_date=now, next_maintenance_date=now
+    )
+    db.add_all([customer, vehicle])
+    db.flush()
+
+    for offset in range(0, contract_count, 10_000):
+        db.bulk_insert_mappings(LeaseContract, [
+            {
+                "contract_number": f"LC-{suffix}-{i}",
+                "customer_id": customer.id,
+                "vehicle_id": vehicle.id,
+                "lease_type": LeaseType.OPERATING,
+                "status": LeaseContractStatus.ACTIVE,
+                "start_date": now - relativedelta(months=6, days=i % 28),
+                "end_date": now + relativedelta(months=30),
+                "monthly_payment": 500_000 + (i % 100) * 1000,
+                "down_payment": 0,
+                "residual_value": 0,
+                "mileage_limit": 20_000,
+                "excess_mileage_rate": 100,
+            }
+            for i in range(offset, min(offset + 10_000, contract_count))
+        ])
+    db.commit()
+
+
+def run(db, year: int, month: int, chunk_size: int, label: str):
+    """청구 실행 1회 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    billing_run = LeaseBillingService.run_monthly_billing(db, year, month, chunk_size)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"[{label}] {billing_run.billing_period} status={billing_run.status.value} "
+        f"processed={billing_run.processed_contracts:,} created={billing_run.created_payments:,} "
+        f"skipped={billing_run.skipped_contracts:,} elapsed={elapsed:.2f}s "
+        f"peak_mem={peak / 1024 / 1024:.1f}MiB"
+    )
+
+
+def main():
+    contract_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    engine.echo = False
+    init_db()
+    db = SessionLocal()
+    try:
+        seed(db, contract_count)
+        target = datetime.now() + relativedelta(months=1)
+        run(db, target.year, target.month, chunk_size, "first")
+
+        # 완료된 기간 재실행: 기존 결과 반환
+        run(db, target.year, target.month, chunk_size, "rerun")
+
+        # 실패 후 재개 시나리오: 실행 상태를 되돌려 이어서 처리해도 결제가 중복되지 않는지 확인
+        period = LeaseBillingService.billing_period(target.year, target.month)
+        billing_run = db.query(BillingRun).filter(BillingRun.billing_period == period).one()
+        billing_run.status = "FAILED"
+        billing_run.last_contract_id = None
+        db.commit()
+        run(db, target.year, target.month, chunk_size, "resume")
+
+        payments = db.query(func.count(Payment.id)).filter(Payment.billing_period == period).scalar()
+        print(f"결제 수 ({period}): {payments:,}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
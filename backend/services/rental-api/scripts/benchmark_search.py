@@ -0,0 +1,108 @@
+"""
+고객 검색 인덱스 벤치마크 스크립트
+
+합성 고객 데이터로 프로세스 내 n-gram 인덱스를 구성하고 검색 지연시간을 측정한다.
+동시에 들어온 첫 검색들이 인덱스를 한 번만 구성하는지, 삭제 후 접두사 검색이 되는지도 확인한다.
+DATABASE_URL 이 PostgreSQL 이면 pg_trgm 경로도 함께 측정한다 (고객 데이터가 미리 적재되어 있어야 함).
+
+사용법: python scripts/benchmark_search.py [고객 수]
+"""
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.services.search_service import NgramIndex, SEARCH_FIELDS
+from lib.models.database import Customer
+
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "시우", "하은", "주원", "지민"]
+QUERIES = ["김민", "010-12", "01034", "kim", "user12345@", "서윤", "박지"]
+
+
+def generate_customers(count: int):
+    """합성 고객 (doc_id, values) 생성"""
+    rng = random.Random(42)
+    for i in range(count):
+        name = rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+        yield f"cust-{i:08d}", {
+            "name": name,
+            "email": f"user{i}@example.com",
+            "phone": f"010-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}",
+        }
+
+
+def measure(label: str, search, runs: int = 20):
+    """쿼리별 p50/p99 지연시간 출력"""
+    for query in QUERIES:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            search(query)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"[{label}] {query!r:14} p50={statistics.median(timings):8.2f}ms p99={p99:8.2f}ms")
+
+
+def check_concurrent_first_search(count: int = 50, threads: int = 8):
+    """동시 첫 검색: 인덱스 구성은 한 번만, 접두사 키는 고객당 1 + 1(전화번호 숫자)개"""
+    fields = SEARCH_FIELDS[Customer]
+    index = NgramIndex(fields["similarity"], fields["prefix"], fields["digit_prefix"])
+    loads = []
+    barrier = threading.Barrier(threads)
+
+    def load_rows():
+        loads.append(1)
+        for row in generate_customers(count):
+            time.sleep(0.001)  # DB 조회 중 다른 검색이 끼어들 시간
+            yield row
+
+    def first_search():
+        barrier.wait()
+        index.ensure_loaded(load_rows)
+        index.search("010", 20)
+
+    workers = [threading.Thread(target=first_search) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert len(loads) == 1, f"인덱스를 {len(loads)}번 구성함"
+    assert len(index._sorted_keys) == count * 2, f"접두사 키 {len(index._sorted_keys)}개 (기대 {count * 2}개)"
+
+    index.remove("cust-00000000")
+    index.search("010", 20)  # 삭제된 문서가 접두사 목록에 남아 있으면 KeyError
+    print(f"동시 첫 검색 {threads}개: 인덱스 구성 1회, 접두사 키 {len(index._sorted_keys)}개, 삭제 후 검색 정상")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    check_concurrent_first_search()
+
+    fields = SEARCH_FIELDS[Customer]
+    index = NgramIndex(fields["similarity"], fields["prefix"], fields["digit_prefix"])
+
+    started = time.perf_counter()
+    index.bulk_load(generate_customers(count))
+    print(f"인덱스 구성: {count:,}건, {time.perf_counter() - started:.1f}s")
+    measure("ngram", lambda q: index.search(q, 20))
+
+    database_url = os.getenv("DATABASE_URL", "")
+    if database_url.startswith("postgresql"):
+        from lib.models import SessionLocal
+        from lib.services.search_service import SearchService
+
+        db = SessionLocal()
+        try:
+            measure("pg_trgm", lambda q: SearchService.search(db, Customer, q, 20))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
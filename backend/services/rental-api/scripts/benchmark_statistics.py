@@ -0,0 +1,137 @@
+"""
+결제/예약 대시보드 통계 벤치마크 스크립트
+
+합성 결제/예약 데이터를 적재한 뒤, 통계 API 한 번당 실행되는 SQL 쿼리 수와
+지연시간(캐시 미적중/적중)을 측정한다.
+
+사용법: DATABASE_URL=sqlite:///bench.db python scripts/benchmark_statistics.py [결제 수] [예약 수] [--no-seed]
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+
+from lib.models import SessionLocal, engine, init_db
+from lib.models.database import Customer, Payment, Reservation, Vehicle
+from lib.models.enums import (
+    CustomerType,
+    FuelType,
+    PaymentMethod,
+    PaymentStatus,
+    ReservationStatus,
+    ReservationType,
+    TransmissionType,
+    VehicleCategory,
+)
+from lib.services.payment_service import PaymentService
+from lib.services.reservation_service import ReservationService
+from lib.services.stats_cache import stats_cache
+
+
+def seed(db, payment_count: int, reservation_count: int):
+    """합성 데이터 적재"""
+    rng = random.Random(7)
+    now = datetime.now()
+    customer = Customer(
+        type=CustomerType.INDIVIDUAL, name="벤치마크", email=f"bench-{time.time()}@example.com",
+        phone="010-0000-0000", address="서울"
+    )
+    vehicle = Vehicle(
+        registration_number=f"BENCH-{time.time()}", make="현대", model="아반떼", year=2024,
+        color="white", vin=f"VIN-{time.time()}", mileage=0, fuel_type=FuelType.GASOLINE,
+        transmission=TransmissionType.AUTOMATIC, category=VehicleCategory.COMPACT,
+        purchase_date=now, purchase_price=1, current_value=1,
+        last_maintenance_date=now, next_maintenance_date=now
+    )
+    db.add_all([customer, vehicle])
+    db.flush()
+
+    statuses = list(PaymentStatus)
+    db.bulk_insert_mappings(Payment, [
+        {
+            "customer_id": customer.id,
+            "contract_type": rng.choice(["RENTAL", "LEASE"]),
+            "amount": rng.randint(10, 1000) * 1000,
+            "status": rng.choice(statuses),
+            "payment_method": PaymentMethod.CREDIT_CARD,
+            "due_date": now - timedelta(days=rng.randint(0, 365)),
+            "paid_date": now - timedelta(days=rng.randint(0, 365)),
+        }
+        for _ in range(payment_count)
+    ])
+    reservation_statuses = list(ReservationStatus)
+    db.bulk_insert_mappings(Reservation, [
+        {
+            "customer_id": customer.id,
+            "vehicle_id": vehicle.id,
+            "reservation_type": ReservationType.RENTAL,
+            "status": rng.choice(reservation_statuses),
+            "pickup_date": now + timedelta(days=rng.randint(-30, 30)),
+            "pickup_time": "10:00",
+            "pickup_location": "서울",
+            "estimated_cost": 100000,
+        }
+        for _ in range(reservation_count)
+    ])
+    db.commit()
+
+
+def measure(label: str, func):
+    """쿼리 수와 지연시간 측정"""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        stats_cache.clear()
+        started = time.perf_counter()
+        func()
+        cold = (time.perf_counter() - started) * 1000
+        cold_queries = len(statements)
+
+        started = time.perf_counter()
+        func()
+        warm = (time.perf_counter() - started) * 1000
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    print(
+        f"{label:28} queries={cold_queries:2d} cold={cold:9.2f}ms "
+        f"cached={warm:7.3f}ms (+{len(statements) - cold_queries} queries)"
+    )
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    payment_count = int(args[0]) if len(args) > 0 else 500_000
+    reservation_count = int(args[1]) if len(args) > 1 else 200_000
+
+    engine.echo = False
+    init_db()
+    db = SessionLocal()
+    try:
+        if "--no-seed" not in sys.argv:
+            seed(db, payment_count, reservation_count)
+        today = datetime.now()
+        measure("payments.statistics", lambda: PaymentService.get_payment_statistics(db))
+        measure(
+            "payments.monthly_summary",
+            lambda: PaymentService.get_monthly_summary(db, today.year, today.month)
+        )
+        measure(
+            "reservations.statistics",
+            lambda: ReservationService.get_reservation_statistics(db)
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile
 from pydantic import BaseModel, Field
 from prisma import Prisma
 
+from shared.utils.event_bus import REPAIR_REQUEST_STATUS_CHANGED, get_event_bus
 from shared.utils.response_utils import success_response, ApiException
 from shared.utils.logging_utils import get_logger
 
@@ -335,6 +336,26 @@ async def get_repair_request(
             error_code="GET_REQUEST_ERROR"
         )
 
+async def publish_status_changed(repair_request, previous_status: str) -> None:
+    """
+    GraphQL 구독(repairRequestStatusChanged)으로 전달할 상태 변경 이벤트 발행
+
+    구독은 정비소 단위이므로 정비소가 배정되지 않은 요청은 발행하지 않습니다.
+    """
+    if not repair_request.workshop_id or repair_request.status == previous_status:
+        return
+    await get_event_bus().publish(
+        REPAIR_REQUEST_STATUS_CHANGED,
+        {
+            "id": repair_request.id,
+            "request_number": repair_request.request_number,
+            "workshop_id": repair_request.workshop_id,
+            "status": repair_request.status,
+            "previous_status": previous_status,
+            "changed_at": datetime.utcnow(),
+        },
+    )
+
 @router.put("/{request_id}")
 async def update_repair_request(
     request_id: str,
@@ -406,6 +427,8 @@ async def update_repair_request(
             }
         )
         
+        await publish_status_changed(updated_request, repair_request.status)
+        
         logger.info(f"정비 요청 수정 완료: {updated_request.request_number}")
         
         return success_response(
@@ -569,6 +592,8 @@ async def cancel_repair_request(
             }
         )
         
+        await publish_status_changed(cancelled_request, repair_request.status)
+        
         logger.info(f"정비 요청 취소 완료: {cancelled_request.request_number}")
         
         return success_response(
@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from prisma import Prisma
 
 from shared.config.settings import settings
+from shared.utils.server_launcher import default_response_class
+from shared.utils.event_bus import close_event_bus
 from shared.utils.logging_utils import get_logger
 
 # 라우터 임포트
@@ -36,6 +38,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # 앱 종료 시 실행될 코드
+    await close_event_bus()
     await prisma.disconnect()
     logger.info("Repair API 서버 종료")
 
@@ -44,6 +47,7 @@ app = FastAPI(
     title="CarGoro Repair API",
     description="정비 요청 및 정비소 관리 API",
     version="0.1.0",
+    default_response_class=default_response_class(),
     docs_url="/api-docs",
     redoc_url="/api-redoc",
     openapi_url="/api-docs.json",
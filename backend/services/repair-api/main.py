@@ -3,13 +3,13 @@ Repair API 진입점
 """
 import os
 import sys
-import uvicorn
 
 # 현재 디렉토리를 모듈 검색 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # 표준화된 서버 모듈 임포트
 from lib.server import app
+from shared.utils.server_launcher import run_server
 
 # 서버 실행 (직접 실행 시에만)
 if __name__ == "__main__":
@@ -17,8 +17,9 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     reload = os.getenv("ENV", "development") == "development"
     
-    uvicorn.run(
-        "main:app" if reload else app,
+    run_server(
+        app,
+        app_path="lib.server:app",
         host=host,
         port=port,
         reload=reload,
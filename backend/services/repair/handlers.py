@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
+from uuid import uuid4
 from fastapi import HTTPException, status
 import logging
 
@@ -412,19 +413,27 @@ async def add_required_parts(
             if repair_job.status != MaintenanceStatus.IN_PROGRESS:
                 raise ValueError("진행 중인 정비 작업에만 부품을 추가할 수 있습니다")
 
+            # 부품 ID 를 미리 만들어 중첩 생성 한 번으로 저장 (한 트랜잭션, 부품마다 INSERT 왕복 없음)
+            part_rows = [
+                {
+                    "id": str(uuid4()),
+                    "name": part_data["name"],
+                    "partNumber": part_data.get("partNumber", ""),
+                    "quantity": part_data["quantity"],
+                    "unitPrice": part_data["unitPrice"],
+                    "totalPrice": part_data["quantity"] * part_data["unitPrice"],
+                }
+                for part_data in parts
+            ]
             created_parts = []
-            for part_data in parts:
-                created_part = await db.maintenancepart.create(
-                    data={
-                        "maintenanceId": repair_job_id,
-                        "name": part_data["name"],
-                        "partNumber": part_data.get("partNumber", ""),
-                        "quantity": part_data["quantity"],
-                        "unitPrice": part_data["unitPrice"],
-                        "totalPrice": part_data["quantity"] * part_data["unitPrice"],
-                    }
+            if part_rows:
+                updated_job = await db.maintenance.update(
+                    where={"id": repair_job_id},
+                    data={"parts": {"create": part_rows}},
+                    include={"parts": True},
                 )
-                created_parts.append(created_part)
+                new_ids = {row["id"] for row in part_rows}
+                created_parts = [part for part in updated_job.parts if part.id in new_ids]
 
             return {
                 "success": True,
@@ -6,9 +6,18 @@ from datetime import datetime, timedelta
 from pydantic import BaseModel, EmailStr
 import asyncio
 import os
+import sys
 from pathlib import Path
 
-app = FastAPI(title="CarGoro Reporting API", version="1.0.0")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
+
+from shared.utils.server_launcher import default_response_class, run_server
+
+app = FastAPI(
+    title="CarGoro Reporting API",
+    version="1.0.0",
+    default_response_class=default_response_class(),
+)
 
 # CORS 설정
 app.add_middleware(
@@ -478,5 +487,4 @@ async def preview_report(
     return report_data
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8005)
+    run_server(app, host="0.0.0.0", port=8005)
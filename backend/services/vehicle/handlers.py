@@ -11,6 +11,8 @@ from fastapi import Depends, HTTPException
 from shared.utils.response_utils import create_response
 from shared.interfaces import DBClient
 
+from .report import REPORT_TYPES, build_report_data, parse_date_range, stream_report, stream_report_zip
+
 
 async def get_vehicle(vehicle_id: str, db: DBClient) -> Dict[str, Any]:
     """차량 정보 조회"""
@@ -685,212 +687,47 @@ async def get_vehicle_report(
 ) -> Dict[str, Any]:
     """차량 보고서 생성
 
+    차량을 배치로 읽고 배치마다 정비/배정 이력을 한 번에 조회합니다 (차량별 쿼리 없음).
+    CSV/NDJSON 은 행 단위로 스트리밍하며, 'all' 유형은 유형별 파일을 담은 zip 으로 내려줍니다.
+
     Args:
         db: 데이터베이스 클라이언트
         report_type: 보고서 유형 (all, maintenance, usage, assignment)
         start_date: 시작 날짜 (YYYY-MM-DD)
-        end_date: 종료 날짜 (YYYY-MM-DD)
-        format: 출력 형식 (json, csv, pdf)
+        end_date: 종료 날짜 (YYYY-MM-DD, 당일 포함)
+        format: 출력 형식 (json, csv, ndjson, pdf)
 
     Returns:
         보고서 데이터
     """
-    try:
-        # 날짜 필터 설정
-        date_filter = {}
-        if start_date:
-            date_filter["gte"] = start_date
-        if end_date:
-            date_filter["lte"] = end_date
-
-        report_data = {
-            "generated_at": datetime.now().isoformat(),
-            "report_type": report_type,
-            "date_range": {
-                "start": start_date,
-                "end": end_date,
-            },
-        }
-
-        # 전체 차량 정보 가져오기
-        vehicles = await db.vehicle.find_many(
-            order_by={"createdAt": "desc"},
-        )
-
-        # 보고서 유형별 데이터 수집
-        if report_type in ["all", "maintenance"]:
-            # 정비 이력 데이터
-            maintenance_records = []
-            for vehicle in vehicles:
-                # 날짜 필터 적용
-                where_condition = {"vehicleId": vehicle.id}
-                if date_filter:
-                    where_condition["date"] = date_filter
-
-                vehicle_maintenance = await db.maintenance.find_many(
-                    where=where_condition,
-                    order_by={"date": "desc"},
-                )
+    if report_type != "all" and report_type not in REPORT_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 보고서 유형입니다: {report_type}",
+        )
 
-                if vehicle_maintenance:
-                    for record in vehicle_maintenance:
-                        maintenance_records.append({
-                            "vehicle_id": vehicle.id,
-                            "registration_number": vehicle.registrationNumber,
-                            "maintenance_id": record.id,
-                            "maintenance_type": record.type,
-                            "description": record.description,
-                            "date": record.date,
-                            "cost": record.cost,
-                            "performed_by": record.performedBy,
-                        })
-
-            report_data["maintenance_records"] = maintenance_records
-
-        if report_type in ["all", "usage"]:
-            # 차량 사용 데이터
-            usage_data = []
-            for vehicle in vehicles:
-                # 주행 기록 필터링
-                mileage_history = vehicle.mileageHistory or []
-                filtered_history = []
-
-                for entry in mileage_history:
-                    entry_date = entry.get("timestamp", "").split("T")[0]
-                    include_entry = True
-
-                    if start_date and entry_date < start_date:
-                        include_entry = False
-                    if end_date and entry_date > end_date:
-                        include_entry = False
-
-                    if include_entry:
-                        filtered_history.append(entry)
-
-                if filtered_history:
-                    usage_data.append({
-                        "vehicle_id": vehicle.id,
-                        "registration_number": vehicle.registrationNumber,
-                        "current_mileage": vehicle.currentMileage,
-                        "mileage_history": filtered_history,
-                    })
-
-            report_data["usage_data"] = usage_data
-
-        if report_type in ["all", "assignment"]:
-            # 차량 배정 데이터
-            assignment_data = []
-            for vehicle in vehicles:
-                # 날짜 필터가 있을 경우만 적용
-                where_condition = {"vehicleId": vehicle.id}
-                if date_filter:
-                    where_condition["OR"] = [
-                        {"startDate": date_filter},
-                        {"endDate": date_filter}
-                    ]
-
-                assignments = await db.vehicleAssignment.find_many(
-                    where=where_condition,
-                    order_by={"startDate": "desc"},
-                    include={"driver": True},
-                )
+    try:
+        date_range = parse_date_range(start_date, end_date)
 
-                if assignments:
-                    vehicle_assignments = []
-                    for assignment in assignments:
-                        driver_name = "Unknown"
-                        if assignment.driver:
-                            driver_name = f"{assignment.driver.firstName} {assignment.driver.lastName}"
-
-                        vehicle_assignments.append({
-                            "assignment_id": assignment.id,
-                            "driver_id": assignment.driverId,
-                            "driver_name": driver_name,
-                            "start_date": assignment.startDate,
-                            "end_date": assignment.endDate,
-                            "notes": assignment.notes,
-                        })
-
-                    assignment_data.append({
-                        "vehicle_id": vehicle.id,
-                        "registration_number": vehicle.registrationNumber,
-                        "assignments": vehicle_assignments,
-                    })
-
-            report_data["assignment_data"] = assignment_data
-
-        # CSV 형식 처리
-        if format == "csv":
-            import csv
-            import io
+        # 스트리밍 형식 처리
+        if format in ("csv", "ndjson"):
             from fastapi.responses import StreamingResponse
 
-            output = io.StringIO()
-            writer = None
-
-            # 보고서 유형에 따라 CSV 헤더 및 데이터 설정
-            if report_type == "maintenance":
-                writer = csv.DictWriter(
-                    output,
-                    fieldnames=[
-                        "vehicle_id", "registration_number", "maintenance_id",
-                        "maintenance_type", "description", "date", "cost", "performed_by"
-                    ]
-                )
-                writer.writeheader()
-                for record in report_data.get("maintenance_records", []):
-                    writer.writerow(record)
-
-            elif report_type == "usage":
-                # 사용 보고서는 평탄화된 구조로 변환
-                writer = csv.writer(output)
-                writer.writerow([
-                    "vehicle_id", "registration_number", "timestamp",
-                    "mileage", "recorded_by", "source"
-                ])
-
-                for vehicle_usage in report_data.get("usage_data", []):
-                    for entry in vehicle_usage.get("mileage_history", []):
-                        writer.writerow([
-                            vehicle_usage["vehicle_id"],
-                            vehicle_usage["registration_number"],
-                            entry.get("timestamp", ""),
-                            entry.get("mileage", 0),
-                            entry.get("recordedBy", ""),
-                            entry.get("source", ""),
-                        ])
-
-            elif report_type == "assignment":
-                writer = csv.writer(output)
-                writer.writerow([
-                    "vehicle_id", "registration_number", "assignment_id",
-                    "driver_id", "driver_name", "start_date", "end_date", "notes"
-                ])
-
-                for vehicle_assignment in report_data.get("assignment_data", []):
-                    for assignment in vehicle_assignment.get("assignments", []):
-                        writer.writerow([
-                            vehicle_assignment["vehicle_id"],
-                            vehicle_assignment["registration_number"],
-                            assignment["assignment_id"],
-                            assignment["driver_id"],
-                            assignment["driver_name"],
-                            assignment["start_date"],
-                            assignment["end_date"],
-                            assignment["notes"],
-                        ])
-
-            else:  # 'all' 유형은 여러 시트를 필요로 하므로 JSON으로 대체
-                return create_response(
-                    data={"error": "CSV 형식은 특정 보고서 유형에만 지원됩니다 (maintenance, usage, assignment)"},
-                    status_code=400
+            if report_type == "all":
+                return StreamingResponse(
+                    stream_report_zip(db, date_range, format),
+                    media_type="application/zip",
+                    headers={
+                        "Content-Disposition": f"attachment; filename=vehicle_all_report_{format}.zip"
+                    }
                 )
 
+            media_type = "text/csv" if format == "csv" else "application/x-ndjson"
             return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
+                stream_report(db, report_type, date_range, format),
+                media_type=media_type,
                 headers={
-                    "Content-Disposition": f"attachment; filename=vehicle_{report_type}_report.csv"
+                    "Content-Disposition": f"attachment; filename=vehicle_{report_type}_report.{format}"
                 }
             )
 
@@ -901,9 +738,21 @@ async def get_vehicle_report(
                 status_code=501
             )
 
+        report_data = {
+            "generated_at": datetime.now().isoformat(),
+            "report_type": report_type,
+            "date_range": {
+                "start": start_date,
+                "end": end_date,
+            },
+        }
+        report_data.update(await build_report_data(db, report_type, date_range))
+
         # 기본 JSON 형식
         return create_response(data=report_data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,335 @@
+"""
+차량 보고서 빌더
+
+차량을 키셋 배치로 읽고, 배치마다 정비/배정 이력을 IN 쿼리 한 번으로 가져와 메모리에서 묶습니다.
+쿼리 수는 차량 수가 아니라 배치 수에 비례하며, CSV/NDJSON 은 행 단위로 스트리밍합니다.
+"""
+
+import csv
+import io
+import json
+import zipfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from shared.interfaces import DBClient
+
+# 배치당 차량 수 (IN 쿼리 파라미터 수와 메모리 사용량의 상한)
+VEHICLE_BATCH_SIZE = 500
+
+REPORT_TYPES = ("maintenance", "usage", "assignment")
+
+MAINTENANCE_COLUMNS = [
+    "vehicle_id", "registration_number", "maintenance_id",
+    "maintenance_type", "description", "date", "cost", "performed_by",
+]
+USAGE_COLUMNS = [
+    "vehicle_id", "registration_number", "timestamp",
+    "mileage", "recorded_by", "source",
+]
+ASSIGNMENT_COLUMNS = [
+    "vehicle_id", "registration_number", "assignment_id",
+    "driver_id", "driver_name", "start_date", "end_date", "notes",
+]
+
+DateRange = Tuple[Optional[datetime], Optional[datetime]]
+
+
+def parse_date_range(start_date: Optional[str], end_date: Optional[str]) -> DateRange:
+    """YYYY-MM-DD 범위를 [시작, 종료 다음 날) 로 변환 (종료일 당일 포함)"""
+    try:
+        start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+        end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1) if end_date else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜는 YYYY-MM-DD 형식이어야 합니다")
+    return start, end
+
+
+def _date_filter(date_range: DateRange) -> Dict[str, datetime]:
+    start, end = date_range
+    date_filter = {}
+    if start:
+        date_filter["gte"] = start
+    if end:
+        date_filter["lt"] = end
+    return date_filter
+
+
+def _in_range(timestamp: Any, date_range: DateRange) -> bool:
+    """주행 기록 시각이 범위 안인지 확인 (파싱할 수 없는 시각은 범위 지정 시 제외)"""
+    start, end = date_range
+    if not start and not end:
+        return True
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return False
+    if not isinstance(timestamp, datetime):
+        return False
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (not start or timestamp >= start) and (not end or timestamp < end)
+
+
+async def iter_vehicle_batches(db: DBClient, batch_size: int = VEHICLE_BATCH_SIZE) -> AsyncIterator[List[Any]]:
+    """(createdAt, id) 내림차순 키셋으로 차량 배치 조회"""
+    last = None
+    while True:
+        where: Dict[str, Any] = {}
+        if last is not None:
+            where = {
+                "OR": [
+                    {"createdAt": {"lt": last.createdAt}},
+                    {"createdAt": last.createdAt, "id": {"lt": last.id}},
+                ]
+            }
+        vehicles = await db.vehicle.find_many(
+            where=where,
+            order_by=[{"createdAt": "desc"}, {"id": "desc"}],
+            take=batch_size,
+        )
+        if not vehicles:
+            return
+        yield vehicles
+        if len(vehicles) < batch_size:
+            return
+        last = vehicles[-1]
+
+
+async def iter_maintenance(
+    db: DBClient, date_range: DateRange, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """정비 이력 행 (차량 배치당 쿼리 1회)"""
+    date_filter = _date_filter(date_range)
+    async for vehicles in iter_vehicle_batches(db, batch_size):
+        where: Dict[str, Any] = {"vehicleId": {"in": [vehicle.id for vehicle in vehicles]}}
+        if date_filter:
+            where["date"] = date_filter
+        records = await db.maintenance.find_many(where=where, order_by={"date": "desc"})
+
+        by_vehicle = defaultdict(list)
+        for record in records:
+            by_vehicle[record.vehicleId].append(record)
+
+        for vehicle in vehicles:
+            for record in by_vehicle.get(vehicle.id, ()):
+                yield {
+                    "vehicle_id": vehicle.id,
+                    "registration_number": vehicle.registrationNumber,
+                    "maintenance_id": record.id,
+                    "maintenance_type": record.type,
+                    "description": record.description,
+                    "date": record.date,
+                    "cost": record.cost,
+                    "performed_by": record.performedBy,
+                }
+
+
+async def iter_usage(
+    db: DBClient, date_range: DateRange, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """차량별 주행 기록 (기간 내 기록이 있는 차량만)"""
+    async for vehicles in iter_vehicle_batches(db, batch_size):
+        for vehicle in vehicles:
+            history = [
+                entry
+                for entry in vehicle.mileageHistory or []
+                if _in_range(entry.get("timestamp"), date_range)
+            ]
+            if history:
+                yield {
+                    "vehicle_id": vehicle.id,
+                    "registration_number": vehicle.registrationNumber,
+                    "current_mileage": vehicle.currentMileage,
+                    "mileage_history": history,
+                }
+
+
+async def iter_assignments(
+    db: DBClient, date_range: DateRange, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """차량별 배정 이력 (차량 배치당 쿼리 1회, 드라이버는 include 로 함께 조회)"""
+    date_filter = _date_filter(date_range)
+    async for vehicles in iter_vehicle_batches(db, batch_size):
+        where: Dict[str, Any] = {"vehicleId": {"in": [vehicle.id for vehicle in vehicles]}}
+        if date_filter:
+            where["OR"] = [{"startDate": date_filter}, {"endDate": date_filter}]
+        assignments = await db.vehicleAssignment.find_many(
+            where=where,
+            order_by={"startDate": "desc"},
+            include={"driver": True},
+        )
+
+        by_vehicle = defaultdict(list)
+        for assignment in assignments:
+            driver = assignment.driver
+            by_vehicle[assignment.vehicleId].append({
+                "assignment_id": assignment.id,
+                "driver_id": assignment.driverId,
+                "driver_name": f"{driver.firstName} {driver.lastName}" if driver else "Unknown",
+                "start_date": assignment.startDate,
+                "end_date": assignment.endDate,
+                "notes": assignment.notes,
+            })
+
+        for vehicle in vehicles:
+            if vehicle.id in by_vehicle:
+                yield {
+                    "vehicle_id": vehicle.id,
+                    "registration_number": vehicle.registrationNumber,
+                    "assignments": by_vehicle[vehicle.id],
+                }
+
+
+def _flatten_usage(usage: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    for entry in usage["mileage_history"]:
+        yield {
+            "vehicle_id": usage["vehicle_id"],
+            "registration_number": usage["registration_number"],
+            "timestamp": entry.get("timestamp", ""),
+            "mileage": entry.get("mileage", 0),
+            "recorded_by": entry.get("recordedBy", ""),
+            "source": entry.get("source", ""),
+        }
+
+
+def _flatten_assignments(group: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    for assignment in group["assignments"]:
+        yield {
+            "vehicle_id": group["vehicle_id"],
+            "registration_number": group["registration_number"],
+            **assignment,
+        }
+
+
+# 보고서 유형별 (JSON 키, 컬럼, 조회 함수, 평탄화 함수)
+REPORT_SECTIONS: Dict[str, Tuple[str, List[str], Callable, Optional[Callable]]] = {
+    "maintenance": ("maintenance_records", MAINTENANCE_COLUMNS, iter_maintenance, None),
+    "usage": ("usage_data", USAGE_COLUMNS, iter_usage, _flatten_usage),
+    "assignment": ("assignment_data", ASSIGNMENT_COLUMNS, iter_assignments, _flatten_assignments),
+}
+
+
+async def iter_report_rows(
+    db: DBClient, report_type: str, date_range: DateRange, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """보고서 유형의 평탄화된 행"""
+    _, _, iterate, flatten = REPORT_SECTIONS[report_type]
+    async for item in iterate(db, date_range, batch_size):
+        if flatten is None:
+            yield item
+        else:
+            for row in flatten(item):
+                yield row
+
+
+async def build_report_data(
+    db: DBClient, report_type: str, date_range: DateRange, batch_size: int = VEHICLE_BATCH_SIZE
+) -> Dict[str, List[Dict[str, Any]]]:
+    """JSON 보고서 본문 (기존 응답 구조 유지)"""
+    report_types = REPORT_TYPES if report_type == "all" else (report_type,)
+    data = {}
+    for section in report_types:
+        key, _, iterate, _ = REPORT_SECTIONS[section]
+        data[key] = [item async for item in iterate(db, date_range, batch_size)]
+    return data
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class _RowWriter:
+    """행을 CSV/NDJSON 바이트로 인코딩"""
+
+    def __init__(self, fmt: str, columns: List[str]):
+        self.fmt = fmt
+        self.columns = columns
+        self._buffer = io.StringIO()
+        self._csv = csv.DictWriter(self._buffer, fieldnames=columns, extrasaction="ignore")
+
+    def _drain(self) -> bytes:
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text.encode("utf-8")
+
+    def header(self) -> bytes:
+        if self.fmt != "csv":
+            return b""
+        self._csv.writeheader()
+        return self._drain()
+
+    def row(self, row: Dict[str, Any]) -> bytes:
+        if self.fmt == "csv":
+            self._csv.writerow(row)
+            return self._drain()
+        return (json.dumps(row, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+
+async def stream_report(
+    db: DBClient, report_type: str, date_range: DateRange, fmt: str, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[bytes]:
+    """단일 보고서를 행 단위로 스트리밍"""
+    writer = _RowWriter(fmt, REPORT_SECTIONS[report_type][1])
+    header = writer.header()
+    if header:
+        yield header
+    async for row in iter_report_rows(db, report_type, date_range, batch_size):
+        yield writer.row(row)
+
+
+class _ZipStream:
+    """ZipFile 이 쓴 바이트를 모아 두었다가 꺼내 가는 비탐색(non-seekable) 출력"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# zip 청크를 내보내는 최소 크기
+ZIP_FLUSH_BYTES = 64 * 1024
+
+
+async def stream_report_zip(
+    db: DBClient, date_range: DateRange, fmt: str, batch_size: int = VEHICLE_BATCH_SIZE
+) -> AsyncIterator[bytes]:
+    """전체 보고서를 유형별 파일이 담긴 zip 으로 스트리밍"""
+    output = _ZipStream()
+    extension = "csv" if fmt == "csv" else "ndjson"
+    with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for report_type in REPORT_TYPES:
+            writer = _RowWriter(fmt, REPORT_SECTIONS[report_type][1])
+            with archive.open(f"vehicle_{report_type}_report.{extension}", mode="w") as entry:
+                entry.write(writer.header())
+                pending = 0
+                async for row in iter_report_rows(db, report_type, date_range, batch_size):
+                    data = writer.row(row)
+                    entry.write(data)
+                    pending += len(data)
+                    if pending >= ZIP_FLUSH_BYTES:
+                        pending = 0
+                        chunk = output.drain()
+                        if chunk:
+                            yield chunk
+            chunk = output.drain()
+            if chunk:
+                yield chunk
+    yield output.drain()
@@ -188,7 +188,7 @@ def create_vehicle_router(db: DBClient) -> APIRouter:
         report_type: str = Query("all", description="보고서 유형 (all, maintenance, usage, assignment)"),
         start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
         end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
-        format: str = Query("json", description="출력 형식 (json, csv, pdf)"),
+        format: str = Query("json", description="출력 형식 (json, csv, ndjson, pdf)"),
     ):
         """차량 보고서 생성"""
         # 결과를 생성하기 전에 이전에 정의된 get_vehicle_report 함수 호출이 필요
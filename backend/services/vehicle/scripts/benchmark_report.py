@@ -0,0 +1,174 @@
+"""
+차량 보고서 벤치마크 스크립트
+
+메모리 내 가짜 DB(쿼리마다 왕복 지연을 흉내 냄)에 합성 차량을 적재하고,
+기존 방식(차량마다 정비/배정 쿼리)과 배치 방식의 쿼리 수와 소요 시간을 비교합니다.
+CSV 스트림과 'all' zip 스트림의 크기와 최대 메모리도 측정합니다.
+
+사용법: python services/vehicle/scripts/benchmark_report.py [차량 수] [쿼리 지연(ms)]
+"""
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from services.vehicle.report import (
+    build_report_data,
+    parse_date_range,
+    stream_report,
+    stream_report_zip,
+)
+
+
+def _matches(value, condition):
+    if isinstance(condition, dict):
+        if "in" in condition and value not in condition["in"]:
+            return False
+        if "lt" in condition and not value < condition["lt"]:
+            return False
+        if "gte" in condition and not value >= condition["gte"]:
+            return False
+        return True
+    return value == condition
+
+
+def _where(row, where):
+    for key, condition in where.items():
+        if key == "OR":
+            if not any(_where(row, option) for option in condition):
+                return False
+        elif not _matches(getattr(row, key), condition):
+            return False
+    return True
+
+
+class FakeModel:
+    """vehicleId 인덱스를 가진 메모리 테이블 (쿼리마다 지연 + 호출 수 집계)"""
+
+    def __init__(self, db, rows):
+        self.db = db
+        self.rows = rows
+        self.position = {row.id: index for index, row in enumerate(rows)}
+        self.by_vehicle = defaultdict(list)
+        for row in rows:
+            if hasattr(row, "vehicleId"):
+                self.by_vehicle[row.vehicleId].append(row)
+
+    async def find_many(self, where=None, order_by=None, take=None, include=None):
+        self.db.queries += 1
+        await asyncio.sleep(self.db.latency)
+        where = dict(where or {})
+        vehicle_filter = where.pop("vehicleId", None)
+        if isinstance(vehicle_filter, dict):
+            candidates = [row for vehicle_id in vehicle_filter["in"] for row in self.by_vehicle.get(vehicle_id, ())]
+        elif vehicle_filter is not None:
+            candidates = self.by_vehicle.get(vehicle_filter, [])
+        elif "OR" in where and "id" in where["OR"][-1]:
+            # (createdAt, id) 키셋: 정렬된 목록에서 마지막 행 다음부터
+            last_id = where.pop("OR")[-1]["id"]["lt"]
+            candidates = self.rows[self.position[last_id] + 1:]
+        else:
+            candidates = self.rows
+        result = [row for row in candidates if _where(row, where)]
+        return result[:take] if take else result
+
+
+class FakeDB:
+    def __init__(self, vehicle_count, latency):
+        self.queries = 0
+        self.latency = latency
+        base = datetime(2024, 1, 1)
+        vehicles, maintenance, assignments = [], [], []
+        for i in range(vehicle_count):
+            vehicle_id = f"veh-{i:06d}"
+            vehicles.append(SimpleNamespace(
+                id=vehicle_id,
+                registrationNumber=f"{i % 100:02d}가{i:04d}",
+                currentMileage=10_000 + i,
+                createdAt=base + timedelta(minutes=i),
+                mileageHistory=[
+                    {"timestamp": (base + timedelta(days=d * 30)).isoformat() + "Z", "mileage": 1000 * d,
+                     "recordedBy": "driver", "source": "app"}
+                    for d in range(6)
+                ],
+            ))
+            for m in range(3):
+                maintenance.append(SimpleNamespace(
+                    id=f"mnt-{i}-{m}", vehicleId=vehicle_id, type="regular", description="정기 점검",
+                    date=base + timedelta(days=m * 60), cost=100_000.0, performedBy="정비소",
+                ))
+            for a in range(2):
+                assignments.append(SimpleNamespace(
+                    id=f"asg-{i}-{a}", vehicleId=vehicle_id, driverId=f"drv-{a}",
+                    driver=SimpleNamespace(firstName="길동", lastName="홍"),
+                    startDate=base + timedelta(days=a * 90), endDate=base + timedelta(days=a * 90 + 30), notes=None,
+                ))
+        # 최신 차량 우선 (createdAt desc, id desc)
+        vehicles.sort(key=lambda v: (v.createdAt, v.id), reverse=True)
+        self.vehicle = FakeModel(self, vehicles)
+        self.maintenance = FakeModel(self, maintenance)
+        self.vehicleAssignment = FakeModel(self, assignments)
+
+
+async def legacy_report(db, date_range):
+    """기존 방식의 쿼리 패턴: 차량 전체 조회 후 차량마다 정비/배정 쿼리 (행 변환 제외)"""
+    vehicles = await db.vehicle.find_many()
+    rows = 0
+    for vehicle in vehicles:
+        rows += len(await db.maintenance.find_many(where={"vehicleId": vehicle.id}))
+        rows += len(await db.vehicleAssignment.find_many(where={"vehicleId": vehicle.id}))
+    return f"{rows:,} rows"
+
+
+async def measure(label, db, coroutine_factory):
+    """소요 시간과 최대 메모리는 각각 따로 측정 (tracemalloc 오버헤드 제외)"""
+    db.queries = 0
+    started = time.perf_counter()
+    result = await coroutine_factory()
+    elapsed = time.perf_counter() - started
+    queries = db.queries
+
+    tracemalloc.start()
+    await coroutine_factory()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:24} queries={queries:6,} elapsed={elapsed:7.2f}s peak_mem={peak / 1024 / 1024:6.1f}MiB  {result}")
+
+
+async def consume(stream):
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+    return f"{size / 1024:,.0f}KiB"
+
+
+async def main():
+    vehicle_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 0.5) / 1000
+    db = FakeDB(vehicle_count, latency)
+    date_range = parse_date_range(None, None)
+
+    await measure("legacy (N+1)", db, lambda: legacy_report(db, date_range))
+    await measure(
+        "batched json",
+        db,
+        lambda: _count_json(db, date_range),
+    )
+    await measure("batched csv maintenance", db, lambda: consume(stream_report(db, "maintenance", date_range, "csv")))
+    await measure("batched csv all (zip)", db, lambda: consume(stream_report_zip(db, date_range, "csv")))
+    await measure("batched ndjson all (zip)", db, lambda: consume(stream_report_zip(db, date_range, "ndjson")))
+
+
+async def _count_json(db, date_range):
+    data = await build_report_data(db, "all", date_range)
+    return {key: len(value) for key, value in data.items()}
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
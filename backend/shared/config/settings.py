@@ -60,6 +60,21 @@ class CommonSettings(BaseSettings):
         description="데이터베이스 연결 URL",
     )
 
+    db_pool_size: int = Field(
+        default=10, env="DB_POOL_SIZE", description="Prisma 쿼리 엔진 커넥션 풀 크기"
+    )
+    db_pool_timeout: int = Field(
+        default=10, env="DB_POOL_TIMEOUT", description="커넥션 풀 대기 시간(초)"
+    )
+    db_connect_timeout: int = Field(
+        default=10, env="DB_CONNECT_TIMEOUT", description="데이터베이스 연결/상태 확인 제한 시간(초)"
+    )
+    db_health_check_interval: int = Field(
+        default=30,
+        env="DB_HEALTH_CHECK_INTERVAL",
+        description="데이터베이스 상태 확인 주기(초, 0 이면 비활성화)",
+    )
+
     # Redis 설정
     redis_url: str = Field(
         default="redis://localhost:6379/0",
@@ -109,6 +124,122 @@ class CommonSettings(BaseSettings):
     # 로깅 설정
     log_level: str = Field(default="INFO", env="LOG_LEVEL", description="로깅 레벨")
 
+    # 감사 로그 수집 설정
+    audit_api_url: str = Field(
+        default="http://localhost:8305/api/admin",
+        env="AUDIT_API_URL",
+        description="감사 로그 일괄 수집 API 기본 URL (admin_api)",
+    )
+    audit_spill_dir: str = Field(
+        default="/tmp/cargoro-audit-spill",
+        env="AUDIT_SPILL_DIR",
+        description="감사 로그 전송 실패 시 이벤트를 보관할 디렉터리",
+    )
+    audit_retention_months: int = Field(
+        default=12,
+        env="AUDIT_RETENTION_MONTHS",
+        description="DB 에 보관할 감사 로그 월 파티션 수 (이전 파티션은 아카이브)",
+    )
+    audit_archive_dir: str = Field(
+        default="/var/lib/cargoro/audit-archive",
+        env="AUDIT_ARCHIVE_DIR",
+        description="감사 로그 파티션 아카이브 디렉터리",
+    )
+    audit_archive_format: str = Field(
+        default="ndjson",
+        env="AUDIT_ARCHIVE_FORMAT",
+        description="감사 로그 아카이브 형식 (ndjson: gzip NDJSON, parquet: pyarrow 필요)",
+    )
+
+    # 실시간 알림 설정
+    realtime_api_url: Optional[str] = Field(
+        default=None,
+        env="REALTIME_API_URL",
+        description="읽지 않은 알림 수를 전송할 realtime 서비스 기본 URL (없으면 전송 안 함)",
+    )
+
+    # 서비스 간 이벤트 버스 설정
+    event_bus_redis_url: Optional[str] = Field(
+        default=None,
+        env="EVENT_BUS_REDIS_URL",
+        description="이벤트 버스 Redis URL (없으면 같은 프로세스 안에서만 전달)",
+    )
+
+    # GraphQL 게이트웨이 설정
+    graphql_max_query_depth: int = Field(
+        default=10, env="GRAPHQL_MAX_QUERY_DEPTH", description="GraphQL 쿼리 최대 중첩 깊이"
+    )
+    graphql_max_query_cost: int = Field(
+        default=1000, env="GRAPHQL_MAX_QUERY_COST", description="GraphQL 쿼리 1건의 최대 비용"
+    )
+    graphql_cost_budget_per_minute: int = Field(
+        default=20000,
+        env="GRAPHQL_COST_BUDGET_PER_MINUTE",
+        description="클라이언트(토큰/IP)별 분당 GraphQL 쿼리 비용 한도",
+    )
+    graphql_response_cache_ttl: float = Field(
+        default=30.0,
+        env="GRAPHQL_RESPONSE_CACHE_TTL",
+        description="GraphQL 쿼리 응답 캐시 유지 시간(초, 0 이면 사용 안 함)",
+    )
+    graphql_persisted_queries_path: Optional[str] = Field(
+        default=None,
+        env="GRAPHQL_PERSISTED_QUERIES_PATH",
+        description="미리 등록할 persisted query 목록 JSON 파일 ({sha256: query})",
+    )
+
+    # 비밀번호 해싱 설정
+    password_hash_rounds: int = Field(
+        default=12, env="PASSWORD_HASH_ROUNDS", description="bcrypt 라운드 수 (변경 시 로그인할 때 다시 해싱)"
+    )
+    password_hash_workers: Optional[int] = Field(
+        default=None,
+        env="PASSWORD_HASH_WORKERS",
+        description="비밀번호 해싱 동시 실행 수 (없으면 CPU 수, 최대 4)",
+    )
+    password_hash_queue_timeout: float = Field(
+        default=5.0,
+        env="PASSWORD_HASH_QUEUE_TIMEOUT",
+        description="비밀번호 해싱 작업자 대기 최대 시간(초, 초과 시 요청 거부)",
+    )
+    password_hash_executor: str = Field(
+        default="thread",
+        env="PASSWORD_HASH_EXECUTOR",
+        description="비밀번호 해싱 작업자 풀 종류 (thread, process)",
+    )
+
+    # 서버 실행 설정 (shared.utils.server_launcher)
+    server_workers: int = Field(
+        default=1, env="SERVER_WORKERS", description="uvicorn 워커 프로세스 수 (0 이면 CPU 수)"
+    )
+    server_loop: str = Field(
+        default="auto", env="SERVER_LOOP", description="이벤트 루프 (auto: uvloop 있으면 사용, uvloop, asyncio)"
+    )
+    server_http: str = Field(
+        default="auto", env="SERVER_HTTP", description="HTTP 파서 (auto: httptools 있으면 사용, httptools, h11)"
+    )
+    server_keepalive_timeout: int = Field(
+        default=5,
+        env="SERVER_KEEPALIVE_TIMEOUT",
+        description="keep-alive 연결 유지 시간(초, 로드 밸런서 유휴 시간보다 길게)",
+    )
+    server_backlog: int = Field(
+        default=2048, env="SERVER_BACKLOG", description="listen 소켓 backlog (대기 연결 수)"
+    )
+    server_graceful_timeout: float = Field(
+        default=30.0,
+        env="SERVER_GRACEFUL_TIMEOUT",
+        description="종료 신호 후 처리 중인 요청을 기다리는 최대 시간(초)",
+    )
+    server_limit_concurrency: Optional[int] = Field(
+        default=None,
+        env="SERVER_LIMIT_CONCURRENCY",
+        description="워커당 최대 동시 연결/요청 수 (초과 시 503, 없으면 제한 없음)",
+    )
+    server_access_log: bool = Field(
+        default=True, env="SERVER_ACCESS_LOG", description="uvicorn 접근 로그 출력 여부"
+    )
+
     # 외부 서비스 설정
     clerk_secret_key: Optional[str] = Field(
         default=None, env="CLERK_SECRET_KEY", description="Clerk 인증 서비스 시크릿 키"
@@ -3,6 +3,7 @@
 """
 
 from .db_operations import DBClient
+from .client_registry import PrismaClientRegistry, get_prisma_client, prisma_registry
 
 
 def init_db():
@@ -12,3 +13,6 @@ def init_db():
     db_client = DBClient()
     db_client.connect()
     return db_client.get_client()
+
+
+__all__ = ["DBClient", "PrismaClientRegistry", "get_prisma_client", "init_db", "prisma_registry"]
@@ -0,0 +1,343 @@
+"""
+Prisma 클라이언트 레지스트리
+
+애플리케이션 수명 동안 Prisma 클라이언트를 공유합니다.
+- 요청/세션마다 connect/disconnect 하지 않음 (쿼리 엔진 연결은 한 번만 생성)
+- 시작/종료 훅과 FastAPI lifespan 제공
+- 커넥션 풀 크기/대기 시간 설정 (DB_POOL_SIZE, DB_POOL_TIMEOUT)
+- 주기적 상태 확인과 연결 오류 시 재연결
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLIENT = "default"
+# 재연결로 교체된 이전 클라이언트를 해제하기 전 대기 시간(초) (진행 중인 쿼리가 끝나도록)
+RETIRED_CLIENT_GRACE = 30.0
+
+# 연결이 끊겼음을 뜻하는 Prisma 예외 이름 (prisma 임포트 없이 판별)
+CONNECTION_ERROR_NAMES = frozenset(
+    {
+        "ClientNotConnectedError",
+        "EngineConnectionError",
+        "HTTPClientClosedError",
+        "ConnectError",
+        "ReadError",
+    }
+)
+
+
+async def _maybe_await(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def with_pool_params(url: Optional[str], pool_size: int, pool_timeout: int) -> Optional[str]:
+    """데이터소스 URL 에 커넥션 풀 파라미터를 추가 (URL 에 이미 있으면 유지)"""
+    if not url:
+        return url
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.setdefault("connection_limit", str(pool_size))
+    query.setdefault("pool_timeout", str(pool_timeout))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class OfflinePrismaClient:
+    """
+    테스트 환경(TESTING=1)용 DB 없는 클라이언트
+
+    연결/해제와 SELECT 1 상태 확인만 흉내내고, 모델 조회는 오류를 냅니다.
+    모델을 사용하는 테스트는 PrismaClientRegistry(client_factory=...) 로 클라이언트를 직접 주입합니다.
+    """
+
+    def __init__(self):
+        self._connected = False
+
+    async def connect(self, timeout: Any = None) -> None:
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def query_raw(self, query: str, *args: Any) -> list:
+        return []
+
+    async def execute_raw(self, query: str, *args: Any) -> int:
+        return 0
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise RuntimeError(
+            f"테스트 환경의 오프라인 DB 클라이언트는 '{name}' 을(를) 지원하지 않습니다 (client_factory 로 클라이언트 주입 필요)"
+        )
+
+
+def default_client_factory(datasource_url: Optional[str]) -> Any:
+    """Prisma 클라이언트 생성 (테스트 환경에서는 오프라인 클라이언트)"""
+    if os.environ.get("TESTING") == "1":
+        return OfflinePrismaClient()
+    try:
+        from prisma import Prisma
+    except ImportError as e:
+        # 모의 클라이언트로 대신하면 쿼리가 조용히 빈 결과를 돌려주므로 시작 단계에서 실패시킴
+        raise RuntimeError("Prisma 모듈을 가져올 수 없습니다 (prisma 설치 및 prisma generate 필요)") from e
+
+    if datasource_url:
+        return Prisma(datasource={"url": datasource_url})
+    return Prisma()
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """재연결이 필요한 오류인지 확인"""
+    current: Optional[BaseException] = error
+    while current is not None:
+        if type(current).__name__ in CONNECTION_ERROR_NAMES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class PrismaClientRegistry:
+    """
+    이름별 Prisma 클라이언트 레지스트리
+
+    서비스는 get_client() 로 연결된 공유 클라이언트를 받고, 앱 시작/종료 시 startup()/shutdown() 을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[Optional[str]], Any] = default_client_factory,
+        connect_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        self._client_factory = client_factory
+        self._connect_retries = connect_retries
+        self._retry_backoff = retry_backoff
+        self._clients: Dict[str, Any] = {}
+        self._urls: Dict[str, Optional[str]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        # 해제 대기 중인 이전 클라이언트 (작업 -> (이름, 클라이언트))
+        self._retiring: Dict[asyncio.Task, Tuple[str, Any]] = {}
+
+    def register(self, name: str = DEFAULT_CLIENT, datasource_url: Optional[str] = None) -> None:
+        """클라이언트 데이터소스 등록 (미등록 이름은 DATABASE_URL 사용)"""
+        self._urls[name] = datasource_url
+
+    def _datasource_url(self, name: str) -> Optional[str]:
+        settings = get_settings()
+        url = self._urls.get(name) or os.environ.get("DATABASE_URL")
+        return with_pool_params(url, settings.db_pool_size, settings.db_pool_timeout)
+
+    def _lock(self, name: str) -> asyncio.Lock:
+        if name not in self._locks:
+            self._locks[name] = asyncio.Lock()
+        return self._locks[name]
+
+    @staticmethod
+    def _is_connected(client: Any) -> bool:
+        is_connected = getattr(client, "is_connected", None)
+        if is_connected is None:
+            return True
+        connected = is_connected()
+        return connected if isinstance(connected, bool) else True
+
+    async def get_client(self, name: str = DEFAULT_CLIENT) -> Any:
+        """연결된 공유 클라이언트 반환 (처음 호출 시 연결)"""
+        client = self._clients.get(name)
+        if client is not None and self._is_connected(client):
+            return client
+
+        async with self._lock(name):
+            client = self._clients.get(name)
+            if client is not None and self._is_connected(client):
+                return client
+            client = await self._connect(name, client)
+            self._clients[name] = client
+            return client
+
+    @staticmethod
+    async def _open(client: Any) -> None:
+        try:
+            result = client.connect(timeout=get_settings().db_connect_timeout)
+        except TypeError:
+            # timeout 인자를 받지 않는 클라이언트
+            result = client.connect()
+        await _maybe_await(result)
+
+    async def _connect(self, name: str, client: Any = None) -> Any:
+        """재시도하며 연결 (실패한 클라이언트는 버리고 새로 생성)"""
+        last_error: Optional[BaseException] = None
+        for attempt in range(self._connect_retries):
+            if client is None:
+                client = self._client_factory(self._datasource_url(name))
+            try:
+                await self._open(client)
+            except Exception as e:
+                last_error = e
+                logger.warning(f"데이터베이스 연결 실패 ({name}, {attempt + 1}/{self._connect_retries}): {e}")
+                client = None
+                await asyncio.sleep(self._retry_backoff * (2 ** attempt))
+                continue
+            logger.info(f"데이터베이스 클라이언트 연결됨: {name}")
+            return client
+        raise ConnectionError(f"데이터베이스에 연결할 수 없습니다 ({name}): {last_error}")
+
+    async def reconnect(self, name: str = DEFAULT_CLIENT, stale: Any = None) -> Any:
+        """
+        새 클라이언트로 다시 연결
+
+        새 클라이언트가 연결된 뒤에 교체하고, 이전 클라이언트는 RETIRED_CLIENT_GRACE 초 뒤에 해제합니다.
+        (이미 이전 클라이언트를 받아 쿼리 중인 요청을 끊지 않음, 새 연결에 실패하면 이전 클라이언트 유지)
+
+        stale 을 넘기면 현재 클라이언트가 그 클라이언트일 때만 다시 연결합니다.
+        같은 클라이언트로 실패한 요청들이 몰려도 재연결은 한 번만 하고, 나머지는 교체된 클라이언트를 받습니다.
+        """
+        async with self._lock(name):
+            current = self._clients.get(name)
+            if stale is not None and current is not stale and current is not None:
+                return current
+            client = await self._connect(name)
+            old = self._clients.get(name)
+            self._clients[name] = client
+            logger.info(f"데이터베이스 클라이언트 재연결됨: {name}")
+        if old is not None and old is not client:
+            task = asyncio.create_task(self._disconnect_later(name, old))
+            self._retiring[task] = (name, old)
+            task.add_done_callback(lambda done: self._retiring.pop(done, None))
+        return client
+
+    @staticmethod
+    async def _disconnect(name: str, client: Any) -> None:
+        try:
+            await _maybe_await(client.disconnect())
+        except Exception as e:
+            logger.debug(f"이전 클라이언트 해제 실패 ({name}): {e}")
+
+    async def _disconnect_later(self, name: str, client: Any) -> None:
+        await asyncio.sleep(RETIRED_CLIENT_GRACE)
+        await self._disconnect(name, client)
+
+    @staticmethod
+    async def _probe(client: Any) -> None:
+        if hasattr(client, "query_raw"):
+            await asyncio.wait_for(_maybe_await(client.query_raw("SELECT 1")), get_settings().db_connect_timeout)
+
+    async def health_check(self, name: str = DEFAULT_CLIENT, reconnect: bool = True) -> Dict[str, Any]:
+        """SELECT 1 로 상태 확인, 실패하면 재연결 후 다시 확인"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        client = None
+        try:
+            client = await self.get_client(name)
+            await self._probe(client)
+            return {"name": name, "healthy": True, "latency_ms": round((loop.time() - started) * 1000, 2)}
+        except Exception as e:
+            logger.error(f"데이터베이스 상태 확인 실패 ({name}): {e}")
+            error = str(e)
+        if not reconnect:
+            return {"name": name, "healthy": False, "error": error}
+        try:
+            # 재연결만으로는 쿼리가 되는지 알 수 없으므로 새 클라이언트로 다시 확인
+            await self._probe(await self.reconnect(name, stale=client))
+            return {
+                "name": name,
+                "healthy": True,
+                "reconnected": True,
+                "error": error,
+                "latency_ms": round((loop.time() - started) * 1000, 2),
+            }
+        except Exception as reconnect_error:
+            logger.error(f"재연결 후 상태 확인 실패 ({name}): {reconnect_error}")
+            return {"name": name, "healthy": False, "reconnected": False, "error": str(reconnect_error)}
+
+    async def _health_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            for name in list(self._clients):
+                await self.health_check(name)
+
+    async def startup(self, *names: str) -> None:
+        """앱 시작 훅: 클라이언트 연결 및 주기적 상태 확인 시작"""
+        for name in names or (DEFAULT_CLIENT,):
+            await self.get_client(name)
+        interval = get_settings().db_health_check_interval
+        if interval > 0 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop(interval))
+
+    async def shutdown(self) -> None:
+        """앱 종료 훅: 상태 확인 중단 및 모든 클라이언트 연결 해제"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        # 해제 대기 중인 이전 클라이언트는 바로 해제
+        for task, (name, client) in list(self._retiring.items()):
+            task.cancel()
+            await self._disconnect(name, client)
+        self._retiring.clear()
+
+        for name, client in list(self._clients.items()):
+            try:
+                await _maybe_await(client.disconnect())
+                logger.info(f"데이터베이스 클라이언트 연결 해제됨: {name}")
+            except Exception as e:
+                logger.error(f"데이터베이스 연결 해제 실패 ({name}): {e}")
+        self._clients.clear()
+
+    @asynccontextmanager
+    async def lifespan(self, app: Any = None, *names: str):
+        """FastAPI lifespan 으로 사용할 수 있는 시작/종료 컨텍스트"""
+        await self.startup(*names)
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
+    @asynccontextmanager
+    async def session(self, name: str = DEFAULT_CLIENT):
+        """
+        공유 클라이언트 세션 (연결 오류가 나면 다음 사용 전에 재연결)
+
+        세션을 시작한 클라이언트가 아직 현재 클라이언트일 때만 재연결하므로,
+        같은 장애로 동시에 실패한 요청들이 각자 새 클라이언트를 만들지 않습니다.
+        """
+        client = await self.get_client(name)
+        try:
+            yield client
+        except Exception as e:
+            if is_connection_error(e):
+                logger.warning(f"데이터베이스 연결 오류 감지, 재연결합니다 ({name}): {e}")
+                try:
+                    await self.reconnect(name, stale=client)
+                except Exception as reconnect_error:
+                    logger.error(f"재연결 실패 ({name}): {reconnect_error}")
+            raise
+
+
+# 프로세스 전역 레지스트리
+prisma_registry = PrismaClientRegistry()
+
+
+async def get_prisma_client(name: str = DEFAULT_CLIENT) -> Any:
+    """공유 Prisma 클라이언트 반환 (FastAPI 의존성으로도 사용)"""
+    return await prisma_registry.get_client(name)
@@ -225,28 +225,13 @@ class Prisma:
 async def database_session():
     """데이터베이스 세션 컨텍스트 매니저
 
-    테스트에서는 모의 객체를 반환하고, 실제 환경에서는 Prisma 클라이언트를 반환합니다.
+    애플리케이션 수명 동안 공유되는 Prisma 클라이언트를 반환합니다 (세션마다 연결/해제하지 않음).
+    테스트 환경에서는 레지스트리가 모의 클라이언트를 반환합니다.
     """
-    from contextlib import asynccontextmanager
+    from .client_registry import prisma_registry
 
-    # 테스트 환경 확인
-    if os.environ.get("TESTING") == "1":
-        mock_client = MagicMock()
-        yield mock_client
-    else:
-        try:
-            from prisma import Prisma
-
-            client = Prisma()
-            client.connect()
-            yield client
-        except ImportError:
-            mock_client = MagicMock()
-            yield mock_client
-        finally:
-            # 세션 종료 시 자원 정리 (실제 환경에서만)
-            if "client" in locals() and not os.environ.get("TESTING") == "1":
-                client.disconnect()
+    async with prisma_registry.session() as client:
+        yield client
 
 
 # 데이터베이스 트랜잭션을 위한 컨텍스트 매니저
@@ -259,13 +244,6 @@ async def database_transaction():
         yield mock_tx
     else:
         async with database_session() as client:
-            try:
-                # 실제 환경에서는 Prisma 트랜잭션 시작
-                tx = await client.tx()
+            # 블록이 예외로 끝나면 Prisma 가 롤백, 정상 종료 시 커밋
+            async with client.tx() as tx:
                 yield tx
-                await tx.commit()
-            except Exception as e:
-                # 오류 발생 시 롤백
-                if "tx" in locals():
-                    await tx.rollback()
-                raise
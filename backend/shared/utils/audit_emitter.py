@@ -0,0 +1,347 @@
+"""
+감사 로그 배치 전송기
+
+서비스는 emit() 으로 감사 이벤트를 버퍼에 넣기만 하고, 백그라운드 작업이 묶어서
+admin_api 의 일괄 수집 API(POST /audit-logs/bulk)로 전송합니다.
+- batch_size 개가 모이거나 flush_interval 초가 지나면 전송
+- 일시적 오류(연결 실패, 5xx, 429)는 지수 백오프로 재시도
+- 재시도 후에도 실패하면 배치를 spill_dir 에 NDJSON 파일로 보관하고, 전송이 다시 성공하면 재전송
+- 버퍼가 max_buffer 를 넘으면 넘친 이벤트를 바로 디스크에 보관 (메모리 상한)
+- 이벤트마다 id 를 붙여 보내므로 일부만 저장된 배치를 다시 보내도 수집 API 가 중복 저장하지 않음
+
+사용 예:
+    emitter = get_audit_emitter()
+    await emitter.start()
+    emitter.emit({"level": "info", "service": "fleet", "category": "operation", "message": "차량 등록"})
+    ...
+    await emitter.close()
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AuditDeliveryError(Exception):
+    """감사 이벤트 배치 전송 실패"""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class AuditEmitter:
+    """감사 이벤트를 버퍼링해 일괄 전송하는 비동기 전송기"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+        max_buffer: int = 100_000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        spill_dir: Optional[str] = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            base_url: admin_api 감사 API 기본 URL (기본값: AUDIT_API_URL)
+            batch_size: 요청 한 번에 보낼 최대 이벤트 수
+            flush_interval: 배치가 차지 않아도 전송하는 주기(초)
+            max_buffer: 메모리에 보관할 최대 이벤트 수
+            max_retries: 배치당 재시도 횟수
+            retry_backoff: 재시도 기본 대기 시간(초)
+            spill_dir: 전송 실패 이벤트 보관 디렉터리 (기본값: AUDIT_SPILL_DIR)
+            timeout: 요청 타임아웃(초)
+            transport: HTTP 전송 계층 (테스트/부하 테스트용)
+        """
+        settings = get_settings()
+        self.base_url = (base_url or settings.audit_api_url).rstrip("/")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.spill_dir = spill_dir or settings.audit_spill_dir
+        self.timeout = timeout
+        self._transport = transport
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closing = False
+        self._idle: Optional[asyncio.Event] = None
+        # emit() 에서 넘친 이벤트와 이를 디스크에 쓰는 작업 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        self._overflow: List[Dict[str, Any]] = []
+        self._overflow_task: Optional[asyncio.Task] = None
+
+        # 전송 통계
+        self.sent = 0
+        self.spilled = 0
+        self.rejected = 0
+
+    # ---------- 수명 주기 ----------
+
+    async def start(self) -> None:
+        """백그라운드 전송 작업 시작 (앱 시작 시 호출)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=self._transport,
+        )
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """남은 이벤트를 전송(실패 시 디스크 보관)하고 종료 (앱 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        if self._overflow_task is not None:
+            await self._overflow_task
+            self._overflow_task = None
+        await self._client.aclose()
+        self._client = None
+
+    async def __aenter__(self) -> "AuditEmitter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    # ---------- 이벤트 추가 ----------
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        """
+        감사 이벤트를 버퍼에 추가 (블로킹하지 않음)
+
+        Args:
+            event: AuditLogCreate 형식의 이벤트 (id 가 없으면 새 ID, timestamp 가 없으면 현재 시각)
+        """
+        if "id" not in event or "timestamp" not in event:
+            event = {"id": uuid.uuid4().hex, "timestamp": datetime.now(timezone.utc), **event}
+        self._buffer.append(event)
+
+        if len(self._buffer) > self.max_buffer:
+            # 메모리 상한 초과: 가장 오래된 이벤트부터 디스크로
+            overflow = [self._buffer.popleft() for _ in range(len(self._buffer) - self.max_buffer)]
+            self._spill_overflow(overflow)
+
+        if self._wakeup is not None and len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """현재 버퍼의 이벤트를 모두 전송할 때까지 대기"""
+        if self._task is None:
+            return
+        while self._buffer or not self._idle.is_set():
+            self._wakeup.set()
+            await asyncio.sleep(0.01)
+
+    @property
+    def pending(self) -> int:
+        """전송 대기 중인 이벤트 수"""
+        return len(self._buffer)
+
+    # ---------- 전송 ----------
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        count = min(self.batch_size, len(self._buffer))
+        return [self._buffer.popleft() for _ in range(count)]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            self._idle.clear()
+            try:
+                delivered = True
+                while self._buffer:
+                    batch = self._take_batch()
+                    if not await self._deliver(batch):
+                        delivered = False
+                        # 수집 API 장애 중에는 남은 이벤트도 디스크로 (재시도 폭주 방지)
+                        while self._buffer:
+                            await asyncio.to_thread(self._spill, self._take_batch())
+                        break
+                if delivered and not self._closing:
+                    await self._replay_spilled()
+            except Exception as e:
+                logger.error(f"감사 이벤트 전송 작업 오류: {e}")
+            finally:
+                self._idle.set()
+
+            if self._closing and not self._buffer:
+                return
+
+    async def _post(self, events: List[Dict[str, Any]]) -> None:
+        """배치 1회 전송 (일시적 오류는 재시도)"""
+        body = json.dumps({"events": events}, ensure_ascii=False, default=_json_default)
+        last_error = ""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.post(
+                    "/audit-logs/bulk", content=body, headers={"Content-Type": "application/json"}
+                )
+                if response.status_code < 300:
+                    rejected = response.json().get("data", {}).get("rejected", [])
+                    if rejected:
+                        self.rejected += len(rejected)
+                        logger.warning(f"잘못된 감사 이벤트 {len(rejected)}건이 거부됨: {rejected[:3]}")
+                    self.sent += len(events) - len(rejected)
+                    return
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    # 재시도해도 성공할 수 없는 요청 (예: 형식 오류)
+                    self.rejected += len(events)
+                    logger.error(f"감사 이벤트 배치 거부됨 (HTTP {response.status_code}): {response.text[:200]}")
+                    return
+                last_error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                last_error = str(e) or type(e).__name__
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_backoff * (2 ** attempt))
+        raise AuditDeliveryError(last_error)
+
+    async def _deliver(self, batch: List[Dict[str, Any]]) -> bool:
+        """배치 전송, 실패하면 디스크에 보관"""
+        try:
+            await self._post(batch)
+            return True
+        except AuditDeliveryError as e:
+            logger.warning(f"감사 이벤트 {len(batch)}건 전송 실패, 디스크에 보관합니다: {e}")
+            await asyncio.to_thread(self._spill, batch)
+            return False
+
+    # ---------- 디스크 보관 ----------
+
+    def _spill_overflow(self, events: List[Dict[str, Any]]) -> None:
+        """넘친 이벤트 보관 (이벤트 루프 안이면 모아서 스레드에서, 루프 밖이면 바로)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._spill(events)
+            return
+        self._overflow.extend(events)
+        if self._overflow_task is None or self._overflow_task.done():
+            self._overflow_task = asyncio.create_task(self._drain_overflow())
+
+    async def _drain_overflow(self) -> None:
+        # 파일을 쓰는 동안 넘친 이벤트는 다음 파일에 함께 보관
+        while self._overflow:
+            events, self._overflow = self._overflow, []
+            try:
+                await asyncio.to_thread(self._spill, events)
+            except OSError as e:
+                logger.error(f"감사 이벤트 {len(events)}건 디스크 보관 실패: {e}")
+
+    def _spill(self, events: List[Dict[str, Any]]) -> None:
+        """이벤트를 NDJSON 파일로 보관 (파일 이름 순서 = 보관 순서)"""
+        if not events:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        name = f"audit-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.ndjson"
+        temp_path = os.path.join(self.spill_dir, f".{name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            for event in events:
+                file.write(json.dumps(event, ensure_ascii=False, default=_json_default))
+                file.write("\n")
+        # 완성된 파일만 재전송 대상이 되도록 이름 변경
+        os.replace(temp_path, os.path.join(self.spill_dir, name))
+        self.spilled += len(events)
+
+    def _spilled_files(self) -> List[str]:
+        if not os.path.isdir(self.spill_dir):
+            return []
+        return sorted(
+            os.path.join(self.spill_dir, name)
+            for name in os.listdir(self.spill_dir)
+            if name.startswith("audit-") and name.endswith(".ndjson")
+        )
+
+    @staticmethod
+    def _read_spilled(path: str) -> List[Dict[str, Any]]:
+        with open(path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    @staticmethod
+    def _rewrite_spilled(path: str, events: List[Dict[str, Any]]) -> None:
+        """보관 파일을 아직 전송하지 못한 이벤트만 남기도록 교체 (다 보냈으면 삭제)"""
+        if not events:
+            os.remove(path)
+            return
+        temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            for event in events:
+                file.write(json.dumps(event, ensure_ascii=False, default=_json_default))
+                file.write("\n")
+        os.replace(temp_path, path)
+
+    async def _replay_spilled(self) -> None:
+        """
+        보관된 이벤트를 오래된 파일부터 재전송 (실패하면 다음 주기에 다시 시도)
+
+        배치가 전송될 때마다 파일에서 해당 이벤트를 지워, 중간에 실패해도 이미 보낸 배치는 다시 보내지 않습니다.
+        """
+        for path in await asyncio.to_thread(self._spilled_files):
+            events = await asyncio.to_thread(self._read_spilled, path)
+            total = len(events)
+            while events:
+                batch, rest = events[:self.batch_size], events[self.batch_size:]
+                try:
+                    await self._post(batch)
+                except AuditDeliveryError as e:
+                    logger.warning(f"보관된 감사 이벤트 재전송 실패 (남은 이벤트 {len(events)}건): {e}")
+                    return
+                await asyncio.to_thread(self._rewrite_spilled, path, rest)
+                self.spilled -= min(self.spilled, len(batch))
+                events = rest
+            if total == 0:
+                await asyncio.to_thread(os.remove, path)
+            logger.info(f"보관된 감사 이벤트 {total}건 재전송 완료")
+            if self._buffer:
+                # 새 이벤트 전송을 오래 막지 않도록 한 파일씩 처리
+                return
+
+
+_emitter: Optional[AuditEmitter] = None
+
+
+def get_audit_emitter() -> AuditEmitter:
+    """프로세스 전역 감사 이벤트 전송기 (설정값 사용)"""
+    global _emitter
+    if _emitter is None:
+        _emitter = AuditEmitter()
+    return _emitter
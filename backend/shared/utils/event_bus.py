@@ -0,0 +1,182 @@
+"""
+서비스 간 이벤트 버스
+
+서비스는 publish() 로 도메인 이벤트(차량 위치 갱신, 정비 요청 상태 변경 ...)를 발행하고,
+게이트웨이처럼 이벤트가 필요한 프로세스는 subscribe() 로 핸들러를 등록한 뒤 start() 합니다.
+- EVENT_BUS_REDIS_URL 이 있으면 Redis pub/sub 채널(cargoro:events:<이벤트>)로 전달
+- 없으면 같은 프로세스 안의 핸들러에만 전달 (개발/테스트용)
+- URL 이 있는데 redis 패키지가 없으면 경고 로그를 남기고 프로세스 안에서만 전달
+
+발행 실패는 로그만 남깁니다. 이벤트는 원래 요청(DB 쓰기)이 끝난 뒤의 알림이므로
+버스 장애가 API 요청을 실패시키지 않도록 합니다.
+
+사용 예:
+    bus = get_event_bus()
+    await bus.publish(VEHICLE_LOCATION_UPDATED, {"vehicle_id": "v-1", "latitude": 37.5, ...})
+
+    bus.subscribe(VEHICLE_LOCATION_UPDATED, handle_location)   # 동기 핸들러
+    await bus.start()
+    ...
+    await bus.close()
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config.settings import get_settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis 가 없는 서비스는 프로세스 내 전달만 사용
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL_PREFIX = "cargoro:events:"
+
+# 이벤트 이름
+VEHICLE_LOCATION_UPDATED = "vehicle.location_updated"
+REPAIR_REQUEST_STATUS_CHANGED = "repair_request.status_changed"
+
+# 수신 연결이 끊겼을 때 다시 시도하기 전 대기 시간(초)
+RECONNECT_DELAY = 1.0
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class EventBus:
+    """Redis pub/sub 기반 이벤트 버스 (Redis 미설정 시 프로세스 내 전달)"""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url
+        if redis_url and aioredis is None:
+            logger.warning(
+                "EVENT_BUS_REDIS_URL 이 설정되었지만 redis 패키지가 없어 이벤트를 이 프로세스 안에서만 전달합니다 "
+                "(다른 서비스로 발행/수신되지 않음)"
+            )
+        self._redis = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        # 통계
+        self.published = 0
+        self.delivered = 0
+
+    @property
+    def distributed(self) -> bool:
+        """Redis 로 프로세스 간 전달하는지 여부"""
+        return aioredis is not None and bool(self.redis_url)
+
+    def _client(self):
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    # ---------- 발행 ----------
+
+    async def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """이벤트 발행 (실패해도 예외를 올리지 않음)"""
+        message = json.dumps(payload, ensure_ascii=False, default=_json_default)
+        self.published += 1
+        if not self.distributed:
+            self._dispatch(event_type, message)
+            return
+        try:
+            await self._client().publish(EVENT_CHANNEL_PREFIX + event_type, message)
+        except Exception as e:
+            logger.warning(f"이벤트 발행 실패 ({event_type}): {e}")
+
+    # ---------- 구독 ----------
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """
+        핸들러 등록 (start() 전에 호출)
+
+        핸들러는 수신 루프에서 바로 호출되므로 블로킹하지 않는 짧은 동기 함수여야 합니다.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    async def start(self) -> None:
+        """Redis 채널 수신 시작 (프로세스 내 전달이면 할 일 없음)"""
+        if not self.distributed or not self._handlers or self._reader is not None:
+            return
+        self._pubsub = self._client().pubsub()
+        await self._pubsub.subscribe(*(EVENT_CHANNEL_PREFIX + event_type for event_type in self._handlers))
+        self._reader = asyncio.create_task(self._read())
+        logger.info(f"이벤트 버스 수신 시작: {', '.join(self._handlers)}")
+
+    async def _read(self) -> None:
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    channel = message["channel"]
+                    self._dispatch(channel[len(EVENT_CHANNEL_PREFIX):], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 재연결 시 redis-py 가 구독 채널을 다시 등록함
+                logger.warning(f"이벤트 버스 수신 오류, {RECONNECT_DELAY}초 후 다시 연결합니다: {e}")
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    def _dispatch(self, event_type: str, message: str) -> None:
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            logger.warning(f"잘못된 이벤트 메시지 ({event_type}): {message[:200]}")
+            return
+        for handler in handlers:
+            try:
+                handler(payload)
+                self.delivered += 1
+            except Exception as e:
+                logger.error(f"이벤트 핸들러 오류 ({event_type}): {e}")
+
+    # ---------- 종료 ----------
+
+    async def close(self) -> None:
+        """수신 중지와 Redis 연결 정리 (앱 종료 시 호출)"""
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """프로세스 전역 이벤트 버스 (설정값 사용)"""
+    global _bus
+    if _bus is None:
+        _bus = EventBus(get_settings().event_bus_redis_url)
+    return _bus
+
+
+async def close_event_bus() -> None:
+    """앱 종료 시 전역 이벤트 버스 정리"""
+    global _bus
+    if _bus is not None:
+        await _bus.close()
+        _bus = None
@@ -57,6 +57,20 @@ def setup_logger(
 
     return logger
 
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈 로거 반환
+
+    핸들러/레벨은 setup_logger 또는 루트 로거 설정을 따릅니다.
+
+    Args:
+        name: 로거 이름 (보통 __name__)
+
+    Returns:
+        로거 인스턴스
+    """
+    return logging.getLogger(name)
+
 def get_request_logger(logger: logging.Logger):
     """
     요청 로깅을 위한 미들웨어 생성
@@ -1,16 +1,31 @@
 """
 공유 모델 변환 유틸리티 - 백엔드 전체에서 활용 가능
+
+DB 행(camelCase)과 Pydantic 모델(snake_case) 간 키 변환은 모든 응답의 모든 행에서 실행되므로
+- 키 단위 변환 결과를 캐시하고 (같은 키는 한 번만 변환)
+- 모델별 필드 맵(DB 키 -> 모델 필드, 필드 -> DB 키)을 클래스당 한 번만 만들고
+- 중첩 값이 없는 행은 재귀 없이 한 번에 변환합니다.
 """
-from typing import Dict, Any, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 import re
 
+T = TypeVar("T")
 
-def snake_to_camel(snake_str: str) -> str:
-    """
-    snake_case 문자열을 camelCase로 변환합니다.
+# 키 변환 캐시 (요청 데이터의 임의 키로 무한히 커지지 않도록 상한을 둠)
+MAX_CACHED_KEYS = 10_000
+_camel_cache: Dict[str, str] = {}
+_snake_cache: Dict[str, str] = {}
 
-    예: "hello_world" -> "helloWorld"
-    """
+_CAMEL_BOUNDARY = re.compile(r"(.)([A-Z][a-z]+)")
+_LOWER_UPPER_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
+# 모델 클래스별 (DB 키 -> 모델 입력 키, 모델 필드 -> DB 키)
+_field_maps: Dict[type, Tuple[Dict[str, str], Dict[str, str]]] = {}
+
+_NESTED_TYPES = (dict, list)
+
+
+def _convert_snake_to_camel(snake_str: str) -> str:
     # 앞뒤 밑줄 처리를 위해 문자열 분리
     prefix = ""
     suffix = ""
@@ -40,20 +55,61 @@ def snake_to_camel(snake_str: str) -> str:
     return prefix + camel + suffix
 
 
-def camel_to_snake(camel_str: str) -> str:
+def snake_to_camel(snake_str: str) -> str:
     """
-    camelCase 문자열을 snake_case로 변환합니다.
+    snake_case 문자열을 camelCase로 변환합니다. (결과 캐시)
 
-    예: "helloWorld" -> "hello_world"
+    예: "hello_world" -> "helloWorld"
     """
-    # 첫 번째 패턴: 소문자 뒤의 대문자 앞에 밑줄 삽입
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_str)
+    try:
+        return _camel_cache[snake_str]
+    except KeyError:
+        camel = _convert_snake_to_camel(snake_str)
+        if len(_camel_cache) < MAX_CACHED_KEYS:
+            _camel_cache[snake_str] = camel
+        return camel
 
-    # 두 번째 패턴: 소문자나 숫자 뒤의 대문자 앞에 밑줄 삽입
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
 
-    # 소문자로 변환
-    return s2.lower()
+def camel_to_snake(camel_str: str) -> str:
+    """
+    camelCase 문자열을 snake_case로 변환합니다. (결과 캐시)
+
+    예: "helloWorld" -> "hello_world", "vehicleID" -> "vehicle_id"
+    """
+    try:
+        return _snake_cache[camel_str]
+    except KeyError:
+        # 소문자 뒤의 대문자+소문자 앞, 소문자나 숫자 뒤의 대문자 앞에 밑줄 삽입
+        snake = _LOWER_UPPER_BOUNDARY.sub(r"\1_\2", _CAMEL_BOUNDARY.sub(r"\1_\2", camel_str)).lower()
+        if len(_snake_cache) < MAX_CACHED_KEYS:
+            _snake_cache[camel_str] = snake
+        return snake
+
+
+def _convert_value(value: Any, convert_dict) -> Any:
+    if isinstance(value, dict):
+        return convert_dict(value)
+    return [convert_dict(item) if isinstance(item, dict) else item for item in value]
+
+
+def _is_flat(data: Dict[str, Any]) -> bool:
+    for value in data.values():
+        if isinstance(value, _NESTED_TYPES):
+            return False
+    return True
+
+
+def _convert_keys(data: Dict[str, Any], key_map: Dict[str, str], convert_key, convert_nested) -> Dict[str, Any]:
+    if _is_flat(data):
+        # 평평한 행: 재귀 없이 한 번에 변환
+        return {key_map.get(key) or convert_key(key): value for key, value in data.items()}
+
+    return {
+        key_map.get(key) or convert_key(key): (
+            _convert_value(value, convert_nested) if isinstance(value, _NESTED_TYPES) else value
+        )
+        for key, value in data.items()
+    }
 
 
 def convert_dict_keys_to_camel(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -64,22 +120,7 @@ def convert_dict_keys_to_camel(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        # 중첩된 구조 처리
-        if isinstance(value, dict):
-            value = convert_dict_keys_to_camel(value)
-        elif isinstance(value, list):
-            value = [
-                convert_dict_keys_to_camel(item) if isinstance(item, dict) else item
-                for item in value
-            ]
-
-        # 키 변환
-        camel_key = snake_to_camel(key)
-        result[camel_key] = value
-
-    return result
+    return _convert_keys(data, _camel_cache, snake_to_camel, convert_dict_keys_to_camel)
 
 
 def convert_dict_keys_to_snake(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,43 +131,124 @@ def convert_dict_keys_to_snake(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        # 중첩된 구조 처리
-        if isinstance(value, dict):
-            value = convert_dict_keys_to_snake(value)
-        elif isinstance(value, list):
-            value = [
-                convert_dict_keys_to_snake(item) if isinstance(item, dict) else item
-                for item in value
-            ]
+    return _convert_keys(data, _snake_cache, camel_to_snake, convert_dict_keys_to_snake)
 
-        # 키 변환
-        snake_key = camel_to_snake(key)
-        result[snake_key] = value
 
-    return result
+def field_maps(model_class: type) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    모델 클래스의 필드 맵을 반환합니다. (클래스당 한 번 계산)
 
+    :param model_class: Pydantic 모델 클래스
+    :return: (DB/camelCase 키 -> 모델 입력 키, 모델 필드 이름 -> DB 키)
+    """
+    try:
+        return _field_maps[model_class]
+    except KeyError:
+        pass
+
+    fields = getattr(model_class, "model_fields", None) or getattr(model_class, "__fields__", {})
+    config = getattr(model_class, "model_config", None) or {}
+    populate_by_name = bool(config.get("populate_by_name"))
+
+    to_model: Dict[str, str] = {}
+    to_db: Dict[str, str] = {}
+    aliases: Dict[str, str] = {}
+    for name, field in fields.items():
+        alias = getattr(field, "validation_alias", None)
+        if not isinstance(alias, str):
+            alias = getattr(field, "alias", None)
+        # 별칭만 받는 모델이면 별칭으로, 아니면 필드 이름으로 전달
+        target = alias if alias and not populate_by_name else name
+        camel = snake_to_camel(name)
+        to_model[name] = target
+        to_model[camel] = target
+        to_db[name] = camel
+        if alias:
+            aliases[alias] = target
+
+    # 명시적 별칭이 파생된 camelCase 키보다 우선
+    to_model.update(aliases)
+    _field_maps[model_class] = (to_model, to_db)
+    return _field_maps[model_class]
+
+
+def register_models(*model_classes: type) -> None:
+    """
+    모델 클래스들의 필드 맵을 미리 계산합니다. (모듈 임포트 시 호출)
 
-def model_to_db_dict(model_instance, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
+    :param model_classes: Pydantic 모델 클래스들
+    """
+    for model_class in model_classes:
+        field_maps(model_class)
+
+
+def _row_to_dict(data: Any) -> Dict[str, Any]:
+    # Prisma 모델 등 Pydantic 인스턴스는 딕셔너리로 변환
+    if isinstance(data, dict):
+        return data
+    if hasattr(data, "model_dump"):
+        return data.model_dump()
+    if hasattr(data, "dict"):
+        return data.dict()
+    return dict(data)
+
+
+def model_to_db_dict(
+    model_instance, exclude: Optional[Iterable[str]] = None, exclude_unset: bool = False
+) -> Dict[str, Any]:
     """
     Pydantic 모델 인스턴스를 딕셔너리로 변환하고 키를 camelCase로 변환합니다.
     DB 저장용으로 사용합니다.
 
     :param model_instance: Pydantic 모델 인스턴스
-    :param exclude: 제외할 필드 목록
+    :param exclude: 제외할 필드 목록 (snake_case)
+    :param exclude_unset: 요청에 없던 필드 제외 (부분 업데이트용)
     :return: camelCase 키를 가진 딕셔너리
     """
-    exclude = exclude or []
+    exclude = set(exclude or [])
 
     # Pydantic v2 호환
     if hasattr(model_instance, "model_dump"):
-        data = model_instance.model_dump(exclude=set(exclude))
+        data = model_instance.model_dump(exclude=exclude, exclude_unset=exclude_unset)
     # Pydantic v1 호환
     else:
-        data = model_instance.dict(exclude=set(exclude))
+        data = model_instance.dict(exclude=exclude, exclude_unset=exclude_unset)
+
+    to_db = field_maps(type(model_instance))[1]
+    return _convert_keys(data, to_db, snake_to_camel, convert_dict_keys_to_camel)
+
 
-    return convert_dict_keys_to_camel(data)
+def db_row_to_model_dict(model_class: type, data: Any) -> Dict[str, Any]:
+    """
+    DB 행(camelCase)을 모델 생성에 쓸 딕셔너리로 변환합니다.
+
+    모델 필드는 미리 계산한 필드 맵으로, 그 밖의 키(관계 등)는 snake_case로 변환합니다.
+    """
+    data = _row_to_dict(data)
+    to_model = field_maps(model_class)[0]
+    return _convert_keys(data, to_model, camel_to_snake, convert_dict_keys_to_snake)
+
+
+def db_to_model(model_class: Type[T], data: Any) -> T:
+    """
+    DB에서 가져온 camelCase 키를 가진 행을 Pydantic 모델 인스턴스로 변환합니다.
+
+    :param model_class: 변환할 Pydantic 모델 클래스
+    :param data: camelCase 키를 가진 딕셔너리 또는 Prisma 모델
+    :return: Pydantic 모델 인스턴스
+    """
+    return model_class(**db_row_to_model_dict(model_class, data))
+
+
+def db_rows_to_models(model_class: Type[T], rows: Iterable[Any]) -> List[T]:
+    """
+    여러 DB 행을 Pydantic 모델 인스턴스 목록으로 변환합니다.
+
+    :param model_class: 변환할 Pydantic 모델 클래스
+    :param rows: camelCase 키를 가진 행 목록
+    :return: Pydantic 모델 인스턴스 목록
+    """
+    return [model_class(**db_row_to_model_dict(model_class, row)) for row in rows]
 
 
 def db_dict_to_model(data: Dict[str, Any], model_class) -> Any:
@@ -138,14 +260,7 @@ def db_dict_to_model(data: Dict[str, Any], model_class) -> Any:
     :param model_class: 변환할 Pydantic 모델 클래스
     :return: Pydantic 모델 인스턴스
     """
-    # 데이터의 최상위 키만 snake_case로 변환 (중첩된 딕셔너리는 유지)
-    snake_case_data = {}
-    for key, value in data.items():
-        snake_key = camel_to_snake(key)
-        snake_case_data[snake_key] = value
-
-    # 모델 인스턴스 생성
-    return model_class(**snake_case_data)
+    return db_to_model(model_class, data)
 
 
 def find_camel_case_variables(content: str) -> List[str]:
@@ -0,0 +1,209 @@
+"""
+비밀번호 해싱 서비스
+
+bcrypt 해시/검증은 한 번에 수백 ms 동안 CPU 를 사용하므로 async 핸들러에서 바로 호출하면
+그동안 이벤트 루프 전체가 멈춥니다. PasswordHasher 는 해싱을 크기가 정해진 작업자 풀에서 실행합니다.
+- 동시 실행 수는 작업자 수로 제한하고, 자리를 기다리다 queue_timeout 을 넘기면 PasswordHashingBusy
+- bcrypt 는 해싱 중 GIL 을 놓으므로 기본은 스레드 풀 (PASSWORD_HASH_EXECUTOR=process 로 프로세스 풀 사용 가능)
+- verify_and_update(): 검증과 함께 현재 설정(라운드 수, 스킴)으로 다시 해싱한 값을 돌려주므로
+  로그인 성공 시 저장하면 설정 변경 후 해시가 자연스럽게 갱신됩니다.
+
+동기 라우트(스레드 풀에서 실행되는 def 핸들러)는 *_sync 메서드를 사용합니다.
+이미 작업 스레드이므로 그 자리에서 실행하되 같은 작업자 수로 동시 실행을 제한합니다.
+
+사용 예:
+    hasher = get_password_hasher()
+    valid, new_hash = await hasher.verify_and_update(password, user.password_hash)
+    if valid and new_hash:
+        await save_password_hash(user.id, new_hash)
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 작업자 수를 지정하지 않았을 때 상한 (CPU 수와 비교해 작은 값 사용)
+DEFAULT_MAX_WORKERS = 4
+
+
+class PasswordHashingBusy(Exception):
+    """해싱 작업자 자리를 queue_timeout 안에 얻지 못함 (요청 폭주)"""
+
+
+def _create_context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+# 프로세스 풀 작업자에서 사용하는 컨텍스트 (initializer 에서 생성)
+_worker_context: Optional[CryptContext] = None
+
+
+def _init_worker(rounds: int) -> None:
+    global _worker_context
+    _worker_context = _create_context(rounds)
+
+
+def _worker_hash(password: str) -> str:
+    return _worker_context.hash(password)
+
+
+def _worker_verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return _worker_context.verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """크기가 정해진 작업자 풀에서 비밀번호를 해싱/검증"""
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: Optional[int] = None,
+        queue_timeout: float = 5.0,
+        executor: str = "thread",
+    ):
+        self.rounds = rounds
+        self.max_workers = max_workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        self.queue_timeout = queue_timeout
+        self.executor_type = executor
+        self.context = _create_context(rounds)
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_slots = threading.BoundedSemaphore(self.max_workers)
+        # 통계
+        self.rejected = 0
+        self.rehashed = 0
+
+    # ---------- 작업자 풀 ----------
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_init_worker, initargs=(self.rounds,)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # 세마포어는 생성한 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    def _function(self, name: str) -> Callable[..., Any]:
+        # 프로세스 풀에는 피클 가능한 모듈 함수를 넘김
+        if self.executor_type == "process":
+            return _worker_hash if name == "hash" else _worker_verify_and_update
+        return getattr(self.context, name)
+
+    async def _run(self, name: str, *args: Any) -> Any:
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PasswordHashingBusy(f"비밀번호 해싱 대기 시간 초과 ({self.queue_timeout}초)")
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._function(name), *args)
+        finally:
+            slots.release()
+
+    def _run_sync(self, name: str, *args: Any) -> Any:
+        if not self._sync_slots.acquire(timeout=self.queue_timeout):
+            self.rejected += 1
+            raise PasswordHashingBusy(f"비밀번호 해싱 대기 시간 초과 ({self.queue_timeout}초)")
+        try:
+            return getattr(self.context, name)(*args)
+        finally:
+            self._sync_slots.release()
+
+    # ---------- async API ----------
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return await self._run("hash", password)
+
+    async def verify(self, password: str, hashed: Optional[str]) -> bool:
+        """비밀번호 검증"""
+        valid, _ = await self.verify_and_update(password, hashed)
+        return valid
+
+    async def verify_and_update(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        비밀번호 검증 + 재해싱
+
+        Returns:
+            (일치 여부, 새 해시) - 저장된 해시가 현재 설정과 다를 때만 새 해시가 있음
+        """
+        if not hashed:
+            return False, None
+        valid, new_hash = await self._run("verify_and_update", password, hashed)
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    # ---------- 동기 API (스레드 풀에서 실행되는 def 라우트용) ----------
+
+    def hash_sync(self, password: str) -> str:
+        """비밀번호 해싱 (동기)"""
+        return self._run_sync("hash", password)
+
+    def verify_sync(self, password: str, hashed: Optional[str]) -> bool:
+        """비밀번호 검증 (동기)"""
+        valid, _ = self.verify_and_update_sync(password, hashed)
+        return valid
+
+    def verify_and_update_sync(self, password: str, hashed: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """비밀번호 검증 + 재해싱 (동기)"""
+        if not hashed:
+            return False, None
+        valid, new_hash = self._run_sync("verify_and_update", password, hashed)
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def shutdown(self) -> None:
+        """작업자 풀 종료 (앱 종료 시 호출)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """프로세스 전역 비밀번호 해싱 서비스 (설정값 사용)"""
+    global _hasher
+    if _hasher is None:
+        settings = get_settings()
+        _hasher = PasswordHasher(
+            rounds=settings.password_hash_rounds,
+            max_workers=settings.password_hash_workers,
+            queue_timeout=settings.password_hash_queue_timeout,
+            executor=settings.password_hash_executor,
+        )
+    return _hasher
+
+
+def close_password_hasher() -> None:
+    """앱 종료 시 전역 해싱 서비스 정리"""
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
@@ -0,0 +1,190 @@
+"""
+서버 실행기
+
+서비스 진입점에서 uvicorn.run 대신 사용하는 공용 실행 함수입니다.
+설정(SERVER_*)으로 워커 수, 이벤트 루프, HTTP 파서, keep-alive, backlog, 종료 대기 시간을 조정합니다.
+- 워커가 2개 이상이면 부모 프로세스가 소켓을 한 번 열고(pre-fork) 워커 프로세스들이 같은 소켓에서 연결을 받습니다.
+  워커는 앱을 import 문자열로 다시 불러오므로 app_path("모듈:변수")를 넘기고, 없으면 __main__ 모듈에서 찾습니다.
+- 이벤트 루프/HTTP 파서는 uvloop/httptools 가 설치되어 있으면 사용하고 선택 결과를 로그로 남깁니다.
+- 종료 신호(SIGTERM)를 받으면 새 연결을 받지 않고 처리 중인 요청을 SERVER_GRACEFUL_TIMEOUT 까지 기다립니다.
+- 설치된 uvicorn 버전이 지원하지 않는 옵션은 경고 후 무시합니다.
+
+프로세스 메모리 캐시(권한 캐시, 구독 허브 등)는 워커마다 따로 유지됩니다.
+
+JSON 응답은 FastAPI(default_response_class=default_response_class()) 로 앱을 만들면
+orjson 이 설치된 경우 ORJSONResponse 를 사용합니다.
+
+사용 예:
+    if __name__ == "__main__":
+        run_server(app, app_path="lib.server:app", port=port)
+
+컨테이너에서는 uvicorn CLI 대신:
+    python -m shared.utils.server_launcher main:app --port 8000
+"""
+import argparse
+import importlib.util
+import inspect
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional, Type
+
+import uvicorn
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from ..config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def default_response_class() -> Type[JSONResponse]:
+    """orjson 이 설치되어 있으면 ORJSONResponse, 없으면 JSONResponse"""
+    return ORJSONResponse if _installed("orjson") else JSONResponse
+
+
+def resolve_loop(loop: str) -> str:
+    """이벤트 루프 설정값을 uvicorn loop 옵션으로 변환"""
+    if loop in ("auto", "uvloop"):
+        if _installed("uvloop"):
+            return "uvloop"
+        if loop == "uvloop":
+            logger.warning("uvloop 가 설치되어 있지 않아 asyncio 이벤트 루프를 사용합니다")
+        return "asyncio"
+    return loop
+
+
+def resolve_http(http: str) -> str:
+    """HTTP 파서 설정값을 uvicorn http 옵션으로 변환"""
+    if http in ("auto", "httptools"):
+        if _installed("httptools"):
+            return "httptools"
+        if http == "httptools":
+            logger.warning("httptools 가 설치되어 있지 않아 h11 HTTP 파서를 사용합니다")
+        return "h11"
+    return http
+
+
+def _main_app_path(app: Any) -> Optional[str]:
+    """__main__ 모듈에 정의된(또는 import 된) 앱의 import 문자열"""
+    main = sys.modules.get("__main__")
+    attribute = next((name for name, value in vars(main).items() if value is app), None) if main else None
+    if attribute is None:
+        return None
+    spec = getattr(main, "__spec__", None)
+    if spec is not None:
+        module = spec.name
+    elif getattr(main, "__file__", None):
+        # 스크립트로 실행하면 스크립트 디렉터리가 sys.path[0] 이므로 파일 이름으로 import 가능
+        module = os.path.splitext(os.path.basename(main.__file__))[0]
+    else:
+        return None
+    return f"{module}:{attribute}"
+
+
+def _supported(options: Dict[str, Any]) -> Dict[str, Any]:
+    """설치된 uvicorn.run 이 받는 옵션만 남김"""
+    parameters = inspect.signature(uvicorn.run).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return options
+    unsupported = [name for name, value in options.items() if name not in parameters and value is not None]
+    if unsupported:
+        logger.warning(
+            f"uvicorn {uvicorn.__version__} 에서 지원하지 않는 옵션을 무시합니다: {', '.join(unsupported)}"
+        )
+    return {name: value for name, value in options.items() if name in parameters}
+
+
+def server_options(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    **overrides: Any,
+) -> Dict[str, Any]:
+    """설정값으로 uvicorn.run 옵션 구성 (overrides 가 우선)"""
+    settings = get_settings()
+    workers = settings.server_workers if workers is None else workers
+    options = {
+        "host": host or settings.api_host,
+        "port": port or settings.api_port,
+        "workers": workers or os.cpu_count() or 1,
+        "loop": resolve_loop(settings.server_loop),
+        "http": resolve_http(settings.server_http),
+        "timeout_keep_alive": settings.server_keepalive_timeout,
+        "backlog": settings.server_backlog,
+        "timeout_graceful_shutdown": settings.server_graceful_timeout,
+        "limit_concurrency": settings.server_limit_concurrency,
+        "access_log": settings.server_access_log,
+    }
+    options.update(overrides)
+    return options
+
+
+def run_server(
+    app: Any,
+    *,
+    app_path: Optional[str] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    reload: bool = False,
+    **overrides: Any,
+) -> None:
+    """
+    공용 설정으로 uvicorn 서버 실행
+
+    Args:
+        app: ASGI 앱 또는 import 문자열
+        app_path: 워커/리로드에서 앱을 불러올 import 문자열 (예: "lib.server:app")
+        host, port, workers: 설정값 대신 사용할 값
+        reload: 코드 변경 시 재시작 (개발용, 워커 1개)
+        overrides: 그 밖의 uvicorn.run 옵션 (예: log_level="info")
+    """
+    options = server_options(host=host, port=port, workers=workers, reload=reload, **overrides)
+    target = app
+    if options["workers"] > 1 or reload:
+        target = app if isinstance(app, str) else app_path or _main_app_path(app)
+        if target is None:
+            logger.warning("앱 import 문자열을 찾을 수 없어 워커 1개로 실행합니다 (app_path 지정 필요)")
+            target = app
+            options.update(workers=1, reload=False)
+    if reload:
+        options["workers"] = 1
+
+    logger.info(
+        f"서버 시작: {options['host']}:{options['port']} workers={options['workers']} "
+        f"loop={options['loop']} http={options['http']} json={default_response_class().__name__} "
+        f"keep-alive={options['timeout_keep_alive']}s backlog={options['backlog']}"
+    )
+    uvicorn.run(target, **_supported(options))
+
+
+def main(argv=None) -> None:
+    """uvicorn CLI 대신 사용하는 실행 명령 (python -m shared.utils.server_launcher main:app)"""
+    parser = argparse.ArgumentParser(description="공용 설정(SERVER_*)으로 uvicorn 서버 실행")
+    parser.add_argument("app", help="앱 import 문자열 (예: main:app)")
+    parser.add_argument("--host", default=None, help="호스트 (기본: API_HOST)")
+    parser.add_argument("--port", type=int, default=None, help="포트 (기본: PORT 또는 API_PORT)")
+    parser.add_argument("--workers", type=int, default=None, help="워커 수 (기본: SERVER_WORKERS)")
+    parser.add_argument("--reload", action="store_true", help="코드 변경 시 재시작 (개발용)")
+    parser.add_argument("--log-level", default="info", help="로그 레벨")
+    args = parser.parse_args(argv)
+
+    # uvicorn CLI 와 같이 현재 디렉터리의 모듈을 불러올 수 있도록 함
+    sys.path.insert(0, os.getcwd())
+    port = args.port or (int(os.environ["PORT"]) if os.getenv("PORT") else None)
+    run_server(
+        args.app,
+        host=args.host,
+        port=port,
+        workers=args.workers,
+        reload=args.reload,
+        log_level=args.log_level,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+서비스 서버 실행 방식 처리량 벤치마크
+
+서비스 앱을 실행 방식별로 별도 프로세스에서 띄우고 같은 부하를 주어 초당 처리 요청 수와 지연 시간을 비교합니다.
+- current: 기존 진입점과 같은 uvicorn.run(app, host, port) (워커 1개, loop/http auto, 기본 JSONResponse)
+- asyncio-h11: uvicorn[standard] 없이 설치된 경우 (loop=asyncio, http=h11, 기본 JSONResponse)
+- launcher: shared.utils.server_launcher.run_server (SERVER_* 설정, 워커 --workers 개, orjson 있으면 ORJSONResponse)
+
+부하는 keep-alive 연결 --connections 개가 --duration 초 동안 GET 을 반복하는 asyncio 클라이언트가 만듭니다.
+부하 생성기도 같은 머신에서 실행되므로 CPU 수가 적으면 워커 수를 늘린 효과가 작게 나옵니다.
+서비스 의존성(DB, Prisma 클라이언트 등)이 없어 앱을 불러오지 못하면 해당 대상은 건너뜁니다.
+synthetic 대상은 서비스 의존성 없이 차량 목록 형태의 JSON(--items 개)을 돌려주는 앱입니다.
+analytics-api, payment-api 는 패키지 상대 import 를 사용해 모듈 경로로 불러올 수 없어 제외합니다.
+
+사용법: python scripts/benchmark_server_launcher.py [--targets synthetic,gateway] [--modes current,launcher]
+                                                      [--workers 4] [--connections 64] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import re
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "backend")
+sys.path.insert(0, BACKEND_DIR)
+
+# 대상 이름 -> (실행 디렉터리, 앱 import 문자열, 요청 경로)
+TARGETS = {
+    "synthetic": (SCRIPTS_DIR, "benchmark_server_launcher:app", "/vehicles"),
+    "gateway": ("gateway", "main:app", "/health"),
+    "gateway-simple": ("gateway", "gateway:app", "/"),
+    "core_api": ("services/core_api", "main:app", "/health"),
+    "admin_api": ("services/admin_api", "main:app", "/health"),
+    "delivery_api": ("services/delivery_api", "main:app", "/health"),
+    "fleet_api": ("services/fleet_api", "main:app", "/health"),
+    "parts_api": ("services/parts_api", "main:app", "/health"),
+    "rental-api": ("services/rental-api", "main:app", "/health"),
+    "repair-api": ("services/repair-api", "main:app", "/health"),
+    "reporting-api": ("services/reporting-api", "main:app", "/templates"),
+}
+MODES = ("current", "asyncio-h11", "launcher")
+
+# 서버 프로세스에서 실행하는 코드
+SERVER_BOOTSTRAP = """
+import os, sys
+sys.path[:0] = [os.getcwd(), {backend!r}]
+mode, app_path, port, workers = {mode!r}, {app_path!r}, {port}, {workers}
+if mode == "launcher":
+    from shared.utils.server_launcher import run_server
+    run_server(app_path, host="127.0.0.1", port=port, workers=workers, log_level="warning")
+else:
+    # 기존 설정: 앱을 불러오기 전에 기본 응답 클래스를 JSONResponse 로 되돌림
+    from fastapi.responses import JSONResponse
+    import shared.utils.server_launcher as launcher
+    launcher.default_response_class = lambda: JSONResponse
+    import uvicorn
+    options = dict(loop="asyncio", http="h11") if mode == "asyncio-h11" else {{}}
+    uvicorn.run(app_path, host="127.0.0.1", port=port, log_level="warning", **options)
+"""
+
+
+def create_synthetic_app(items: int):
+    from fastapi import FastAPI
+
+    from shared.utils.server_launcher import default_response_class
+
+    synthetic = FastAPI(default_response_class=default_response_class())
+    vehicles = [
+        {
+            "id": f"vehicle-{i}",
+            "plateNumber": f"12가{i:04d}",
+            "status": "ACTIVE",
+            "mileage": 10_000 + i * 37,
+            "location": {"latitude": 37.5 + i / 1000, "longitude": 127.0 + i / 1000},
+            "tags": ["fleet", "rental"],
+            "updatedAt": "2024-01-01T00:00:00Z",
+        }
+        for i in range(items)
+    ]
+
+    @synthetic.get("/vehicles")
+    async def list_vehicles():
+        return {"success": True, "data": vehicles, "total": len(vehicles)}
+
+    return synthetic
+
+
+if os.getenv("BENCHMARK_SYNTHETIC_ITEMS"):
+    app = create_synthetic_app(int(os.environ["BENCHMARK_SYNTHETIC_ITEMS"]))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(process: subprocess.Popen, port: int, timeout: float = 60.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return True
+        except OSError:
+            await asyncio.sleep(0.2)
+    return False
+
+
+async def generate_load(port: int, path: str, connections: int, duration: float):
+    """keep-alive 연결마다 요청-응답을 반복하고 (요청 수, 지연 시간 목록, 오류 수) 반환"""
+    request = f"GET {path} HTTP/1.1\r\nHost: benchmark\r\n\r\n".encode()
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                writer.write(request)
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = re.search(rb"content-length:\s*(\d+)", head, re.I)
+                await reader.readexactly(int(length.group(1)) if length else 0)
+                latencies.append(time.perf_counter() - started)
+                if head[9:12] != b"200":
+                    errors += 1
+        except (OSError, asyncio.IncompleteReadError):
+            errors += 1
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(client() for _ in range(connections)))
+    return len(latencies), latencies, errors
+
+
+async def run_case(target: str, mode: str, args) -> None:
+    directory, app_path, path = TARGETS[target]
+    cwd = directory if os.path.isabs(directory) else os.path.join(BACKEND_DIR, directory)
+    port = free_port()
+    code = SERVER_BOOTSTRAP.format(
+        backend=BACKEND_DIR, mode=mode, app_path=app_path, port=port, workers=args.workers
+    )
+    env = {**os.environ, "BENCHMARK_SYNTHETIC_ITEMS": str(args.items)}
+    process = subprocess.Popen(
+        [sys.executable, "-c", code], cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        if not await wait_ready(process, port):
+            process.kill()
+            error = process.communicate()[1].decode(errors="replace").strip().splitlines()
+            print(f"{target:<15} {mode:<12} skipped: {error[-1] if error else '시작 실패'}")
+            return
+        # 워밍업 (워커가 모두 연결을 받을 때까지)
+        await generate_load(port, path, args.connections, 1.0)
+        started = time.perf_counter()
+        count, latencies, errors = await generate_load(port, path, args.connections, args.duration)
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0
+        print(
+            f"{target:<15} {mode:<12} {count / elapsed:>9,.0f} req/s  "
+            f"p50 {statistics.median(latencies or [0]) * 1000:6.2f} ms  p99 {p99 * 1000:7.2f} ms  errors {errors}"
+        )
+    finally:
+        if process.poll() is None:
+            # 정상 종료(SIGTERM) 경로 확인 겸 종료
+            process.send_signal(signal.SIGTERM)
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", default=",".join(TARGETS), help="비교할 서비스 (쉼표 구분)")
+    parser.add_argument("--modes", default=",".join(MODES), help="비교할 실행 방식 (쉼표 구분)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="launcher 워커 수")
+    parser.add_argument("--connections", type=int, default=64, help="동시 keep-alive 연결 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간(초)")
+    parser.add_argument("--items", type=int, default=50, help="synthetic 응답의 차량 수")
+    args = parser.parse_args()
+
+    print(
+        f"cpu {os.cpu_count()}, launcher workers {args.workers}, "
+        f"connections {args.connections}, duration {args.duration:g} s"
+    )
+    for target in args.targets.split(","):
+        for mode in args.modes.split(","):
+            await run_case(target.strip(), mode.strip(), args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())